@@ -0,0 +1,63 @@
+"""
+Benchmark saving and loading gardens in the binary format against pickle.
+
+Compares the time taken to convert the gardens to and from bytes,
+and the size of the result, for gardens containing 1k, 10k, and 100k items.
+Run with: python bench_codec.py
+"""
+
+import pickle
+import time
+
+import context
+from gardenlife import codec
+from gardenlife.garden import Garden
+from gardenlife.organisms import Creature, Plant
+from gardenlife.task import Task
+
+
+def build_gardens(items, number_of_gardens=10):
+    gardens = {}
+    items_per_garden = items // number_of_gardens // 3
+    for garden_number in range(number_of_gardens):
+        garden = Garden(f"Garden {garden_number}", "Hull", 1, "04/02/1987", ["Dave Davidson"])
+        gardens[garden.name] = garden
+        for number in range(items_per_garden):
+            garden.add_item(
+                "creatures",
+                Creature(f"Creature {number}", org_type="mammal", appeared="03/07/2020"),
+            )
+            garden.add_item(
+                "plants", Plant(f"Plant {number}", org_type="tree", planted="01/04/2019")
+            )
+            task = Task(f"Task {number}", assignee="Dave Davidson", linked_plants=["Plant 0"])
+            task.set_schedule("01/05/2020", "Weekly", "100", "", "")
+            task.update_completed_dates({"01/05/2020": True, "08/05/2020": True})
+            garden.add_item("tasks", task)
+    return gardens
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    print(f"{'Items':>8} {'Format':>7} {'Save':>11} {'Load':>11} {'Size':>12}")
+    for items in (1_000, 10_000, 100_000):
+        gardens = build_gardens(items)
+        formats = (
+            ("pickle", lambda: pickle.dumps(gardens, pickle.HIGHEST_PROTOCOL), pickle.loads),
+            ("binary", lambda: codec.dumps(gardens), codec.loads),
+        )
+        for name, dumps, loads in formats:
+            data, save_ms = timed(dumps)
+            _, load_ms = timed(loads, data)
+            print(
+                f"{items:>8,} {name:>7} {save_ms:>8.1f} ms {load_ms:>8.1f} ms {len(data):>10,} B"
+            )
+
+
+if __name__ == "__main__":
+    main()
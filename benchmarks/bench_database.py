@@ -0,0 +1,95 @@
+"""
+Benchmark starting up and saving with the SQLite database.
+
+Startup loads the gardens and shows the summary of the most recent one.
+Compares the database, which loads a garden's items when they're first used,
+with unpickling every garden. Saving one change is compared in the same way.
+Run with: python bench_database.py
+"""
+
+from operator import attrgetter
+import os
+import pickle
+import tempfile
+import time
+
+import context
+from gardenlife.database import Database
+from gardenlife.garden import Garden
+from gardenlife.organisms import Creature, Plant
+from gardenlife import progress
+from gardenlife.task import Task
+
+
+def build_gardens(items_per_garden, number_of_gardens=10):
+    gardens = {}
+    for garden_number in range(number_of_gardens):
+        garden = Garden(f"Garden {garden_number}", "Hull", 1, "04/02/1987", ["Dave Davidson"])
+        gardens[garden.name] = garden
+        for number in range(items_per_garden):
+            garden.add_item("creatures", Creature(f"Creature {number}", org_type="mammal"))
+            garden.add_item("plants", Plant(f"Plant {number}", org_type="tree"))
+            task = Task(f"Task {number}")
+            task.set_schedule("01/05/2020", "Weekly", "100", "", "")
+            garden.add_item("tasks", task)
+    return gardens
+
+
+def start_up(load):
+    # Load the gardens and calculate the summary of the most recent garden
+    gardens = load()
+    garden = max(gardens.values(), key=attrgetter("timestamp"))
+    len(garden.creatures), len(garden.plants)
+    progress.outstanding_tasks(garden.tasks.values())
+    return gardens
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    print(
+        f"{'Items':>10} {'Unpickle':>12} {'Database':>12} {'Pickle save':>12} {'Database save':>14}"
+    )
+    for items_per_garden in (100, 1_000, 10_000):
+        with tempfile.TemporaryDirectory() as directory:
+            gardens = build_gardens(items_per_garden)
+            pickle_path = os.path.join(directory, "gardens.pickle")
+            with open(pickle_path, "wb") as file:
+                pickle.dump(gardens, file)
+            database = Database(os.path.join(directory, "gardens.db"))
+            database.import_gardens(gardens)
+            database.save()
+            database.close()
+
+            def unpickle():
+                with open(pickle_path, "rb") as file:
+                    return pickle.load(file)
+
+            unpickled, unpickle_ms = timed(start_up, unpickle)
+            database = Database(os.path.join(directory, "gardens.db"))
+            loaded, database_ms = timed(start_up, database.load)
+
+            def pickle_save():
+                unpickled["Garden 0"].add_item("creatures", Creature("badger", org_type="mammal"))
+                with open(pickle_path, "wb") as file:
+                    pickle.dump(unpickled, file)
+
+            def database_save():
+                loaded["Garden 0"].add_item("creatures", Creature("badger", org_type="mammal"))
+                database.save()
+
+            _, pickle_save_ms = timed(pickle_save)
+            _, database_save_ms = timed(database_save)
+            database.close()
+            print(
+                f"{items_per_garden * 30:>10,} {unpickle_ms:>9.1f} ms {database_ms:>9.1f} ms "
+                f"{pickle_save_ms:>9.1f} ms {database_save_ms:>11.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark date string conversions.
+
+Compares the cached, hand-rolled conversions in dates.py with strptime and strftime.
+Run with: python bench_dates.py
+"""
+
+from datetime import datetime, timedelta
+import timeit
+
+import context
+from gardenlife import dates
+
+
+def main():
+    # A daily schedule's worth of dates, as shown in the add progress window
+    all_dates = [datetime(2020, 1, 1) + timedelta(days=day) for day in range(2000)]
+    date_strings = [date.strftime("%d/%m/%Y") for date in all_dates]
+    number = 20
+
+    cases = {
+        "strptime": lambda: [datetime.strptime(string, "%d/%m/%Y") for string in date_strings],
+        "string_to_date (uncached)": lambda: [
+            dates.string_to_date.__wrapped__(string) for string in date_strings
+        ],
+        "string_to_date (cached)": lambda: [dates.string_to_date(string) for string in date_strings],
+        "strftime": lambda: [date.strftime("%d/%m/%Y") for date in all_dates],
+        "date_to_string (uncached)": lambda: [
+            dates.date_to_string.__wrapped__(date) for date in all_dates
+        ],
+        "date_to_string (cached)": lambda: [dates.date_to_string(date) for date in all_dates],
+    }
+
+    print(f"{'Conversion':<28} {'us per date':>12}")
+    for name, case in cases.items():
+        seconds = timeit.timeit(case, number=number)
+        print(f"{name:<28} {seconds / number / len(all_dates) * 1e6:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark exporting every task to an iCalendar file.
+
+Measures the time and peak memory of the export as the number of tasks grows.
+Peak memory should stay about the same, as the file is written a line at a time.
+Run with: python bench_ical.py
+"""
+
+from datetime import datetime, timedelta
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+import context
+from gardenlife.garden import Garden
+from gardenlife.task import Task
+from gardenlife import ical
+
+
+FREQUENCIES = ("Daily", "Weekly", "Monthly", "Yearly")
+
+
+def build_gardens(number_of_tasks, number_of_gardens=10):
+    random.seed(1)
+    gardens = {}
+    for garden_number in range(number_of_gardens):
+        name = f"Garden {garden_number}"
+        gardens[name] = Garden(name, "Hull", 1, "04/02/1987", ["Dave Davidson"])
+    for task_number in range(number_of_tasks):
+        task = Task(f"Task {task_number}", description="Cut back, then tidy up.")
+        start = datetime(2020, 1, 1) + timedelta(days=random.randrange(1000))
+        task.set_schedule(
+            start_date=start.strftime("%d/%m/%Y"),
+            freq=random.choice(FREQUENCIES),
+            count=random.choice(("", str(random.randrange(2, 500)))),
+            bymonth=random.choice(("", "3 4 5", "6 7 8")),
+            interval=str(random.randrange(1, 4)),
+            until=random.choice(("", "Never", "01/01/2030")),
+        )
+        gardens[f"Garden {task_number % number_of_gardens}"].add_item("tasks", task)
+    return gardens
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "gardens.ics")
+        print(f"{'Tasks':>10} {'Time':>12} {'Peak memory':>14} {'File size':>12}")
+        for number_of_tasks in (1_000, 10_000, 100_000):
+            gardens = build_gardens(number_of_tasks)
+            # Export once first, so values that schedules cache aren't counted as export memory
+            ical.export_calendar(gardens, path)
+            tracemalloc.start()
+            start = time.perf_counter()
+            ical.export_calendar(gardens, path)
+            elapsed = (time.perf_counter() - start) * 1000
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{number_of_tasks:>10,} {elapsed:>9.0f} ms {peak / 1024:>11.0f} KiB "
+                f"{os.path.getsize(path) / 1024:>8.0f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark importing gardenlife, to keep the core quick to import without the GUI.
+
+Imports the core classes and functions in a new interpreter each time, and reports
+the median time taken and any of the slow optional modules that were imported.
+The GUI is timed in the same way if PySimpleGUI is installed. An import that fails
+stops the benchmark with the error it raised.
+Run with: python bench_import.py
+"""
+
+from importlib.util import find_spec
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+REPOSITORY = Path(__file__).resolve().parents[1]
+RUNS = 15
+
+TIMED = """
+import sys, time
+start = time.perf_counter()
+{}
+elapsed = (time.perf_counter() - start) * 1000
+slow = [name for name in ("PySimpleGUI", "tkinter", "numpy", "sqlite3") if name in sys.modules]
+print(elapsed, *slow)
+"""
+
+# The name, code, and module needed by each import, or None if it has no optional module
+IMPORTS = (
+    ("Core", "import gardenlife\nfor name in gardenlife.CORE: getattr(gardenlife, name)", None),
+    ("GUI", "import gardenlife.manage", "PySimpleGUI"),
+)
+
+
+def import_time(code):
+    # Return the median time in milliseconds and the slow modules imported
+    times = []
+    for _ in range(RUNS):
+        result = subprocess.run(
+            [sys.executable, "-c", TIMED.format(code)],
+            cwd=REPOSITORY,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode:
+            raise SystemExit(f"Importing failed:\n{code}\n{result.stderr}")
+        elapsed, *slow = result.stdout.split()
+        times.append(float(elapsed))
+    return statistics.median(times), slow
+
+
+def main():
+    print(f"{'Imports':>8} {'Median':>10}  Slow modules imported")
+    for name, code, required in IMPORTS:
+        if required is not None and find_spec(required) is None:
+            print(f"{name:>8} {'-':>10}  {required} not installed")
+            continue
+        median, slow = import_time(code)
+        print(f"{name:>8} {median:>7.1f} ms  {', '.join(slow) or 'None'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark refreshing the organism type dropdowns and filtering the edible plants,
+and finding the tasks linked to a plant.
+
+Compares scanning every item in a generated garden, as the dropdowns and
+the edible plants window did, with the garden's indexes. The indexes
+are built before timing, as they are the first time they're used, and the time
+taken to build the link index and check every link is shown separately.
+Run with: python bench_indexes.py
+"""
+
+import time
+import timeit
+
+import context
+from generate import generate_garden
+
+
+def main():
+    print(f"{'Items':>8} {'Operation':<10} {'Scan (ms)':>10} {'Index (ms)':>11} {'Speedup':>9}")
+    for items in (1_000, 10_000, 100_000):
+        garden = generate_garden(items)
+        garden.field_values("creatures", "org_type"), garden.field_values("plants", "org_type")
+        operations = (
+            (
+                "dropdowns",
+                lambda: (
+                    {c.org_type for c in garden.creatures.values() if c.org_type},
+                    {p.org_type for p in garden.plants.values() if p.org_type},
+                ),
+                lambda: (
+                    garden.field_values("creatures", "org_type") - {"", None},
+                    garden.field_values("plants", "org_type") - {"", None},
+                ),
+            ),
+            (
+                "edible",
+                lambda: [plant for plant in garden.plants.values() if plant.edible],
+                lambda: garden.find_items("plants", edible=True),
+            ),
+            (
+                "links",
+                lambda: [
+                    task for task in garden.tasks.values() if "Plant 0" in task.linked_plants
+                ],
+                lambda: garden.linked_tasks("plants", "Plant 0"),
+            ),
+        )
+        start = time.perf_counter()
+        garden.broken_links()
+        links_ms = (time.perf_counter() - start) * 1000
+        number = 20
+        for name, scan, indexed in operations:
+            scan_ms = timeit.timeit(scan, number=number) / number * 1000
+            index_ms = timeit.timeit(indexed, number=number) / number * 1000
+            print(
+                f"{items:>8,} {name:<10} {scan_ms:>10.3f} {index_ms:>11.3f} "
+                f"{scan_ms / index_ms:>8.1f}x"
+            )
+        print(f"{items:>8,} Indexing and checking every link: {links_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark saving a single change to the gardens.
+
+Compares appending the change to the journal with pickling the whole gardens dict,
+which is how changes were saved before the journal.
+Run with: python bench_journal.py
+"""
+
+import os
+import pickle
+import tempfile
+import time
+
+import context
+from gardenlife.garden import Garden
+from gardenlife.journal import Journal
+from gardenlife.organisms import Creature, Plant
+from gardenlife.task import Task
+
+
+def build_gardens(journal, items_per_garden, number_of_gardens=10):
+    gardens = journal.load()
+    for garden_number in range(number_of_gardens):
+        garden = Garden(f"Garden {garden_number}", "Hull", 1, "04/02/1987", ["Dave Davidson"])
+        gardens[garden.name] = garden
+        journal.put_garden(garden)
+        for number in range(items_per_garden):
+            garden.add_item("creatures", Creature(f"Creature {number}", org_type="mammal"))
+            garden.add_item("plants", Plant(f"Plant {number}", org_type="tree"))
+            task = Task(f"Task {number}")
+            task.set_schedule("01/05/2020", "Weekly", "100", "", "")
+            garden.add_item("tasks", task)
+    # Start from a compacted snapshot, as the journal would be after heavy use
+    journal.save()
+    journal.compact()
+    journal.wait()
+    return gardens
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    print(f"{'Items':>10} {'Pickle all':>12} {'Journal':>12} {'Appended':>10}")
+    for items_per_garden in (100, 1_000, 10_000):
+        with tempfile.TemporaryDirectory() as directory:
+            journal = Journal(
+                snapshot_path=os.path.join(directory, "gardens.pickle"),
+                journal_path=os.path.join(directory, "gardens.journal"),
+            )
+            gardens = build_gardens(journal, items_per_garden)
+            creature = Creature("badger", org_type="mammal", notes="Digs holes.")
+            gardens["Garden 0"].add_item("creatures", creature)
+
+            def pickle_all():
+                with open(os.path.join(directory, "full.pickle"), "wb") as file:
+                    pickle.dump(gardens, file)
+
+            pickle_ms = timed(pickle_all)
+            journal_ms = timed(journal.save)
+            appended = os.path.getsize(journal.journal_path)
+            print(
+                f"{items_per_garden * 30:>10,} {pickle_ms:>9.1f} ms {journal_ms:>9.2f} ms "
+                f"{appended:>8} B"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark aggregating the measures of the plants across a number of gardens.
+
+Compares walking every plant object, as any report over the measures had to,
+with the measure columns, for the mean impact of each type, the count of each
+prevalence level, and the share of declining plants. The time taken to build
+each garden's columns the first time they're used, and to combine the gardens'
+columns, is shown separately.
+Run with: python bench_measures.py
+"""
+
+from collections import Counter, defaultdict
+import time
+
+import context
+from generate import generate_gardens
+from gardenlife import measures
+
+
+def walk(gardens):
+    # Aggregate by visiting each current plant object in turn
+    totals, counts = defaultdict(int), defaultdict(int)
+    levels = Counter()
+    declining = current = 0
+    for garden in gardens.values():
+        for plant in garden.plants.values():
+            if plant.status.get() == "Archived":
+                continue
+            totals[plant.org_type] += plant.impact
+            counts[plant.org_type] += 1
+            levels[plant.prevalence] += 1
+            declining += plant.trend <= 2
+            current += 1
+    means = {org_type: totals[org_type] / counts[org_type] for org_type in totals}
+    return means, levels, declining / current
+
+
+def aggregate(plants):
+    return (
+        plants.mean_by_type("impact"),
+        plants.counts_by_level("prevalence"),
+        plants.declining_share(),
+    )
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    print(f"{'Plants':>8} {'Walk':>11} {'Build':>11} {'Combine':>11} {'Columns':>11}")
+    for items_per_garden in (3_000, 30_000, 300_000):
+        gardens = generate_gardens(10, items_per_garden // 10)
+        walk_ms = timed(walk, gardens)
+        build_ms = timed(lambda: [garden.measures("plants") for garden in gardens.values()])
+        combine_ms = timed(measures.combine, gardens, "plants")
+        plants = measures.combine(gardens, "plants")
+        columns_ms = min(timed(aggregate, plants) for _ in range(3))
+        print(
+            f"{items_per_garden // 3:>8,} {walk_ms:>8.1f} ms {build_ms:>8.1f} ms "
+            f"{combine_ms:>8.1f} ms {columns_ms:>8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
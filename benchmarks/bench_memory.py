@@ -0,0 +1,56 @@
+"""
+Benchmark the memory used by each item and the time taken to load them.
+
+A garden of 100k items is generated by generate.py. The items in each category are
+decoded from the binary format while tracemalloc measures the memory they use,
+which includes their statuses, schedules, and completed dates. Loading the whole
+garden from the binary format and from a pickle is then timed.
+Run with: python bench_memory.py
+"""
+
+import gc
+import pickle
+import time
+import tracemalloc
+
+import context
+from gardenlife import codec
+from generate import generate_garden
+
+ITEMS = 100_000
+
+
+def decoded_size(encoded_items):
+    # Return the bytes allocated while decoding the items, and the items
+    gc.collect()
+    tracemalloc.start()
+    items = [codec.decode_item(data) for data in encoded_items]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, items
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    garden = generate_garden(ITEMS)
+    print(f"{'Category':<10} {'Items':>8} {'Per item':>12}")
+    for category in ("creatures", "plants", "tasks"):
+        items = getattr(garden, category)
+        encoded_items = [codec.encode_item(item) for item in items.values()]
+        size, _ = decoded_size(encoded_items)
+        print(f"{category:<10} {len(items):>8,} {size / len(items):>10.0f} B")
+
+    gardens = {garden.name: garden}
+    data = codec.dumps(gardens)
+    pickled = pickle.dumps(gardens, pickle.HIGHEST_PROTOCOL)
+    print(f"Binary load: {min(timed(codec.loads, data) for _ in range(3)):.1f} ms")
+    print(f"Pickle load: {min(timed(pickle.loads, pickled) for _ in range(3)):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
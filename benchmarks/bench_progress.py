@@ -0,0 +1,79 @@
+"""
+Benchmark task progress and next due date calculations on long schedules.
+
+Compares the binary search used by Task with the linear scans over a list
+of scheduled dates that it replaced. Task's calculations are called directly,
+so the cached progress isn't what's timed. Run with: python bench_progress.py
+"""
+
+from datetime import timedelta
+import timeit
+
+import context
+from gardenlife.completed_dates import CompletedDates
+from gardenlife.task import Task
+
+
+def linear_current_progress(schedule, completed_dates, current_date):
+    # The original implementation, which scans the whole schedule
+    if not completed_dates:
+        if current_date < schedule[0]:
+            return "Not yet due"
+        elif current_date == schedule[0]:
+            return "Due"
+        missed = sum(date < current_date for date in schedule)
+        return "Overdue" if missed == 1 else "Very overdue"
+    if current_date in schedule and current_date > completed_dates[-1]:
+        return "Due"
+    missed = sum(date > completed_dates[-1] and date < current_date for date in schedule)
+    if missed == 1:
+        return "Overdue"
+    elif missed > 1:
+        return "Very overdue"
+    return "Completed"
+
+
+def linear_next_due_date(schedule, completed_dates):
+    # The original implementation, which scans the whole schedule
+    if not completed_dates:
+        return schedule[0]
+    elif schedule[-1] <= completed_dates[-1]:
+        return "No further due dates"
+    return min(date for date in schedule if date > completed_dates[-1])
+
+
+def daily_task(count):
+    task = Task("water greenhouse")
+    task.set_schedule(start_date="01/01/2000", freq="Daily", count=str(count), bymonth="", interval="")
+    # Completed halfway through the schedule
+    task.completed_dates = CompletedDates([task.schedule[count // 2]])
+    return task
+
+
+def main():
+    print(f"{'Occurrences':>12} {'Linear (ms)':>12} {'Bisect (ms)':>12} {'Speedup':>10}")
+    for count in (10_000, 50_000, 100_000):
+        task = daily_task(count)
+        schedule = list(task.schedule)
+        current_date = task.schedule[count // 2] + timedelta(days=10)
+        number = 20
+
+        linear = timeit.timeit(
+            lambda: (
+                linear_current_progress(schedule, task.completed_dates, current_date),
+                linear_next_due_date(schedule, task.completed_dates),
+            ),
+            number=number,
+        )
+        binary = timeit.timeit(
+            lambda: (task._calculate_progress(current_date), task._calculate_next_due_date()),
+            number=number,
+        )
+        print(
+            f"{count:>12,} {linear / number * 1000:>12.3f} "
+            f"{binary / number * 1000:>12.3f} {linear / binary:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Benchmark how gardenlife scales with the number of items in a garden.
+
+Gardens of 1k, 10k, and 100k items are generated by generate.py, saved in the
+SQLite database, and loaded again. Then loading, saving a change, sorting the tasks,
+updating the task summaries, getting every task's progress, and building the summary
+rows are each timed, taking the best of a few repeats. The tasks' cached progress
+is cleared before each repeat, so every repeat calculates it as the window first does.
+
+Progress is calculated for the generator's fixed current date, so results don't
+change as the real date moves on.
+
+Results are compared with the baselines in baselines.json. An operation is reported
+as slower if it takes more than REGRESSION_RATIO times its baseline and over NOISE
+milliseconds longer. Baselines depend on the machine, so save your own before making
+changes. Run with: python bench_scaling.py [--save-baselines]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import context
+from gardenlife.database import Database
+from gardenlife.dates import date_to_string
+from gardenlife import event_funcs
+from gardenlife.organisms import Creature
+from gardenlife import progress
+from gardenlife import summaries
+
+from generate import CURRENT_DATE, generate_garden
+
+SIZES = (1_000, 10_000, 100_000)
+REPEATS = 3
+REGRESSION_RATIO = 1.25
+# Differences smaller than this, in milliseconds, are timing noise rather than regressions
+NOISE = 1
+BASELINES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+
+class SummaryElement:
+    # Stands in for the window's summary text elements, which only need updating
+    def update(self, value):
+        self.value = value
+
+
+def best_time(function, setup=None):
+    # Return the fastest of the repeats in milliseconds, running setup untimed before each
+    times = []
+    for _ in range(REPEATS):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000)
+    return round(min(times), 2)
+
+
+def time_operations(path):
+    # Start up as manage.load_gardens and manage.load_garden do, then read every item
+    def load():
+        gardens = Database(path).load()
+        garden = gardens.latest()
+        list(garden.creatures.values()), list(garden.plants.values()), list(garden.tasks.values())
+        return garden
+
+    # Each timed load opens its own connection, which is closed once it's loaded
+    results = {"load_gardens": best_time(lambda: load().store.close())}
+    garden = load()
+    current_date = date_to_string(CURRENT_DATE)
+    window = {
+        "-SUMMARY TOTAL TASKS-": SummaryElement(),
+        "-SUMMARY OUTSTANDING TASKS-": SummaryElement(),
+    }
+    additions = iter(range(REPEATS))
+
+    def save():
+        garden.add_item("creatures", Creature(f"Badger {next(additions)}", org_type="Mammal"))
+        garden.store.save()
+
+    def clear_cached_progress():
+        for task in garden.tasks.values():
+            task.clear_cached_progress()
+
+    def summary_rows():
+        all_progress = progress.garden_progress(garden.tasks.values(), current_date)
+        creature_rows = [
+            summaries.creature_values(creature)
+            for creature in summaries.sorted_organisms(garden.creatures.values())
+        ]
+        plant_rows = [
+            summaries.plant_values(plant)
+            for plant in summaries.sorted_organisms(garden.plants.values())
+        ]
+        task_rows = [
+            summaries.task_values(task, all_progress[task.name])
+            for task in summaries.sorted_tasks(garden.tasks.values(), all_progress, current_date)
+        ]
+        return creature_rows, plant_rows, task_rows
+
+    results["save"] = best_time(save)
+    results["sorted_tasks"] = best_time(
+        lambda: summaries.sorted_tasks(garden.tasks.values(), current_date=current_date),
+        clear_cached_progress,
+    )
+    results["update_task_summaries"] = best_time(
+        lambda: event_funcs.update_task_summaries(window, garden, current_date),
+        clear_cached_progress,
+    )
+    results["get_all_progress"] = best_time(
+        lambda: [
+            task.get_all_progress(current_date=current_date) for task in garden.tasks.values()
+        ],
+        clear_cached_progress,
+    )
+    results["summary_rows"] = best_time(summary_rows, clear_cached_progress)
+    garden.store.close()
+    return results
+
+
+def compare(results, baselines):
+    # Print each result next to its baseline, and return the operations that have regressed
+    regressions = []
+    print(f"{'Items':>8} {'Operation':<22} {'Time':>12} {'Baseline':>12} {'Ratio':>7}")
+    for size, operations in results.items():
+        for operation, milliseconds in operations.items():
+            baseline = baselines.get(size, {}).get(operation)
+            if baseline is None:
+                print(
+                    f"{int(size):>8,} {operation:<22} {milliseconds:>9.1f} ms {'-':>12} {'-':>7}"
+                )
+                continue
+            ratio = milliseconds / baseline
+            regressed = ratio > REGRESSION_RATIO and milliseconds - baseline > NOISE
+            flag = " slower" if regressed else ""
+            print(
+                f"{int(size):>8,} {operation:<22} {milliseconds:>9.1f} ms "
+                f"{baseline:>9.1f} ms {ratio:>6.2f}x{flag}"
+            )
+            if flag:
+                regressions.append((size, operation))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--save-baselines", action="store_true", help="save results as baselines")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="items per garden")
+    arguments = parser.parse_args()
+
+    results = {}
+    for size in arguments.sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "gardens.db")
+            garden = generate_garden(size)
+            database = Database(path)
+            database.import_gardens({garden.name: garden})
+            database.save()
+            database.close()
+            results[str(size)] = time_operations(path)
+
+    try:
+        with open(BASELINES_FILE, encoding="utf-8") as file:
+            baselines = json.load(file)
+    except FileNotFoundError:
+        baselines = {}
+    regressions = compare(results, baselines)
+    if arguments.save_baselines:
+        with open(BASELINES_FILE, "w", encoding="utf-8") as file:
+            json.dump({**baselines, **results}, file, indent=4)
+        print(f"Baselines saved to {BASELINES_FILE}")
+    elif regressions:
+        print(f"{len(regressions)} operations are more than {REGRESSION_RATIO}x slower")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark saving and loading gardens stored in shards.
+
+Compares saving a single change by rewriting one garden's shard with writing
+every garden to a single file, and loading all the shards in one process
+with loading them in parallel with a pool of processes.
+Run with: python bench_shards.py
+"""
+
+import os
+import tempfile
+import time
+
+import context
+from gardenlife import codec
+from gardenlife.garden import Garden
+from gardenlife.organisms import Creature, Plant
+from gardenlife.shards import ShardStore
+from gardenlife.task import Task
+
+
+def build_gardens(store, number_of_gardens, items_per_garden=1_000):
+    gardens = {}
+    for garden_number in range(number_of_gardens):
+        garden = Garden(f"Garden {garden_number}", "Hull", 1, "04/02/1987", ["Dave Davidson"])
+        gardens[garden.name] = garden
+        for number in range(items_per_garden):
+            garden.add_item("creatures", Creature(f"Creature {number}", org_type="mammal"))
+            garden.add_item("plants", Plant(f"Plant {number}", org_type="tree"))
+            task = Task(f"Task {number}")
+            task.set_schedule("01/05/2020", "Weekly", "100", "", "")
+            garden.add_item("tasks", task)
+    store.import_gardens(gardens)
+    store.save()
+    return gardens
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    print(
+        f"{'Gardens':>8} {'Single file':>12} {'Shard':>10} {'Load 1 process':>15} "
+        f"{'Load pool':>11}"
+    )
+    for number_of_gardens in (10, 50, 100):
+        with tempfile.TemporaryDirectory() as directory:
+            store = ShardStore(os.path.join(directory, "gardens"))
+            gardens = build_gardens(store, number_of_gardens)
+            gardens["Garden 0"].add_item("creatures", Creature("badger", org_type="mammal"))
+            _, single_ms = timed(codec.dump, gardens, os.path.join(directory, "gardens.dat"))
+            _, shard_ms = timed(store.save)
+            _, sequential_ms = timed(ShardStore(store.directory).load_all, 1)
+            _, pool_ms = timed(ShardStore(store.directory).load_all)
+            print(
+                f"{number_of_gardens:>8} {single_ms:>9.1f} ms {shard_ms:>7.1f} ms "
+                f"{sequential_ms:>12.1f} ms {pool_ms:>8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark starting up as the number of gardens grows.
+
+Startup loads the gardens and the most recently created/updated garden,
+as manage.main does. Compares the database, which reads the garden names and
+timestamps and then only the latest garden, with unpickling every garden.
+Run with: python bench_startup.py
+"""
+
+import os
+import pickle
+import tempfile
+import time
+
+import context
+from gardenlife.database import Database
+from gardenlife.garden import Garden
+from gardenlife.organisms import Creature, Plant
+from gardenlife.task import Task
+
+
+def build_gardens(number_of_gardens, items_per_garden=100):
+    gardens = {}
+    for garden_number in range(number_of_gardens):
+        garden = Garden(f"Garden {garden_number}", "Hull", 1, "04/02/1987", ["Dave Davidson"])
+        gardens[garden.name] = garden
+        for number in range(items_per_garden):
+            garden.add_item("creatures", Creature(f"Creature {number}", org_type="mammal"))
+            garden.add_item("plants", Plant(f"Plant {number}", org_type="tree"))
+            task = Task(f"Task {number}")
+            task.set_schedule("01/05/2020", "Weekly", "100", "", "")
+            garden.add_item("tasks", task)
+    return gardens
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    print(f"{'Gardens':>8} {'Unpickle':>12} {'Database':>12}")
+    for number_of_gardens in (10, 100, 1_000):
+        with tempfile.TemporaryDirectory() as directory:
+            gardens = build_gardens(number_of_gardens)
+            pickle_path = os.path.join(directory, "gardens.pickle")
+            with open(pickle_path, "wb") as file:
+                pickle.dump(gardens, file)
+            database_path = os.path.join(directory, "gardens.db")
+            database = Database(database_path)
+            database.import_gardens(gardens)
+            database.save()
+            database.close()
+
+            def unpickle():
+                with open(pickle_path, "rb") as file:
+                    loaded = pickle.load(file)
+                latest = max(loaded.values(), key=lambda garden: garden.timestamp)
+                len(latest.creatures)
+
+            def database_load():
+                loaded = Database(database_path).load()
+                len(loaded.latest().creatures)
+
+            print(
+                f"{number_of_gardens:>8,} {timed(unpickle):>9.1f} ms "
+                f"{timed(database_load):>9.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
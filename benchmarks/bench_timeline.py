@@ -0,0 +1,80 @@
+"""
+Benchmark finding the tasks due soon across all gardens.
+
+Compares querying the due timeline with evaluating every task in every garden.
+Run with: python bench_timeline.py
+"""
+
+from datetime import datetime, timedelta
+import random
+import time
+
+import context
+from gardenlife.dates import string_to_date
+from gardenlife.garden import Garden
+from gardenlife.task import Task
+from gardenlife import timeline
+
+
+FREQUENCIES = ("Daily", "Weekly", "Monthly", "Yearly")
+
+
+def build_gardens(number_of_tasks, number_of_gardens=10):
+    random.seed(1)
+    gardens = {}
+    for garden_number in range(number_of_gardens):
+        name = f"Garden {garden_number}"
+        gardens[name] = Garden(name, "Hull", 1, "04/02/1987", ["Dave Davidson"])
+    for task_number in range(number_of_tasks):
+        task = Task(f"Task {task_number}")
+        start = datetime(2020, 1, 1) + timedelta(days=random.randrange(1000))
+        task.set_schedule(
+            start_date=start.strftime("%d/%m/%Y"),
+            freq=random.choice(FREQUENCIES),
+            count=str(random.randrange(1, 500)),
+            bymonth="",
+            interval=str(random.randrange(1, 4)),
+        )
+        gardens[f"Garden {task_number % number_of_gardens}"].add_item("tasks", task)
+    return gardens
+
+
+def scan(gardens, end):
+    # Evaluate every task in every garden, as the task summary window does for one garden
+    due = []
+    for garden in gardens.values():
+        for task in garden.tasks.values():
+            next_due = task._calculate_next_due_date()
+            if next_due != "No further due dates" and string_to_date(next_due) <= end:
+                due.append((string_to_date(next_due), garden.name, task.name))
+    return sorted(due)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    number_of_tasks = 100_000
+    gardens = build_gardens(number_of_tasks)
+    end = datetime(2021, 6, 1)
+
+    due_timeline, build_ms = timed(timeline.build_timeline, gardens)
+    scanned, scan_ms = timed(scan, gardens, end)
+    queried, query_ms = timed(due_timeline.due_between, datetime.min, end)
+    assert queried == scanned
+
+    print(f"Tasks: {number_of_tasks:,}. Due or overdue by {end:%d/%m/%Y}: {len(queried):,}")
+    print(f"{'Build timeline':<30} {build_ms:>10.1f} ms")
+    print(f"{'Scan every task':<30} {scan_ms:>10.1f} ms")
+    print(f"{'Query timeline':<30} {query_ms:>10.1f} ms")
+
+    task = gardens["Garden 0"].tasks["Task 0"]
+    _, update_ms = timed(gardens["Garden 0"].update_task_progress, task.name, {"01/01/2020": True})
+    print(f"{'Update one task':<30} {update_ms:>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
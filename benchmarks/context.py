@@ -0,0 +1,6 @@
+from pathlib import Path
+import sys
+
+# Enables gardenlife package imports when running benchmarks
+context = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(context))
@@ -0,0 +1,113 @@
+"""
+Generate synthetic gardens for the benchmarks.
+
+The same seed always generates the same garden, so benchmark results can be
+compared between runs. Items are split evenly between creatures, plants, and tasks.
+Tasks have a mix of schedules, are completed up to a point with the odd date
+missed, and are linked to some of the creatures and plants. Items are added
+with Garden.add_item, so they're given IDs as they would be in the window.
+"""
+
+from datetime import datetime, timedelta
+import random
+
+import context
+from gardenlife.dates import date_to_string
+from gardenlife.garden import Garden
+from gardenlife.organisms import Creature, Plant
+from gardenlife.task import Task
+
+CREATURE_TYPES = ("Mammal", "Bird", "Insect", "Amphibian", "Rodent")
+PLANT_TYPES = ("Tree", "Shrub", "Vegetable", "Herb", "Flower")
+ASSIGNEES = ("Dave Davidson", "Sarah Davidson", "Jon Boland", "")
+LENGTHS = ("10 minutes", "30 minutes", "1 hour", "2 hours", "")
+# Frequency, count, by month, interval, and until of each kind of schedule
+SCHEDULES = (
+    ("Daily", "365", "", "1", ""),
+    ("Weekly", "100", "", "", ""),
+    ("Weekly", "", "", "2", "Never"),
+    ("Monthly", "24", "3 4 5 6 7 8 9", "", ""),
+    ("Yearly", "10", "", "", ""),
+)
+START = datetime(2018, 1, 1)
+CURRENT_DATE = datetime(2021, 6, 1)
+
+
+def generate_garden(items, seed=0, name="Synthetic Garden"):
+    """Return a garden with the number of items, generated from the seed."""
+    generator = random.Random(seed)
+    garden = Garden(name, "Hull", 2, "04/02/1987", ["Dave Davidson", "Sarah Davidson"])
+    count = items // 3
+    for number in range(count):
+        creature = Creature(
+            f"Creature {number}",
+            org_type=generator.choice(CREATURE_TYPES),
+            appeared=_random_date(generator),
+            impact=generator.randint(1, 5),
+            prevalence=generator.randint(1, 5),
+            trend=generator.randint(1, 5),
+        )
+        plant = Plant(
+            f"Plant {number}",
+            org_type=generator.choice(PLANT_TYPES),
+            planted=_random_date(generator),
+            edible=generator.random() < 0.3,
+            impact=generator.randint(1, 5),
+            prevalence=generator.randint(1, 5),
+            trend=generator.randint(1, 5),
+        )
+        if generator.random() < 0.1:
+            creature.status.archive()
+        if generator.random() < 0.1:
+            plant.status.archive()
+        garden.add_item("creatures", creature)
+        garden.add_item("plants", plant)
+    for number in range(items - 2 * count):
+        task = _generate_task(generator, number, count)
+        garden.add_item("tasks", task)
+    return garden
+
+
+def generate_gardens(number_of_gardens, items_per_garden, seed=0):
+    """Return a dict of gardens, each generated from its own seed."""
+    return {
+        garden.name: garden
+        for garden in (
+            generate_garden(items_per_garden, seed + number, f"Garden {number}")
+            for number in range(number_of_gardens)
+        )
+    }
+
+
+def _generate_task(generator, number, organisms):
+    linked_creatures = [
+        f"Creature {generator.randrange(organisms)}"
+        for _ in range(generator.randint(0, 3) if organisms else 0)
+    ]
+    linked_plants = [
+        f"Plant {generator.randrange(organisms)}"
+        for _ in range(generator.randint(0, 3) if organisms else 0)
+    ]
+    task = Task(
+        f"Task {number}",
+        description="Synthetic task",
+        assignee=generator.choice(ASSIGNEES),
+        length=generator.choice(LENGTHS),
+        linked_creatures=sorted(set(linked_creatures)),
+        linked_plants=sorted(set(linked_plants)),
+    )
+    freq, count, bymonth, interval, until = generator.choice(SCHEDULES)
+    task.set_schedule(_random_date(generator), freq, count, bymonth, interval, until)
+    # Completed up to a random date with around one in ten dates missed
+    if generator.random() < 0.8:
+        completed_until = CURRENT_DATE - timedelta(days=generator.randint(0, 60))
+        task.complete_until(date_to_string(completed_until))
+        missed = [date for date in task.completed_dates if generator.random() < 0.1]
+        task.completed_dates.update(removed=missed)
+    if generator.random() < 0.05:
+        task.status.archive()
+    return task
+
+
+def _random_date(generator):
+    return date_to_string(START + timedelta(days=generator.randrange(3 * 365)))
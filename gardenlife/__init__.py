@@ -1 +1,47 @@
+"""
+Gardenlife is a garden management application.
+
+The core modules, which contain the models, scheduling, summaries, and storage,
+don't depend on PySimpleGUI, so they can be used without the GUI, eg:
+
+    import gardenlife
+
+    gardens = gardenlife.Database().load()
+
+The application is run with python -m gardenlife. Core classes and functions
+are imported the first time they're used, to keep importing quick.
+"""
+
+from importlib import import_module
+
 __version__ = '0.1.0'
+
+# The module containing each core class or function
+CORE = {
+    "Creature": "organisms",
+    "Database": "database",
+    "DueTimeline": "timeline",
+    "Garden": "garden",
+    "Journal": "journal",
+    "Plant": "organisms",
+    "Schedule": "schedule",
+    "ShardStore": "shards",
+    "Task": "task",
+    "build_timeline": "timeline",
+    "due_tasks": "timeline",
+    "export_calendar": "ical",
+    "garden_progress": "progress",
+    "outstanding_tasks": "progress",
+    "sorted_organisms": "summaries",
+    "sorted_tasks": "summaries",
+}
+
+
+def __getattr__(name):
+    if name not in CORE:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{CORE[name]}", __name__), name)
+
+
+def __dir__():
+    return sorted([*globals(), *CORE])
@@ -0,0 +1,5 @@
+"""Runs the gardenlife application with python -m gardenlife."""
+
+from .manage import main
+
+main()
@@ -0,0 +1,76 @@
+"""
+Contains a class to save changes to the gardens in a background thread,
+shortly after they stop being made.
+
+Changes are recorded in the store as they're made, with the items they change
+already encoded, so saving only writes what was recorded and never touches
+the gardens in use by the window.
+"""
+
+import threading
+import time
+
+from .constants import AUTOSAVE_DELAY
+
+
+class Autosaver:
+    """
+    Class to represent a background thread that saves the store once no further changes
+    have been made for the delay, in seconds, so a burst of changes is saved once.
+    The time taken and the size of each save is logged.
+    """
+
+    def __init__(self, store, logger, delay=AUTOSAVE_DELAY):
+        self.store = store
+        self.logger = logger
+        self.delay = delay
+        self._condition = threading.Condition()
+        # Monotonic time the next save is due, or None if there are no changes to save
+        self._due = None
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="autosave")
+        self._thread.start()
+
+    def changed(self):
+        """Schedule a save for the delay from now, replacing any save already scheduled."""
+        with self._condition:
+            self._due = time.monotonic() + self.delay
+            self._condition.notify()
+
+    def flush(self):
+        """Save any changes now, rather than waiting for the scheduled save."""
+        with self._condition:
+            self._due = None
+        self._save()
+
+    def stop(self):
+        """Save any changes and stop the background thread."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self._thread.join()
+        self.flush()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                # Wait until the delay has passed without any further changes
+                while not self._stopping and (self._due is None or self._due > time.monotonic()):
+                    timeout = None if self._due is None else self._due - time.monotonic()
+                    self._condition.wait(timeout)
+                if self._stopping:
+                    return
+                self._due = None
+            self._save()
+
+    def _save(self):
+        start = time.perf_counter()
+        try:
+            size = self.store.save()
+        except Exception:
+            # The changes are kept by the store, so they're saved by the next save
+            self.logger.exception("Autosave failed")
+            return
+        if size:
+            milliseconds = (time.perf_counter() - start) * 1000
+            self.logger.info("Autosaved %d bytes in %.1f ms", size, milliseconds)
@@ -0,0 +1,496 @@
+"""
+Contains functions to convert gardens and their items to and from a compact,
+versioned binary format, which is used instead of pickle.
+
+Data starts with a magic number and the format version, followed by a table
+of the distinct values used, and then the records. Each record has a fixed layout
+for its class, with values stored as their position in the table, so repeated
+strings are only stored once. Dates are stored as integer ordinals, including
+strings in DD/MM/YYYY format. Each item's ID follows its record from version 2,
+and the next ID to give in each category follows each garden's details from version 3.
+Data in an earlier version of the format is read by the decoder for that version,
+and data that doesn't start with the magic number is treated as a pickle saved
+by an earlier version of gardenlife.
+"""
+
+from datetime import datetime, timedelta
+from functools import lru_cache
+from io import BytesIO
+import pickle
+from struct import pack, Struct, unpack_from
+
+from .completed_dates import CompletedDates
+from .constants import SCHEDULE_CACHE_SIZE
+from .dates import date_to_string, string_to_date
+from .garden import Garden
+from .gc_pause import paused_gc
+from .organisms import Creature, Plant
+from .schedule import compile_schedule
+from .status import STATUSES
+from .task import Task
+
+MAGIC = b"GDNL"
+ITEM_MAGIC = b"GI"
+GARDEN_MAGIC = b"GG"
+FORMAT_VERSION = 3
+
+# Stored in place of a count or a list length when the value is None
+NONE = 0xFFFFFFFF
+
+# Value table tags
+NONE_VALUE, FALSE, TRUE, INT, FLOAT, STRING, DATE_STRING = range(7)
+
+# Item type codes
+CREATURE, PLANT, TASK = range(3)
+
+HEADER = Struct("<4sH")
+ITEM_HEADER = GARDEN_HEADER = Struct("<2sH")
+UINT8 = Struct("<B")
+UINT32 = Struct("<I")
+INT64 = Struct("<q")
+FLOAT64 = Struct("<d")
+CREATURE_RECORD = Struct("<B5I4B")
+PLANT_RECORD = Struct("<B6I4B")
+# Followed by the linked creatures, linked plants, and completed dates
+TASK_RECORD = Struct("<B4IBIBIHIIB6I3I")
+GARDEN_RECORD = Struct("<4Iq")
+RAW_SCHEDULE_KEYS = ("start date", "freq", "count", "bymonth", "interval", "until")
+CATEGORIES = ("creatures", "plants", "tasks")
+
+# Modules whose classes are pickled, which earlier versions imported outside the package
+PICKLED_MODULES = {
+    "completed_dates",
+    "garden",
+    "organism",
+    "organisms",
+    "schedule",
+    "status",
+    "task",
+}
+
+
+def dumps(gardens):
+    """Return the gardens in the gardens dict in the binary format."""
+    writer = _Writer()
+    writer.count(len(gardens))
+    for garden in gardens.values():
+        _write_garden(writer, garden)
+    return HEADER.pack(MAGIC, FORMAT_VERSION) + writer.getvalue()
+
+
+def loads(data):
+    """Return the gardens dict from data in the binary format, or pickled by earlier versions."""
+    if not data.startswith(MAGIC):
+        return unpickle(BytesIO(data))
+    _, version = HEADER.unpack_from(data)
+    reader = _reader(version, data, HEADER.size)
+    gardens = {}
+    with paused_gc():
+        for _ in range(reader.count()):
+            garden = _read_garden(reader)
+            gardens[garden.name] = garden
+    return gardens
+
+
+def dump(gardens, path):
+    """Write the gardens in the gardens dict to a file in the binary format."""
+    with open(path, "wb") as file:
+        file.write(dumps(gardens))
+
+
+def load(path):
+    """Return the gardens dict from a file in the binary format, or pickled by earlier versions."""
+    with open(path, "rb") as file:
+        return loads(file.read())
+
+
+def migrate_pickle(pickle_path, path):
+    """Convert a file of gardens pickled by earlier versions to the binary format."""
+    dump(load(pickle_path), path)
+
+
+def unpickle(file):
+    """
+    Return the next object pickled in a file, including objects pickled by earlier versions,
+    which refer to gardenlife's modules without the package name, eg garden.Garden.
+    """
+    return _Unpickler(file).load()
+
+
+def encode_item(item):
+    """Return a creature, plant, or task in the binary format."""
+    writer = _Writer()
+    _write_item(writer, item)
+    return ITEM_HEADER.pack(ITEM_MAGIC, FORMAT_VERSION) + writer.getvalue()
+
+
+def decode_item(data):
+    """Return a creature, plant, or task from data in the binary format, or pickled."""
+    if not data.startswith(ITEM_MAGIC):
+        return unpickle(BytesIO(data))
+    _, version = ITEM_HEADER.unpack_from(data)
+    return _read_item(_reader(version, data, ITEM_HEADER.size))
+
+
+def encode_garden(garden):
+    """Return a garden's details, without its creatures, plants, or tasks, in binary."""
+    writer = _Writer()
+    _write_garden_details(writer, garden)
+    return GARDEN_HEADER.pack(GARDEN_MAGIC, FORMAT_VERSION) + writer.getvalue()
+
+
+def decode_garden(data):
+    """Return a garden, without any creatures, plants, or tasks, from its details in binary."""
+    _, version = GARDEN_HEADER.unpack_from(data)
+    return _read_garden_details(_reader(version, data, GARDEN_HEADER.size))
+
+
+class _Unpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        if module in PICKLED_MODULES:
+            module = f"{__package__}.{module}"
+        return super().find_class(module, name)
+
+
+class _Writer:
+    # Collects the records, and the table of values they refer to
+
+    def __init__(self):
+        self.indexes = {}
+        self.table = bytearray()
+        self.body = bytearray()
+
+    def getvalue(self):
+        return bytes(UINT32.pack(len(self.indexes)) + self.table + self.body)
+
+    def ref(self, value):
+        # Return the position of the value in the table, adding it if it's new
+        # The type is part of the key so 1, 1.0, and True are stored separately
+        key = (value.__class__, value)
+        index = self.indexes.get(key)
+        if index is None:
+            index = self.indexes[key] = len(self.indexes)
+            self.table += _encode_value(value)
+        return index
+
+    def count(self, count):
+        self.body += UINT32.pack(NONE if count is None else count)
+
+    def refs(self, values):
+        # A list of values, or None, stored as its length followed by the positions
+        if values is None:
+            self.count(None)
+        else:
+            self.count(len(values))
+            self.uint32s([self.ref(value) for value in values])
+
+    def uint32s(self, values):
+        self.body += pack(f"<{len(values)}I", *values)
+
+
+class _Reader:
+    # Reads records in the current version of the format
+
+    def __init__(self, data, offset):
+        self.data = data
+        (length,) = UINT32.unpack_from(data, offset)
+        self.offset = offset + UINT32.size
+        self.values = self._read_values(length)
+
+    def unpack(self, record):
+        values = record.unpack_from(self.data, self.offset)
+        self.offset += record.size
+        return values
+
+    def uint32s(self, length):
+        values = unpack_from(f"<{length}I", self.data, self.offset)
+        self.offset += length * UINT32.size
+        return values
+
+    def count(self):
+        (count,) = self.unpack(UINT32)
+        return None if count == NONE else count
+
+    def refs(self):
+        length = self.count()
+        if length is None:
+            return None
+        values = self.values
+        return [values[index] for index in self.uint32s(length)]
+
+    def item_id(self):
+        return self.count()
+
+    def next_ids(self):
+        next_ids = {category: self.count() for category in CATEGORIES}
+        return {category: next_id for category, next_id in next_ids.items() if next_id}
+
+    def _read_values(self, length):
+        # Read the value table, with the offset held locally as this runs for every item
+        data = self.data
+        offset = self.offset
+        values = []
+        append = values.append
+        for _ in range(length):
+            tag = data[offset]
+            offset += 1
+            if tag == STRING:
+                (size,) = UINT32.unpack_from(data, offset)
+                offset += UINT32.size + size
+                append(data[offset - size : offset].decode())
+            elif tag == DATE_STRING:
+                (ordinal,) = UINT32.unpack_from(data, offset)
+                offset += UINT32.size
+                append(date_to_string(datetime.fromordinal(ordinal)))
+            elif tag == INT:
+                append(INT64.unpack_from(data, offset)[0])
+                offset += INT64.size
+            elif tag == FLOAT:
+                append(FLOAT64.unpack_from(data, offset)[0])
+                offset += FLOAT64.size
+            elif tag <= TRUE:
+                append((None, False, True)[tag])
+            else:
+                raise ValueError(f"{tag} is not a valid value tag")
+        self.offset = offset
+        return values
+
+
+class _ReaderV2(_Reader):
+    # Reads records in version 2 of the format, which didn't store the gardens' next IDs
+
+    def next_ids(self):
+        return {}
+
+
+class _ReaderV1(_ReaderV2):
+    # Reads records in version 1 of the format, which didn't store the items' IDs either
+
+    def item_id(self):
+        return None
+
+
+# Readers for each version of the format, so data saved by earlier versions can be read
+READERS = {1: _ReaderV1, 2: _ReaderV2, 3: _Reader}
+
+
+def _reader(version, data, offset):
+    if version not in READERS:
+        raise ValueError(f"Version {version} of the gardens format is not supported")
+    return READERS[version](data, offset)
+
+
+def _encode_value(value):
+    if value is None:
+        return UINT8.pack(NONE_VALUE)
+    if value is True or value is False:
+        return UINT8.pack(TRUE if value else FALSE)
+    if isinstance(value, int):
+        return UINT8.pack(INT) + INT64.pack(value)
+    if isinstance(value, float):
+        return UINT8.pack(FLOAT) + FLOAT64.pack(value)
+    if isinstance(value, str):
+        # Strings that are dates are stored as ordinals if they convert back unchanged
+        if len(value) == 10 and value[2] == value[5] == "/":
+            try:
+                date = string_to_date(value)
+            except ValueError:
+                pass
+            else:
+                if date_to_string(date) == value:
+                    return UINT8.pack(DATE_STRING) + UINT32.pack(date.toordinal())
+        encoded = value.encode()
+        return UINT8.pack(STRING) + UINT32.pack(len(encoded)) + encoded
+    raise TypeError(f"{value.__class__.__name__} values can't be stored in the gardens format")
+
+
+def _write_garden(writer, garden):
+    _write_garden_details(writer, garden)
+    for items in (garden.creatures, garden.plants, garden.tasks):
+        writer.count(len(items))
+        for item in items.values():
+            _write_item(writer, item)
+
+
+def _read_garden(reader):
+    garden = _read_garden_details(reader)
+    for category in CATEGORIES:
+        items = getattr(garden, category)
+        for _ in range(reader.count()):
+            item = _read_item(reader)
+            items[item.name] = item
+    return garden
+
+
+def _write_garden_details(writer, garden):
+    ref = writer.ref
+    microseconds = (garden.timestamp - datetime.min) // timedelta(microseconds=1)
+    writer.body += GARDEN_RECORD.pack(
+        ref(garden.name), ref(garden.location), ref(garden.size), ref(garden.since), microseconds
+    )
+    writer.refs(garden.owners)
+    for category in CATEGORIES:
+        writer.count(garden.next_ids.get(category, 0))
+
+
+def _read_garden_details(reader):
+    name, location, size, since, microseconds = reader.unpack(GARDEN_RECORD)
+    values = reader.values
+    garden = Garden(values[name], values[location], values[size], values[since], reader.refs())
+    garden.timestamp = datetime.min + timedelta(microseconds=microseconds)
+    garden.next_ids = reader.next_ids()
+    return garden
+
+
+def _write_item(writer, item):
+    ref = writer.ref
+    archived = STATUSES.index(item._status)
+    # Levels set from the window's sliders are floats
+    if isinstance(item, Creature):
+        writer.body += CREATURE_RECORD.pack(
+            CREATURE,
+            ref(item.name),
+            ref(item.org_type),
+            ref(item.notes),
+            ref(item.age),
+            ref(item.appeared),
+            int(item.impact),
+            int(item.prevalence),
+            int(item.trend),
+            archived,
+        )
+    elif isinstance(item, Plant):
+        writer.body += PLANT_RECORD.pack(
+            PLANT,
+            ref(item.name),
+            ref(item.org_type),
+            ref(item.notes),
+            ref(item.age),
+            ref(item.planted),
+            ref(item.edible),
+            int(item.impact),
+            int(item.prevalence),
+            int(item.trend),
+            archived,
+        )
+    elif isinstance(item, Task):
+        schedule = item.schedule
+        raw_schedule = item.raw_schedule
+        if raw_schedule is None:
+            raw_refs = (0,) * len(RAW_SCHEDULE_KEYS)
+        else:
+            raw_refs = [ref(raw_schedule.get(key, "")) for key in RAW_SCHEDULE_KEYS]
+        # The lists are stored after the record, with their lengths in it
+        lists = []
+        for values in (item.linked_creatures, item.linked_plants):
+            if values is not None:
+                lists += [ref(value) for value in values]
+        lists += [date.toordinal() for date in item.completed_dates]
+        writer.body += TASK_RECORD.pack(
+            TASK,
+            ref(item.name),
+            ref(item.description),
+            ref(item.assignee),
+            ref(item.length),
+            archived,
+            schedule.dtstart.toordinal(),
+            schedule.freq,
+            NONE if schedule.count is None else schedule.count,
+            sum(1 << month for month in schedule.bymonth) if schedule.bymonth else 0,
+            schedule.interval,
+            schedule.until.toordinal() if schedule.until else 0,
+            raw_schedule is not None,
+            *raw_refs,
+            NONE if item.linked_creatures is None else len(item.linked_creatures),
+            NONE if item.linked_plants is None else len(item.linked_plants),
+            len(item.completed_dates),
+        )
+        writer.uint32s(lists)
+    else:
+        raise TypeError(f"{item.__class__.__name__} items can't be stored in the gardens format")
+    writer.count(item.id)
+
+
+def _read_item(reader):
+    # Items are created without calling __init__, as their values have already been validated
+    data = reader.data
+    values = reader.values
+    item_type = data[reader.offset]
+    if item_type == CREATURE:
+        _, name, org_type, notes, age, appeared, *levels = reader.unpack(CREATURE_RECORD)
+        item = Creature.__new__(Creature)
+        item.appeared = values[appeared]
+    elif item_type == PLANT:
+        _, name, org_type, notes, age, planted, edible, *levels = reader.unpack(PLANT_RECORD)
+        item = Plant.__new__(Plant)
+        item.planted = values[planted]
+        item.edible = values[edible]
+    elif item_type == TASK:
+        return _read_task(reader)
+    else:
+        raise ValueError(f"{item_type} is not a valid item type")
+    item.name = values[name]
+    item.org_type = values[org_type]
+    item.notes = values[notes]
+    item.age = values[age]
+    item._impact, item._prevalence, item._trend, archived = levels
+    item._status = STATUSES[archived]
+    item.id = reader.item_id()
+    return item
+
+
+def _read_task(reader):
+    record = reader.unpack(TASK_RECORD)
+    _, name, description, assignee, length, archived = record[:6]
+    schedule = _decode_schedule(record[6:12])
+    has_raw_schedule = record[12]
+    raw_refs = record[13:19]
+    creatures_length, plants_length, completed_length = record[19:]
+    lists = reader.uint32s(
+        (0 if creatures_length == NONE else creatures_length)
+        + (0 if plants_length == NONE else plants_length)
+        + completed_length
+    )
+    values = reader.values
+    linked_creatures = linked_plants = None
+    start = 0
+    if creatures_length != NONE:
+        linked_creatures = [values[index] for index in lists[:creatures_length]]
+        start = creatures_length
+    if plants_length != NONE:
+        linked_plants = [values[index] for index in lists[start : start + plants_length]]
+        start += plants_length
+    completed_dates = CompletedDates.__new__(CompletedDates)
+    completed_dates.__setstate__([datetime.fromordinal(ordinal) for ordinal in lists[start:]])
+    task = Task.__new__(Task)
+    task.name = values[name]
+    task.description = values[description]
+    task.assignee = values[assignee]
+    task.length = values[length]
+    task._status = STATUSES[archived]
+    task.schedule = schedule
+    task.raw_schedule = (
+        dict(zip(RAW_SCHEDULE_KEYS, [values[index] for index in raw_refs]))
+        if has_raw_schedule
+        else None
+    )
+    task.linked_creatures = linked_creatures
+    task.linked_plants = linked_plants
+    task.completed_dates = completed_dates
+    task._progress_cache = task._next_due_cache = None
+    task.id = reader.item_id()
+    return task
+
+
+@lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def _decode_schedule(parameters):
+    # Schedules are immutable, so tasks with the same stored parameters share one
+    dtstart, freq, count, bymonth, interval, until = parameters
+    return compile_schedule(
+        dtstart=datetime.fromordinal(dtstart),
+        freq=freq,
+        count=None if count == NONE else count,
+        bymonth=[month for month in range(1, 13) if bymonth & 1 << month] or None,
+        interval=interval,
+        until=datetime.fromordinal(until) if until else None,
+    )
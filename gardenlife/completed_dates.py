@@ -0,0 +1,74 @@
+"""Contains a class to represent the dates on which a task has been completed."""
+
+from bisect import insort
+from heapq import merge
+
+
+class CompletedDates:
+    """
+    Class to represent the dates on which a task has been completed.
+    Keeps a set for fast membership checks and a sorted list of the same dates.
+    The version number increases whenever the dates change.
+    """
+
+    __slots__ = ("_dates", "_sorted", "version")
+
+    def __init__(self, dates=()):
+        self._dates = set(dates)
+        self._sorted = sorted(self._dates)
+        self.version = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._sorted})"
+
+    def __getstate__(self):
+        return self._sorted
+
+    def __setstate__(self, state):
+        self._sorted = state
+        self._dates = set(state)
+        self.version = 0
+
+    def __eq__(self, other):
+        if isinstance(other, CompletedDates):
+            return self._sorted == other._sorted
+        return self._sorted == list(other)
+
+    def __len__(self):
+        return len(self._sorted)
+
+    def __iter__(self):
+        return iter(self._sorted)
+
+    def __getitem__(self, index):
+        return self._sorted[index]
+
+    def __contains__(self, date):
+        return date in self._dates
+
+    def add(self, date):
+        """Add a completed date if it isn't already present."""
+        if date not in self._dates:
+            self._dates.add(date)
+            insort(self._sorted, date)
+            self.version += 1
+
+    def remove(self, date):
+        """Remove a completed date if it's present."""
+        if date in self._dates:
+            self._dates.remove(date)
+            self._sorted.remove(date)
+            self.version += 1
+
+    def update(self, added=(), removed=()):
+        """Add and remove any number of completed dates, sorting only once."""
+        added = set(added) - self._dates
+        removed = self._dates.intersection(removed) - added
+        if removed:
+            self._dates -= removed
+            self._sorted = [date for date in self._sorted if date not in removed]
+        if added:
+            self._dates |= added
+            self._sorted = list(merge(self._sorted, sorted(added)))
+        if added or removed:
+            self.version += 1
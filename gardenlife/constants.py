@@ -7,7 +7,21 @@ from dateutil.rrule import DAILY, WEEKLY, MONTHLY, YEARLY
 ACCENT_COLOR = "#004225"
 VERSION_NUMBER = "v0.1.0"
 
+# autosave.py
+AUTOSAVE_DELAY = 2
+
+# database.py
+DATABASE_FILE = "gardens.db"
+
+# dates.py
+DATE_CACHE_SIZE = 4096
+
 # garden.py
+# Changes to a garden's items, passed to the garden's listeners
+ITEM_ADDED = "Added"
+ITEM_REMOVED = "Removed"
+ITEM_UPDATED = "Updated"
+PROGRESS_CHANGED = "Progress changed"
 SEASONS = {
     "Spring": ["March", "April", "May"],
     "Summer": ["June", "July", "August"],
@@ -15,6 +29,19 @@ SEASONS = {
     "Winter": ["December", "January", "February"],
 }
 
+# indexes.py
+INDEXED_FIELDS = {
+    "creatures": ("org_type", "status"),
+    "plants": ("org_type", "status", "edible"),
+    "tasks": ("assignee", "status"),
+}
+LINK_FIELDS = {"creatures": "linked_creatures", "plants": "linked_plants"}
+
+# journal.py
+SNAPSHOT_FILE = "gardens.pickle"
+JOURNAL_FILE = "gardens.journal"
+JOURNAL_COMPACT_SIZE = 1 << 20
+
 # manage.py
 FIELD_SIZE = (25, 1)
 IB_TEXT = ("CREATE/UPDATE", "REMOVE")
@@ -22,6 +49,11 @@ MG_FIELD_SIZE = (34, 1)
 MONTHS = [str(month) for month in range(1, 13)]
 RB_TEXT = ("VIEW ALL CREATURES", "VIEW ALL PLANTS", "VIEW EDIBLE PLANTS", "VIEW ALL TASKS")
 
+# measures.py
+MEASURES = ("impact", "prevalence", "trend")
+# Trends at or below this level are decreasing
+DECLINING_TREND = 2
+
 # organism.py
 LEVELS = {
     "impact_levels": {
@@ -47,6 +79,14 @@ LEVELS = {
     },
 }
 
+# schedule.py
+SCHEDULE_CACHE_SIZE = 1024
+
+# shards.py
+MANIFEST_FILE = "manifest.json"
+SHARD_DIRECTORY = "gardens"
+SHARD_POOL_MINIMUM = 8
+
 # subwindows.py
 CREATURE_HEADS = ("Name", "Type", "Appeared", "Impact", "Prevalence", "Trend", "Status")
 PLANT_HEADS = ("Name", "Type", "Planted", "Impact", "Prevalence", "Trend", "Status")
@@ -54,7 +94,5 @@ TASK_HEADS = ("Name", "Progress", "Next Due", "Assignee", "Length", "Creatures",
 
 # task.py
 FREQS = {"Daily": DAILY, "Weekly": WEEKLY, "Monthly": MONTHLY, "Yearly": YEARLY}
-
-# base64 images
-ICON = b"iVBORw0KGgoAAAANSUhEUgAAAEYAAABGCAYAAABxLuKEAAAkGXpUWHRSYXcgcHJvZmlsZSB0eXBlIGV4aWYAAHjarZxplmSpkYX/s4peAvOwHDDgHO2gl9/fxSOzcpJUOq0MVUakh/t7gJndweDJnf/9x3X/w5+eY3e5tF5HrZ4/eeQRJz90//kz39/B5/f3+5Pr1+/Cz6+777+IvJT4nj7/7F+vh2+vh+8X+Hyb/FR+uFC3r1+sn38x8tf1+y8X+rpR0ogiP+yvC42vC6X4+UX4usD8TMvX0duPU1jn8/3r859l4D+nv+y8a/vwdbdf/50bq7cLL6YYT+Jl/o4pfgaQ9F9wafJD4e+YBm8MfE3+q++V+jUSFuRP6+R/GJX7NSrffwr/5PVfgsLN3uuOF35ezPr9+x9fD+XPi+/eEv9w52Tf7/zT63OE++t0vv137+7u3vOZ3cyVJa1fk/o2lfcTb1wseXofq3w1/iv83N7X4Ks7stcI+fbmF18WRoiE5YYcdpjhhvO+WzCGmOOJje8xGoHSaz21OKIl74hQ1le4saWRdupEywhv4tX4fSzh3Xe821no3HgH3hkDFwtKBae//htf//RC9yrlQ/D9+1oxrqgkZBiKnP7mXQREYfjkUXkL/O3r1z+KayKC5S1zZ4LTr88lVglfuaU8Si/QiTcWvn9qLbT9dQGWiHsXBkPW5+BrSCXU4FuMLQTWsROfyYV6TDkuQhBKiZtRxpxSJTg96t58poX33lji52Uwi0AUyqgRmpEmscoAG/nTcieHZkkll1JqaaWXUWZNNddSa21V4DdbarmVVltrvY02e+q5l15769310eeIIwGOZdTRRh9jzMlNJ1eefHryhjlXXGnlVVZdbfU11jTSx7IVq9asOxs2d9xpgxO77rb7HnuecEilk0859bTTzzjzkmo33XzLrbfdfsed36MW3Cesv339/aiFb1GLL1J6Y/seNT7a2rdLBMFJUcyIWMyBiDdFgISOipnvIefoFDrFzI9IVZTIKIuCs4MiRgTzCbHc8D12f0Xup7i5nP9fcYvfIucUuv9G5JxC908i93vc/hC1LbYxn9yLkMpQi+oT5ccbTp+xT5Ha3/7ufn5h2l573rFDGK2d7WcbJ841u0Ggh1luXmBEfhlJwOg9KHaWXRcKE4V7xtoA12V1646trMlMUx6Eaq101+YD+7aW705zl7ALq36P3R5qY8LmbNshtCuF3e+6q+Q2I0vcSgaJYIILmLa7dyo71DmqsdA193FF2lzaxqWCmRpBn7mN0ldNfc3IO3I7Jd+Ym12bVprGHiY5QaJVkuj3FRrVhVXHOam1kbyNWPdZK+RhutYeNQyxxkq5XvI2DEtz+BZu34lUKOZrCZn/wSJ/IyKAWB2524e5Wxhnk3ExZxvDWIFRrDlqZ8U7IcZRW8jbk43NWJteS7+ZujmjUB6J1aHW3v2LRIt++ut7dJ0yRG7wz3mOnRZNt1/6Zdk75toKRQBHVgo+A7N7ElIqOM6TdiNTGksdthsdAguSQJdUPgTZ93koOlKaWRAq0p3EGEYakbVz7M1lZ7VL8prtUudKE8pO+pVe3NTi++67fssHT/JapzgYXSAhjjHs0fw+zVYfweYtpCOsH4qLKtMU9178a5J6/BkkjpHP5ESYjTTzh1QlfcPY496VSrmbRK4qyD0rF60usRDW/KpUq+UK/YwAmPCJzAjXtVV8ajUlFpOCnXfXcd/Ib/R7Tf3E5a671nc9M1UqvvfjP/V6auifBNGs/vg9MJZFKgOly+ZyC6QbIS/JhkGGgGtnl5PBnDl6vhXJ0mss2VM2tRcgZ5zm05mAU+RK259wV3aMBLZbq54DUHE15sTolcyEN2cwsewMdYG+cUXLhyyZy3cTq/aAvJ42dnGQ0jGyneKkTqJve1sDE/loupuQlH25iRmYy0KdEzvFDVZ6yt5YRwTO4o2O+fWZ+m312jEWNnFjVPatM7Gm9QCLF1gBXkDFlYYxUDBrDiNvWYnMCy0gtCCDxEtkK/M9nVWfrGK+/uXU7D1wzb0MDQnYcpEDaJfajgcABwQD/N1yHDVGQmnWrcB7c5xeEnMNifI+BXgr1MEwUryQjNS91pyLjjVOugcuuVxnupwO4OD1m5cd442EfCmDlOFDAGJVUClt44N+kBr5ZHi1T2ioIHrIvAMdJXwWKBiYAqsEfpbPJctZ4Vz0ZLmJpVrgbHm3OnzbbbYAEbWp/I11OgayBvlq65YIJVE9K/ezK3LKr16VWrHzKvFr+bDoiNxeaz8lon3fXBKl5FqasUFjgM8mTtRJu76my4RqZsWKsWbEqjUwgfUhRZPtuXshIsSxT+MeMTsQBi6IIDETzZURgGaVED4krpF64BIsMctDnVeY3UMn4sjRTt5kzxb5OLAsEGzSjrGfdQGATuasiETQipCYY13w8WrScDcjbh23Bn2QffmxGSXvwCfslHA4LX2wbwgLi1WZ7F6dEIVLih7RC+AH7kXWoFXGB0kV/oIzKT0XJ8NmbKTPzCQX+LHEKvC+LbI3k7bMZB/qkDIF28k5srht9M5CoxSWCghF+uErGlXKCg8jPCQ/a6Q60/rD0OtQHGQzDICIVxT83kX1NYtn2k2EN5zVuEBRuAQ+6V/kx7r9OzjygpvImvgqx7mwEJN130MwmQgWErqkzCq07OtV+EixUxl/uCOeji730kFIU9Z5IeWFXtMcIv1ksAYyk7aneCYcLynRpKoq9BeDYDD7I/6hZIntQY2qJghnn3XMfRw0SCllD8mDZY1sqNT5hK+zsNAIMNiI3ppiV1IHCTlA2M6r0AEZUZBg7bp4NjgVqCpQoNZFbeDdeguVUuuEG4HaDR58cvgAbQgOMnTlcz2XhwoIxmgu5oOiAjNGD2eQK1wSKmUdYMcehVFEe53ST89QDioCiN2gyPG2yZGG8pynO0xhFjauQ6IeitV4a7Xno8kssLPEJJY7RJa4MKFgRWIrCj1rjFQgcsxdRJVtIlWM1YC0h9IM+ITfkcigCuyJh53gDusce8VHL3UaIPHABHICJld3E/VAGiFOBwx6VL5EnBU5A7NVcSxkhqy1pCKBLgeBXle96GWuvCjimkI1F1BqF30btok/xNvkx9U066lckLWj7vSFDLqDIuseQiGXVGWi8jE7vIY8A9mxHAcvfaQKodk5oAS4I5x9PAq28CsgawioTb/mDQaAxxm5tBFjc4RzeX2aOokj7FOrzeMxFawz9BEILatACNHLK/ZGSUEQ+WECFgMalYwNLq4aDzGoUMXpNseTYGWYtY35acaKg4LobWBn70Cl4l0q8J10AyxVCjBUd3iGdaiIdYlMJN/Ao96A6RQLCwwCjSScygzAPqqS+QIyceBIYOOmTzAiaoJkQ2kJ1NAEfRHiA2bA3QtaozpBt/R4BUmHFOJqPmFtEEIoPLAmyiLg11ivgohg1TxX4H+syI6jkS6nooo6amP4mAxuCFJAqbNgA26rgEYEfoGS4UBNDGbGMe2O2CmSmzkWyI21iqwPpeQVZQU7MYeFIJE0RlRgJCj5pzmvw/NT1FNZ0rs/QGuX282KEjoXdRbjjUwK7fbWCgJvp1FzEAA5AeogHft23AaS7fsFi8t85CcX++37QDJu1hkLDmnHGSiFjvhkpqSkQ0Qxdrwil52IxItKOzjYTfWR9KiQiprgIuDqkDMdvYJJt730zE8wAa3RifooETBOpR83FMcQyEuQj5Uu6CmYAfIPsaYIAEplAlvrGIisuDJQbILbCNxOndQFpaNrX7+SBAIkGcKYTahSQCekGV7cEP+JlKO05ampFEKxdjEnn0KeFyRgyBRHpaJJnY2JDXEsTQe9SjIW3o5wxRDZeTYBHMxQx3tTTA6gQoSSXxAkPJcCb5U5hwSOAorOAgRl2fFxaHAMxBiaaX99MWq6pdPrch2Zze2QLdyXtQDM2w5GJcdRpI2lhwExfDP+oT2ZD50B09Q1Mmxn1F3M24EA0IusZWZQJgDBqOQDxCJ/4PyNYTpRAhpAHF2jzilcL6lTdWmycTYEO6A9APdbI/zDUh/ihkWjCC6QiNltDBkRiZRFLRuGA2aBf3wuMZjd0slJM5flCIEenIbkngAFUoGVAtIfpkL+AwA3BhQPF6jIiQhwUHQdcW4js0ad9EEeS9CUgpCI6OyO0gOHQGHAJgtNI0KrQ8P/Rgw4HwA8Iun72GgB0g/4kYakFliOTSVJr2AigU5sMjrSd9ZRwADW3OCl9e92IBYl39QPopTWYjxUVSYHMEADspeJ9PDv7CxUzCuI7dFsy2OGkIcEGFk7XcXnBdQSPJ+zBwusyxof81Qiy/ebk/xrPhQZFo6RUArHNSlV5MUOyA/sK7LAFmqTqqEyWUhDqTMwmPvI5cHc6jovaBUwPHLHazaMH/lR0XXookDB4snUemNxUzgkE+lM/ZVG+SyZY1Cr4H2pEcqvgyKJT+ASvHdo9DIeSbM2R3CCUR34MVQVuAqvlWihUY+dykYmiWl3A3KC4LKJSYEfc7cWSF1qSr9bEBXEU7rfLJQd6SNKLGCAOvMHLFFk8hlXWy/g3FrvZ1toSDlr/BF3Qe4seIEYy/cUaBQzD4hgeIraZBigughcF1OgF0hwbq+22ikOFGzAOLg7ScuszlCv2MtKbSA+cM1N+k39gjxv3EuGgdT2qDKYGNlPHkIUbkkBBZyjoSvOpsLBxogSoG7seSxWKiOr7Gl0fDAmACZiWgBmAKsYcfHZIZUR6QbxIwqpOziPmomC3TjiykLu1nQz3DwZEQ2JImOfJt4EqY82zRWEpPQTucPCD+U0VH2Ax09TBiz9oStTAfHNRGtnkUgrrB9UCK+RBS1iIVC6uJqF/4xqdgXsh/dLEj+ToqATCqLI/2GEQ5HXiMpzLDZ6mNVJpMSpjuvhLQb5JnjW8tlqY6zGNCkoxMfq7z4zeenfClagbCYVCOYR7IpUgVUdEQ0Jo3jQmxRIRkYikHLnLncsdeOUuGi9kkW/Bi2NjBwtuLSM7ckjPPfv0iKdMoKtgMxgaVFTFkU+Xm8OMMY6v02woGLDHxWU4MYUQYEsO2WUCUHNDrM5PBiL6CG/cLsV1oea1EEZVB8mwox13goW4EVkyNUN+EjLw4TmKe4RnC6AWkKtx4GQ2snHtan8/JQZ1U/ck5poSMNGrvNvkPxdbQgeqIKzZj+A/y0qejAwYOWhl4Ltvt2jA3pRQJMd1ZnSC8UF4CCI8J8LwQ8z4kPmGK24MIU5p+EJT1GRMWSsVtsp1wFRqq9xu9o318TXEjMszUQswhTwCvI0oEng/oy/yt3I44waQykY7/UeLyzWpI4lnTLBQghQbEp59adj64Cn1kSGbTjcPwBuSK0UXst7UvGK/8jSk9hEW75Fxs+1CUSLmJr+aQ8aWI5R2lbucK9JgfE8T7si2qSmzMT2FAKiIL4maD94ERkjxJI6z4w1k70X3Y6xj7KiAHxUqYOLKD4qtNZY5jPjik3K+E9omM96ORwW6AhTLaOUjOtTwBXZhdD6jMmYfldvDTCAuBC3N/l7A9dHglJzS7tNyC6FpAEgCC25LzlQGUS8iJoHsJF60Zl6qFIdWuJtF6dHwh11RPyOSNCtXhGLt6Pa8bIXEwshheBAcoxjYfFJK3WEVol8hYzGRzHoh4wU5W3a6UYXoKdVj5v0XtSzuuAyzk5qKi7+DWFCIKnKQ8FMpCZ1xWwNwKXmOyqWCtgm6wbWkJigWqpDNp1Md9r1RGuw+vAGCQ82lO3J+UDEamLNUzaElwwCuKcezd4bzpdRlwHH/4LHSD9PheDVUahUDb4CRL6IAwrVImAYPbA/yQ3lx2sNT8aSSDGgzcgxJkJKgEeg+SBG0EgQ5lPCoIVabJguwor5pboMdde8qbUIMS/iciNORZuyyGqcQHAbXHgqhHytwhlk4SRSmftlNchAQ3Q3NUweQdjEE4cPMGmqVxsnNTDFhfErwBqzIklykGgWCVI3+CgAliDDwrVQ/EHilUrq6svgffghY9Up046Yd6/ZHowBZ1jmzjwZlvZlJoHCRqXeCD4icMeLjKUKt3q9DKtrC7dX7apya0QEkwH9MCRgMLoj907todGgW9h0mJz59dWCOpnA35LZQlAhybgr9ExBW3C8WklzyWXAuR+4Wu1jUJCsukgzqoyyCyAi2L2ZH0RVZa6MtIGX66Kcd3GMnfGrpX1wcT76iykpvAHdLSkPWiK8so5CVFva6a0mkw2U9ARsp4JlxNi50UiDCkDd25DAwjeM9lzdQ3MT4QdwKnjDVzIWOacmYt9ULtoInXKRZOqauQN9YuXQ0V27O2YFFdYiioAkZdw12jXMS45qbo5AnpPxaMK8NlWEh9Ke4yhOG0cIGJGp0BNzAwghEpXFamvjN6C/oE49hQplQ2o2J3J1sco2lSdq2yG0QHBtoYESZIY4FFkKerAcjBJLZVMHFsLusigoBDBlCsBMzVVxpFHQzXUUut2tVlYEcjQZciErtph4QtfJiQQDk9ZHLdsNLqKtcT93yrxSu0wlOQHn6ytcFPZldXF8MG5lqgy4hbkq9wPNx5HsxD+djQeq+IAOYSOoteU34X64fat3SjKsS9zxkpgC/GrcIcby3pVx7II+SEMbZGrZCh4IgXYXoMICQTJZnFWWgaWoGOfEuEGjKPuvbS/UP3pmP2Mcmi3TZiAzLB9BMZh/nmC2clmdszrb2ACkYPoqgnMiurJgORxWl9Cfo5acelCsM1UdyRGyQq1cVywJdAU2SWtejhegoITQZa0YNsA/7NhqHEKLuR2pPyyG2jR4FjVCenevV23ExSaJhPgAsTtsiowgMN43HIx6LiCAEp5FyzGguMmFt01J2pB4JxI1ssM2C4ZcTKNoJ5cqEnlsoJy/MGYgndqSEoS8MbWLLZVxkGzVqpMKLprar9GWYPCAbVQI0VrLElIHAxSpCXAGO4VXv+qDHD8X2EftEl7NBSK9TkfDMFibQIK9IL5q/RbSCXEJ/rymuvoBrwW/pIzern3UBtFQu1PJFAm/9hgWofH26WX/3qgh38nRoBYzqwEyAbXrbVBSVWqreNwAyl9nD4JJh/WouMfFEhG+bBePgz4l0aEJvMAlZPAZqSZTMEA47AI/qvHm4pAVA9LQKVgZZhDD1kYO5U94jIEPjB5yWR2jiFensgPTR9LDrVvbokD4cVvtPr8DlUgy4dEGMD+0JVllFTEEU400IIjLQjKCBxB5aJkzRSOQYk0rtQZQoeAr5RS2ji8ZXjQLlbSTq00oUJk6AXRxoAfsnMyqzClF1yP2l1frBI/UkoSwd0Q7ybiRKFv9NqCVZJ3KRGQJfKJTeelbfnWZa9ZFiaZsdXoToJXSjxmojS6T4iZTQBYlI+mEC4XAlxkcBEJC0IhjRGZYw5KDyRiQryweNIgmAWt8FTpv+QbSL0JoTQTU6tsxAXgXI+dt+v1dlIjVhTyejQw0PMdQf1D66tnd9tk8BKPebhqlqAke7RYPNU/jqK9hAZJqf9ddHQJoeJczCTMIolY7dfp1Jy6gbRlwm4JDFGnThhrZyORcjnx8RxlE7Yug+oRYOtAEd5FoU50Q3GXWthGkKEdoMtIjy8R7+X5AwiMBmBs/6BLmgs5cdnzOczShf9rQ8Yc6OdpSxCaICytUiM6SDsjcET+btL9nFh3QCFHa641XK6AzfFulZlFfExOKQOC9sH9KCLBPdZj2uoCnrm5FTWpkOGw61BhkbHTY5+0x4mMPYtq0L4+8IP0QSEf9RpD/SJIvVCVerahPBheRBYxo7LePXcVdktwDg9ewWMCCtqcAM7IB+Y3Fl0LHsDISjMhAG/FLNbKwgW5WqRsQWfuSo+tQwStF8BxDQsD5vFxOWLOqySIZiTFHVkXIBn0SbXefEOwXva8TLIQJOszqH6Oz1ZlTM10sjbVS75goMY0mDuEmVOc+2tUiHtDbcswJWkPREURAKejYEBC/oB6YR2cfjiLHjKY2fiF2vBEJ4SNaW4VUqM4YrisIMoJU40AQnz66DGbKn6JDc+4c5DkPgdGhHSz+t3/rVMjQ6aOBvNd+f8QHCkpfg3texLbMFJRLoSYMOJTOsmXtEzBJNbnxgp1STBIo0tKKFn4NQ8mggbdFEVF++OsglM4tVYhywYy8g9kO4ht8wKuRgNqmRLspgk2HXmDaSD32Ci4xQu1HqJOGzoK0tAOEA7Kgjex6S1YfnPoBmbIOMcyIykCZCVKc2qmNUUB+ARNAGtkosmekgIdiwsLVqouJwFE3EvczQWXG4CnpqcNC2IRO+BkKgAzrQ9jXa1fDM3GfZCGXElMpUJbOZyR0tcgl+s7cMa1iyVSPurQOP1eBkEaOAQsrSj2Y9oniMHWf3g4Ng84FY0seogJyv1AYdJrxhX1Im+TrkJQJXQL7QYEpYsyNl7A3HmzAQwIs+M7L/Q+RynM9dJDc/PGEGLWG8ORN0hSkEzVH5mVtG5BolaWFixDLZA2EPsNM6royTMm18RIiReCt9+CO9vFwtRP83HvqVOwROqal4gLjR6E8bpU7M7X8KA3TvjtlfDVn8nrqPCR1w0BO14b6AuUOgPs0NjIeGXkoi6sT1Fp7dObhZjrQQSGiYol4Jzdq9cOhPI/6GNoi7dOaVPKSutK9GcTV2YWifXTGibqmCGrQ1vopqb4zVBQu8sRtHXNDOJe5ydryDh+n0+EIVdLNGW5QdeUPD6oOXw8GaKOWiXDXIS/yCMubTGetiESDUxmfWpVqXWqPfGrPS51Q+ACEBjNAvxpBgqpeM6K/FzVVt7uw/V/3Y5ZPrZAJj3kxAkmlMXGliJW9iG2BcwAXwxMCHSRcUnfWcSd1VBBR6OO8OuIXeNEBIuQxAY696XAP2fcIdSAzrxn1q30h/DNqx+MrloMyl/xcaYh8Sfd0eNPW3hEEC3FDxJA8mA+mwAYPlVgLlNACjEPRwa2Zg8OyZH5gzTGuyLOk40NZApuLgzcMVz756ngNGUzYR8O1QjdkkXVMm0Age4fElsuGglvD4yW1ylIbag/oeKGMS11v84YykttUl6+Dtnd9ncCZqNWDqUHGTnhFFLbwqFtDhFd1dlSd5Da4YtIhg6U4Q5JqoF3lOLNFLTRSFA51gDPSrk7fO2/zJflu3bcu3KHyMKhSy/4+GaROlk6O8nZ0yDENkntTKcEBi7AxjgLjXLaUiPatZHC1HdNAHlyRjs7BGpWIPcnDZdE+xKSq5yVEqC5Q9CSRtlCn0EUmkgo3HW8CCxkuuvbKf+EDlv/jTotOtWEhvAR479iDB95HlgJeGDoAwq8SlZJgblRlwFZSAFhENXIQbfwVEF8dRnHrjR21V8UR2P9aBEIhx6PzHp6a1Yac6XR4G0MnWUuDP0jmvDKCviEeKDa3TWfCMiiaGXTWSRGsLWaLeE/YvMl1YeCuWkjEQmfGtPfY1RM+cgSYZsQPCSkR2XUW66kbFKB4xApulPQwgkP0cc7o2Sq8WdownkdH8VjMpQ4pUzFHhW6uQc7oHEzRdgT+qOJaxlY/YY4r12ATDE5y7FO7rfY2cL30aSQiNfrXYm06KdjJQ1wOlNIy/27anFSDWM4otyoDEhlOS8wxyg5TtWDYSD1zl4UYHegLSTKkdi24Dy/DEBa0hfLESnS9pY6PpCfRt/6oC55FFWh5sH9m90wo70go9iD6qMJDbSCjFAy5YDrmoUPn+x10ubxVe2JDhwDUYSB+6pC4ghWaX+IchEWONfVWUrIKpVLteKlIyl+dvDDR1qy4yvIyEbsIgaCP13LCqnq19byXppP9mwxiAGmlNvQY5AKaXqd5pGa0nw+1dOlSJKFc0yRpXVWHtGnziYlv7WfYtZ7eJgJBzt1jjW+IOjX1Hju52hmCT5iGjkTgU4h6jm6+PQPggewH3QcyBp2TQkTVoaVjq9ohbK/3MKBeYWtES1PEsb7dZFCw64QmOKCj0bFE7oynr7BTbEDU9th7FrO0dxhuaBcjAp98TA0SZAj2SMd9VYHFRZ1SoThB96+DxP/qpNhXqVdI+KJ1aoHhGe1Sqx465S1VHW2vs+5zyYLm0Ib6P0gJ9dbq6Dnid7XvcbvYjtxmlZtaKYjCnHDZrS7mFnViRcWmPKNgh7a3d9Baw/TaSCsFxoDXj6j4ymRUkycbpGGMDrgIojmdUYXwtMecxR2I5U2RTTioRTj4eLUM1CzvQ21h4Caqracj+drOdD1/Tl3qBErReXA9HhCoH1CukjV5bDxo0mGbQAjrReJp3weLM17rLVz5/uVyWfhQ6g1TlsKVI9NxPh1qngOjh+Er6lsnHf15ZGvggo6ZqjZYYbQX2rS78Y5FFh3YkZTR6AgzRhtFrCoDQii5uGumHuCiibJAGm0Ktuq8TU46iXBJSMS5NLT6D7Ns+fOq40p6lAPHgTqjpNR3zgg2nW1CqJLBDFsOpahRHMWhhP+dCJ7SXbwROZEGSlRHOec+sIjVMnWaqqjlDRDJsA9KUHZbKg6BiyVqruhxLO5Rm0w96G/znTHWjq62qVqMB4eLGWclif3LjwgrQxL5qVJge+q4xwzwUZtLO11Lu/W3kYOi/kj5Y0HL1hESHfhfj30XiiNiFZPa9+h3pVYYTmfwtTGuThl0j4bM2oJGHzachTYbsMxH2/rZq5ULzpieb9BRKDAc2YwiQqA6JFOTSJ06M1WnNkJan9p6A6NMsdJ5AtgeMZO08Zd1ZjAIIyhSr8OFE3Hy2fJBvsbXMRvxNZ6i1gtrM9CivufH0pDZvzzw4f5Y3KznQrYjOYBy3NwYI0Pa0nFqdLCWIB9US4anoR1EvAgOrWhbRIcJyPvp1fjNOqSNqGWhrbyTHu8kNAmgXX8tqY5O6tQ0WOixV/E6uAgaVatAZsEng3Lm24Ut73DXvjr0TzlRzleHCaKsHBljctfvBHPRPorTLnvH6KJcskfzq0CpN2pGXrHKQ6pJcff6GC4qW7031d1oevgSgSBd5tSQRlZsMZGpMUSggI2j3hzihdLTiQjStBPCY1Ts1PMpWCjYHNrRaSymEVwP78QF2X5HeDujvOnd/R0ex2i9kWAldIpIZ42Z2vR6OFEBZqhqcQaipscemAXqGKl7tcmM8EjylDrrocc7tNn9ltZDk2A616Z0rjV07buDpux4nRpTRLCRqqXw9aSDminwHBIOPTaATh181OkA3V+FhlTQwal4i1ru7vVlIhRHDcRaQJn4Tt7ed/umJxDvAGLw8zoDTYlhvVbR+eyzF05eB3CQBU56kVyZelqyKP2bDnKiEQgHryNadcYg6MktTCWjx8HhXOFh0RAWmiCYNUQE9NN0oFOH5bUJ1wRfE610lh4O0uamf0/A5aDne4rO7FZBsslEkgKC9K6HvABlZRv0ht2deh4NRAM6zg0gCc5FCWuvFdk+JxABN+UPRs0Atq2HK4qDGLKcB0imRxe0cV6obT2m0ZRAOlM3MqRNRe8LLL69jUOlqAdLWIcOGpbmyHD0j0696BEGHbgFLKtOlnbmohPyTQq1YA+zjmYnNb3fEzY13qyt1PAaAE6bX78+RPS3vxedhcP8whFO3WI9RpV1OpSoFf+AELtLIRewVE3g9xQQ4F104C5Rxaf7qE2EY95gV3IR5c+an4GRnLj//CSgjjvCvcyPT5CuEP+SToeOV5ggFiwoDVTVMwCTJaRcwRS14bUNTuipEB10LLcM3grmE2Bko4cki3ZBtjZq0LHocD06NnRgFTdzF1YUFsg6XIgf0cNA2hSQky3qNgHvOo8ArqF3F7aauNSi84cy12jf0R676XlaAJ7vs4oDMpYhIRZIVHBVNWXqk2JiSw0AJeL74kP6oKBXxcq2zsJUPe1TXcY4U637wGytP5lUIRyvIxEfbAwHPa786AW9sCJ8DpuG96i6wUfEigJ3XU9JMh6daI9qAA+qB9mTr/ZFdMp66uARgiAJKgHlTcaVXlhoclt3pfS6OZ2ebpIeI7UwvZmeYMfLHQGKacOCoU/TyciOG5tUMKUaZUt6hS14g2wOIoKas4aIgAPV7wUVECmJ3DdfqumxCj1YDHKgViiaAYJePByWpau5JhbUOQgHxAyUA8PaDakwuGRWrBGcBsCQqjprp3Y9LpLB4a0R8WhjhqY468EJnWdHHi9QTn3FDz+qLRj/8wcz0ZD6YbGWHj/H6qI9QACdZdJGXv9sn2OJcPJkXwRpcdvSLkddS8kxHXfb06FTqAeWQYda1dVZl3K5gLQ21quezdKDUlWHFtXkALYoTVAw6+kgUH0f8LMOt/D7LDQBFMkuPe6QYG9RovZo9BidT2Ci6dgqg5WEC2ifI/FOHZDGemrTKBG5zizzjUAqeqZK7i/XXAb4wLXUltUZDT2rENE272Cp9Pg7nnrUNpsWySO+WtUJPa3Zf7jEf3137/8GYFB0/wdG88235iPDBwAAAYRpQ0NQSUNDIHByb2ZpbGUAAHicfZE9SMNAHMVfU4ulVBzsIKKQoTpZEBVxlCoWwUJpK7TqYHLpFzRpSFJcHAXXgoMfi1UHF2ddHVwFQfADxM3NSdFFSvxfUmgR48FxP97de9y9A4RmlalmzwSgapaRTsTFXH5V7H1FACMIIQi/xEw9mVnMwnN83cPH17sYz/I+9+foUwomA3wi8RzTDYt4g3hm09I57xNHWFlSiM+Jxw26IPEj12WX3ziXHBZ4ZsTIpueJI8RiqYvlLmZlQyWeJo4qqkb5Qs5lhfMWZ7VaZ+178heGC9pKhus0h5HAEpJIQYSMOiqowkKMVo0UE2naj3v4hxx/ilwyuSpg5FhADSokxw/+B7+7NYtTk25SOA4EXmz7YxTo3QVaDdv+Prbt1gngfwautI6/1gRmP0lvdLToEdC/DVxcdzR5D7jcAQafdMmQHMlPUygWgfcz+qY8MHALhNbc3tr7OH0AstTV8g1wcAiMlSh73ePdwe7e/j3T7u8HFqBygh7kSeoAAA+caVRYdFhNTDpjb20uYWRvYmUueG1wAAAAAAA8P3hwYWNrZXQgYmVnaW49Iu+7vyIgaWQ9Ilc1TTBNcENlaGlIenJlU3pOVGN6a2M5ZCI/Pgo8eDp4bXBtZXRhIHhtbG5zOng9ImFkb2JlOm5zOm1ldGEvIiB4OnhtcHRrPSJYTVAgQ29yZSA0LjQuMC1FeGl2MiI+CiA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogIDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PSIiCiAgICB4bWxuczppcHRjRXh0PSJodHRwOi8vaXB0Yy5vcmcvc3RkL0lwdGM0eG1wRXh0LzIwMDgtMDItMjkvIgogICAgeG1sbnM6eG1wTU09Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9tbS8iCiAgICB4bWxuczpzdEV2dD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlRXZlbnQjIgogICAgeG1sbnM6cGx1cz0iaHR0cDovL25zLnVzZXBsdXMub3JnL2xkZi94bXAvMS4wLyIKICAgIHhtbG5zOkdJTVA9Imh0dHA6Ly93d3cuZ2ltcC5vcmcveG1wLyIKICAgIHhtbG5zOmRjPSJodHRwOi8vcHVybC5vcmcvZGMvZWxlbWVudHMvMS4xLyIKICAgIHhtbG5zOnRpZmY9Imh0dHA6Ly9ucy5hZG9iZS5jb20vdGlmZi8xLjAvIgogICAgeG1sbnM6eG1wPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvIgogICB4bXBNTTpEb2N1bWVudElEPSJnaW1wOmRvY2lkOmdpbXA6ZjE5MjE5MjAtODdkZS00ZDAyLTg3MTUtMDFhZGExMzFhYjM0IgogICB4bXBNTTpJbnN0YW5jZUlEPSJ4bXAuaWlkOmM1ZWE4YjI0LTYxYTYtNGQ4Ni1iMjg1LWY2OGJmNWRhMDZhMyIKICAgeG1wTU06T3JpZ2luYWxEb2N1bWVudElEPSJ4bXAuZGlkOjgzMDZjYzMwLThjNGItNDc0Ni1hOThmLWRlYzhkOGE4NDg5MCIKICAgR0lNUDpBUEk9IjIuMCIKICAgR0lNUDpQbGF0Zm9ybT0iV2luZG93cyIKICAgR0lNUDpUaW1lU3RhbXA9IjE2MjIyODMzODc4MTUyMTAiCiAgIEdJTVA6VmVyc2lvbj0iMi4xMC4yMiIKICAgZGM6Rm9ybWF0PSJpbWFnZS9wbmciCiAgIHRpZmY6T3JpZW50YXRpb249IjEiCiAgIHhtcDpDcmVhdG9yVG9vbD0iR0lNUCAyLjEwIj4KICAgPGlwdGNFeHQ6TG9jYXRpb25DcmVhdGVkPgogICAgPHJkZjpCYWcvPgogICA8L2lwdGNFeHQ6TG9jYXRpb25DcmVhdGVkPgogICA8aXB0Y0V4dDpMb2NhdGlvblNob3duPgogICAgPHJkZjpCYWcvPgogICA8L2lwdGNFeHQ6TG9jYXRpb25TaG93bj4KICAgPGlwdGNFeHQ6QXJ0d29ya09yT2JqZWN0PgogICAgPHJkZjpCYWcvPgogICA8L2lwdGNFeHQ6QXJ0d29ya09yT2JqZWN0PgogICA8aXB0Y0V4dDpSZWdpc3RyeUlkPgogICAgPHJkZjpCYWcvPgogICA8L2lwdGNFeHQ6UmVnaXN0cnlJZD4KICAgPHhtcE1NOkhpc3Rvcnk+CiAgICA8cmRmOlNlcT4KICAgICA8cmRmOmxpCiAgICAgIHN0RXZ0OmFjdGlvbj0ic2F2ZWQiCiAgICAgIHN0RXZ0OmNoYW5nZWQ9Ii8iCiAgICAgIHN0RXZ0Omluc3RhbmNlSUQ9InhtcC5paWQ6ZmU5YTQwYTMtZGQxMi00Y2I1LWI1ODktYTMxMDFkNDkwMDBkIgogICAgICBzdEV2dDpzb2Z0d2FyZUFnZW50PSJHaW1wIDIuMTAgKFdpbmRvd3MpIgogICAgICBzdEV2dDp3aGVuPSIyMDIxLTA1LTI5VDExOjE2OjI3Ii8+CiAgICA8L3JkZjpTZXE+CiAgIDwveG1wTU06SGlzdG9yeT4KICAgPHBsdXM6SW1hZ2VTdXBwbGllcj4KICAgIDxyZGY6U2VxLz4KICAgPC9wbHVzOkltYWdlU3VwcGxpZXI+CiAgIDxwbHVzOkltYWdlQ3JlYXRvcj4KICAgIDxyZGY6U2VxLz4KICAgPC9wbHVzOkltYWdlQ3JlYXRvcj4KICAgPHBsdXM6Q29weXJpZ2h0T3duZXI+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpDb3B5cmlnaHRPd25lcj4KICAgPHBsdXM6TGljZW5zb3I+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpMaWNlbnNvcj4KICA8L3JkZjpEZXNjcmlwdGlvbj4KIDwvcmRmOlJERj4KPC94OnhtcG1ldGE+CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAKPD94cGFja2V0IGVuZD0idyI/PqvGcUQAAAAGYktHRACoAMcA3dWWQYQAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAAHdElNRQflBR0KEBst/n7IAAAXR0lEQVR42u2ceXic1X3vP+ddZpNG20iWbXnfwcTgGBEwwQJiY5tCQpsUGtIaQktcSJOUlIZC7u2TpIGW5iZN700KlCTGIZAbSGnDJYB3NrOYmsUYzOJdyLKsfZnlXc759Y+Z0YYNkre69+l5nnk0ZzTzzvt+9P0t5/c7r+AUH0uXrlT89xg6xoyZOra6esInL754ReRkf7d1qkKZNu3caGvrvkczmfQ/GqNTF1+8wvlvMMDevVu/ImLqM5nOs8LQm6CUGY1qJgBrgDTwtFLWjP8vwFRUjI8bE3yjeI69vV2nGyOxhoYvjNTf/Ay4BEgAi5TiV0uXXh9ZvHjEnz9mMHbhcVxHV1fzhUBNca6UlQTijmOP9MIaBk+MMfN9PztZa+IXXnitOhlgLgTeB77kusnjFj2UYuqgqcRiJV2g3GjUHel3vDx4UlJSfQCYCqQsK7BPBph2YCxwTxj2/WtNzfTk8QAjIvHi86qqCW/FYiXdgHieHtHnU6nJKy3LPZCHkjowe/aCu0VIgioRcawTDsZ1y94EegsX85mOjv0PLV36p5H6+qvUsSnGai0+Hzdu+hNKEYiID0ZG8vl5885/z7ad1nHjZq8955zlf1VWVr0XxAN8y0JOOJilSz8bWpbzaHGudbBs+/ZnfjeZjEQWLbr6SHAqCj7geuB24EfAvcDdwA+B20BVAH5d3WmPjhkz4RWQtGWprG2rEV3Url1vqCDInhaPl2wTkSzQCTSCtEMiHMkxjik3eOyxVZJKTfiHjo6m3xeRCEBvb8eNxpjnHCfWAoSAAs4GPgssAz72UX8QkbzJHDjwztJcLj0xEomvdV23af/+7V1HEhkwHZgNjNm//41KIBKPJ1/JQ5H3lbKawU5v2HCXnHAwAGeeuXjb9u3P3Xro0M7/Baje3pZzgbru7gMBqM+B3AjMHWKCwBWuyzjHpdy2cJVCBLLG0K5D3g1DntYaERNtb98/H5gP3Aw8CfwjsK5wqHLgK8B111133dSGhgYmTpxYgHqAtWvX3vX448+sTyarb588+fS+p55abUZszscKZtGizyvLsip379721ffff+uvQMnkyfN+un//G7+vdTCm+CV/GI1yTjzO5OpqxqWqsWMxVMTNn4TjIJ6HCUPE9zGZLOnuLpp7e9np+2zKZtmkhzjeF4FfAbfedNNNY1asWMHYsWMP58R5/fXX+cY3vuFt3779b6ZOPe9vd+9+3pwUMAAXXfRHrogZ19Ky78qdO1/9n0GQLgOYrRRfTJZx9rSp1IwbR6K+ntKzziJWV4ebSuEmk1jRKEhe3TqXw2tro/Pll+l84AFMNseOlhZ2thxkQzbLs/qDUWn37t3E43FEhKamJvbu3UtbWxvNzc2UlZVRWVnJM888w+rVq7Es51fz5l10zWuvrfNOCpizzlqmdux4/i99v/e7IuImgdvKymiYN4+q+fOpXL6c5Omn45aXF/+Uw/+0Q0JF0N3NO9dcy6vZDHf29OD7Pk1NTQRB8IHvvu2220gmkzzyyCO8/PLLH3mu0WjynoULP/3VXK43eOGFR+VEgokCPwW+AHB1JMq1s2Yx6cIGaq68kuTpp6Ns+4hAgAEoImQOHKDpZz+j+6WXuKm9ndYwxBhDX18fbW1txyWBnDDhtKumT1/wb08//Qv/RDnfBPAo8CmAZY7DtLmn03fTTVQsWYITjSJKoUQOF3qGAOnbs4e2devofey3iBj2ZLO0+D7GGLTW5HK547bkOHSo8VszZy545qKLrm3dtOk+faS1ztGOSAHK4uILky68kOu/9z3OXrgQ27YxQCBCRKkBaQ4CYoKAztdeo/Gee2i7bzXeO28jRkMYsj2T4flcDq01vu/T1dV13MBo7dfEYqWvlZWV75k27eP+nj2vHVfF3AssKU6WL1/OnXfeSV1d3ZCoIIAHxAaZTJjJ0P7ii3Q89BC6+SBiNGIMojWiNRjDId8nDEPCMKSzs/O4r+B7ejqWjhs3bbNSZAr51nEB8xVgRXGycOFC7rjjjn4oMsx0fGOIWhZhNkvbc8/Rcf/9mJ6eARjGgNaINnlIWuMHAUEQ0N3djdb6uIPxvMxMEUmJhK3HC8wZwN8XJ7Nnz+b2229n0qRJHwBSnIda0/LSS3SsWoVubUW0AaMxhwFCAVZKa7q7uwnDkBMxgsBPAWUixJYs+XJm3bofSyEYydGAUQUTigHU1NRw8803M2/evCNCaW5u5u677+Zz27ZRgTqs2RRVU3xNtKYkkzlhUPI1Gu0Yo5OWZceee+6BswrFrY/lK36Ra0YbrlcAq4uT66+/nu985zu4rvsBICLC5s2b+fa3v43v+/yfsjLK4bBm0/+aMZgwRKczNPkeV3d3n+hioXbdxDtBkKkqlE/yEcmOPDEaxbjAtwab0MqVK/uhDFaM53k8+OCDrF69uj/culrnnXFBJWawWgqQTBBgsjkQQ61tM1kp9omcECJTppz1b64bbezqahnX2rr3c0PVFJ4/GjBXFqpgxGIxVq5cyZQpUz4Apbe3l+9///ts3LixH8oUEeLDzcWYIaoxnof4AZCPZLZSfD4S4e8876gufKllscaYI9V79Pjx0zZEIvHWCRNmdmze3HGe7/fUDSqO7RpNPebGAdpTuOyyy/IKGASltbWVW2+9lQ0bNvSH2jAMabBsTBjmFRGGSP8jwPg+Op1BfB8pQEHy+U59LHbUqfifJBKcqw7vKcaNm7k5Eol3AT0g7bNmzb85FqvYBVBZWff2zJkf//lIFTMdWAhQ4zjccMMNVFZWDvErzc3N3HLLLezevRutdb9axBjOjseRIPigSnx/iEqK64PirMqyuSUa5c5RquaWSIQKy+J33Agv+t6wqmO8b/Lk038N+ErRIiK7x4yZsLumZuIOYAZIQgTjLFnyR9bzzz8+O5frvkBrPQskCWwH/gU4UDje7wH8juNw5YwZzFu0aAiUvXv38vWvf52DBw/2A9Fao43hm7EYFSKYYojWGglCjO/lfcwgIMMBgXBRPM6rQcBaYz6kFKooKSkhEolwWSRCQyyG9PUxW2sYBMay7HDOnPN+HI0mOoEeEVptW/UFAWLbNIngKkUVoJ0XX3zyD9Lp9gcO830/AB4E/qLQo+H8eJz5CxcyY+JEciKEIrz77rt87Wtfo7Ozsx9KtTEsdxw+EY8zRikkCPPOtVBvkVAfUSXDAUVQ3FBayq7eXnYNc8SxWIxkMkkkEkEpxeWWxWdjMVxAJ5NUeB4XK4uNYnCcaHbOnIU/TqXGvQVklKJZKasjl8vpzZsflsWLr+kKw/BdERKAcerrl63ZsWPLjw4efG+liHGHJX8r8vJiHsC0eIKy88/HAUqVou2VV+j65jf5uu8j8TiuESoQyvKuHdEGo/P+xPgBEgSHVcWHzfuM5tFMhqtcl0ZtuF+HJJNJSktLcRwHEWGOUnzOdTnNcfrXYsqyQISzHZuNgSGVmritpmb8G0A2bwmqybYlt3nzwwKwfv3q8NOf/vPedNr0ibTjAOnZs+v/Yfz4aS82Ne28tq1t/3lh6JUURBqWl9f63d0HSwHGlJdjwpCgr4+DTz5J509+yhhjGGPbCAqREDGSz2y1zqvE9zF+UCgxfJhKhs4F4U3fZ13O48p4nPGOjVVayuWJBE0ieMYQVYrxlkWtsrAoBAIZ9BOos/Lxpa+vc6IIfcABpdhjWW7XunWrhqw1Hn30h9Kf+QZBznOcSHMymXpuzpxUo1KfqA4Cv9KYMBqJxLoPHNg1q7v74IUzlKLEdehYdR8d9/4EkcHrnLwyiioRrTGBj/GLHY/RqaTXaP41k6HOsvmz0lIiJQnssjIsx2G8EcYNgpAHMBRKf74kUFmITOl0e22+U6D2KCVdGzas+tC02nn22YdlwYKrc+XlNBtD1hjGOI6bArcUiBhjagA+6bqIUoXoMgBEdJiPNsYgYVEhXuGkPwTCYVQCwjbPY6Pvc2UszvhEHKeiAisSyV+0MQPpwXB1DFIJRkDn/ViJ1Z+R2O3tzaqqanz3xo0PfORawwHYuvVBAfyLLvpCm1KqB+QAUALEOztbGvINqAIU1x3IVgvmItrki9m+VzhBRq2SHqN5JJNhsmXz5WQZscoK7EQi/14zVBX9AIaphEEPE4ZIIV0fWDh65SMN+UPymE2bHjBAbunSlZ4x2W7Lsq2urmYfIGopTC6H5Ub6gZgg6M9YjxRVPkolgvCG57HJ9/O+pKwMp7y833kOSSKHqANEzFBIRbMVwQR5v+YM7VeV2LalRg2mONasuUcAXXh4AKEIJpvDD8P8yYS6375HqorDqeTXmQzTbJsvl5cTq6rCisX6L3K0Kin+XkQwOS8vtiH5jq0sa2S965Fkvu0AYeFECYLRQTiCSl73PJ7xfa6MJxhXXlCJUnkHflQqKazZJL9Cz78PfDGDOgTxQGs/csklX9TGiLEs16xde68cLZhugPbCFx3OYY5GJd1G83Amwyzb5sZkGdFUFXY8flxU0q8Wz+/vQHiDksJkshIRmRoEQRYkrXXY96lPrchks7nw+ecfktE29d8DeDwMC4u8EfqSgjKKcxHhVS/Hz9NpLo/FWVReTnzcWOxYLK8SYzBihkIpwipGveLvzAAUMQPRKv9+g/EGOgrdBTCOE+t13WhpT09HQ2dny2U9PR2LjTFztdZ10Wgk3tAwdIfGSBxRVdGcHqmsJGXZI1KNARrDkPeDgG5j2KM1TcZwQ6KECVWVRMrKCsWP46OSAiW052Gy2f513L+HIX8dhiQSVU1aBzHP600NFKTcvurqyb+tq5vxw4qKqu3GqPRTTz0w4tJmB7ATmNEchKSi1oeaiiB0GsPqvj4eHVbEVkqxMxHnY5bFZZ7HfNfFHq0vKaik3/EPU5jJeQUryh93d2HxWVpa8XZb2/5PDG2jBKUtLTuvamvbd2lt7fS/mDNnwc+LwWakfaUzgAUzgNOi0Q81I0+Ev+vtZf2w1bBt29TW1hKNRmkX4YUwZFcQMNe2ifcf4uhUUnTUxvMwwUBzMRC4IwzwgEmT5t6bSo3/+46O5moRM2OwtYiYaDrdU59IlK1OJP4w3dX17IiL4b8FvvSg73O5EVzFESPOm57H88OgRCIRampqsCxrIGUX4XURVmez/Hk83l+cEjGjVkkxK9aDupUi0Kg1PYBlOdlUavzWSCTyxqRJUz/zwgvrJvl+ZrlSKpVIlPckEuVvT516xr9HIvGe7dtvH1WXYA3Q2QaV7/gec4+gmk6j2TCsqBSPx0mlUiilhhTKi89fMIY/1oYSxVGppPi6zuUGeuGFn1tN3pRTqUlbXDfSoZTy1q79hQH2AnctXXqDikZdZYymr69HNmy4T0bbV/KA+4GvPpnLMTcSHaISg7A1l2NLEDB4P0IikaCqqqofyuHAiAhaDIIavUqKjj7IlzQG+5ZuEe4rKLe2dtIaEXpEjD80kb1LBu8pONo9eP8b0I9pza6iHQt0aM09vb0I8Kelpcwu7GwoQhkM4nCPsdBfv8lX9Aq/M6agDJOHVQjZzVqz3vd5wPP4hZdjTS7HvnS6v6xRNKPnC2ul0tKavdXVdVtAum07MuKW5mi6BLsKqrn2/2Yy/GWyjFe9HFuDgCsTCaoK2yGn2DZRyxoC5XAqKT5fYtt5ZYxAJa+FIX/j+/3HMMaQyWQQEW60LC51XRChXYQfFdQyYcKsh4AOpVR63bpVI95qNtpdm38NZNYbw3d7ewD4UmlpPxSAWdEo1anURypFRDAinG3bH6kSEaHHGH7g+wOfNYZsNtsP+J+M4a0wxACPFDqYFRXj3x47dspTQJuIjKqiPlowjaC+DbDFGCY5zkCztxBVyquq+GIk8pFQRIRrbJuaYqQyw8O0GRRxhK1BQF/R0WpNJpPJ974HjdeNYYvW/EYEpaxw+vQz/xnUIdumy3XH6xMJBoj/ANRmD7grnSZTkD4IuC5WJMKiSIS5H6GYc5VisePmVWIGq0SGpP/FheG6MERECIKg33yGj33A7YWkcsqUM3+dTFZtBw5qbWXXrfuenGAwmdBxElcDh54VYVW6D68QWouVtqgIX47FOOMIcC5Qii9ForjDoky/GQ1SEJLPpN/Ummw2i/chPabnCueRSk1+bfLk0x8CDliW6nzqqftHvTvgqHZUGRN0u27JS8aEf/C2iBtqzRmOgyWCFYuhCt3AetumVoQ9WpMRYRZwreNweSRClEGlBZNP7BiWtwCI1ryfy/GbI6hk+CgpqW4844zz73AcZy+wz7Lcvj17XpOTAgbgk5/8dGNLS+O2MPR/700RpzMMmWtZOIULEMBVFlNti0sdh0sdh0tcl7phFf3D5SWiNRIE6FwO43m0hSFPmo8OKIlE1cEzz1z03UgkvhPYbVmqc+PGnx/VrqOjBrNv3w7q6694r7e37RXPS1+xUySyIwyZpRTlWmOyOXQmgw4DJAzzux2KNeLito+wMC/2tX0Pk8vlN0EXKoUAXSI8MXztNSwzSybH7Js374Lbo9HEe8BupaxDmzb9Ijja6zumm7Def/9NFiz4zC7fT6/P5fouOWh0+WNhSJUx1NkWriIPIAjyF+v7GM/PL/Z8Hwn8/kZc/yaiwYuwgo9KAM0iNAFXKMW5ShEChwrvqamZunXu3PPvjERie4Ddtk2L59l+Y+Pr/KeAAWhsfEPq65c1JxKlD/X29k4Pw9ycl4zh5SAgBaSUwinuOjjMRR9uF9bwuaMUF1g2iy1FqwirRDiU384Rjh0744XTTvvEP9m2fSBfHrEOiuA/++z9x7Sx5rjctrd373aZOfO8vunT5/4mm83tzOX6zm43uuwpY1gfhsSNIY6ixFJYcBhVHBmYJ8J7xvCY1txhDK8WXq+unrytunriK01NOz7V1tb88bKyqk3RaPw92w7TmzY9eMy7jY7b/YyNjW9SWztVjx075c3q6gm/9P2gz/dzc9ImLH1JhP+nNevDkNAY0iJ4kq/y+SKECB6QFeg2wgERdmjNWq35rtasFeGtwvfk96+cfe/UqXMfTqe7qzs6DiwIgkxFW1vzovLy6vXRaFnr3r3bjnnz3gm5C37Jkj+2tPbjQZCrbmx894rOzkOf7e4+eC6IezTHc92SnpqaiS/V1k7aVFEx5p18gV46u7vbJ73yypOPFK8jkUi9dM45yy6PRJz2tWtHfgvOSQMD0NBwvbLt0FYqjIlQnsv11bW2Hli0f/+OrzhOxAmCXNT3+yqHJ5lKqTCRSLXE48mm0tLy3WVlqe2p1Nh3yN9D3ZMvtaoOsNJgyrZuXffLnp6W/g0706Yt+MzUqac9sWHD0Uek0a6uRzWefvpeAcLzzrs6XVoaycZiJR2HDjUu9byeSSUlE7fX1y/9jmXZ3el0VyIMg1KllHLdWCaRSGa0DkUpAsAHlSlA6QXSSpEFgljMlVzO13V1M/+2r6+t3hgdB+jqOnSpMaetB4JTUjHDR23ttIqWlt17gXKlVK6h4eorlOJdEZUGsUFZIAqUKCUaCEEFIAEQKoXu6xOzZcuAY21o+BNLqWxpU9POZXv2vP7jMMxVJxJVL9fXL1+czUZ6t2xZJaecYgaPiy9eoTZv/peryN+qh4g4SqmcCN3RqNvleR7RqAXkt6iJRMhkkFjM8GER5umnf2IuuODzfRMmzH68tLR8+Z492/9HNts7VSSkqirBKWlKQ1aqlqW0DhcPFMdLOkEygL9mzapjcpLPPvtLc/75V6XLy2vfmD+/5jpjtGVZTu7JJ++VUx4MGGVZTkmhZUNJSeXbItJl245/PI6+efOvBPCWL7/Gt+1SdeiQfcx5zEkBE4aiotFEq++nCyn8xAdEaLcs97jeLPDEE6uPWNw+RRWjiUQSb+YXe7XPTJgw/XFQvevW/dRwio6T8m9SotGYGTNm8m9dt/SdadPmfU0p1bpx4/0Bp/A4KYo5dCiQ8eOnvDd+/MSzRVxfa++UhnLSx7Jlf/Zf5h9x/Qc9TAKXS7FpNgAAAABJRU5ErkJggg=="
-LOGO = b"iVBORw0KGgoAAAANSUhEUgAAAZoAAACWCAYAAADns06sAAAMB3pUWHRSYXcgcHJvZmlsZSB0eXBlIGV4aWYAAHjarZhpcivJDYT/1yl8hNpQQB2n1gjfwMf3hyYlv6eRHB7PiBK71eyuBchMJBjOv/55wz/4KSnVUEWt9dYiP7XXngcnFl8/43lPsT7vz08f77P0+/XQ2/uhzKXCsbz+tff19HH9/cDHMfmA8stAtt4fzN8/6PU9vn0Z6D1R8RVlTvbHit4Dlfz6IL0HGK9txdZNf93CPK/j+/lXGPgL/nYlTr8m75u//l+V6G1hnpLzKalE3nPJrwUU/0uhDE6E91yUGxPHUerzHsvHSgjId3GKv6wqfM3K59mXrMj+Pimlve4IXPg9mO3z+O31JN8HPzwh/mXmst5n+ffrx96o+hLkJ8Z3W7j3vHY3aiOk7b2pjy0+Z9xI8Gt5Hmu8lD/hXJ9X52WBeRYp33GRqcl5T5m03FTTTiPddJ7jSosl1nwyKck5LxLl14wU9bxKDOSp+ivdrKWXXYyMLdJbPHefa0nPvP2ZbiVj4p24MycG80zn4G9/x+vHge51yKfkwST16clPyg5CluGZ83fuIiHpfuBIngB/vL7+eF4LGZQnzMYGR5yvIeYL/GDLcVSeRBduFI4vriXd7wEIEXMLi0mFDMSWiqSWouas6FDJRn4GA1kuNU9SkETyZpW5ltJIjmWfm2c0Pfdmya/LaBaJkNKKkppeBrlyYQM/Wg0MDSlSRaSJikmX0UqrTVpr2lz8hhatKtpU1bTrsGLVxJqpWbBuo+deEEfprWu33vsYTDoYefD04IYxZp5l1imzTZ02+xwL+Ky6ZLWly8Lqa+y8y0Yndtu6bfc9TjpA6dQjpx09dvoZF6jdcuuV265eu/2Oz6yl8ErrH17/e9bSR9bykym/UT+zxqOqH0MklxPxnJGxXBMZV88AgM6es2ip1hw8dZ6z2DOskMwqxZOzk2eMDNaTstz0mbv/ZO63vIVa/1Le8kfmgqfu78hc8NT9kLk/5u2brG2XuxVLeDLkNPSgxgL9uOHYyDa8qLHSfQj0XpXwtj3n9u0cq7eOuVtq1jWV1QPxioSiTzSS4HVpaSNOkoT/NcIWGwTQ+IhYzzTZv+vizqMK+2SYXqf2IEYAam5D5myHuOcjxMJkrjFjOx3aLnOqeiFjhruyx8ms1t487GsmkxJQmOQ6Rx5PYdNHpK+2T7U1rJ/Sc67r5iUROk/P5q55N93lRIIuba8xdj/Battea5Q4stxDzG2mOlDns5BTZYfsqRdL+wwlbWmuXZtehHsw4ux9pn5DPtEWuypbmXEkm4tTJXexlzYmuNub2cDisDvroi6MOe3c61p16+mSu+zATVquMlIRdgOKocsqeay5o7Fqmf3kMhcx7w1MI3C2hMqxWFzZk+ytMjSU2stEiT3fJMIz/pH5P3UMP30Af0dHZXO0g9YC1GvtLvIxwaKKVA+1bfjCQ9LDhtWWztERx5Ibz6Hm6cmyPU6Ajqq48zrXss48rrZyVhTd2k9qN67T94l3h9jI01gdxZakVMVF2V62ifC9RMfgTEtLRj1nywJkq+iNfugD+WBo0HpzOFElKwpxj14wyAc7cpcM2TMpQeUVTSrKglG9p7XZ02ZdGT7Cn8o8I52wp6FE6cKmfloBT5sxGU2H7jYtb4exQ2cANXh78BosD8bD3xYLg4N1uMZFHidwwPM08DuRMUmnKWSB4nrhbWSjBpkWXloPwoEZBNuoAYgvgKUFQLouyCDA2teFBHB7AFrCKl3ZfSHcw5L5xme7CQStTXjmLL0hwZOIbw2dCav/rl4EBrPCvuboePiduiSIR+RvHp4olgkNE2I0ksMAIc5tk6ExQ9oII2OzuU78O1JRzlwnnjKlUrlxSrpaGX1PYkLWB1Ed+5AjKlRBStBqKwQ7gSy7A6JBo7XzxPUjlpKGF/BZTGBDbuUiekx7JuSeZWO/MgQsFAU2WENKx9oAVoi2qXC1xnGYHSGpTnoEpt4tBB7twCD2HPdKYkCxonZ8vKgWN6RJWUIFHTONIsI+jywaDaQcWN/aErFHVUFBe1PSvjmGnz74/pgXkEeAyrb5oA+dxWnnmwIZv/pSiyZjwdKK8u2Bwc2E0WkF3BYpu6uBZQg5mk213pYryT7iHRDlqMfS8chTZLJBXF6eE2buQftC0RNokCY6Pz1F5BNCKL1KmrhSBR+wi1DdgKp5LEApUMdxPbmJdeZGoS1VylJWABROjeBGfG0bVDCwomkjw8oJLwOE29zvSk2Zh87xRAQZNYZTmknYHhARilJnEvQiC0h63ZOqTNVuuSO2bYXbxOsbNcFXUY5zERvRHN/IEQ7AqOWUqwzWK+daJo7yXFkzd6I3zkKpY7hQESZS4FPaHfxRHBC7BZWpKe4wKeAaKfatXaoYS0q3WywAqTyBuERuarDjVf4Cor1R1ouOIlwG51kxQrL4HMPBnlOlVjORERVgjRsA9eXpJDTBNUocZOgd8rRLQtZeE6dCD0FDQcuHrxBMLLmi6lKxkQyQTAWLh8k2cyLoNgLeoGZv3JsZJbIn80KklapGydr1FqPuqceObVTWgqdY2B1IuiAP6gp7SyH9qjxzIU71HVVkoyrbbdCuycr5jli8yAp4Lkr1oN4ChNnBVzxgmb0htcPdkLDkeSYaSL1pDRM4dS3JBiNoBBfdGb8A6rhlEU+u7YPGyUYYgKuTltbppp6xFwWQv0tncm4ZBO59g2U0xUUnynMWvzuGP3ygqBlOB15hjbr3apuiEjEvEDF5yT4H9SNwZAwBPUpObg1AtgDPkyLlAWrnqVfoGO9+BscafQqAF98ZaeRZe8K6wlZF3TG5vaVQe1JMp7V0bWfQjRFDbVEjSqa3uU7fpBXNJDzbmdkpyLzWBNIM5UZm47PnAFmY2EUVHyjfcn+2Lw6EXNSL6HcKUMfRHEEj4b8uPQMInUJZEaDEXmYABzY2BKIFOwcXG/FylgAv1tGXoAfnivNbg5mxu9crDWDZZ29SSVkFYlg/wUQDfKB3Cvim/1RXowJcS8FEt4KXpdVu7NfGlYYi0fmhMhS5viNChgMvjUrbJgUNJ0WdamtHbMQ2JCA65ydxg4Qd/aA4oN+J7nziUJBJ6i51HxyC0L0CDIX8FB6jgLkjOPwCciRFoT9uB4gvILtpLHXiMMQyeoLRwRlvZ/eF3iMIti2rA2jA0qTUjjohGi6rZx2IF/oZjT3hJ7CzGRXCpfZFGXdyQBKcEm3WGF3dApHmJwVWGl4dLXG7L4CNqoVHOhc9GlADueIPiiOTlNTmeoSRmyGOkXANiKpvKVZrLmZtYd7NZQMKdjzCJLwMpYtIjccdLntTx78FEwD5PvkrR0pMDBgRgnfR7DQHW8KRCfCtc7v+IEIGUJ8Or3WMhO+OpSC+lQpMxunVTlUXNiwzbf7w3eGrt3cFds6gUuIbCTAtFfml8Sh0Wt2lYbi7YNiBkTgd0+Y5Cm3ia8aEDscwRLM2Yk6VWdQNhJpGkW4ME+bVi0aEykh713IaaNCk92JhOD/cSIMfNF3YM5iAuWXW03KEmqMbnglJuDR8EdWU+mwU+CpoPr4VYJCoofAroIjQUccFsDLpMIiMuQ1Dx/BSNFwXp0YpqVimHiELwpXuOrP2yTIpTjyRd6BpQ3lALuNj/mq/iwlQMcrtES8EmA7KAI/acqc3aIwxVfgr/B9qrG4x8wybCTGcaCuNFS01jf8ES1LRgkZY6OvpjFrJD9sTRcEtGL5td/cniBNMIwcB5a8LKpqrZkmoJd2Z54eiTCw2wfDGVO0oFoco0asiZvsgSoBVDvgBE7gRARkFjSeud6RO32EECGeOrUNe8qp3dp4EetSXH51YGH/Osv10RNhoairWjU6aFVRcGAqB6XFRJ2Ipw21awPjkKScltXXH8Xwt0DbLFioiVpXuqOJQVC6kp8bDTPJMW0VzyyedMg+oaSoZbSXveiNiRjox/nf612n0VfMuCzbK9QnwSaymyvHEdGxe8/6LDlajf7kRu/MPU9MTjo8SR1UBKOqtYHVfGTKOjSkPLbq5hW4HZvRToeYVykk8m0arU+sGNm5Gqj8+/FbtNJe09nHQweBKA0Rba/g3LP5F81NyJf8fghL++w0KZXYP/wYkxD6CdbBNOwAAAYVpQ0NQSUNDIHByb2ZpbGUAAHicfZE9SMNAHMVfU0ulVBzsIOqQoTpZqB+Io1SxCBZKW6FVB5NLv6BJQ9Li4ii4Fhz8WKw6uDjr6uAqCIIfIG5uToouUuL/kkKLGA+O+/Hu3uPuHSA0K0w1e6KAqtWMVDwmZnOrov8VPgwjgAlEJWbqifRiBq7j6x4evt5FeJb7uT9Hn5I3GeARieeYbtSIN4hnNms6533iECtJCvE58bhBFyR+5Lrs8Bvnos0CzwwZmdQ8cYhYLHax3MWsZKjE08RhRdUoX8g6rHDe4qxW6qx9T/7CYF5bSXOd5gjiWEICSYiQUUcZFdQQoVUjxUSK9mMu/iHbnySXTK4yGDkWUIUKyfaD/8Hvbs3C1KSTFIwBvhfL+hgF/LtAq2FZ38eW1ToBvM/AldbxV5vA7CfpjY4WPgL6t4GL644m7wGXO8Dgky4Zki15aQqFAvB+Rt+UAwZugcCa01t7H6cPQIa6Wr4BDg6BsSJlr7u8u7e7t3/PtPv7AefqctbfGfp8AAAPnGlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPD94cGFja2V0IGJlZ2luPSLvu78iIGlkPSJXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQiPz4KPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNC40LjAtRXhpdjIiPgogPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgeG1sbnM6aXB0Y0V4dD0iaHR0cDovL2lwdGMub3JnL3N0ZC9JcHRjNHhtcEV4dC8yMDA4LTAyLTI5LyIKICAgIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIgogICAgeG1sbnM6c3RFdnQ9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZUV2ZW50IyIKICAgIHhtbG5zOnBsdXM9Imh0dHA6Ly9ucy51c2VwbHVzLm9yZy9sZGYveG1wLzEuMC8iCiAgICB4bWxuczpHSU1QPSJodHRwOi8vd3d3LmdpbXAub3JnL3htcC8iCiAgICB4bWxuczpkYz0iaHR0cDovL3B1cmwub3JnL2RjL2VsZW1lbnRzLzEuMS8iCiAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyIKICAgIHhtbG5zOnhtcD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wLyIKICAgeG1wTU06RG9jdW1lbnRJRD0iZ2ltcDpkb2NpZDpnaW1wOjA4NTM5ZTdkLWY5YjctNDRiNi05MmVkLTIzYjNhYjQ0NmNkNCIKICAgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDoyOTg1N2YyMC01YmRmLTRmNGEtYmU0YS0zYTFlZjRkZTgxYTciCiAgIHhtcE1NOk9yaWdpbmFsRG9jdW1lbnRJRD0ieG1wLmRpZDpjZTc3MWFjMC0zZmM4LTQzYjItOGQxZS05ZDc0OWUwZDEyMzQiCiAgIEdJTVA6QVBJPSIyLjAiCiAgIEdJTVA6UGxhdGZvcm09IldpbmRvd3MiCiAgIEdJTVA6VGltZVN0YW1wPSIxNjIyMTE1NzI1ODIwMDczIgogICBHSU1QOlZlcnNpb249IjIuMTAuMjIiCiAgIGRjOkZvcm1hdD0iaW1hZ2UvcG5nIgogICB0aWZmOk9yaWVudGF0aW9uPSIxIgogICB4bXA6Q3JlYXRvclRvb2w9IkdJTVAgMi4xMCI+CiAgIDxpcHRjRXh0OkxvY2F0aW9uQ3JlYXRlZD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkxvY2F0aW9uQ3JlYXRlZD4KICAgPGlwdGNFeHQ6TG9jYXRpb25TaG93bj4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkxvY2F0aW9uU2hvd24+CiAgIDxpcHRjRXh0OkFydHdvcmtPck9iamVjdD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OkFydHdvcmtPck9iamVjdD4KICAgPGlwdGNFeHQ6UmVnaXN0cnlJZD4KICAgIDxyZGY6QmFnLz4KICAgPC9pcHRjRXh0OlJlZ2lzdHJ5SWQ+CiAgIDx4bXBNTTpIaXN0b3J5PgogICAgPHJkZjpTZXE+CiAgICAgPHJkZjpsaQogICAgICBzdEV2dDphY3Rpb249InNhdmVkIgogICAgICBzdEV2dDpjaGFuZ2VkPSIvIgogICAgICBzdEV2dDppbnN0YW5jZUlEPSJ4bXAuaWlkOjRhN2E4ZDU4LTkzMzMtNDIxNC05MTVkLWQ1Yzg0MmFkMjNjZiIKICAgICAgc3RFdnQ6c29mdHdhcmVBZ2VudD0iR2ltcCAyLjEwIChXaW5kb3dzKSIKICAgICAgc3RFdnQ6d2hlbj0iMjAyMS0wNS0yN1QxMjo0MjowNSIvPgogICAgPC9yZGY6U2VxPgogICA8L3htcE1NOkhpc3Rvcnk+CiAgIDxwbHVzOkltYWdlU3VwcGxpZXI+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpJbWFnZVN1cHBsaWVyPgogICA8cGx1czpJbWFnZUNyZWF0b3I+CiAgICA8cmRmOlNlcS8+CiAgIDwvcGx1czpJbWFnZUNyZWF0b3I+CiAgIDxwbHVzOkNvcHlyaWdodE93bmVyPgogICAgPHJkZjpTZXEvPgogICA8L3BsdXM6Q29weXJpZ2h0T3duZXI+CiAgIDxwbHVzOkxpY2Vuc29yPgogICAgPHJkZjpTZXEvPgogICA8L3BsdXM6TGljZW5zb3I+CiAgPC9yZGY6RGVzY3JpcHRpb24+CiA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgCjw/eHBhY2tldCBlbmQ9InciPz4q6IJeAAAABmJLR0QAqADHAN3VlkGEAAAACXBIWXMAAA7DAAAOwwHHb6hkAAAAB3RJTUUH5QUbCyoF1vGoOQAAIABJREFUeNrsnXd8XeV9/9/POXfrasuSJXkbD2wMxuxhNgaSloRCRhMSSJuGkp2WJmmbJk36o0lJmjSk2U0IEDIJgQRIAoZgZsxwGDZmeMgL46l1ddc55/n+/jjnyldX50pXsiTL5nxerwvy2et5Ps/nux4IECBAgAABxhEqeATji2nT/lodd1xcgamUMtBa5NFHDenp+Y4ETydAgABvBJjBIxg/LFnyYbVggWls3Phc9ebN6+dWV0/pcZy8mj8/gsjp7N//ZPCQAgQIcMTDCB7BeKqZvPHUU3+c+tJLzzz4+usb7xGxG0WI9/b2hefPTxlwSaAoAwQIECiaAKPDKadco/buXR/r6Hj+dpDTgVqt2dbQ0L5BKbTjGM6sWVW6o+O54GEFCBAgUDQBRo7q6m5j/frV14nocwvLenu7LlZK14hI3HGskGmaxgS/65D3CxAgQICAaA5nLF/+SfXUU/cvdJz8p4uX9/buOR5UDRAHwqZpG8ccc8V4m89qgc8CzwGdwGvAXcD5wZsKECBAQDSH60M1XjW6u7u+4BFKPxwn35RKdbUDcaUI5/NitLU1jCfRzAVWA58HjgGSwBTgUuAPwBcWLToh+AYCBAgQEM3hhtWrVy4F5y1+zzud7p0JREWIiNgmWONFNFHgF8CCMutN4DMbN65795ve9PfmihVXBt9CgAABAqI5HLBkydtVLpf6OGUCLXK5TKtSREEiSpkhw0DB8vEgm78Clg2zjbKs/Ge7u3dVOY6EL7jgPeYJJ1wRRMIFCBAgIJrJjA0bVtaJyFvKrXccuwaIgIqADjlOzjjzzOPG41LeVMlGWuujurr2HCtCwnGMSHNzrbl06XsDsgkQIEBANJMVmUz3yUD1EJuERQgDYVBmNhtSTU3Z8ejYWyvdMJvNzdda1YlYVZlMJjx1qmnU118VkE2AAAGOWKJZDPwvblTUYZfnYxhlfSIuy4TDfUopE1QIMCMRrfbty4/Hpbxe6YbV1Q0OSANQrRSxfD4TOu00FRBNgAABjliiOQX4IHA/8CBw8uHzOE9QWuv2ITaQmpopG0XEADFElFLKVI2NNeNxMb+vZKNotOb1uropvUCtUm7otYgR0tpUcFxANgECBDgiicbx/q+As4BHgOvr6mZH4cxJ3fE1NPQAUldufTxe/1p1dd2uwr+VQikFImP/GpLJ9l8Bzw+33axZi+8CiQAJERKgYiISEskbS5cuDVpIgAABjkii2crAqtIR4F+6ujbf19jY0bp8+fsNOGlSEo5tOzBE5n1Ly8zVIBqUKIWAFtt2yGYzY34tp5321lxT0/S/Ngxjczl1NWPGkrvb2uY+gWuiDANhERUC07QspZqa6oMWEiBAgCOSaNYBts/ys/bt2/7wn/9818KLLjrGOOWUSycd2fT0mJS5dkDZLS0zHxFRopRoERzHUdowRLQe+9cQi8VYvHj5ppNOumiFUqqr/4UboUxDw/QXliw59ytz5hx3O4gcEJBKKYUSUYRCkMmkgxYSIECAI49oDKNqH/BKmdVzU6k9v9+48alZ8Xht6Lzz/maSXf90lDJ2+6uZuU/F48m9rqLBAZxQyHDyeSWRSN+Yz02TSr2OYRhi27YhIkkApcz0WWe949qlS8/5SmNj2zoQcP+jAUcpbMA2DK1tWyQazQQtJECAAEce0USjZ2ml1MqhevOOjlduNM1QTCk7dOaZ7zOUOn2SqJtlKGWuHaRllGHNnLngTkArpRzAEhFLBCcScSSXmzHmVxIKaYlERHd0vDQfL3ovmWzcopSR0VprpdBKoUVwgDxIFiQDklfKtONxUx58cFfQQgIECHDkEU1dXSPRaNVd3kjbF7adv2TjxmcvcBwdj0ad8IoVC1Qk8g41Ts8njpsXUwdMBZqBetxilQlc34Z37q9IXd2MB4Hu4oPMmnXc7YlE3WuAFhFbRCzDUBaIYxgRvXLlhjG/8Pvvf4JwOKF7evYvLlxfVVXdSyI6D9giOCLkgQyQUooeEXq1lozjaNuyQhruC2YBDRAgwMEPfCfbBSUSU2lrO+PxNWse2CRizy2zmXr99Y5/nDPnmKfBIZ+H885rtH7/e0bTMRoekSwGjsUtRDkHmIFbgLJQbTnEgbwe7f3SXkfdCWwHOjo7N3UoZTwooi8DrPb2o2+fOXPRXUpheurBApUTUXlwbMOICPxiHDr0Duno2CSOk+kvOxCLxdcqRUYEwyOfvFL0geoVkW6gJxQyMuGwYe/eHQ9IJkCAAEcm0ezdex8LFpxoh8Oxb+fzqa+U2y6b7Txt166tJ7a0TH9KRItt9+pzzvmoPPTQjZV0kNOAc4AzgdNxC08WKZNhYXq/Wu83FTgaQET6xZhSZj6TSc3evHntpXV1U9bX17esB5UDskBeRDmRCOPWoa9d+wBAgWikqqrueSDnvXcNpEToAd2jlJEyDJU2zUjesqr0mjU3BkQTIECAI5NourufF9s+VRYuPP5H69b96e8cxyqXaW/s3bvjiubmaa8opWytsePxjIa/1PBb8VEti4DLgb/0lEt4vO9FxKnav3/bqfv3bzt1yxbEMEK9tbUtq6urG35dU9P025aWad3bt4fHokNPAu1Am0d8YY/M0sBR3jbphoaWDSIklSIvQk4p1S0inUqplIiTVUpZjmPpBx64UQdNI0CAAGOFSZmPcuGF7zZsW0Vee+2lk1555ZnfiUiVL0uGYruWL3/bZSJ6j1LGfq2dlFJh+6GHbi50lM3AlcB7cedjmUwlbXqBe4H/A1YB1gj2jQCneaR5tqfIkkO9T6VUqrl57ndaW2f/ub6+5XURSQH7RNR+wzDSsVjC3rEjp59//qZAyQQIEODIVjQAmUyNJBJpp63t6BeyWfsTW7Y8+y2/a7Xt7JTe3v2zq6vr0iKSNgyVy2T2atzy+B8HLsN12I8YEaBGKRqUYpphUG8YVLlZllgi9ImwRWv2ak2PCH0FFVP5KaqBd3i/V4HvAD8EuobYZwpwDfA+XD+Sy6bNzVx55ZWcdNJJTJs2jaqqKkzTJJPJ0NXVxebNm7nzzjuT991333W7dm2QeLxh/ZQp0342c+biH4tgxeOmvXZtl9627WcByQQIEOCNoWgALrroGjOTScUMQ9W9+uqaq3fsePHzfopkyZJzP9nY2PqYYRi7X331mQXbt7/0cRE5jxFE1C01DM6MxZgZDtMcClFjmNQYBjHDIKJc8igkmyiPTZR3AkeEjGj6tKZXa/bZNq/bNuvyee6yLEZog+oEvgt8DSjOx6kC/sH71QFEo1E+9alPsXz5cubNm0csFvP8Q2UVDZs3b+buu+/m+uuvB8AwzM2hUPLzM2Ys/MmGDautoDkECBDgDUU05513jaF1b1hrVWWaqrGj48V3dHQ8+xkRHS3aTJYtu+g627azGzc+9+6+vr2nVkIwiwyDi+NxFkWjtIfDNJgmWtynoRJVmMkkRjwG4TAqFALDwE2Z95z9IohjI7aNtix0Po/OZJC+NGLlAYUB5ETY5dhszud5MpvlzsqJpxu4Efgqrj/p+8B8gEgkwpe+9CUuueQS6uvrhySXcoTT0dHB17/+dX76058WRNhKw4hcM3PmxR2bN/8mUDUBAgR4YxBNY+M56sQT55j5fC4qomqBpv37d568cePz1/X17ZkPqGi0ZmdDQ+urO3e+fAbD+F/mGwZvT1RxbDzGtHDYje+tribU3IyZTBKKxzGiUZQyEK3BNFDxOGZtLWZjIyoaRYUjiG0h2Rz2nt1Y+/ejOzvBceuAiqNd4smksdNp7K4uJONm1xtAj6PZmM/zSCbNryyrEqfMbk/BRAAWLVrE9773PY466qgRE0wp8vk83/zmN7nhhhsKi/aFw9Grzzjjit+9/HKf3rnzzoBwAgQIcGQTDcCFF37IcJzOkOOQUMolG6Vo6Ozcc9z27a9esW9fxzIRKRs9ZgDvikY5P1nNvEiEkGkQmjaNcGMj4ZoajEgEsW1C7e3Ejj6aaFsbkSlTCNfWEqqqwohG3RLLHFAyhZLLbvEWwUmnyXV2ktm2jZ4//YnM448jIv1EoHM57J5e7H37yObz7LZt0tphq23z00yGV3TlxrU77riD0047bchtTNOks7OTvXv3kkqlSKVS5HI5lFLEYjESiQSRSIR4PM6OHTu4/PLLi3e3otHaj55//hX/19eX16tW3RpEnwUIEODIJhqlZqiLL77Q6OvrCxtGqAqkrqdn75ING577fE/P68cORTAfS1RxVjJJWyiE0TqVaFsb4bo6lGFg1NWROOkkEnPnEp82jVBNDRQ6/EqUQtE2MvCCSW3axNbPfhbJZl1lpN0U/AdTKb6/by9bd+4kb43OHXLfffexZMmSgfdqGHR1ddHR0cH69eu56667eOKJJ8jlcmVVj/LmNCuz3qmqavjEWWdd9l3Lspxt23bpl1/+Q6BuAgQIcGQSDUBLy/vUCSeI0dubib788lNX79nT8UURXVOOYD6cSHBRdQ1NkQjhuXOItrZixmIYySTJM88kuXgx8bY2KJ1AslJTlLfdUFt3fOtbpFY+AFqjRbitp5vf5fOIW7KZ/fv3s3///hE/i+XLl3PDDTfQ2trKzp07eeWVV7j//vu58847SaVSY/nY7bq6KVctXXrBHfF41Orq6tZPPPHrgGwCBAhwZBINQCLRUJXJdH9DxLm63DW/PRLhnbV1tEejRBbMJ9bWhgqFiC5cSO3ZZ5M86iiUaQ6rUEZNMAVTmWXxyic/hd3RAaJZ1dfHd9LpfnNa4dfd3c3evXsn86fRe9RRy1ZMm7bo+VjMyHd29jqrV98RkE2AAAGOSKKZCdwOnOi3cp5hcF1dHcfF4oTnzCYxazYqHCJx8snUn3UWsfb28kRyMGYyn22cXI5tt9xC6p57XTJxbD7a2UlO60FEIyLs2rWLTGbyluKPRKqfPf30S99kmnQbRjjf09MTkE2AAAFGDHOSX9+JwP3AQr+V18bjfLKxiZmNjVSdeCLx1jZiy46n5aqrqD/1VELV1aMnmBGoGIDul19my3/dQGb1asAlkof7+njastA+RKO1xnEcstnspH34jpOfmk73ZZubZzzjOLaTTNZokXY6O18JWk6AAAEqRmgSX9vFwM9xqycPwFSl+FxdPcfFY3S1tZM66ijC7W0se+c7qZk7F1OpCSOY3o0b2f3rX5N+5FF3jwKRiPDrdBrtkYqfosnn85P+A9mzZ8tHensX/zqRqO2w7Ywcc0yrtXfvW3VPTxD+HCBAgMNb0VzukUyydMXJpsnfVdewzbH56cKFPN86lXmXXcaZ73kP4cZGbCDv1eMPeaHJFZNMhWYycRy6XniB7d//Pntv+hHW1q2uitG6n2h2Wha/zmT61UspyTiOQ1dX12HwiUjUth1paWl/Smtl27btzJ49VzZseDQgmgABAlSEyeijuQK4DS9JsRRTlCKXTHLyKacwY8YMPvjBDzJnzhzfUF0DSCg1fKmASggGsHp62P/00+z/5S9xXtt5YEqAQt6MRyiI8FQ6ww19qbJEk0ql6O3tPSw+EsMId55++lsvDoUiO5RS3bGYmd27N+Y89dR3A7IJECDAsJhsprM3A7eWIxkAmpo4/YQTOPHEE3n/+99PdXV12XwRDaS9uvjDkcxQPWZ6+3b2rVpF9113Qd7yiOWAeikmGkRACzusfD/BlBKNbduHDckAaG3V79y5+YIZMxb8SinyuZy2W1psDQREEyBAgGExmUxnpwF3MUS15dbWVpYtW8aKFSv427/9W+Lx+BD8cYBAFK4ZbSQqRrSme906tv/oR+z53vfIvfgi2M6BCgFygDwK5IJoRAsK4YF0mo2OM8D5X/h/V1cXWh9eSfdKmcbUqTMfBmWBWCKOU1+/SHbuXBu0ogABAhwWiuYo4A58fDIFtLW1cdxxx3HZZZdx2WWXYRjGsCRTQE6ESMFfMwzB6Hye/c88w75f/Qpr06Z+EhnKTOaSzAGVo0TosO0BSqbwd29vL7ZtH3YfSlfXayeIUKMUaREyjoPV2trkBKomQIAAhwPR1HgkM7XcBi0tLRx77LFcfvnlvPWtb+0voTIcwRQTiiXSb4/z28pOp9m/ejV7b7vNLZRZIBit+wmGIvMXBVNZMQkVEctexxlENJlMZlKHMw8FrZ3qrq7d8+vrm3uVok9rldG6z5o+/WrZtu1HAdkECBBg0hKNgTv/ypJyG9TV1XHcccdx6aWXliWZSioZW56qKd3SzmTY9+ij7Pvxj9GpVD+h9BNIkS/mgNlsMAlJidLJaz2AaHK5HH19fYfzt6L6+nrm1tc3vwjEDEMimYydX7asUW/bFqiaAAECTF6i+RDuDJO+iEajnHDCCZxzzjlcccUVoyKZwnobkKL9dS7H3scfdwmmu7s/NBkRRB8wkxXqlVFKMuVIyDtOXGv2F0gnnz+snP/lkM9nW0WIKUVcRKJKGZlMptsOmlGAAAEmK9EcB3yJIUKsTzrpJJYuXcrVV1+NWVKnrFKC6f833gyZWtO5Zg27b74ZZ+fOAQQhJYQipdFkJSQkpfto108j4toBt2mNZVlHBMkA2LZVD0RARYGI1k7INMnDJxXcEKiaAAECTCqiiQE3MUSE2fHHH8/06dO59tpriUajFRNMuW2UUuzbtImuW24hv3atD0EMZSYbSChlCcg7hhZhGvBYPj/WVZUPKbS2YkAYiCpFBAzTth3jjDN6nMceG/i4i/g9QIAAAdEcElwHHF9u5Zw5c2hubuZjH/sY9fX1o1YxBfT29nLHHXfQ8utfc0w4PJA0BpjJCopksEopFwwgRVFnhcgzEaHZcY4okiniD1NEQqBCIk7IcUxVV+fODQcsxk24nQ+kgceBXwE9QVMLECAgmonEQuDT5VbW1NQwe/Zs3vOe9zBv3ryDIhiA5557jhtuuIHXX3+dD8XjSCg0MjNZCYEM2MeLOisU0eyvc5bL0ZjLHXkfSyia8QothEQkZBiGIaKMTZteDAH/CXzUUzwFvB/4PHAV8MeguQUIEBDNRA2JvwxUldtg8eLFnHzyyaxYsWLUZjKAdDrNT3/6U37yk58MqC/mkkOBTOg3dTGUr6bUdKYHJm0WVwhwslkkn6fZNPuH+UcK9uzZfko+n6mKx5Pro9H40zU1Ux5vaKjpeemlR28APlZmt+nAb0Oh+DmXX/7BNfv25WXlym8EJrUAAQKiGTdcBLyp3MoFCxZQX1/PVVddNWRC5nAqZuvWrXzpS1/ipZdeGlD6RRXlvviqlHJmsqJimf1mMgqE44Uwa43OZhHbBoFm0yTu2Y+OFGSznU3ZbOc5wDkeh9qgtoLMHGbXKsfJfm3nzh0XhkIh58wz3+U8+qgt8IuAcAIEeAPAmMBzFcwrvuesqamhtbWVD3zgAzQ1NQ1JMEORzMMPP8wHPvABXnrpJbSXy1L4RfoVi0brInWjtadavARML0dGitdpDY72iKWwzEvKdBx0Oo1Ydr+ESSrFOaZ5JH87CgiDzK1kwCIip+/bt/Vox5FYOEz4/PNrDcM4TwVNMECAQNGMJS4DlpZbOX/+fJYtW8bpp58+KhWTz+f5yU9+ws033zyAkIqTJqvggBlMDyyKWWwWK1U1B7ZlUGSa2DY6ky0qbXMgb+fMaJR700eGpgmH4/uPPfacr/f07JueSnW3d3XtmpXNds8UkTiVVQE30un0MqXUHiAFmcz55y+27r//wUDVBAgQEM2YwAT+tVyHNH36dJLJJO95z3t8TWbD+Wq6urr42te+xsMPP+w7wZj2ki6rPaLpd+T3EwwHqjGXEpAu9sEMLKSp83kkVzx52cBK0PMiEThCiKa5eebzNTUNHdXVDRuArGmaXZaVS7/wwqP/0dm544JKjhGNJuJAg4go20ZMs0efc86n5KGH/isgmwABjmBMlOlsBXCsr/1FKdrb23nb297G9OnTBxHMcCSzY8cOrrvuOlatWjXIVFb8i2pNnVL9pjC0FJnJnH7zWLHJrGBmc01qnplMa3AcdCZTRDKez4aBzv9mw2TFEWI+q69vfaromzEdx0mYZiieTNZXVL5ZKZVvamrfo5TUKaVqlJK4iBWOxfYZQTMMECAgmoOFAj5eTs3MmTOH6upqLrnkkhGpGID169dz7bXXsmHDhiFJRmvNUsMg2h+SXEwozoBlB3w2A7fVhb9tGyedQWzHV8UUixsB3hyLHfKX/B/RKNMOYv9otGZ3U1PbSwNuGJQI4WnT5j9smuHu4Y4xder8R0OhiIiQFFFJMGJKGSGw1KJFVwW+mgABAqI5KCwEzvc9uWEwZcoUrr76ampqaipWMQCPP/44H/7wh+nu7h4w14vfT7TmlFDII4tiAnF8VIwXTeat00XrdD4/yB9TqmIGLhCOjkRYoA5dPzpNKU6KRLgyEhn1MaZPX3A/4ABaKWUDOSCrFNlYLLFn7twT/sudp8YfyWTT1rlzj/0lrqk2AhIFiYgQsixt1NfXBi0xQIAjGBPho7maMhOszZo1i7q6OpYvX14RuRSI6A9/+ANf/OIXfX0xfj4aR2sWhML94cj9zvwBfpoiZ78e6IsRx0Hn8i4RDaNiSteHleK9sRj/mskckhf8t+Ewpkc2Kp8fcV5PNFq9r61t7iql3EcM5JUiBfSIqIxhiEybdtQ9pmnu37Rp7XW5XPdRRbvbra0LHp8z59ifh8ORtAgKlKGUGCIY7r/zZDJ7gpYYIEBANKO3ugDv9luhlKKxsZErr7xyyJkyiwlGRPjFL37Bt771rbJOf7/ll5gmDUq5CqZsNFlhhsyBuTXaspC8NYBNyhOMPwmdFIuxNJvlWZlYn/c8pTjJqxNXaxi81wxxszOyYstz5hz7S8Mw8yKFvBnJiNCrFJ1An2EobdtOeOrUWX9saZn1XFfX7uOy2fRRphmSuropW8LhaKrk4WgRtFLKm2MhQk1Nc9ASAwQIiGbUOBNo81vR3t5OVVUVZ5xxxrAEA+A4Drfccgs33XQTgC+plFt2cVVVP8nIoEKaA4thUhSVNloVU7o+jOKaRIJrJ3g+mg9Fo0Q9s50InB4Jc3OmcqJpapq1pqVl1mpPzTigLKUkK6L6RHTKMFSfYZiOYYgpIjYYRl1d8zql1GsiklCKMCjlPRWtFLaI5IAsqLyItkMh9N69LwUtMUCAIxhG+U7mgyWOhXpFZfkSxfir0n0+U5VkkWHQ0NDA5ZdfTnV19bAkk8/n+fa3v81NN93UX0pmOOd/4XdlOMw0wxjga6E/ObMQDOAccPYX+2KKSGY4X4wMQ0ILIxHeHw5P2It9fyjE4oJfRtz/zAqFmF2hvygardk3f/4JPyqIScBRSnJA2jAkLaIyjqNzu3apvFLkRFQa6FVK9QApICNCTkQsESz3b9JAH0hKRGdEsA2jTp577p4gvDlAgDeCokkkzlRnnz1XKRVTudx+tWPHU5FMpnZeNtu3yHGc2Up1N4tQA1jABuAB4DlcJ3G5Y7+ldOEpiQTz62q5MRLhrLPO8vXNFC/LZrN8/etf5+67765IvRT/+xTD4M3xuEsiA/wwZcxktu2ayUqSL0ejYvxMbZdVVfFCTw+r+wlsbBCJRIjH44TDYUzT5JRQiHfE44S9sjiONx+OAi4PhfiKZQ09+jDCmcWLT/9GJBLrOaBmyIPKgPSJkFFKWfF4WK9adac+99y/lFBI5SzL7gMj5J5KOd4EaSH3iShLKdIi0qOU0aO1ZEKhsJVK9eigGQYI8AYgmurqv1Bnnz3d2LdvS/iZZx5+s2Vl/lrEOReoK6geH0LQwEbgx8APge0l65cArcULVoRCNJkGrW1t/PvJJ9Pe3j7guKXnSKfTfPnLX+b++++vyBfTH30mwrvDYS5NJIiAr5msOBigoGJwtC9BlCOQkZJQXCk+UZXkH1O97DhIf00ikSCRSBCNRvtnHhURlijFtYmEazIzDIxkEhUKYXV2ArAwFIIhiMYwQrljjjnrGzU1jR1FAQC2a+6SlFKqT2uy4bC2czlbQ5esWwcnnRR1RCSrtSittVZK5YC4+40JoCwR8RSNShmGkTOMsPPII98P1EyAAG8Eojn33BkqldpvPv30AzdaVu7vRmB2m4dbBv5TwK3AvwOve+svKDXNLY/H0YCZTHL8ihVUARmvF6Ok4+3u7ub666/nscceq9jxb2rNm8NhLozFaDfNfoe/DMjwL6q4rDWSzxflxIy9iindptk0uT5RxSf6UnSO8GWFw2FqamqIxWIYhjGIpE8zDN4fj5NA9T9PAYxoFAwDtKbVNGkBdvl9DKFYavHi5d+or29+2XslhcKZWaUkBfSCpEHlDaNG33//dwRg9+5bpaPjSj1tWo2Vz3cJKBtURmsdVUqZSinRWhylyAE5rXU+Gq11HnigNyCZAAHeKERj26aCsDl16sKfb9/+/DtFpHqkA2zgGlyfzFXA74GzSzeaG4lgVFWhDIPqefMwcYtPenYZLG/4vHfvXv7tM5/h+RdeKKtexCsrkxS4MGRyTDjMnFCIGsM4kBtTMJP1m8gOkIy2LMSyhieIg1QxfuvbwyHeGgpxk12ZYz6ZTJJMJgl7Pp7SXCMR4V2hEJdEo54tVAYpRCMaRaczRFBcbJrc7Dgl55iyddGiU7+VSNS8DqAU2jOZ5TyS6VGKlG2rTCIRtVKp1ACT17p1P5ZU6hy9ePEcy7Isx7IsSykjrZRlgEKpsFZKnGg06pimo++9d5WIrAuIJkCANwrRmKaFiMm8eUvWVlVVv2/jxjVft6x0+yiONwW4A0IrwD6xeIUJtIVCmLW1GHX1xFpa+kfdpmdWiitF7/btbPzMv3HJtq2cEY2Sdhxynokr4tliqpSiTinqlUGdoVCeuayQ8yKeuczPFyO2jbYsb8KyiVExhT8U8JrjcFNfHyu1ZqlS1CrFKh+fjVKK2tpaqqqqBtR/KyWYhUrxnliMuaFQ/zopVYgiKDPUf41HmyaUEE1TU/vTPiSTVYqUM+BhAAAgAElEQVQ+3Bkye7SmzzR1XsTWjz7640G3u2XLQ7Jly0Nyzjn/IlOnik6nbWXbKTKZDPF4hFQK2bDBkm3bbg4IJkCANxrRaK0ELBHBnjp15vP19VOu3rDh2X/Ys2fzRYy8ekAM7OuBAckRl4bDRFGY0Rjxk04cZCoD6Fq7lm2f/wKtfX20RiIDTV+FTlQXT1A22KFfaibrN5E5jkcw+pCoGBtYlcnw37kcWeCD4TBvjicwgWWZNDdaFg5utYT6+noSicTAwxUTDG65hbdGoxwTCmNyQOEM8HPJAftXIfZPgFaf+mupVOdcpZSASDHJiNCllHSJGL2gs7W1tfbatX8ekigeeug/fYPwAgQI8AYmmu7uXkkmTTubdXJAXyxW9foxx5zxpX37Zq/csmX9+7q7dy5mBKHNSql2ERmw/XGRKNowMMIhQrW1LjEUnNiOw8777mPv/37TI4KBmfmDJh3zJRh/M5k4DmJZiOOMMYFUdgwF7LBtfphO86DWHKsUH44nOCoc7qe4v0wkOBVYl0yy0jTZLgPJT0QwgblKsTwUYoFp0m6aKCm5hhIV49ZbkwH+GoBGwyAGZIvO0d29e4ZSSmsthRIzfSJ0AZ1KqW6lVDoUSlgdHegNG/4UkMgbE8s9q0UxVgM7gkfTj2XArJJla4FXSpYZoEIgeYBIJHnZ3LlL71+//tFYLFZ3ejbb9ZtRnLsOeDtwMW4R4ymeUOgEXga+A/zqkBHNo4/+WFas+IA2zUxea+kTEVNEqcbGtqcbG9tf2bfvtaW7dnVcvHv35mUieqg0/nxd3bS7o9HI3l27Nn2geMXUcAgjEUdESD37LPqtb8WIRkl1dPDarbeSfezxomrJJQTj58wvRIwNMpMdICJtWe6Ml5WYucZBxVgirMpm+WIuhwAfDoe5JJ4gptSBKzAMjNpa2hMJ2pXiInFtVL3aIe/WaCGmFEmlqPJsWpSQSlkV45GMlGwTVYpTDYOHikx2lpWpyWRSiWg0sUspUiJ0A11KSbfWRl80Gsnv34/z7LPfDkjmjYvPMbhu4RWHqvOapPh7oDSg6tPAfxUvMM1IyAzHv3h2U/Wc45YsWbxvx2vRR3dt+Zdbb7019thjqxuefnqTevrpeyttaybwIe/9NPisT+JOqf7aISUagJUrn5DzzjvVNs101jPfe4l6Wjc0TH2moWHq+oULT67q7e2clsulp1hWvsa2rbhSiGGYmUgk/npd3ZS1kUjstWeeWflvAxQO0GiaqGgU0Zr8Cy+w/pprULE4dkfHoHBjfzPZQGe+HwH1hyoXHP1jTiCVq5jtts3/pdOs0pplSnFtPMHcfhXjqjmzthazqqo/PNnlBaFaQbIQNVeEUpIZiYqRAql4VaUXlRANYKZS3TWxWNUrrpLR3WD0ipCORs18X1/Ieeqp7x5qkokCi4CjgZmeeTbpNTQLN4ixEzfycYs3ittK+VyvAAEOCbS2Fv3rRz7+4Wvf+55IJJ1m1S23cPctt/z4rrvuYtOmTemOjj1/BJ6u4FAJ3Ijfv5r0pjP3xl+QlSurufjiRZZtZ0Upty4VYItgAZZSplVT05iBxs2AoRSGaynrz7fQSqkax7EHTCwTxq21pUKhfjJwXt81MKeloFIKo+8SlTJo1ssBZWT0YII5hCrmj9ksX8nlsIGPhsNcHHfzWgpXYFRXE6qpQRlGPzkUq4/BKkWKTuHji/FUXamKGbBvv2/KfVHNPhUC+vq66xobW7tAdYLZo5SdjUTi1v79h5RkWrxGdClwhkcslZpxNbAPeBz4A/BbBud7BQgw0TDe9a53/fwdV18VeeY3v6XpFz+nc8cO9vT28tDttxNFJcwpsz7W2Djjt/v2bf3FMErmx7izF09qlNQ6e1x+//s8Z599vK1UNisiGpStFJaI5JSSJKiEiMSAsOc6MEX6AwZMkHg22zMgEKBJKeKGAYaBOLqomOXwZrIBs14WOk4tRctdgtGWVTK6n3gVs81TMQ9rzYlK8ffxBHOKVIxKJAjV1mJ4hNtPMiIDiFB8VMpofDEDzGuWPeAO6nxmMs3l0vVAyq1jRiYSiVpbt2q9fv33DgXJLPJMDlfgBhuOqkF7duq3eL//AVbizvb6bNDfBZhoTJkye65jWx9695Ilc1/5xjeI3XMP2UyWKbbNZ5ubaY1G2dJnbXxo7rH/Yhihvscf3zrU4T5UhmQ6PRPZGlxXbLM3SMscqvv2Kar5tKxa9bScffZVtlJ5MU2lHcewQeW0lgxIQikSnhkjqpQKeWVGDEDZthV2nHxV8RFnGQZhcJ3XhZpj4hdNpgeqlFICKlYx2hmGYCZCxbj/sER4IJPhK/k8Gvh4OMKKeLxfxahwGLO+HjMaHUgw7o2Pn4rpJyJBbGvApVf5KJpsNl0noi3DUPlwOGJv357S69ffPtEk0wj8J/A+TwyPJSLAmzyFExBNgAnHnj2bN85tmXtT/sYbP95g2+Qti55IhKq6Js5HcPJ5eiwr1dfXk37hhT/uH+JQtcBnfZavAt6Bf072IZuFsWzo8qpVN+tUyrZDoVgOjD6ldBewVym127uJ3SC7QfYqpfYrpTqVoiuXS1ulHcQc0/RESGHaZOeAShHpVzni+Mx6WTCpFdY7DjqXxUmn3bIxxR3yAIKQYQhk+EKZw6sYYZtt84XeXm7I5zlJKX5QVcWliQRRBRiKUEMDkalTD5BM/3mkApIpus7S9VoO3IEfybgF+Q+Ed5dEsiV8rE9aO3VusKBgWTbr1t0+0d/jRbj18z4wDiQTIMCkwMZdGzv29fZ27shm+Q8RXo3HMbRDLpsl25tiO2r3q6+uefv06ccMVV3/bd6grBi7PAvArjL7ZCeRoinSNk//UlpaTtbz5x9lRaPKAbFEjKxS0ufmT6qIUiqitRN2lY1h5POZKCU29CbDQAOGYyOmUd5MVuSLKTaTiQg4Djqfc0OVh1EYE+GLyYuwMpPhq/k8CviHcIQL43EinooZ5IcpPsYEqZj+XUqSMxEI+3o5VBIwtQ6rqioDeD/wfxPxHSrgn4Drh/gmhQPFXJ8CXvUaVNrbJ+6ZydqBBcDxwMnA1KBrCzDJ0PtwJvPlC2vr/rM6GlHxfB5LhFt6esjnnb4t0xZ9Ibt5zaPbtg05Q/pf+Cz7DrB3Mt7wsPPR7Nr1pOza9aSEQmfJ8uWzdTgctSGdtyydNU3DFFEhwzBNwFRKqd7eztbSYyQMA0FcR304XKRSDpjJKCovU2wmcysq5xDbHjbzfizMYMOrGOiwbb6fTvO41pyqDK5JJJgZCrlmskiYcH09qr9Ef4mKQSpQMcP4Yrx/+6oYkUH3IcWlbjwS83vxuVw6aZrKEHGMfN5Wp5+e4/HHJ0RVfwX4RJn1FvBT4H+BZ3Ad/OWwvuTfYWCpN8q7kjJzIwUIMNG4GfMryUwudqllf6JJnJq9li2dKrrrmcb27y2cefTjbF4z3CFO9Fl2z2S934onPrPth+WPf3xYAJYv/yddXy9ONtupIhFRlmUblqWUZaFee21TvnRfs2DJyeUwYjGXYPpDmQf7YsTRiGW5pjHtVEQQE6Vi7vdUjADXRSJcEIsTVgpREKqrx0wmfdTJRKgY9xyDL108E+PAO/R78VrbUcMwTMcRw3FCqrZ23Ge+VLj5BeVI5iHgI7gJb6OB5amfp3BzDP4a+JegmwtwyGHn7G/auX+PVjW+MC/ZNMuMJdbQMHVdZtMLKx566Lbhps5I+pjN8rjV9A9voinGI498uX/YvGTJNaqmJuRMnaqUYUwhn09rv94EQGcySKLKrQhQXAEAtzqA2DaSyxeNwGVSqZjv9PWxWoQzDIO/iyeY4akYIxEnVFeHKpR2mQQqhqKSNO5U1ANL2Pg9V6WUEsEwDDFE0mrPnj3j/f19EPhHn+UO8P+8nz1G58oCN3nqaEbQ0wWYDIgY5p9T8arfd3Q818eW58ENVx4OCW/8XowMhzCqbFyIphgvvPBdKematW+f7a21OztRsWg/2fQTzIhK9U+cismJcF8mw9fyeULAJyMRziuoGEMRamjEjMdHpmKKSKRs2LKWA3dZ4sgfSDL+KqbwP21ZvvfqH0pmCIgBSoXDCerq2hTjV7PsNOC/GZwTY+NmVv9onM6bZXA5kAABDgl6e3dv6u3dPdLdDJ92oxnarHx4E40PcqUL8sX5HI6N7rNHRiCHSMVssiy+m07zpAhnGQZ/G08wvaBiqhKE6+rceV4mm4rpP44g+bzvvTo+D9kwDFsEQwTlOKjq6vx4fXcJT11EfRrLh8aRZAIEOJIxactDjQfRpPyIRh00gUyEinH/kRPh95kM3/DyYj4diXBOkYoJNzRixOM+6uSAwpBDqGKKSUh7/qTS+/WJ3SMWq+oR0QZgOI5WXV171fLl/6hEunj00R+M5Uf8SdzIsFL8L/C9oL8IEODIwngQTY/Xy/VLu92Og/LnhMmnYmybb/b1sUaEsz0VM63YF1Nf74YsT2IV089blnWgxtmBjQC3VE4plFJpEUzDICRiRExTJBbboyEkb3rT34ptax2JVMndd//vwZDOVPyd/2txKwEECBAgIJph0Yub29BfHWCD1hgUGRAnlYpx/8iK8Lt0mm9YFhHgnyNRzonFCBUiyhoaMYvniKlExfhFlE2AiimcQw8qLHrg6CkfogmFIn2GoaJAlVJKRHQkl8NRKu+I4CilHMfpci666Godjcb09u27Zc2aO0ZKOh8BanzexseYxM5M75rPAE7BLY8zDbdSbgTXXLwXN8/nT7hhpiOpqWb4tEXBjZobMBbwlOCluIVFY157Ww/8EOiu4FxJ4ELcGXAX44Z8x3GjlnYB63BzlX7ntePxwlTgzd4zXYCbAxXyzrnDG3j80buWkX4XYfx9f9rneR6NW57oZGC2957zwG7vWawE7h2Hb1Phn5Rcaq82Gez4j5Q5ZnSI8/ndf7lv8TjgEuAE75nUet9jF9CBm2bwe9zk6or8QuNBNBnPfNZPNNu1dkOHJqmK2WBZfDudZo0I5xkG70skaDe9vJhohHBDg1sQ9DBQMVJ0Xp3LDQprLqDPh2ii0USn+96UFtExEWUrhS0iNihLaycPRl7EsvJ5bTU1Je0LL7xK33//ZoGHKyGcGG5pmVKs9DqVyQYDd26P9wMrir/pMjgTuNrrLO7Aram2qYLznAfcX/Ki1jAwV6IN+BpuTpBfRY8nPJIrhxbgU97zryuzzQLgLOBaj3RuAL7hQ3gHg8XAZ3BrdEWH2GYF8A/AHuCbwFc9Uq0Ej3udZDEu8p5xASfhljo6H/8irQtw59/5e2An8AXg+4xdJfAmbzBSTDZpj4CL3Q+fBv6jDFEVo36YgcZVuFWeh/rWr/C+kWVDbHcCcLn37J7BjQy9i2H8Q8Y4NE4L2Fa8YLcIfY4u6uXLqBQZSEIHUx5m6GO4f2RF+FVfH9f09fG8CP8aifKpZDVtHsmYNTVEmpsHkowUK4wD5WF8C2HKECqmqBCmlCUZXZ5kikrM+KmpA9NV+7//Lh+iicerukVIikgDqGaQFpCpoKa6HZVqBppEVJ1SksznnZjj5EMXXDDHaG+/pJKKyucDrT7Lv87kcmQqr2N62lMnl1VAMqUjznd6ZPGXIzxv8a+AY4EncSe1Gk2b/WtvdP6JIUjGj5j+2+ucm8bgmYa9znqN92yiFe43Bfh3H+IdyXNUJX3evwCPARdQWSXwVuDbwM8YfYHXkV7nWG2nKrjHGcB9wM+HIRk/0rnDey41E61o8EZxJxYzT4/WVBlqUqgYPBXzzXSa50Q43zD4m0SCVo9gMBThpikY0eihUTFDVGIeUsUUXaPOZsv23QrYprUf0ez3OoAwiDdVhNLuFBDaBpVXSrJAWmtJgUqJ0Oc4dnbhwmarpeUtes2au4YijLf6LNvpfeSTCcd4piN1kMepBX6JW8jzwVEeY7pnpmgdZUf2/7xR8WgHlWd75z/3IM2Ov/DIe7Q4ynuGbzkI9WvgVvD+yCj3v8IzQb2LI2eq8lOAOxl9qSblDYBmeeq/cyKJ5tXSBXsdm6khc0iCmIiIsowI96TTfMuyiAH/Fo2yPBbD9OLiVCxGuLFxoMN/QiPKZGgV4+OLGURkXm6SL6d71/hyyfUrpayqqrpd2Wxf0969ry3NZFLTLCtbq7U2lVJ2JBLrNc3Qvng8ubWhYeqaaLRqJ0hUxAgDvbZtp5uaqq3Fi9/lrFv3EynzQV7gs/yeMTbNjAVCZUhGcHNwnsHNwt5fNOI9EzjVp0OP4oZrL6EyH0rpM/ueD8kUPoLhRqv/TvlKCNq7jz/hTg5neeaXxZ4pr6Fk5HrjKJ9lErjbM0P54SWPODZ71zDFO985PqqnGrf8/cm4/rCR4h9LSEY8pfSIZ4URz0R5pncOP3J+hzcwuukIIZk/eAMiP8vUI56S3uW1iZnewOMYn+/uZOA2T8E7E0U0zw0atto2x0SjE6JiFGAL7HccurWmTzSOCA5wWzbL8yIsMww+maii2TT7jWxmbS2hmprJo2KKt69AxRT2dHLZIUkmI8KTJUQTDld17ty5+eyNG59+B8gwlZOV1dAwbXVr6+yfNTfP/JOINg1Dq0xGpdvaVD4avdRZs+Y3pa+sHdeBXoqHDoMG+Rquff42r4MrR6SneqQy30eVfBD44gjPe4k3SixgFa7P5DFv5FiD67i9yqdxX4HrC/FrOT/zzFgvl7mXBPA3HlEVSp1chRtROlIF8YMyJPO81/E/iL9DuR23yOp7Szq1eu8Zn83I/CUn4ZYhKv7urvOIRnze5YkeyS8toxJ/zvgGSxTwa5+Bex3wLQYGCaSAayhfSWO1zzd5pw/JaFxfzudwZ6n1+87Pwk1FOMbne/0wril80E7jgXneR9x//L8MhfhkXV1hYD9uKmaLbbM6m+U3ts1rUl7dRoHFyuCCcIh5kQizW1qIx+NFnfoYqJiSScnGU8WA9E+H7fT2+hJMAdu15gP5gcEtiUT9S+l05zwGR7gMBamublk9a9ai/5kype1pEekG6YvHq/LPPtupX3vtV8W3fGEZE9kiBhfDPNQ43uuA+nCdnjfikx9WBu3eKLDNx5w8v0zneAEDHdV459/nPTcHN/fofygf5VMc2NkCvOCpg2JkcQMbflKh6WcWrqP32GHMSeXmof97XN9GKX7qXcdwHbXyyOgGn77qPZQv1/I0g4MBshyYj+WruE7v4cob1eIGqvj5hq4GbvZZ/j3cyhbF+DRuTb9iTMGNrisNBmip4Fub6imwYqHQ6S2vJMva9L63UnNo3nsvt1ZoDr3LU56UXMc879sd8HGOBzoomRPhHtsmo2WA8h+xM38IktnvOHyrp4f39fbyHcsakmTAjUddI5r/Af69tpZ/tCzuyWTYZzvuBG0cmC/GN2y5X2EUzRdTMheM6+T3KYRZHCxQHFRQomKkNCDA5xz911AgphICEZ+os50+/pnGxra1jLyEhert3XXqCy88dOvatU98ynF0o4iKp9P50PHHT1U+NvZS9HmNbTKi4Hz+zxGQDN79+OUDzfbMUpViVlEj/mevcxzq/RSv+5wPyWivc7yNyv0LHbjRX6Mp1tjiPbtS3OWpo0rUgOAGJNzis+66EfZfBZL5P9wpKSqpodeNW/Xbz0TwtsPYZHalD8noEZAMnrp9u0/7rfcGGEwE0ViUhFpqz3x2UBFl4k9CmyyLj/b2crszssjDZDJJS0sLpmnSCdyaz/OhvhQ/zaTpdJzRRZQVSr8MG1FWxuEvUhRRNkR+ThHB9JOM1m5Ic/8mg6naAP7sQzT19c1/amtbeCujcnJKePfuTX+3evW9P+7q2j8NnDBkjYaG84vJpq3Mx9ozCRviZs888NIo9/8lblhu6ej85BEco8Eb7f7e62wrxXT8Q8i/65l7RopdnnoYaXHTf/I6nWJs865tJD458dRHaWjzcT6qZTi8Anx8hAOqlz0FVorTqDxybjIhUmJCLOCHIyCZAvZ45lV81OYAy0hoHG/oEUqijF618swMhyo2g1ViSttm23w4lRrx1HENDQ0kCyX9izpyBdxpWdxjWXwoEuGkSMTV7CW+GPD3kxy8L4aByZm+vhgGqJjC/sUkU44vMiL8sYRoDCPUV1vbsqGxse0hrZ2tu3Zt+CcRqRrpC8/lek5ct+7RH59wwrkrlMrnZs1azP79DxSPdPxGjAeDCxh9NFRhTnU/dB3kdWW97/+vSpbPH+FxtKeORtIxXs3gKXv3A/92EPfzBHA7blhyJajG9fGU4jOUiUqqgOxu9yHQt+BOAVEpPuup6JHiNp9zN+CGBb96mBHNWzx1Xfq9//Moj/cTz7RZ3L4XeL8XJ4Jo7vcaSL9qWpXLcWEi4ZOoPrqAgIwW/nuEJKOUYsqUKcRiscEdedG/LeBruRxvcRzeFothToQvppSEhvDFlNrHXDWTH1KQCK5/prR3r6trfTEUCvWJ6PzRR5/83Wg09IutW1++TkS/E9cxXPnwU2xj375d9TNmzN4XiST8TBelFsyDwXJGP7/MhiGIZizwgg/RjDSEdBU+gTVDfd6eOcNvtLrvIO/nuyMgmjf7DCy2llEGleIen87+rBHsvxPXsT4aPM5AH08B8w5Donm3z7KbGP3MnGnc6g1X+LybF8fbdAZugljHAImjNbscZ0gz2EhMaU95EWSVwjRNWltbfUmm1ERW+Psu2+Z3mSxqCD/JSHwxpSQzwBcjlftiBprQwMlkhyYZ70Qv+pgX6+qm/FlEbKUMC5Q1e/ayTRdf/K4P1NVNW2CaoU8qZfzZx3RSeEs504xsaGhov2XWrKXvOvPMt50/bdqCLfF4nbz88mPDmWkNjlzs9Fk2UpX4qxFuPwM3uKIUt47B/TxB5Zn5b/ZZ9gsOLoz9zz7KbiHly7H4DXxHW448g//UEi2H2TcZL2MBuO0gj/u0z7KlE2U608BvcG2i/Xgpl6M5nhi1iiksFIS78pUPiCORCM3NzRhefoyUMYH5/f0T2+IMHaZOqUOmYgab0YrmnLEtxLaGJhkEG7h9sH/GmTJl+p+UwlJK5UUcJxIx9YsvZvS0aRftaGnJfDUUCn/tyScfnGXbuWXhsNNkGFE7Eol2xmJ1r7e0HLWjvr6pu6+vE8MI20phgVhax3Vn5yPFj8WvkSc48lCPG3nmZyYLj0QcAo+O8Nx+eTzbikeWB4EcblDA0gpU1RllOvqDwXZvsFNMLFNwI8MqmaHvYNXrNgZH3yUPs2/zOAZn8O8Cnj3I4/qFQR81UUQDrlP0YxSFJv46l2N5PO7frKjclLbPcfhzhWomkUjQ2NiIUqosqQxFOFqEzbbN8eHwxPhiYED5GN+8nSIlpDOZIQmmgE2OM6hF1tRMfSWRqN7lEoFYSpl2NBrVW7bcKgBr1+JceOEX1AUXzNqUy2U2O06PgqzK5QwFjnKcPNlsN+FwTJSyJBar0r29ltx774bSl+Pnj6nFdRo6h1FjNbwOZpbXmOZ5v6O8X2MZM+FIkWXk0V5LyiiBsZqltBLfVYNHtMWwPetGzUGcW3nPJOKjKiohmm0Hee+dBzlwmAzwC1N/cRRKuxR+o9zWiSSaJ3HzB+b2f/Vas8mymBMOj1jFFP5Iac09mcqKqSaTSRoaGsqaxiolnNcdBwmFUAc9tfLYqJgDyZm5gfuXIRkFPOZjNmtqan9MRCyljJyItgzDcKySyWruv/+z/Td09NFvU4Yxi5kzq4nFYmSzXYTDCWw7yssvbySV2sTrr9/n9wr9phGswU0+G63/4Hu4WefD4Vb857+pFEfhZjyf7TXWaRPQyXQysrBqgDk+y14ew2uqZEDQ6kMGoTG+jtJvqBL0HeR58mXI73DCbJ9l53LwQTnDvpfxJhobNwb+88ULH85mmRsOlxQWrsyUtjaf58ZMhg0VqJmamhrq6upGpWJKt0tpQRVl6R9SFVMw19l2RXkzAPu05vZBZWeM3NSpsx5WSuVBciLKAkc7jln24a5f/0sBWLduTOR1xFMGoyWaHVSWhzPaDO5zcYMNzmPi/Umjic7yCzbYOcHX3TzB56s0xPhgpzk+EmqbTTlU72UiGs+PKIkuus2y2GM7QwcE+KiYW1IpPppOs1uEi4yhL72urm5IkqlU4RS2MxiGZIbLi5Fh8mKGIZkBeTHecZ1stiKSUcCTPmpmypTZT0YisU4gJ0JeRFvRaNTp6Ng4Ht/BS2Ua6wmTsEFW4ZZOWYkbQj2SdpLFLVmz6SCvYTSOa7/Rfe8EP7uJ9rsdbqriUCJxqN7LRBDNVtzQxAEy5/FsUSSXH8EUkdAL+Twf7u3lR7bN5abJD6qrOSccGZJkqqurDyQyDkMqlWxX6/l3BtQdG0l2v19EWUHF+CRfMuBvBhAM4JKMHwn59TQi/HRwEIC0ts76A659NQuSMwxsywrJq6+uHI/R26v4J2eeOwkb4924eSDGECakbbhhnd/FTU78K8+sVqjp9rlDMIL2M+dNdMHSoOOfvDhk7yY0Qef5Ku6cHv03+o18juWxKHWmWaZpCb1a86t0mltsm2bgS7EYJ0ZjKCBh2EOSTCXmsJH4bJoKEWcT4IvZqzU7HYc9IvSI4IhQBTQoxVTDoMWyML3qzEMlZxZOvNq2BwXJ19S0vNrQ0PqiiGRFJGsY5EUMR6nEeJkIcriF/VaULF/hde7pSdIYb2Rw/aaCUrkLN3HwUeD1SdiR6IMwLVWCSgam2TLLLh0n89OzBBiJ2i7F77z+eaxhHQqieQI3U/qsYlXzQCbDFcmkr6/muVyO/8lm2SLCFabJOxMJGgyzv1uv9zGd1dbW9pPMwZBK6d8CtBnGQHIYY1+MBtbaNr+1bZ72pr7229eyLBqyWd5hmpxqmiSV/yClQEC9IvzAp+RMe/u834hI3lMzWQjlEwnT2bBh53jaou/xIZoG4C9w8ywONU6h/Ayg14yBOWy84Rc80DCGx69k0q/OIfqAFAEOJfzeTa/3fSCjpsUAABtCSURBVI8rJsrBqXFLaw/o8b5pWezs99W4HWOP1vwwleITmQxpEW6Ixfn7ZDX1xoFy/gI0muaAoVoymaTGK/F/ML4Yv3WzgSbDGDdfTFaE7+dyfMGyWFOGZEQE27bJZrO8BnzNcfhIPs9axxmkhwsko4A/Os6gkJJkcsrmlpaZTyqlcrjJaFmlsESq5OWXfz6eRHMn/r6HjzM5kjc/4nMdT+FGnI2UZCKH4Pr9IvtmjWFfUUllg9d9lEuEwy+58UjEaz7Lpk/EiSeyca/ELakxALen+zzyEJ7L5fhQby8/tm3ebpp8p7qGE6JRryMd2LnHleIvPLNbPB6nvr5+THwxfuveZIYq9MXIiH0xIsJt+Tz3Oc6Q16S1Jlvi/N8NfNq2ecy2UQz21ezUmu/7qJkZMxb+CsiJSMY1WZk5cBww9Dh/A1vxnyrgNNwaTIcSEdyS/KW4vozJYTg0H4J76PBZtnSMjl1XYae0h8H5NgaD5y4JMPHwq25wNBOQDzSRRCO4oaIDnCt3OA6PZDL8wFMxIsKX43E+kKymzjAoF5WmBU4LhwmFQv15MmOpYgrrFHBsyKxQxciII8qesW3uLYoI8yNEESHjPRu/h3q947DJcQY8IQ38zKtAXYz6+rYXW1pmPOV2nioNZJRyLJEq5957b5yIEM4v42+r/yr+hTcnCtN8yCGPa/IdDZYcgnvwCzo/jgOTlx0MzqWyuYpy+FcimGxBH29E/Nmn7dUxAZGfE22u+BM+dXU+l8uxWWveGQrxv9U1LIv4q5gBvSuwMBxmZlMTqshPMVYqpoC3GQb1SlWmYg7YrYZUMYV9MiL8wLKGJEQRIZ1O+5JMMX5SRCoKeMpxWDloH6VnzTrmNhE8k5mkDUNlQVnRqExUnsAjuKXv/Uw8/8fIJl4bS/hNY5DmwHTNI1VH5x2Ce3jCp7nEcANxDhZXjmDbh3yWXc6hMScGOIAd+E+B/ddHGtEA6l/xSdBrUor3VyWpHULFlIY9J+vreZdXzmYsVUzh75AI54XDBxxLw6mYYiKpIC9mjW2zewhC1FpXRDIAj4vwmmcm2y3C133yZtra5j9YV9f8qmcK6gPVp7XOR6NVzrZteyaKaAR31kS/0g5/5SmbQ+GviY3hsd7CyCs1jwVewt+X9LGDNI8cixuwUSnuKqMY3xX09YcUGv9KGu9lnE29h6BByw5Qg0q7/9ZxeDo3TG5N8R/RKEYiwemRCMlxMJsBXBMOe+Y7Bk+tPFIVU3IMjXC7bZe9Btu2y5rLymG3uIUzb7btQQkrkUhy/5w5x/5MRHKeyaxPKTJKGflYrEavXXvnRGY+r6d8ef+PesomPsEfpl9EVNLrIEeCKuA/DlFHIviX4j8Gn1kPR6DOvsnIIlTXAM/7LL9+jDo08xAq38MdtzA4DL4O+Apjk2cTmSREAzDjh/iE1P1nNssO2x5SxRT+CnkRZlVKcU0kOiZms+K/T1eK08PhASpGDkbFFB8DYYvjsKXM9VmWRTabHRHJ4A1Z77VtHhq8nxx11LIfhUKRbqVUBkgpRZ9SkovHo86rr3YeivIaNwI/K7Pufbi5KmNhO1YVdkpbGVzLK4Q7W+BIOsBvcXB11Q4W38c/eOFLwOmjGIj+N3DmCPdzgK/5LG/DDWM/mKrH0zzF1EiA0eBZ/ANyrvQsDQeDi4FvTyKi2WIbRvTvSk1oPcDX0mnSAzLiGUAwAhixGEZRJeVl4RAXFOXVHGzZmSnAVdEo5hirGIqKcRbmhSm9hmw2Sy43uvnAXhThez5RZq2tCx5qaZn+FJAVkT4RSYn8//bOPLiu+rrj3/O79+3aJVuLV7DwhsHB7AkEOmwBMiEdJiQ0DaRpkjZJm6TbDOlk0qbTSadpZho30JBkgCw0U9KkhiQ2xoCXxHUAb7KNjTE2koUstNha37vvvnvv75z+ca9tWX5PlmzZEuH3mZEl6y56d/t971l+55DDDJ/I4r17H5sKoWEAfwpgfYnlKxDGHJ6Mfp7ovRpHmJb8AsaX8fQ2ijex+nuE82vORCoa5B8YcXxTQTuAR4v8/njFgzvGuZ9UtJ+/iP7voXh6bCmeBLC9yO9viq7JgrOwFP82spTugOFc+ApOn2ZAAP41smwm6kZuRthpczVOr9w9lUIDVFRcdVgp+wujH8gdIngsl4N/wjo43ZWmUqmTs/KjzLD7k0ksBs657ExGBF+Jx1FFNOlWzEixWjsqnVlrjXw+jyA4+4ruPy4iMul07ZHm5vc8KYICEeUADCtFWQAF24beuHH7VBYLdBDGM9aOYaR9PBqwdkUPwUcQxgxmRoNnMjL9L0I4Ifjz0SDXjrAf0ngLYkq0XTH32bpowC1WKyqBsLvgVpyc7OkBeHgKz+vXUTxWUx0NBo+NIb7p6JzvAPCZEb//FkKX53gJoheJYlWTrx1xPS8dw2VjA7gGYavgQwgzFqthmAyr5p9L6MHfRNfmswDqxthHJYAPI6yUsRdhQkHJ58yeqiMdGPg/Wbbso/+zd+/P3isiXxy57BmtUZt38LF0+vQ7UACy7VMrGkevX19KpfDNfB6HuPSs/LHEpwrAVxMJzLKsk1YMxrBioiXFWisXs2KOc4wZR0YIned58P3JL0mlVCy/ZMm137EsexhAXgRZgIZF4FiW8m27XOdy26e6Km02EptvAfjCGDfrshGDo0QvKDzibUxN8MWp2Al/BGEsY3RcpgLAdxDGXl5G2IRLRW9vV+H02ff/DKB1Cs/pAMK2yy8CKC/i3vsUgE9GYrQbYWZdHMC8yHocvc0mAP+EUTULx8Gu6G89idOTETLRoPZXCLOhXkXYhMuLxH1uJEJVMPXTzgffQNiNtVh77oUIa/h9J3q5OIiTVQVqI2t0ESZQ3sieyiN99dWnuLn5mocOHnxleWRSn+DxIEDKcXDPSLE5Q/2wKiI8lEjiUTeP7RPsP3MpET6fSGAGqVOslnPtF4Miy3sjIfR9H57nTTgWM17X1KJF1z5WXl7dhjDDaxiQIYBygHi2LXrt2kemS+lzD2ESwPPRzT3vDOsfj7ucTUD4DYRB6adKDNAPAFhTwn1QNQ63zRPRQ3z/FJ/TrQiz+H6B4lWdFU42axuLl6L9FM7yc/wsul6Pl7AIFcKJoBOZod53Dp/HEDlRADwYnccHSoh5HOE8rOUT2G/ntHKdnVA6e5ZbWzvnfhSZtfpIEGB1Pj/CsIjSfj2vZJykXBG+nErhQcs6cebGFBwR/Ilt46FkEnUTEJnxxmJGLpfoY3Z7HhzHQaFQOF8ig3nzlq9qaJi/BUCBCDkAQ4AME0k+Hrf8rq6Ap+HN/6vIavkKJrdoZYAwLvCRaP8/Qumqxhsil8Cxs3hwvxG5HKZLx9AXInfinrN5UYlcbLfh7OYSjeQphAkF289xP34kWO/B+WnW9W7DQ+ju/XOcXf+jkXQhLOH0Z9POogGA/ftXyY03Pti9desz9xYKgy+KyCnpjyt9H74I7kmlcHyGTTA4CBDBSiaLtla2AdyZSOBK28YWz8cqHcCJYjkU7SMpgnstC9fHYqEVAyldCHO0G20iAnNcZETAftiorMsrgPn8jfMNDQs3XXTRslUi4kUiMxgKDeWUghcEtbxr179P10ZOWYQZUiujAf8+hNWUqya4n6ORm2stwlhN+wS2fS4azP4xci1kzjAgbwDwNQBbRvx+qMjLU6kmbU6RdQ9P0vncBeBqhPGWv4zcImcazF8E8C8AfjNqWUeRzznefjc7AVwXXc/PRz+PxyKVyH2zKhKZ8dScO1zE/edMwkA6+tiLDc7dRdbrK/FicmCUSzGP8SWRHN925Ph9tsIrCDvVrorujwfG4VEY+Xm3IEyp/2+M0cV02vg+7777E2rLlg3X9Pd3rEGRgN8nLAsfS6UQG1EFQMUTsDIZUMw+tSHZCOuDAHjC6GXGIDMYQJoITUohDpw5FjPKihktIGe0YrSG9gOI7+N4ocvHPe+0bpeTxYwZF21duvT6h4mUA0g2fBjkaOgW0rl4PO2vW/fEdHnjHi8phP7k5ZGrpzFyB8Wihy4XPczHZz7vQVj3y5uEv12NsHzKVQjjBuWRhdSNML7xfDT4vRM6MNoIEyneD2AxwgRLOzp/HQiDxBsxseyys4EQxrduRFiqZ/YI954bWZMdCCegbo0+D8Nwoe6RyxDWH1yMsBhqKrrncwhLLLYijKntQPEeU9NXaBoabqcVKxrVxo2rbnKcoaeLvJHgTqXwmVQKZaRGiDEA24ZKpaDicdCJCZbRP6XK+Y9aPmlWTCQuHAQQPzitIRkB+K7n4VfnQWjq6ua1LF16/UqlLAfhXJkBETpGJP0AsolErLBvn8ft7T8V8zwZDIYLxbSZXZvNHkImcxEuueTStwYGjm5x3dyHMGp2+EER7AkCXKoUqtSIamjMEM8D5/NgtwDRGiIcqujIvjWj58VMghUjzEAQWizseeBCARIEEM0o1Va5RWvsn3RLZv7WpUuvfyQSGScypftFZBBALhaLFbJZn1991YiMwWB4lwoNAHR17cesWUtlzpxFHZ6X35TN9n0Qo2YR9wJYGwSYC2DWiID/SSuEIYEPKRSgXRfaccLkgSAAaw3RDBF96lyY0ZbMcYGRk9+hdbiPQIN9D1IogF0XEu1btC5u6RShjRk7J9GiaWi45LdLllz7PaWsPEK/6ZAI+okwQMTDlhUr5POKt2z5iREZg8Hw7hYaAGhv34u5c69DbW3t276fX+M42T8Q0TNGrqMBbNIauSBAs2UhdTK/7FS9OA5z6MbyvVAYCh50JBQnvvLHf86H3wuF0Drxom18PwzmB37YuqVYyf4ztVVGNPtfBBvGITSXEyGJMaN8PH/+5c80N6/4r7AKM/IABkXQb1kYEMGwUlQgqtGbNn3P+LgNBoMRmuMcPrxdLrnkClRUNPan08lVg4PHLtM6uHj0evtFsM73MQdAk6VOZKVhtJUzlgiNsGJKi8N4BGT8+6gkwlbm07pDAeFEg/uI8CGlMIgw2lYMpezCokXXPz5nzqK1CIPeDsLAXD8R+okwTATXsqqCF1542IiMwWCYMqb1jNvbbntAiQR2EOj07t0bv9rX1/3lUuJ4IxHuj8exwLZHacuZBObcRGa8Vsxojolgi9ZoF0EGwCwizCHCDCLsZsZKZpQqRpNOV3cvWXLdw+XlNa0jRYaI+gEZEKFhyxJXJOGvX/+4ERmDwWCEZixuv/0TipkspZDYt2/7nZ2dB1Yy+42l1r9XKdwVj2O2siDTyIopeQGitOwCwiSBHzLjrTH+ZEND8++am1f8JBazcyLkESEngkGA+gA9IKKGicitqMgE69a9LK7bYuIyBoNhSpn2PR0OHdot8+evAACurm54s7JyxirHGZpfKDiXFBPK10TwyyCAqzWqiU72k5kGVszofRAEORFsY8ZKrfG0SMmkdMuKZSsqZh4sK6t+mwh+KlXeA1ABoCyAASIaANSwZcGNx2cGa9Y8zEHQZe5wg8FghGY8tLa2yMyZyyWRACeTmdycOQtXBwEfyGb7rxbh8mLb7BPBaq1xOAhQBqBCKSRO1AWYOitGIiumUwS/YcY3opbLY9T4kPr65t/V1DS91t196IbBwe6F3d2tNwwO9jdXVtbuisXixxDWMRsW0W4iUeWvX/+SMHeau9tgMBihmQgdHbtQW7tMMhkR32ddW1v/Rn39/F+4bkE5zuAylGhV2w5gPTOeCQIwa8QQVgZIEJ0iBxfCiullwW6t8QQzvs+MbSJjVgYsL5/ZtmTJ9d+bN2/J2vb2/R/M54dOlOdx3aH6np6O95WX12xPpTJdALlKkWdZgSYK5NixN83dbTAYjNBMlM7OPXCcRmlszAigWKmEU18/e0tVVf3afN6tLhSGF5Q6Jg1gtwieY8azQYBu5kg9CAkAMZo8K+Z49tuwCN4SwXat8f1A4wes8VuRkgWvjpNMVvYsWLDipwsXXvmTdLqsGxDu6mq70XWHTqkDx+ynjx7teH95ec22VKqiVwS+1tA1NQ385pvbTGzGYDBMC96xfR5uvvmPVSLBludRTISSSlG6p6djWUfHG58bHDxyh4hMqFfCzURYpBQaiVBFhHIipKN5LKUqjwoAN5oX40TxlT4RtDHjVQAtE5yUmUpVdc2Zs2hNY+PFm4lUAWF9IQ0ABw5s/3Rn5/4PFNsuFkt3XX75zZ8sK6t+TSkaUCrIFwoVwebN3zdiYzAYjNCcC8uWfYgaGmYoZscGVFwEKaVUpr+/96LOzoMf7+lpu4c5OOfe4mUA6omQRljG10FYGvioyGRUbeSqqqb9TU0LXpg5c852gHwiCqLKy5HYEI4cOXjTgQMvfbW0SFXvufLK2x6IxWKdIhhOpcoLzz77qEltNhgMU471Tv7wPT2vo7f3CixcaDOzYhEVAOwnk8n+2tpZL8+du/Tntp04xIx0oZCtx1m2RfAQ1gPvQVhSththbfRzKYGcSJT3NjUt3Lhw4dWPzZu3dHUmU/kWoFwicgHkiDAM0BCAIRFyU6lMb0fHgQ+LcFFLLQjc+kKhQHV1c14G2EskVJBOL5fu7hZzlxsMBmPRTAbz5j1IS5akldY5i1lsZiQATgJIA5R2Xae+q6v15oGBnvcPDnYvZw4qLvBH5FSququurmlXTU3jK9XV9QcBBETQIgiIyAPERVgm3QHIASQvIoGIspVC5Z49m79+9GjbH5a8mKScq66669Z0uuINQA+nUlX+2rWm9IzBYDBCM6nccMOXqKwsqzwvbwGxGBDEiZBgRipyrSW19iuOHn172fDwsStyuaEVx461Xx5tPlkdR4VIBYlEeU9NTeOBsrLq16uqZryeyVR2i2gGSEciE4STLsUVgUtEeUDyAPJKWW4QwANElOKYCFX293ev2LXr+afGsswaGxf+28KFV31bKRpIpeKFNWvecb1nDAbD7xn279sBbd68UgDoa675KFdVZTQz+SJUEPHzRBIXkQSRNTRz5pw+xxme0d9/5D4AVF9/8ZaZM+f/xnGGZnmeW10o5Gs9L1/tutkyz3PSIjohAisSIw6LVVpBIlGeS6crBmw7NpBMpnvj8VRPOl3eWV5efSQeTzla+4iERYuIJqIAYRfDAgCPCC5ALhFcESmISIGIPGYEZWWktQZcFxqAXVMz87Wamtnr+vo67ip1/P39XXfbduK7Wns2s3hEXyKRlSYpwGAwGIvm/Fk4n6VMRimRYRUEtqW1ZytF8dbWfXe1tbU8MUJs+Yorbv+HqqoZh0Tgh2JAgVJKlFKKmS0RViJQRATLshgAtNZgDo0GIhKEnQCFCCwCDUATIUCYQeYD5AHwAPHCmf3wRNhTyvZEgoBIaduOa8sSefnlDlm+/BIkEv2258WSWuuq4eH+pS0tz/2cWZeVOGS+/PJbbqmpqd+tlM4yz/A3bnzYCI3BYJgyrN/3A2xv345Dh7ZJLHaV1Nb6bNspffjwgUxb246ficjIPvQUj2cGq6vrdwNwwmA8hgDJiXAegAOIQxR+F+E8M7sA8krBISKHCA4RckSUE6EsEbIn90NDRGpIRIYADEfLciLIE1luPG75yWQ6cBxXb9jQJgcPPiP5/Jtoa9uK5ubb4ft5EAkSiaRjWfaRvr6uW0pcP7Lt5MHa2qYWEdsrLwcfOLDDCI3BYJgy7HfLge7f/4S8/noTbr31Vmlr2/kpZp49ep18fng2IAFAeQADRMiGVghIBARAAaQi44VCK0YgQhARIQITKQaEiRDFYkSHlo1oImgi1sy2tm2wUsT5PLGILRs2HASwqaggvP76sCxenAhcdzgvQmr27CW/BkgOHdr5DRGdGb2+42SXA7CJoHxfmbvcYDAYoblQvO999+Dw4a0p3/e+UGy56zqVAOlo/koOkCHALgAsAJFSIECImYjZgggTQKKUQCkIEQughJlEqUBEwCJxtiwtRJqZLQHSEgSOdHYGcvDgYYi8ckZro7X1B1Jd/Umuq7N93yeHWWP27MW/TiQy3W+8se2bnpebO3L9QiF3EZFFzB7lckLmNjcYDEZoLhCplFadnW0fAGRWseVaB5ZSSjNzQESe1rpAxG5ZmcXJZBoDAwPEHINlERIJBWYBswLA8DwLgI9kkoU5DtdVorUnmUwWQ0NJeeutLDo73wTz3rNyY+3Y8UNZseIeXVNT6WkNAcAzZsx5qby86v4DB3Y81Nf31t2IsuZcd6geEFKKkEoZr5nBYDBCc0G47ba/JuYuy3EG70OJJAjLsoMwMyxMPSayg3hc6dWrfxSlCN9JQAZz5zahvr4LQBKdnT6OHMmHBhAIwHPnbWTfseMZueyye3VDQ7l4ni9ESieTZf7y5Tf93ZEjB3/Z3r7/i647sEypmCtCAZElWhuDxmAwGKG5IDBnaWjoaJLZv63UOvF4MivCmkj5ItBKEStVMUI4nhUAaG8Pv6aCPXt+IdnsLbxgwXwvCPJMZGtm7TU1Na+bNat5U2fnm0tddzhlWVQIAtbxeNKYNAaDwQjNhSCZBO3Z88YSAJUlT4Zt9wHkA+KLUMAsYlnWtBuoW1tflNZWyM03/1FApDmsLMAFIoo1Ns7fDCAIAs9LJGK6tzduhMZgMEwp74qUpOuue4CYXRWPywyMMXcokci0E1E0kVKCdFp43z5v2h7Xxo0/5b6+Xp3JlHmxmMoz66xlqayIl0+n4/7wcA2/8sqjRmgMBoOxaM438XgSQeBD6+RYdb+ksrJuB4A8wK5SFFhWhtvavjutB+qWlnXS0gK54ooPy/z5y3RlZYx6eo5i69ac9PZ+24iMwWAwQnMhGBzMoqYmoEymfABRN+XR6yST1a11dbN2i7ATWjWxIAiq3jED9c6dT8vOnU8DZ2oDajAYDBeYd4XrjJlBZFNtbV1XqYG4qenipwDJKkU5EasQi5Fev/4VM2gbDAaDEZpxHKSqhtYKdXXzhwDqHb08kSg/PHv2wtWADDFzXinxRSz2/U1GaAwGg8EIzXgYApAXxxmUTGbG3lELZe7cxQ9bljomgiyRchMJO2hp6TciYzAYDEZoxkdFRSVisTSYidPp9NaRyyorG9fPmrXoWQCDRMpRSnlHj1Zwd/f/GqExGAwGIzTjI5/vRCymmAi6rm7OCwhL+cO2E0cWLbr6a0QYAChnWVxQCrx1638YkTEYDAYjNONn27anRam0EFHQ1LRgdzJZtVkpu3vRoms/nU5XtIpgmEi7tl2pn3/+x6b1scFgMEwi75rKAEGQFJFcwBw4zc2XfS4WS0hFRX1PWKlZeamUHaxe/Z9GZAwGg2GSeRdVXHwv3XHHYgoC32KGJaJIKWbLUjqfT/HmzY8akTEYDIbzwP8DdPvmBNG0vwsAAAAASUVORK5CYII="
+NO_END_DATE = "Never"
+PROGRESS_PAGE_SIZE = 50
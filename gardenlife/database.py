@@ -0,0 +1,387 @@
+"""
+Contains a class to store the gardens in an SQLite database, and a class
+to load a garden's creatures, plants, or tasks from it when they're first used.
+
+Gardens are rows in the gardens table and their items are rows in the items table,
+with indexed columns for querying and the item in the binary format from codec.py.
+Items pickled by earlier versions are still read. Loading only reads the
+names and timestamps of the gardens, and saving only writes the rows that have changed.
+"""
+
+from collections.abc import MutableMapping
+from datetime import datetime
+import json
+import sqlite3
+import threading
+
+from .codec import decode_item, encode_item
+from .constants import DATABASE_FILE
+from .dates import string_to_date
+from .garden import Garden
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS gardens (
+    name TEXT PRIMARY KEY,
+    location TEXT,
+    size TEXT,
+    since TEXT,
+    owners TEXT,
+    timestamp TEXT,
+    next_ids TEXT
+);
+CREATE TABLE IF NOT EXISTS items (
+    garden TEXT NOT NULL REFERENCES gardens (name) ON DELETE CASCADE,
+    category TEXT NOT NULL,
+    name TEXT NOT NULL,
+    org_type TEXT,
+    status TEXT,
+    next_due INTEGER,
+    data BLOB NOT NULL,
+    PRIMARY KEY (garden, category, name)
+);
+CREATE INDEX IF NOT EXISTS gardens_manifest ON gardens (timestamp, name);
+CREATE INDEX IF NOT EXISTS items_category_name ON items (category, name);
+CREATE INDEX IF NOT EXISTS items_org_type ON items (category, org_type);
+CREATE INDEX IF NOT EXISTS items_status ON items (category, status);
+CREATE INDEX IF NOT EXISTS items_next_due ON items (next_due);
+"""
+
+UPSERT_GARDEN = """
+INSERT INTO gardens (name, location, size, since, owners, timestamp, next_ids)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (name) DO UPDATE SET
+    location = excluded.location,
+    size = excluded.size,
+    since = excluded.since,
+    owners = excluded.owners,
+    timestamp = excluded.timestamp,
+    next_ids = excluded.next_ids
+"""
+
+# Columns added since the tables were first created, which older databases are missing
+ADDED_COLUMNS = {"gardens": {"next_ids": "TEXT"}}
+
+UPSERT_ITEM = """
+INSERT INTO items (garden, category, name, org_type, status, next_due, data)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (garden, category, name) DO UPDATE SET
+    org_type = excluded.org_type,
+    status = excluded.status,
+    next_due = excluded.next_due,
+    data = excluded.data
+"""
+
+
+class Database:
+    """
+    Class to represent the SQLite database the gardens are stored in.
+    Changes are recorded as they're made and written to the database when saved.
+    """
+
+    def __init__(self, path=DATABASE_FILE):
+        self.path = path
+        # Allow the connection to be used by other threads, eg to save in the background
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+        self._add_missing_columns()
+        self._pending = []
+        # Statements are queued under the pending lock and run under the connection lock,
+        # so the window can queue more while a save runs them in another thread
+        self._pending_lock = threading.Lock()
+        self._connection_lock = threading.Lock()
+
+    def load(self):
+        """
+        Return a dict-like table of the gardens in the database. Only the garden names
+        and timestamps are read. Each garden is loaded when it's first used,
+        and its creatures, plants, and tasks are loaded when they're first used.
+        """
+        with self._connection_lock:
+            rows = self.connection.execute("SELECT name, timestamp FROM gardens").fetchall()
+        timestamps = {name: datetime.fromisoformat(timestamp) for name, timestamp in rows}
+        return GardenTable(self, timestamps)
+
+    def load_garden(self, name):
+        """Return a garden from the database, and attach the database to it."""
+        with self._connection_lock:
+            row = self.connection.execute(
+                "SELECT location, size, since, owners, timestamp, next_ids "
+                "FROM gardens WHERE name = ?",
+                (name,),
+            ).fetchone()
+        if row is None:
+            raise KeyError(name)
+        location, size, since, owners, timestamp, next_ids = row
+        garden = Garden(name, location, size, since, json.loads(owners))
+        garden.timestamp = datetime.fromisoformat(timestamp)
+        garden.next_ids = json.loads(next_ids or "{}")
+        garden.creatures = ItemTable(self, name, "creatures")
+        garden.plants = ItemTable(self, name, "plants")
+        garden.tasks = ItemTable(self, name, "tasks")
+        garden.store = self
+        return garden
+
+    def import_gardens(self, gardens):
+        """Record every garden in the gardens dict and all their items, eg to import them."""
+        for garden in gardens.values():
+            self.put_garden(garden)
+            for category in ("creatures", "plants", "tasks"):
+                for item in getattr(garden, category).values():
+                    self._upsert_item(garden, category, item)
+
+    def put_garden(self, garden):
+        """Record a created or updated garden and attach the database to it."""
+        garden.store = self
+        self._upsert_garden(garden)
+
+    def remove_garden(self, garden):
+        """Record a removed garden and detach the database from it. Its items are removed too."""
+        garden.store = None
+        self._append("DELETE FROM gardens WHERE name = ?", (garden.name,))
+
+    def record(self, garden, operation, *args):
+        """
+        Record a change to a garden. The operation is the name of the Garden method
+        that made the change, and args are its arguments. Only the garden's timestamp
+        and next IDs are written with the change, as its details are recorded when it's put.
+        """
+        self._append(
+            "UPDATE gardens SET timestamp = ?, next_ids = ? WHERE name = ?",
+            (garden.timestamp.isoformat(), json.dumps(garden.next_ids), garden.name),
+        )
+        if operation == "add_item":
+            self._upsert_item(garden, *args)
+        elif operation in ("remove_item", "rename_item"):
+            category, name = args[:2]
+            self._append(
+                "DELETE FROM items WHERE garden = ? AND category = ? AND name = ?",
+                (garden.name, category, name),
+            )
+            if operation == "rename_item":
+                self._upsert_item(garden, category, getattr(garden, category)[args[2]])
+        else:
+            # Progress changes replace the whole task row
+            self._upsert_item(garden, "tasks", garden.tasks[args[0]])
+
+    def save(self):
+        """
+        Write the recorded changes to the database in a single transaction,
+        and return the size in bytes of the values written.
+        Can be called from any thread. If the save fails the changes are kept.
+        """
+        with self._connection_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, []
+            try:
+                with self.connection:
+                    for statement, parameters in pending:
+                        self.connection.execute(statement, parameters)
+            except Exception:
+                with self._pending_lock:
+                    self._pending[:0] = pending
+                raise
+        return sum(
+            len(value)
+            for _, parameters in pending
+            for value in parameters
+            if isinstance(value, (str, bytes))
+        )
+
+    def discard(self):
+        """Forget the changes recorded since the database was last saved."""
+        with self._pending_lock:
+            self._pending.clear()
+
+    def wait(self):
+        """Return immediately, as the database doesn't do any work in the background."""
+
+    def load_items(self, garden_name, category):
+        """Return a dict of a garden's items in a category, with their names as keys."""
+        with self._connection_lock:
+            rows = self.connection.execute(
+                "SELECT name, data FROM items WHERE garden = ? AND category = ?",
+                (garden_name, category),
+            ).fetchall()
+        return {name: decode_item(data) for name, data in rows}
+
+    def count_items(self, garden_name, category):
+        """Return the number of a garden's items in a category."""
+        with self._connection_lock:
+            (count,) = self.connection.execute(
+                "SELECT COUNT(*) FROM items WHERE garden = ? AND category = ?",
+                (garden_name, category),
+            ).fetchone()
+        return count
+
+    def find_items(self, category, org_type=None, status=None, garden_name=None):
+        """
+        Return a list of (garden name, item) tuples for the saved items in a category,
+        optionally limited to an organism type, a status, and a garden.
+        """
+        query = "SELECT garden, data FROM items WHERE category = ?"
+        parameters = [category]
+        for column, value in (("org_type", org_type), ("status", status), ("garden", garden_name)):
+            if value is not None:
+                query += f" AND {column} = ?"
+                parameters.append(value)
+        with self._connection_lock:
+            rows = self.connection.execute(query + " ORDER BY garden, name", parameters).fetchall()
+        return [(garden, decode_item(data)) for garden, data in rows]
+
+    def tasks_due_before(self, date):
+        """
+        Return a list of (next due date, garden name, task name) tuples for the saved,
+        current tasks with a next due date on or before date, ordered by next due date.
+        """
+        with self._connection_lock:
+            rows = self.connection.execute(
+                "SELECT next_due, garden, name FROM items "
+                "WHERE next_due <= ? AND category = 'tasks' AND status = 'Current' "
+                "ORDER BY next_due, garden, name",
+                (date.toordinal(),),
+            ).fetchall()
+        return [(datetime.fromordinal(next_due), garden, name) for next_due, garden, name in rows]
+
+    def close(self):
+        """Close the connection to the database."""
+        self.connection.close()
+
+    def _add_missing_columns(self):
+        # Add the columns that databases created by earlier versions don't have
+        for table, columns in ADDED_COLUMNS.items():
+            existing = {row[1] for row in self.connection.execute(f"PRAGMA table_info({table})")}
+            for column, column_type in columns.items():
+                if column not in existing:
+                    self.connection.execute(
+                        f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"
+                    )
+
+    def _upsert_garden(self, garden):
+        parameters = (
+            garden.name,
+            garden.location,
+            garden.size,
+            garden.since,
+            json.dumps(garden.owners),
+            garden.timestamp.isoformat(),
+            json.dumps(garden.next_ids),
+        )
+        self._append(UPSERT_GARDEN, parameters)
+
+    def _upsert_item(self, garden, category, item):
+        # The item is encoded now, so later changes to it need to be recorded separately
+        next_due = None
+        if category == "tasks":
+            next_due_date = item.get_next_due_date()
+            if next_due_date != "No further due dates":
+                next_due = string_to_date(next_due_date).toordinal()
+        parameters = (
+            garden.name,
+            category,
+            item.name,
+            getattr(item, "org_type", None),
+            item.status.get(),
+            next_due,
+            encode_item(item),
+        )
+        self._append(UPSERT_ITEM, parameters)
+
+    def _append(self, statement, parameters):
+        with self._pending_lock:
+            self._pending.append((statement, parameters))
+
+
+class _Table(MutableMapping):
+    # Base class of the dict-like tables, which are pickled and copied as plain dicts,
+    # as the database connection or shard store they load from can't be
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class GardenTable(_Table):
+    """
+    Class to represent the gardens stored in the database. Behaves like a dict.
+    Starts with only the names and timestamps of the gardens, and each garden
+    is loaded the first time it's used.
+    """
+
+    def __init__(self, database, timestamps):
+        self._database = database
+        self._timestamps = timestamps
+        self._gardens = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({sorted(self._timestamps)!r})"
+
+    def __getitem__(self, name):
+        if name not in self._gardens:
+            if name not in self._timestamps:
+                raise KeyError(name)
+            self._gardens[name] = self._database.load_garden(name)
+        return self._gardens[name]
+
+    def __setitem__(self, name, garden):
+        self._gardens[name] = garden
+        self._timestamps[name] = garden.timestamp
+
+    def __delitem__(self, name):
+        del self._timestamps[name]
+        self._gardens.pop(name, None)
+
+    def __iter__(self):
+        return iter(self._timestamps)
+
+    def __len__(self):
+        return len(self._timestamps)
+
+    def __contains__(self, name):
+        return name in self._timestamps
+
+    def latest(self):
+        """Return the most recently created/updated garden, without loading any others."""
+        # Gardens changed since they were loaded have newer timestamps than the manifest
+        for name, garden in self._gardens.items():
+            self._timestamps[name] = garden.timestamp
+        return self[max(self._timestamps, key=self._timestamps.get)]
+
+
+class ItemTable(_Table):
+    """
+    Class to represent a garden's creatures, plants, or tasks stored in the database.
+    Behaves like a dict. The items are loaded the first time they're used.
+    """
+
+    def __init__(self, database, garden_name, category):
+        self._database = database
+        self._garden_name = garden_name
+        self._category = category
+        self._items = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._garden_name!r}, {self._category!r})"
+
+    def __getitem__(self, name):
+        return self._loaded()[name]
+
+    def __setitem__(self, name, item):
+        self._loaded()[name] = item
+
+    def __delitem__(self, name):
+        del self._loaded()[name]
+
+    def __iter__(self):
+        return iter(self._loaded())
+
+    def __len__(self):
+        # Counting the rows is quicker than loading the items if they aren't needed yet
+        if self._items is None:
+            return self._database.count_items(self._garden_name, self._category)
+        return len(self._items)
+
+    def _loaded(self):
+        if self._items is None:
+            self._items = self._database.load_items(self._garden_name, self._category)
+        return self._items
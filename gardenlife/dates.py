@@ -0,0 +1,39 @@
+"""
+Date functions for the gardenlife application.
+
+Converts between datetime objects and strings in DD/MM/YYYY format.
+The conversions are hand-rolled because strptime and strftime are slow,
+and recently converted values are cached.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+from .constants import DATE_CACHE_SIZE
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def string_to_date(date_string):
+    """Convert a DD/MM/YYYY string into a datetime object. Raise ValueError if invalid."""
+    parts = date_string.split("/")
+    if (
+        len(parts) != 3
+        or not all(part.isascii() and part.isdigit() for part in parts)
+        or not 0 < len(parts[0]) < 3
+        or not 0 < len(parts[1]) < 3
+        or len(parts[2]) != 4
+    ):
+        raise ValueError(f"time data {date_string!r} does not match format '%d/%m/%Y'")
+    day, month, year = parts
+    return datetime(int(year), int(month), int(day))
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def date_to_string(date):
+    """Convert a datetime object into a DD/MM/YYYY string."""
+    return f"{date.day:02d}/{date.month:02d}/{date.year:04d}"
+
+
+def today():
+    """Return a datetime object for midnight today."""
+    return datetime.combine(datetime.today(), datetime.min.time())
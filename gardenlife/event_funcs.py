@@ -1,11 +1,12 @@
 """Event functions for the gardenlife application."""
 
-from datetime import datetime
+from .dates import string_to_date
+from . import progress
 
 
 def check_date_validity(date):
-    """Check date validity by attempting to create datetime object with strptime."""
-    datetime.strptime(date, "%d/%m/%Y")
+    """Check date validity by attempting to create datetime object from it."""
+    string_to_date(date)
 
 
 def clear_summary_values(window):
@@ -24,15 +25,11 @@ def clear_summary_values(window):
         window[f"-SUMMARY {value}-"].update("")
 
 
-def update_task_summaries(window, garden):
-    """Update total and outstanding task summaries."""
+def update_task_summaries(window, garden, current_date=None):
+    """Update total and outstanding task summaries. Today is used if no date is supplied."""
+    outstanding = progress.outstanding_tasks(garden.tasks.values(), current_date)
     window["-SUMMARY TOTAL TASKS-"].update(len(garden.tasks))
-    window["-SUMMARY OUTSTANDING TASKS-"].update(
-        sum(
-            task.get_current_progress() in {"Due", "Overdue", "Very overdue"}
-            for task in garden.tasks.values()
-        )
-    )
+    window["-SUMMARY OUTSTANDING TASKS-"].update(outstanding)
 
 
 def update_garden_dropdown(window, gardens):
@@ -50,7 +47,7 @@ def clear_garden_values(window):
 def update_creature_dropdowns(window, garden):
     """Sort, filter, and update creature tab dropdowns."""
     creature_names = sorted([""] + list(garden.creatures))
-    types = {c.org_type for c in garden.creatures.values() if c.org_type}
+    types = garden.field_values("creatures", "org_type") - {"", None}
     creature_types = sorted([""] + list(types))
     window["-CREATURE NAME-"].update(values=creature_names, size=(25, 10))
     window["-CREATURE TYPE-"].update(values=creature_types, size=(25, 10))
@@ -67,7 +64,7 @@ def clear_creature_values(window):
 def update_plant_dropdowns(window, garden):
     """Sort, filter, and update plant tab dropdowns."""
     plant_names = sorted([""] + list(garden.plants))
-    types = {p.org_type for p in garden.plants.values() if p.org_type}
+    types = garden.field_values("plants", "org_type") - {"", None}
     plant_types = sorted([""] + list(types))
     window["-PLANT NAME-"].update(values=plant_names, size=(25, 10))
     window["-PLANT TYPE-"].update(values=plant_types, size=(25, 10))
@@ -100,6 +97,7 @@ def clear_task_values(window):
         "START",
         "FREQUENCY",
         "COUNT",
+        "UNTIL",
         "BY MONTH",
         "INTERVAL",
     ):
@@ -112,6 +110,31 @@ def clear_organism_links(window, garden):
     window["-TASK LINKED PLANTS-"].update(sorted(list(garden.plants)))
 
 
+def deselect_organism_links(window):
+    """Deselect creature and plant links, without updating the creatures and plants listed."""
+    window["-TASK LINKED CREATURES-"].set_value([])
+    window["-TASK LINKED PLANTS-"].set_value([])
+
+
+def update_changed_items(window, garden):
+    """
+    Update the dropdowns, links, and summaries of only the categories
+    with items that have changed since the garden was last cleaned.
+    """
+    dirty = garden.clean()
+    if dirty["creatures"]:
+        update_creature_dropdowns(window, garden)
+        window["-TASK LINKED CREATURES-"].update(sorted(list(garden.creatures)))
+        window["-SUMMARY TOTAL CREATURES-"].update(len(garden.creatures))
+    if dirty["plants"]:
+        update_plant_dropdowns(window, garden)
+        window["-TASK LINKED PLANTS-"].update(sorted(list(garden.plants)))
+        window["-SUMMARY TOTAL PLANTS-"].update(len(garden.plants))
+    if dirty["tasks"]:
+        update_task_dropdown(window, garden)
+        update_task_summaries(window, garden)
+
+
 def update_all_item_dropdowns(window, garden):
     """Update creature, plant, and task dropdowns."""
     update_creature_dropdowns(window, garden)
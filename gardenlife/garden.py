@@ -1,11 +1,46 @@
 from datetime import datetime
 from time import strftime
 
-from constants import SEASONS
+from .constants import (
+    ITEM_ADDED,
+    ITEM_REMOVED,
+    ITEM_UPDATED,
+    LINK_FIELDS,
+    PROGRESS_CHANGED,
+    SEASONS,
+)
+from . import dates
+from .indexes import GardenIndex
+from .slots import Slotted
 
 
-class Garden:
-    """Class to represent a garden."""
+class Garden(Slotted):
+    """
+    Class to represent a garden.
+
+    Each change to its creatures, plants, and tasks is passed to the functions in
+    listeners, as listener(garden, change, category, name), where change is ITEM_ADDED,
+    ITEM_UPDATED, ITEM_REMOVED, or PROGRESS_CHANGED. The names of the changed items
+    in each category are also kept in the dirty sets until they're taken by clean().
+    """
+
+    __slots__ = (
+        "name",
+        "location",
+        "size",
+        "since",
+        "owners",
+        "creatures",
+        "plants",
+        "tasks",
+        "timestamp",
+        "next_ids",
+        "timeline",
+        "store",
+        "listeners",
+        "dirty",
+        "_index",
+    )
 
     def __init__(self, name, location, size, since, owners):
         self.name = name
@@ -17,6 +52,13 @@ class Garden:
         self.plants = dict()
         self.tasks = dict()
         self.timestamp = datetime.today()
+        # The next ID to give in each category, kept so removed items' IDs aren't given again
+        self.next_ids = {}
+        self.timeline = None
+        self.store = None
+        self.listeners = []
+        self.dirty = _clean_sets()
+        self._index = None
 
     def __repr__(self):
         return (
@@ -24,6 +66,21 @@ class Garden:
             f"{self.size}, {self.owners}, {self.since})"
         )
 
+    def __getstate__(self):
+        # The timeline and store cover other gardens too, so they aren't pickled with this one
+        # The index is rebuilt when it's needed, and the listeners and changes are left behind
+        state = super().__getstate__()
+        state["timeline"] = state["store"] = None
+        for name in ("listeners", "dirty", "_index"):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__({"next_ids": {}, **state})
+        self.timeline = self.store = self._index = None
+        self.listeners = []
+        self.dirty = _clean_sets()
+
     def __str__(self):
         return (
             f"{self.__class__.__name__} in {self.location} called {self.name}, "
@@ -40,11 +97,8 @@ class Garden:
 
     def ownership_length(self, today=None):
         """Return garden ownership length."""
-        if not today:
-            now = datetime.today()
-        else:
-            now = datetime.strptime(today, "%d/%m/%Y")
-        ago = datetime.strptime(self.since, "%d/%m/%Y")
+        now = dates.string_to_date(today) if today else dates.today()
+        ago = dates.string_to_date(self.since)
         dif = now - ago
         years, days = divmod(dif.days, 365)
         if days > 240:
@@ -77,11 +131,116 @@ class Garden:
             raise ValueError(f"{category} is not a valid category")
         item_type = getattr(self, category)
         item_name = getattr(item, "name")
+        index = self._identified(category)
+        # An item replacing one with the same name, eg after being edited, keeps its ID,
+        # and an item keeps the ID it already has unless another item in the garden has it
+        existing = item_type.get(item_name)
+        change = ITEM_ADDED if existing is None else ITEM_UPDATED
+        if existing is not None:
+            item.id = existing.id
+        elif item.id is None or index.item_by_id(category, item.id) is not None:
+            item.id = index.new_id(category)
         item_type[item_name] = item
+        index.add_item(category, item)
+        self.next_ids[category] = index.next_id(category)
+        if category == "tasks" and self.timeline is not None:
+            self.timeline.add_task(self.name, item)
         self.timestamp = datetime.today()
+        if self.store is not None:
+            self.store.record(self, "add_item", category, item)
+        self._changed(change, category, item_name)
 
     def remove_item(self, category, item):
-        """Remove a creature, plant or task from the garden."""
+        """
+        Remove a creature, plant or task from the garden.
+        A removed creature or plant is also unlinked from the tasks linked to it.
+        """
+        self._remove_item(category, item)
+        if category in LINK_FIELDS:
+            for task in self.linked_tasks(category, item):
+                self._relink(task, category, item, None)
+
+    def rename_item(self, category, item, new_name):
+        """
+        Rename a creature, plant or task in the garden.
+        The tasks linked to a renamed creature or plant are linked to the new name.
+        """
+        renamed = self._get_item(category, item)
+        items = getattr(self, category)
+        if new_name in items:
+            raise ValueError(f'The {category[:-1]} "{new_name}" already exists in this garden.')
+        # The item is moved to its new name as a single change, keeping its ID
+        index = self._identified(category)
+        index.remove_item(category, item, renamed.id)
+        del items[item]
+        renamed.name = new_name
+        items[new_name] = renamed
+        index.add_item(category, renamed)
+        if category == "tasks" and self.timeline is not None:
+            self.timeline.remove_task(self.name, item)
+            self.timeline.add_task(self.name, renamed)
+        self.timestamp = datetime.today()
+        if self.store is not None:
+            self.store.record(self, "rename_item", category, item, new_name)
+        # The old name has changed too, as it's no longer in the garden
+        self.dirty[category].add(item)
+        self._changed(ITEM_UPDATED, category, new_name)
+        if category in LINK_FIELDS:
+            for task in self.linked_tasks(category, item):
+                self._relink(task, category, item, new_name)
+
+    def item_by_id(self, category, item_id):
+        """Return the creature, plant or task in the garden with an ID."""
+        item = self._identified(category).item_by_id(category, item_id)
+        if item is None:
+            raise ValueError(
+                f"The {category[:-1]} with ID {item_id} was not found in this garden."
+            )
+        return item
+
+    def item_id(self, category, name):
+        """
+        Return the ID of a creature, plant or task in the garden. Items keep their IDs
+        when they're edited or renamed, and IDs are unique in each category.
+        """
+        item = self._get_item(category, name)
+        if item.id is None:
+            self._identified(category)
+        return item.id
+
+    def linked_tasks(self, category, name):
+        """Return a list of the tasks linked to a creature or plant, using the garden's index."""
+        if category not in LINK_FIELDS:
+            raise ValueError(f"{category} can't be linked to tasks")
+        return self._linked().linked_tasks(category, name)
+
+    def broken_links(self):
+        """
+        Return a list of (task name, category, name) tuples for each link from a task
+        to a creature or plant that isn't in the garden.
+        """
+        index = self._linked()
+        return [
+            (task.name, category, name)
+            for category, name in index.links()
+            if name not in getattr(self, category)
+            for task in index.linked_tasks(category, name)
+        ]
+
+    def measures(self, category):
+        """
+        Return the measures of the creatures or plants in columns, eg to find the mean
+        impact of each type with measures("plants").mean_by_type("impact").
+        """
+        if category not in LINK_FIELDS:
+            raise ValueError(f"{category} don't have measures")
+        if self._index is None:
+            self._index = GardenIndex()
+        if self._index.measures(category) is None:
+            self._index.add_measures(category, getattr(self, category).values())
+        return self._index.measures(category)
+
+    def _get_item(self, category, item):
         if category not in {"creatures", "plants", "tasks"}:
             raise ValueError(f"{category} is not a valid category")
         item_type = getattr(self, category)
@@ -89,5 +248,121 @@ class Garden:
             raise ValueError(
                 f'The {category[:-1]} "{item}" was not found in this garden.'
             )
-        del item_type[item]
+        return item_type[item]
+
+    def _remove_item(self, category, item):
+        removed = self._get_item(category, item)
+        del getattr(self, category)[item]
+        if self._index is not None:
+            self._index.remove_item(category, item, removed.id)
+        if category == "tasks" and self.timeline is not None:
+            self.timeline.remove_task(self.name, item)
+        self.timestamp = datetime.today()
+        if self.store is not None:
+            self.store.record(self, "remove_item", category, item)
+        self._changed(ITEM_REMOVED, category, item)
+
+    def update_task_progress(self, task_name, all_progress):
+        """
+        Update a task's completed dates from a dict containing scheduled dates
+        in string format as keys and booleans indicating whether they are completed.
+        """
+        task = self._get_task(task_name)
+        task.update_completed_dates(all_progress)
+        self._task_progressed(task)
+        if self.store is not None:
+            self.store.record(self, "update_task_progress", task_name, all_progress)
+        self._changed(PROGRESS_CHANGED, "tasks", task_name)
+
+    def complete_task_until(self, task_name, date=None):
+        """Mark every scheduled date of a task up to and including date as completed."""
+        task = self._get_task(task_name)
+        # Use a fixed date so the change can be replayed from a journal on a later day
+        date = date or dates.date_to_string(dates.today())
+        task.complete_until(date)
+        self._task_progressed(task)
+        if self.store is not None:
+            self.store.record(self, "complete_task_until", task_name, date)
+        self._changed(PROGRESS_CHANGED, "tasks", task_name)
+
+    def clean(self):
+        """
+        Return a dict of the names of the items changed in each category since
+        the garden was last cleaned, and start new, empty dirty sets.
+        """
+        dirty, self.dirty = self.dirty, _clean_sets()
+        return dirty
+
+    def find_items(self, category, **fields):
+        """
+        Return a list of the items in a category with all the field values given,
+        eg find_items("plants", edible=True). The fields are those in INDEXED_FIELDS.
+        """
+        if not fields:
+            return list(getattr(self, category).values())
+        return self._indexed(category).find(category, **fields)
+
+    def field_values(self, category, field):
+        """Return the set of values of a field in a category, eg the types of creature."""
+        return self._indexed(category).values(category, field)
+
+    def _indexed(self, category):
+        # Return the index, indexing the category's items if they haven't been indexed yet
+        if category not in {"creatures", "plants", "tasks"}:
+            raise ValueError(f"{category} is not a valid category")
+        if self._index is None:
+            self._index = GardenIndex()
+        if category not in self._index:
+            self._index.add_category(category, getattr(self, category).values())
+        return self._index
+
+    def _identified(self, category):
+        # Return the index, indexing the category's items by ID if they haven't been yet
+        if category not in {"creatures", "plants", "tasks"}:
+            raise ValueError(f"{category} is not a valid category")
+        if self._index is None:
+            self._index = GardenIndex()
+        if not self._index.ids_indexed(category):
+            # Items saved by earlier versions are given IDs, which are recorded to be saved
+            items = getattr(self, category).values()
+            unidentified = self._index.add_ids(category, items, self.next_ids.get(category, 1))
+            self.next_ids[category] = self._index.next_id(category)
+            for item in unidentified:
+                if self.store is not None:
+                    self.store.record(self, "add_item", category, item)
+        return self._index
+
+    def _linked(self):
+        # Return the index, indexing the links of every task if they haven't been indexed yet
+        if self._index is None:
+            self._index = GardenIndex()
+        if not self._index.links_indexed:
+            self._index.add_links(self.tasks.values())
+        return self._index
+
+    def _relink(self, task, category, name, new_name):
+        # Replace a task's link to an organism with a link to its new name, or remove it
+        field = LINK_FIELDS[category]
+        links = [new_name if linked == name else linked for linked in getattr(task, field)]
+        setattr(task, field, [linked for linked in links if linked is not None])
+        self.add_item("tasks", task)
+
+    def _get_task(self, task_name):
+        if task_name not in self.tasks:
+            raise ValueError(f'The task "{task_name}" was not found in this garden.')
+        return self.tasks[task_name]
+
+    def _changed(self, change, category, name):
+        self.dirty[category].add(name)
+        for listener in self.listeners:
+            listener(self, change, category, name)
+
+    def _task_progressed(self, task):
+        # Update the task's entry in the timeline now its next due date may have changed
+        if self.timeline is not None:
+            self.timeline.add_task(self.name, task)
         self.timestamp = datetime.today()
+
+
+def _clean_sets():
+    return {"creatures": set(), "plants": set(), "tasks": set()}
@@ -0,0 +1,21 @@
+"""
+Contains a context manager to pause garbage collection while many objects are created.
+
+The gardens and indexes built when loading don't contain reference cycles,
+so scanning them repeatedly as they're created only slows loading down.
+"""
+
+from contextlib import contextmanager
+import gc
+
+
+@contextmanager
+def paused_gc():
+    """Disable garbage collection in the block, then enable it again if it was enabled."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
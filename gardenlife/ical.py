@@ -0,0 +1,110 @@
+"""
+iCalendar export for the gardenlife application.
+
+Writes each task as an event with a recurrence rule, so other calendar
+applications can show its due dates. The output is generated one line
+at a time, so any number of tasks can be exported in constant memory.
+"""
+
+from datetime import datetime, timezone
+import uuid
+
+from dateutil.rrule import DAILY, WEEKLY, MONTHLY, YEARLY
+
+
+RRULE_FREQS = {DAILY: "DAILY", WEEKLY: "WEEKLY", MONTHLY: "MONTHLY", YEARLY: "YEARLY"}
+
+# The maximum length of a content line in octets, excluding the line break
+LINE_LENGTH = 75
+
+
+def export_calendar(gardens, path):
+    """Write the tasks in every garden in the gardens dict to an iCalendar file."""
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        file.writelines(f"{line}\r\n" for line in calendar_lines(gardens))
+
+
+def calendar_lines(gardens):
+    """
+    Generate the folded content lines of an iCalendar object containing the tasks
+    in every garden in the gardens dict. Archived tasks are left out.
+    """
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    yield "BEGIN:VCALENDAR"
+    yield "VERSION:2.0"
+    yield "PRODID:-//gardenlife//Garden Tasks//EN"
+    for garden in gardens.values():
+        for task in garden.tasks.values():
+            if task.status.get() != "Archived":
+                for line in task_event(garden, task, stamp):
+                    yield from _fold(line)
+    yield "END:VCALENDAR"
+
+
+def task_event(garden, task, stamp):
+    """
+    Generate the unfolded content lines of an event for a task in a garden.
+    Nothing is generated if the task's schedule doesn't have any dates.
+    """
+    schedule = task.schedule
+    if not schedule:
+        return
+    yield "BEGIN:VEVENT"
+    yield f"UID:{uuid.uuid5(uuid.NAMESPACE_URL, f'gardenlife:{garden.name}/{task.name}')}"
+    yield f"DTSTAMP:{stamp}"
+    # iCalendar always counts the start date as the first occurrence, so use the first due date
+    yield f"DTSTART;VALUE=DATE:{schedule[0]:%Y%m%d}"
+    if schedule.count != 1:
+        yield f"RRULE:{rrule_value(schedule)}"
+    yield f"SUMMARY:{_escape(task.name)}"
+    yield f"LOCATION:{_escape(garden.name)}"
+    if task.description:
+        yield f"DESCRIPTION:{_escape(task.description)}"
+    yield "END:VEVENT"
+
+
+def rrule_value(schedule):
+    """Return the value of an iCalendar RRULE property for a schedule."""
+    parts = [f"FREQ={RRULE_FREQS[schedule.freq]}"]
+    # iCalendar doesn't allow a count and an until date together, but the length applies both
+    if schedule.until is not None:
+        if schedule.count is None:
+            parts.append(f"UNTIL={schedule.until:%Y%m%d}")
+        else:
+            parts.append(f"COUNT={len(schedule)}")
+    elif schedule.count is not None:
+        parts.append(f"COUNT={schedule.count}")
+    if schedule.interval > 1:
+        parts.append(f"INTERVAL={schedule.interval}")
+    if schedule.bymonth:
+        parts.append(f"BYMONTH={','.join(str(month) for month in schedule.bymonth)}")
+    return ";".join(parts)
+
+
+def _escape(text):
+    # Escape the characters with special meanings in iCalendar text values
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line):
+    # Split a line into parts of at most LINE_LENGTH octets without splitting a character.
+    # Each part after the first starts with a space, which counts towards its length
+    encoded = line.encode("utf-8")
+    if len(encoded) <= LINE_LENGTH:
+        yield line
+        return
+    start, limit = 0, LINE_LENGTH
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # UTF-8 continuation bytes start with the bits 10
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        part = encoded[start:end].decode("utf-8")
+        yield part if start == 0 else f" {part}"
+        start, limit = end, LINE_LENGTH - 1
@@ -0,0 +1,30 @@
+"""
+Image functions for the gardenlife application.
+
+The images are stored as package data in the images directory. Each one is read
+and base64 encoded, as PySimpleGUI expects, the first time it's needed.
+"""
+
+from base64 import b64encode
+from functools import lru_cache
+import os
+
+
+IMAGE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images")
+
+
+@lru_cache(maxsize=None)
+def load_image(name):
+    """Return the base64 encoded contents of an image in the images directory."""
+    with open(os.path.join(IMAGE_DIRECTORY, name), "rb") as file:
+        return b64encode(file.read())
+
+
+def icon():
+    """Return the gardenlife icon."""
+    return load_image("icon.png")
+
+
+def logo():
+    """Return the gardenlife logo."""
+    return load_image("logo.png")
@@ -0,0 +1,200 @@
+"""
+Contains a class to index the items in a garden by the values of some of their fields,
+so the items with a value can be found without checking every item in the garden,
+to index the items by ID and the tasks linked to each creature and plant, and to hold
+the measures of the creatures and plants in columns.
+"""
+
+from .constants import INDEXED_FIELDS, LINK_FIELDS
+from .gc_pause import paused_gc
+from .measures import MeasureColumns
+
+
+class GardenIndex:
+    """
+    Class to represent secondary indexes of the items in a garden, by the fields
+    in INDEXED_FIELDS, eg organism type, status, edibility, and task assignee.
+
+    The items can also be indexed by their IDs, which the index gives out, so each ID
+    is unique in its category. The links from tasks to organisms are indexed in reverse,
+    so the tasks linked to a creature or plant can be found without checking every task.
+    The measures of the creatures and plants can also be kept in columns, to aggregate them.
+
+    The IDs, each category, the links, and the measures are indexed when they're first
+    used, and the garden then keeps the index up to date as items are added and removed.
+    Items changed in place should be added to the garden again, as the manage window does,
+    so their entries are updated.
+    """
+
+    def __init__(self):
+        # Dicts of the items with each value of each field, by name, by category
+        self._items = {}
+        # The indexed values of each item, so its entries can be found when it's removed
+        self._values = {}
+        # Dicts of the tasks linked to each (category, organism name), by task name,
+        # and the organisms each task is linked to, or None until the links are indexed
+        self._links = None
+        self._task_links = None
+        # The measure columns of each category, once they've been used
+        self._measures = {}
+        # Dicts of the items in each category by ID, and the next ID to give in each
+        self._ids = {}
+        self._next_ids = {}
+
+    def __contains__(self, category):
+        return category in self._items
+
+    def add_category(self, category, items):
+        """Index all the items in a category, replacing any existing entries for it."""
+        self._items[category] = {field: {} for field in INDEXED_FIELDS[category]}
+        self._values[category] = {}
+        with paused_gc():
+            for item in items:
+                self.add_item(category, item)
+
+    @property
+    def links_indexed(self):
+        return self._links is not None
+
+    def add_links(self, tasks):
+        """Index the links of all the tasks, replacing any existing links."""
+        self._links = {}
+        self._task_links = {}
+        with paused_gc():
+            for task in tasks:
+                self._add_task_links(task)
+
+    def add_measures(self, category, organisms):
+        """Hold the measures of all the creatures or plants in columns."""
+        with paused_gc():
+            self._measures[category] = MeasureColumns(organisms)
+
+    def ids_indexed(self, category):
+        return category in self._ids
+
+    def add_ids(self, category, items, next_id=1):
+        """
+        Index the items in a category by ID, replacing any existing entries for it.
+        IDs are given from next_id, or after the highest ID if it's higher.
+        Items without an ID, eg saved by earlier versions, are given one,
+        and a list of them is returned.
+        """
+        ids = self._ids[category] = {}
+        unidentified = []
+        for item in items:
+            if item.id is None:
+                unidentified.append(item)
+            else:
+                ids[item.id] = item
+        self._next_ids[category] = max(max(ids, default=0) + 1, next_id)
+        for item in unidentified:
+            item.id = self.new_id(category)
+            ids[item.id] = item
+        return unidentified
+
+    def new_id(self, category):
+        """Return an ID that hasn't been given to an item in a category with indexed IDs."""
+        new_id = self._next_ids[category]
+        self._next_ids[category] += 1
+        return new_id
+
+    def next_id(self, category):
+        """Return the ID that will be given next to an item in a category with indexed IDs."""
+        return self._next_ids[category]
+
+    def item_by_id(self, category, item_id):
+        """Return the item in a category with an ID, or None if there isn't one."""
+        return self._ids[category].get(item_id)
+
+    def measures(self, category):
+        """Return the measure columns of a category, or None if they haven't been added."""
+        return self._measures.get(category)
+
+    def add_item(self, category, item):
+        """Add or update an item's entries if its category or its links have been indexed."""
+        if category in self._ids:
+            self._ids[category][item.id] = item
+            self._next_ids[category] = max(self._next_ids[category], item.id + 1)
+        if category == "tasks" and self._links is not None:
+            self._remove_task_links(item.name)
+            self._add_task_links(item)
+        if category in self._measures:
+            self._measures[category].add(item)
+        if category not in self._items:
+            return
+        self.remove_item(category, item.name)
+        fields = self._items[category]
+        values = tuple(_value(item, field) for field in fields)
+        self._values[category][item.name] = values
+        for items, value in zip(fields.values(), values):
+            items.setdefault(value, {})[item.name] = item
+
+    def remove_item(self, category, name, item_id=None):
+        """Remove an item's entries if it has been indexed. Its ID entry needs its ID."""
+        if category in self._ids:
+            self._ids[category].pop(item_id, None)
+        if category == "tasks" and self._links is not None:
+            self._remove_task_links(name)
+        if category in self._measures:
+            self._measures[category].remove(name)
+        values = self._values.get(category, {}).pop(name, None)
+        if values is None:
+            return
+        for items, value in zip(self._items[category].values(), values):
+            value_items = items[value]
+            del value_items[name]
+            if not value_items:
+                del items[value]
+
+    def find(self, category, **fields):
+        """Return a list of the items in a category with all of the field values given."""
+        first, *others = sorted(
+            (self._field(category, field).get(value, {}) for field, value in fields.items()),
+            key=len,
+        )
+        if not others:
+            return list(first.values())
+        return [item for name, item in first.items() if all(name in other for other in others)]
+
+    def values(self, category, field):
+        """Return the set of values that a field has in the items in a category."""
+        return set(self._field(category, field))
+
+    def linked_tasks(self, category, name):
+        """Return a list of the tasks linked to a creature or plant."""
+        return list(self._links.get((category, name), {}).values())
+
+    def links(self):
+        """Return a list of the (category, organism name) of every organism linked to a task."""
+        return list(self._links)
+
+    def _add_task_links(self, task):
+        keys = tuple(
+            (category, name)
+            for category, field in LINK_FIELDS.items()
+            for name in getattr(task, field) or ()
+        )
+        self._task_links[task.name] = keys
+        for key in keys:
+            self._links.setdefault(key, {})[task.name] = task
+
+    def _remove_task_links(self, task_name):
+        for key in self._task_links.pop(task_name, ()):
+            tasks = self._links[key]
+            tasks.pop(task_name, None)
+            if not tasks:
+                del self._links[key]
+
+    def _field(self, category, field):
+        if field not in self._items[category]:
+            raise ValueError(f"{field} is not an indexed field of {category}")
+        return self._items[category][field]
+
+
+def _value(item, field):
+    # Statuses are indexed by their string, and edibility by whether it's true
+    value = getattr(item, field)
+    if field == "status":
+        return value.get()
+    return bool(value) if field == "edible" else value
+
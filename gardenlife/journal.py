@@ -0,0 +1,210 @@
+"""
+Contains a class to save changes to the gardens in an append-only journal,
+so saving doesn't rewrite every garden.
+
+The gardens are stored as a snapshot, which is the pickled gardens dict,
+and a journal of the changes made since the snapshot was written.
+Each change is a separately pickled record. Loading replays the journal on top
+of the snapshot. Once the journal grows beyond a threshold it's sealed and merged
+into a new snapshot in the background, while new changes go to a new journal.
+
+Every record sets part of a garden to a value, so replaying records that are
+already in the snapshot, as happens if compaction is interrupted, is harmless.
+"""
+
+import os
+import pickle
+import threading
+
+from .codec import unpickle
+from .constants import JOURNAL_COMPACT_SIZE, JOURNAL_FILE, SNAPSHOT_FILE
+from .garden import Garden
+
+
+class Journal:
+    """
+    Class to represent the journal of changes made to the gardens.
+    Changes are recorded as they're made and written to the journal file when saved.
+    """
+
+    def __init__(
+        self,
+        snapshot_path=SNAPSHOT_FILE,
+        journal_path=JOURNAL_FILE,
+        compact_size=JOURNAL_COMPACT_SIZE,
+    ):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.sealed_path = f"{journal_path}.sealed"
+        self.compact_size = compact_size
+        self._pending = []
+        # Records are appended to and taken from the list under this lock, so the window
+        # can carry on recording while the autosave thread appends earlier records
+        self._pending_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._compaction = None
+
+    def load(self):
+        """
+        Return the gardens dict from the snapshot with the journal replayed on top of it,
+        and attach the journal to every garden. Return an empty dict if nothing is saved.
+        """
+        self.wait()
+        gardens = _read_snapshot(self.snapshot_path)
+        _replay(gardens, self.sealed_path)
+        # Drop any partly written record at the end of the journal so later saves can be read
+        valid_length = _replay(gardens, self.journal_path)
+        if valid_length is not None and valid_length < os.path.getsize(self.journal_path):
+            with open(self.journal_path, "r+b") as file:
+                file.truncate(valid_length)
+        for garden in gardens.values():
+            garden.store = self
+        # Finish merging a sealed journal left behind by an interrupted compaction
+        if os.path.exists(self.sealed_path):
+            self.compact()
+        return gardens
+
+    def put_garden(self, garden):
+        """Record a created or updated garden and attach the journal to it."""
+        garden.store = self
+        self.record(garden, "put_garden", garden.location, garden.size, garden.since, garden.owners)
+
+    def import_gardens(self, gardens):
+        """Record every garden in the gardens dict and all their items, eg to import them."""
+        for garden in gardens.values():
+            self.put_garden(garden)
+            for category in ("creatures", "plants", "tasks"):
+                for item in getattr(garden, category).values():
+                    self.record(garden, "add_item", category, item)
+
+    def remove_garden(self, garden):
+        """Record a removed garden and detach the journal from it."""
+        garden.store = None
+        self.record(garden, "remove_garden")
+
+    def record(self, garden, operation, *args):
+        """
+        Record a change to a garden. The operation is the name of the Garden method
+        that makes the change, or put_garden or remove_garden, and args are its arguments.
+        """
+        record = pickle.dumps(
+            (operation, garden.name, garden.timestamp) + args, pickle.HIGHEST_PROTOCOL
+        )
+        with self._pending_lock:
+            self._pending.append(record)
+
+    def save(self):
+        """
+        Append the recorded changes to the journal file, and return the size in bytes
+        of the records appended. Start compacting the journal in the background
+        if it has grown beyond the threshold. Can be called from any thread.
+        """
+        with self._save_lock:
+            with self._pending_lock:
+                data = b"".join(self._pending)
+                self._pending.clear()
+            if data:
+                with open(self.journal_path, "ab") as file:
+                    file.write(data)
+                    file.flush()
+                    os.fsync(file.fileno())
+            if os.path.exists(self.journal_path):
+                if os.path.getsize(self.journal_path) > self.compact_size:
+                    self.compact()
+        return len(data)
+
+    def discard(self):
+        """Forget the changes recorded since the journal was last saved."""
+        with self._pending_lock:
+            self._pending.clear()
+
+    def compact(self):
+        """
+        Seal the journal and merge it into a new snapshot in a background thread.
+        Nothing happens if a compaction is already running.
+        """
+        if self._compaction is not None and self._compaction.is_alive():
+            return
+        if not os.path.exists(self.sealed_path):
+            os.replace(self.journal_path, self.sealed_path)
+        # Not a daemon thread, so the compaction finishes even if the application exits
+        self._compaction = threading.Thread(target=self._merge_sealed, name="journal compaction")
+        self._compaction.start()
+
+    def wait(self):
+        """Wait for a running compaction to finish."""
+        if self._compaction is not None:
+            self._compaction.join()
+
+    def _merge_sealed(self):
+        # Build the new snapshot from the files, so the gardens in use aren't touched
+        gardens = _read_snapshot(self.snapshot_path)
+        _replay(gardens, self.sealed_path)
+        temporary_path = f"{self.snapshot_path}.tmp"
+        with open(temporary_path, "wb") as file:
+            pickle.dump(gardens, file, pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.snapshot_path)
+        os.remove(self.sealed_path)
+
+
+def _read_snapshot(path):
+    # Return the gardens dict from the snapshot file, or an empty dict if there isn't one
+    try:
+        with open(path, "rb") as file:
+            return unpickle(file)
+    except FileNotFoundError:
+        return {}
+
+
+def _replay(gardens, path):
+    # Apply each record in the journal file to the gardens dict. Return the length of the
+    # complete records, or None if there isn't a journal file
+    try:
+        file = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    with file:
+        valid_length = 0
+        while True:
+            try:
+                record = unpickle(file)
+            # A crash while saving can leave a partly written record at the end
+            except (EOFError, pickle.UnpicklingError, ValueError, AttributeError):
+                return valid_length
+            _apply(gardens, record)
+            valid_length = file.tell()
+
+
+def _apply(gardens, record):
+    # Make the change described by a record to the gardens dict
+    operation, garden_name, timestamp, *args = record
+    if operation == "remove_garden":
+        gardens.pop(garden_name, None)
+        return
+    if operation == "put_garden":
+        garden = Garden(garden_name, *args)
+        # Updated gardens keep their items
+        existing = gardens.get(garden_name)
+        if existing is not None:
+            garden.creatures = existing.creatures
+            garden.plants = existing.plants
+            garden.tasks = existing.tasks
+            garden.next_ids = existing.next_ids
+        gardens[garden_name] = garden
+    else:
+        garden = gardens.get(garden_name)
+        if garden is None:
+            return
+        # Skip changes to items that a later record in a replayed journal has removed
+        if operation in ("remove_item", "rename_item") and (
+            args[1] not in getattr(garden, args[0])
+        ):
+            return
+        if operation in ("update_task_progress", "complete_task_until") and (
+            args[0] not in garden.tasks
+        ):
+            return
+        getattr(garden, operation)(*args)
+    garden.timestamp = timestamp
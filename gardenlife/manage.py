@@ -7,44 +7,63 @@ You can also use it to schedule one-off/repeat tasks and record progress.
 
 """
 
-from datetime import datetime
-from operator import attrgetter
 import logging
-import pickle
 from tkinter.constants import SUNKEN, GROOVE
 import webbrowser
 
 import PySimpleGUI as sg
 
-from constants import ACCENT_COLOR, FIELD_SIZE, IB_TEXT, ICON, MG_FIELD_SIZE, MONTHS, RB_TEXT
-from garden import Garden
-from organisms import Creature, Plant
-from task import Task
-import event_funcs
-import popups
-import subwindows
-import tab_funcs
-
-
-def load_gardens():
+from .constants import (
+    ACCENT_COLOR,
+    FIELD_SIZE,
+    IB_TEXT,
+    MG_FIELD_SIZE,
+    MONTHS,
+    NO_END_DATE,
+    RB_TEXT,
+)
+from .autosave import Autosaver
+from .dates import date_to_string, today
+from .database import Database
+from .garden import Garden
+from .journal import Journal
+from .organisms import Creature, Plant
+from .task import Task
+from . import event_funcs
+from . import ical
+from . import images
+from . import popups
+from . import progress
+from . import subwindows
+from . import tab_funcs
+
+
+def load_gardens(store):
     """
-    Load the dictionary of gardens if it already exists.
+    Load the dictionary of gardens from the store if it has been saved.
+    Only the garden names and timestamps are loaded, and each garden is loaded when it's used.
+    Gardens saved in the journal by earlier versions are imported the first time.
     Otherwise, create it and add the default garden.
     """
-    try:
-        with open("gardens.pickle", "rb") as file:
-            gardens = pickle.load(file)
-    except FileNotFoundError:
-        gardens = {}
-        default_garden = Garden("", "", 0, datetime.today().strftime("%d/%m/%Y"), " ")
+    gardens = store.load()
+    if not gardens:
+        journal = Journal()
+        legacy_gardens = journal.load()
+        journal.wait()
+        store.import_gardens(legacy_gardens)
+        store.save()
+        gardens = store.load()
+    if not gardens:
+        default_garden = Garden("", "", 0, date_to_string(today()), " ")
         gardens[""] = default_garden
+        store.put_garden(default_garden)
 
     return gardens
 
 
 def load_garden(gardens):
     """Load the most recently created/updated garden."""
-    return max(gardens.values(), key=attrgetter("timestamp"))
+    return gardens.latest()
 
 
 def create_window(gardens, garden):
@@ -60,11 +79,14 @@ def create_window(gardens, garden):
     sg.theme_input_background_color("light grey")
     sg.theme_input_text_color("black")
     sg.theme_slider_color(ACCENT_COLOR)
-    sg.set_global_icon(ICON)
+    sg.set_global_icon(images.icon())
 
     # -------------------------------------- Menu -------------------------------------- #
 
-    menu_definition = [["File", ["Save", "Exit"]], ["Help", ["About...", "Open web tutorial"]]]
+    menu_definition = [
+        ["File", ["Save", "Export Calendar...", "Exit"]],
+        ["Help", ["About...", "Open web tutorial"]],
+    ]
 
     # ------------------------------- Garden Summary Tab ------------------------------- #
 
@@ -77,10 +99,7 @@ def create_window(gardens, garden):
         "Total creatures:": len(garden.creatures),
         "Total plants:": len(garden.plants),
         "Total tasks:": len(garden.tasks),
-        "Outstanding tasks:": sum(
-            task.get_current_progress() in {"Due", "Overdue", "Very overdue"}
-            for task in garden.tasks.values()
-        ),
+        "Outstanding tasks:": progress.outstanding_tasks(garden.tasks.values()),
         "Current season:": garden.season(),
     }
 
@@ -162,7 +181,7 @@ def create_window(gardens, garden):
     creature_type = [
         tab_funcs.item_label("Creature type:"),
         sg.Combo(
-            sorted([""] + list(set(c.org_type for c in garden.creatures.values() if c.org_type))),
+            sorted([""] + list(garden.field_values("creatures", "org_type") - {"", None})),
             size=(25, 10),
             key="-CREATURE TYPE-",
         ),
@@ -259,7 +278,7 @@ def create_window(gardens, garden):
     plant_type = [
         tab_funcs.item_label("Plant type:"),
         sg.Combo(
-            sorted([""] + list(set(p.org_type for p in garden.plants.values() if p.org_type))),
+            sorted([""] + list(garden.field_values("plants", "org_type") - {"", None})),
             size=(25, 10),
             key="-PLANT TYPE-",
         ),
@@ -451,11 +470,25 @@ def create_window(gardens, garden):
         sg.Input(
             size=(18, 1),
             pad=(5, (8, 0)),
-            tooltip="Number of times task should be completed",
+            tooltip="Number of times task should be completed\n"
+            "Optional if an until date is supplied",
             key="-TASK COUNT-",
         ),
     ]
 
+    task_until = [
+        sg.Text("Until:", size=(8, 1), pad=(3, (8, 0))),
+        sg.Input(
+            size=(18, 1),
+            pad=(5, (8, 0)),
+            tooltip="DD/MM/YYYY\n"
+            "Date of the last time task should be completed\n"
+            f"Or {NO_END_DATE} if task should be repeated indefinitely",
+            key="-TASK UNTIL-",
+        ),
+        sg.CalendarButton("PICK", format="%d/%m/%Y", pad=((0, 7), (8, 0)), key="-TASK PICK UNTIL-"),
+    ]
+
     task_by_month = [
         sg.Text("By month:", size=(8, 1), pad=(3, (8, 0))),
         sg.Input(
@@ -483,6 +516,7 @@ def create_window(gardens, garden):
         task_start,
         task_frequency,
         task_count,
+        task_until,
         task_by_month,
         task_interval,
     ]
@@ -544,21 +578,29 @@ def create_window(gardens, garden):
 ##########################################################################################
 
 
-def run_event_loop(logger, gardens, garden, window):
+def run_event_loop(logger, store, gardens, garden, window):
     """
     Display and interact with the main window and subwindows using an event loop.
 
     Create, select, display, update, and remove gardens 
     and the creatures, plants, and tasks they contain.
-    Save the gardens dict as gardens.pickle.
+    Save changes to the gardens dict in the store in the background.
     If a fatal exception occurs, log it in gardenlife.log.
     """
 
-    # Keeps track of whether any changes have been made since the gardens dict was saved
+    # Saves changes in the background shortly after they stop being made
+    autosaver = Autosaver(store, logger)
+    # Keeps track of whether any changes have been made by the latest event
     gardens_changed = False
 
     try:
         while True:
+            if gardens_changed:
+                # Only the widgets showing the changed items are updated
+                event_funcs.update_changed_items(window, garden)
+                autosaver.changed()
+                gardens_changed = False
+
             event, values = window.read()
             # print(event, values)
 
@@ -566,16 +608,22 @@ def run_event_loop(logger, gardens, garden, window):
 
             # See if user wants to quit or attempted to close the window
             if event in ("Exit", sg.WINDOW_CLOSE_ATTEMPTED_EVENT):
-
-                if gardens_changed:
-                    subwindows.unsaved_changes_window(window, gardens)
-                else:
-                    break
+                break
 
             elif event == "Save":
-                with open("gardens.pickle", "wb") as file:
-                    pickle.dump(gardens, file)
-                gardens_changed = False
+                autosaver.flush()
+
+            elif event == "Export Calendar...":
+                path = sg.popup_get_file(
+                    "Export all tasks to an iCalendar file",
+                    title="Export Calendar",
+                    save_as=True,
+                    default_extension=".ics",
+                    file_types=(("iCalendar", "*.ics"),),
+                    keep_on_top=True,
+                )
+                if path:
+                    ical.export_calendar(gardens, path)
 
             elif event == "About...":
                 popups.about()
@@ -592,7 +640,7 @@ def run_event_loop(logger, gardens, garden, window):
                 subwindows.view_plants_window(window, garden)
 
             elif event == "VIEW EDIBLE PLANTS":
-                subwindows.view_plants_window(window, garden, attr="edible", title="Edible ")
+                subwindows.view_plants_window(window, garden, title="Edible ", edible=True)
 
             elif event == "VIEW ALL TASKS":
                 subwindows.view_tasks_window(window, garden)
@@ -625,8 +673,12 @@ def run_event_loop(logger, gardens, garden, window):
                         cu_garden.creatures = garden_instance.creatures
                         cu_garden.plants = garden_instance.plants
                         cu_garden.tasks = garden_instance.tasks
+                        cu_garden.next_ids = garden_instance.next_ids
                     # Add created/updated garden to gardens dict. Overwrite if already exists
                     gardens[g_name] = cu_garden
+                    store.put_garden(cu_garden)
+                    # Select the created/updated garden so later changes are made to it
+                    garden = cu_garden
                     # Update dropdowns and clear field values and links
                     event_funcs.update_garden_dropdown(window, gardens)
                     event_funcs.clear_all_item_dropdowns(window)
@@ -638,7 +690,7 @@ def run_event_loop(logger, gardens, garden, window):
                     continue
                 g_confirmation = popups.remove_confirmation(garden.name, "garden")
                 if g_confirmation == "OK":
-                    del gardens[values["-GARDEN NAME-"]]
+                    store.remove_garden(gardens.pop(values["-GARDEN NAME-"]))
                     event_funcs.update_garden_dropdown(window, gardens)
                     event_funcs.clear_all_item_dropdowns(window)
                     event_funcs.clear_all_values_and_links(window, garden)
@@ -670,6 +722,7 @@ def run_event_loop(logger, gardens, garden, window):
                 # Then update the item dropdowns and clear item field values and links
                 event_funcs.update_all_item_dropdowns(window, garden)
                 event_funcs.clear_all_item_values_and_links(window, garden)
+                task = None
 
             ####################### Manage Creatures Events ########################
 
@@ -703,13 +756,10 @@ def run_event_loop(logger, gardens, garden, window):
                     if values["-CREATURE STATUS-"] == "Archived":
                         creature.status.archive()
                     garden.add_item("creatures", creature)
-                    event_funcs.update_creature_dropdowns(window, garden)
                     event_funcs.clear_creature_values(window)
                     # Clear the task fields and organism links
                     event_funcs.clear_task_values(window)
-                    event_funcs.clear_organism_links(window, garden)
-                    # Update the associated summary field
-                    window["-SUMMARY TOTAL CREATURES-"].update(len(garden.creatures))
+                    event_funcs.deselect_organism_links(window)
                     gardens_changed = True
 
             elif event == "CREATURE REMOVE":
@@ -719,11 +769,9 @@ def run_event_loop(logger, gardens, garden, window):
                 c_confirmation = popups.remove_confirmation(values["-CREATURE NAME-"], "creature")
                 if c_confirmation == "OK":
                     garden.remove_item("creatures", values["-CREATURE NAME-"])
-                    event_funcs.update_creature_dropdowns(window, garden)
                     event_funcs.clear_creature_values(window)
                     event_funcs.clear_task_values(window)
-                    event_funcs.clear_organism_links(window, garden)
-                    window["-SUMMARY TOTAL CREATURES-"].update(len(garden.creatures))
+                    event_funcs.deselect_organism_links(window)
                     gardens_changed = True
 
             elif event == "-CREATURE NAME-":
@@ -774,11 +822,9 @@ def run_event_loop(logger, gardens, garden, window):
                     if values["-PLANT STATUS-"] == "Archived":
                         plant.status.archive()
                     garden.add_item("plants", plant)
-                    event_funcs.update_plant_dropdowns(window, garden)
                     event_funcs.clear_plant_values(window)
                     event_funcs.clear_task_values(window)
-                    event_funcs.clear_organism_links(window, garden)
-                    window["-SUMMARY TOTAL PLANTS-"].update(len(garden.plants))
+                    event_funcs.deselect_organism_links(window)
                     gardens_changed = True
 
             elif event == "PLANT REMOVE":
@@ -788,11 +834,9 @@ def run_event_loop(logger, gardens, garden, window):
                 p_confirmation = popups.remove_confirmation(values["-PLANT NAME-"], "plant")
                 if p_confirmation == "OK":
                     garden.remove_item("plants", values["-PLANT NAME-"])
-                    event_funcs.update_plant_dropdowns(window, garden)
                     event_funcs.clear_plant_values(window)
                     event_funcs.clear_task_values(window)
-                    event_funcs.clear_organism_links(window, garden)
-                    window["-SUMMARY TOTAL PLANTS-"].update(len(garden.plants))
+                    event_funcs.deselect_organism_links(window)
                     gardens_changed = True
 
             elif event == "-PLANT NAME-":
@@ -823,6 +867,7 @@ def run_event_loop(logger, gardens, garden, window):
                 t_name = values["-TASK NAME-"].strip()
                 start_date = values["-TASK START-"].strip()
                 count = values["-TASK COUNT-"].strip()
+                until = values["-TASK UNTIL-"].strip()
                 bymonth = values["-TASK BY MONTH-"].strip()
                 interval = values["-TASK INTERVAL-"].strip()
                 if not t_name:
@@ -834,6 +879,12 @@ def run_event_loop(logger, gardens, garden, window):
                 except ValueError:
                     popups.invalid_date(field="first due", date=start_date)
                     continue
+                try:
+                    if until and until != NO_END_DATE:
+                        event_funcs.check_date_validity(until)
+                except ValueError:
+                    popups.invalid_date(field="until", date=until)
+                    continue
                 if count and not count.isdigit():
                     popups.invalid_digit(field="count", digit=count)
                 elif bymonth and any(month not in MONTHS for month in bymonth.split(" ")):
@@ -857,6 +908,7 @@ def run_event_loop(logger, gardens, garden, window):
                         count=count,
                         bymonth=bymonth,
                         interval=interval,
+                        until=until,
                     )
                     # Handle rare situation where provided shedule doesn't produce any due dates
                     if not task.schedule:
@@ -871,13 +923,10 @@ def run_event_loop(logger, gardens, garden, window):
                         task.completed_dates = task_instance.completed_dates
                     # Add the task to the garden, overwriting the old version if it already exists
                     garden.add_item("tasks", task)
-                    event_funcs.update_task_dropdown(window, garden)
                     # Clear the task fields and variable once the task has been added to the garden
                     event_funcs.clear_task_values(window)
-                    event_funcs.clear_organism_links(window, garden)
+                    event_funcs.deselect_organism_links(window)
                     task = None
-                    # Update the task numbers shown on the summary tab
-                    event_funcs.update_task_summaries(window, garden)
                     gardens_changed = True
 
             elif event == "TASK REMOVE":
@@ -887,18 +936,16 @@ def run_event_loop(logger, gardens, garden, window):
                 t_confirmation = popups.remove_confirmation(values["-TASK NAME-"], "task")
                 if t_confirmation == "OK":
                     garden.remove_item("tasks", values["-TASK NAME-"])
-                    event_funcs.update_task_dropdown(window, garden)
                     event_funcs.clear_task_values(window)
                     task = None
-                    event_funcs.clear_organism_links(window, garden)
-                    event_funcs.update_task_summaries(window, garden)
+                    event_funcs.deselect_organism_links(window)
                     gardens_changed = True
 
             elif event == "ADD PROGRESS":
                 # Check the task variable exists and has been assigned to a task
                 if "task" in locals() and task:
                     # Open the progress subwindow and set gardens_changed flag if progress added
-                    if subwindows.add_progress_window(window, task):
+                    if subwindows.add_progress_window(window, garden, task):
                         gardens_changed = True
                 else:
                     popups.item_not_created("task", "progress can be added")
@@ -906,7 +953,7 @@ def run_event_loop(logger, gardens, garden, window):
             elif event == "-TASK NAME-":
                 if not values["-TASK NAME-"]:
                     event_funcs.clear_task_values(window)
-                    event_funcs.clear_organism_links(window, garden)
+                    event_funcs.deselect_organism_links(window)
                     task = None
                     continue
                 # If a task is selected populate the relevant fields with its values
@@ -922,6 +969,7 @@ def run_event_loop(logger, gardens, garden, window):
                 window["-TASK START-"].update(task_instance.raw_schedule["start date"])
                 window["-TASK FREQUENCY-"].update(task_instance.raw_schedule["freq"])
                 window["-TASK COUNT-"].update(task_instance.raw_schedule["count"])
+                window["-TASK UNTIL-"].update(task_instance.raw_schedule.get("until", ""))
                 window["-TASK BY MONTH-"].update(task_instance.raw_schedule["bymonth"])
                 window["-TASK INTERVAL-"].update(task_instance.raw_schedule["interval"])
                 # Then assign instance to task variable so progress can be added
@@ -932,7 +980,8 @@ def run_event_loop(logger, gardens, garden, window):
         logger.exception("Fatal Error")
         popups.fatal_error(ex)
 
-    # Finish up by removing from the screen
+    # Finish up by saving any changes and removing from the screen
+    autosaver.stop()
     window.close()
 
 
@@ -947,14 +996,13 @@ def main():
     create the window, and run the event loop.
     """
     logging.basicConfig(
-        filename="gardenlife.log", format="%(asctime)s %(levelname)s %(name)s %(message)s"
+        filename="gardenlife.log",
+        format="%(asctime)s %(levelname)s %(name)s %(message)s",
+        level=logging.INFO,
     )
     logger = logging.getLogger(__name__)
-    gardens = load_gardens()
+    store = Database()
+    gardens = load_gardens(store)
     garden = load_garden(gardens)
     window = create_window(gardens, garden)
-    run_event_loop(logger, gardens, garden, window)
-
-
-if __name__ == "__main__":
-    main()
+    run_event_loop(logger, store, gardens, garden, window)
@@ -0,0 +1,168 @@
+"""
+Contains a class to hold the impact, prevalence, and trend of a garden's creatures or
+plants in columns, with their types and statuses, so they can be aggregated together.
+
+The columns are arrays from the array module, so they're compact without NumPy.
+Aggregates use NumPy if it's installed. Otherwise, each organism is counted individually.
+NumPy is imported the first time it's needed, so importing this module stays quick.
+"""
+
+from array import array
+
+from .constants import DECLINING_TREND, LEVELS, MEASURES
+from .optional import numpy
+from .status import ARCHIVED
+
+
+class MeasureColumns:
+    """
+    Class to represent the measures of a number of organisms in columns, one row each.
+
+    Organism types are stored as codes, which index the types list. Rows are appended
+    as organisms are added, and a removed organism's row is replaced by the last row,
+    so adding and removing organisms takes the same time however many there are.
+    Archived organisms are left out of the aggregates unless they're included.
+    """
+
+    def __init__(self, organisms=()):
+        self.names = []
+        self.types = []
+        self.columns = {measure: array("b") for measure in MEASURES}
+        self.type_codes = array("i")
+        self.archived = array("b")
+        self._rows = {}
+        self._codes = {}
+        for organism in organisms:
+            self.add(organism)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)} organisms)"
+
+    def add(self, organism, name=None):
+        """
+        Add an organism's row, or update it if the organism has already been added.
+        The row is found by the organism's name unless another name is given.
+        """
+        name = organism.name if name is None else name
+        code = self._code(organism.org_type)
+        # Measures are held as integers, though the sliders in the window give floats
+        values = [int(getattr(organism, measure)) for measure in MEASURES]
+        archived = organism.status.get() == ARCHIVED
+        row = self._rows.get(name)
+        if row is None:
+            self._rows[name] = len(self.names)
+            self.names.append(name)
+            for column, value in zip(self.columns.values(), values):
+                column.append(value)
+            self.type_codes.append(code)
+            self.archived.append(archived)
+        else:
+            for column, value in zip(self.columns.values(), values):
+                column[row] = value
+            self.type_codes[row] = code
+            self.archived[row] = archived
+
+    def remove(self, name):
+        """Remove an organism's row if it has been added."""
+        row = self._rows.pop(name, None)
+        if row is None:
+            return
+        last_name = self.names.pop()
+        columns = (*self.columns.values(), self.type_codes, self.archived)
+        last_values = [column.pop() for column in columns]
+        # Move the last row into the removed row, unless the removed row was the last
+        if row < len(self.names):
+            self.names[row] = last_name
+            self._rows[last_name] = row
+            for column, value in zip(columns, last_values):
+                column[row] = value
+
+    def mean_by_type(self, measure, include_archived=False):
+        """Return a dict of each organism type mapped to the mean of a measure."""
+        np = numpy()
+        values = self._selected(self.columns[measure], include_archived)
+        codes = self._selected(self.type_codes, include_archived)
+        if np is None:
+            totals = [0] * len(self.types)
+            counts = [0] * len(self.types)
+            for value, code in zip(values, codes):
+                totals[code] += value
+                counts[code] += 1
+        else:
+            totals = np.bincount(codes, weights=values, minlength=len(self.types)).tolist()
+            counts = np.bincount(codes, minlength=len(self.types)).tolist()
+        return {
+            org_type: total / count
+            for org_type, total, count in zip(self.types, totals, counts)
+            if count
+        }
+
+    def counts_by_level(self, measure, include_archived=False):
+        """Return a dict of each level of a measure, from 1 to 5, mapped to its count."""
+        np = numpy()
+        values = self._selected(self.columns[measure], include_archived)
+        levels = list(LEVELS[f"{measure}_levels"])
+        if np is None:
+            counts = [0] * (levels[-1] + 1)
+            for value in values:
+                counts[value] += 1
+        else:
+            counts = np.bincount(values, minlength=levels[-1] + 1).tolist()
+        return {level: counts[level] for level in levels}
+
+    def declining_share(self, include_archived=False):
+        """Return the share of organisms with a decreasing trend, or 0 if there are none."""
+        np = numpy()
+        trends = self._selected(self.columns["trend"], include_archived)
+        if not len(trends):
+            return 0.0
+        if np is None:
+            declining = sum(trend <= DECLINING_TREND for trend in trends)
+        else:
+            declining = int(np.count_nonzero(trends <= DECLINING_TREND))
+        return declining / len(trends)
+
+    def _code(self, org_type):
+        # Return the code of an organism type, adding the type if it's new
+        code = self._codes.get(org_type)
+        if code is None:
+            code = self._codes[org_type] = len(self.types)
+            self.types.append(org_type)
+        return code
+
+    def _selected(self, column, include_archived):
+        # Return the values in a column, as a NumPy array if it's installed,
+        # leaving out the archived organisms unless they're included
+        np = numpy()
+        if np is None:
+            if include_archived:
+                return column
+            return [value for value, archived in zip(column, self.archived) if not archived]
+        values = np.frombuffer(column, dtype=column.typecode)
+        if include_archived:
+            return values
+        return values[np.frombuffer(self.archived, dtype=np.int8) == 0]
+
+
+def combine(gardens, category):
+    """
+    Return the measures of the creatures or plants in every garden in the gardens dict
+    in one set of columns, so they can be aggregated across the gardens.
+    Rows are named with (garden name, organism name) tuples.
+    """
+    combined = MeasureColumns()
+    for garden in gardens.values():
+        columns = garden.measures(category)
+        codes = [combined._code(org_type) for org_type in columns.types]
+        names = [(garden.name, name) for name in columns.names]
+        combined._rows.update(zip(names, range(len(combined.names), len(combined) + len(names))))
+        combined.names += names
+        for measure, column in columns.columns.items():
+            combined.columns[measure].extend(column)
+        combined.type_codes.extend(map(codes.__getitem__, columns.type_codes))
+        combined.archived.extend(columns.archived)
+    return combined
+
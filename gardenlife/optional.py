@@ -0,0 +1,19 @@
+"""
+Contains functions to import optional dependencies the first time they're needed,
+so importing the modules that use them stays quick, and they work without them.
+"""
+
+# Replaced by the numpy module, or None if it isn't installed, when it's first needed
+_numpy = NotImplemented
+
+
+def numpy():
+    """Return the numpy module, or None if it isn't installed."""
+    global _numpy
+    if _numpy is NotImplemented:
+        try:
+            import numpy as module
+        except ImportError:
+            module = None
+        _numpy = module
+    return _numpy
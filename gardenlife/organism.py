@@ -1,9 +1,25 @@
-from constants import LEVELS
-from status import Status
+from .constants import LEVELS
+from .slots import Slotted
+from .status import CURRENT, StatusAttribute
 
 
-class Organism:
+class Organism(Slotted):
     """Class to represent an organism."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "org_type",
+        "notes",
+        "age",
+        "_impact",
+        "_prevalence",
+        "_trend",
+        "_status",
+    )
+
+    status = StatusAttribute()
+
     def __init__(
         self,
         name,  # Eg Badger, Mouse, Ash, Leek
@@ -21,7 +37,9 @@ class Organism:
         self.impact = impact
         self.prevalence = prevalence
         self.trend = trend
-        self.status = Status()
+        self.status = CURRENT
+        # Given by the garden the organism is added to
+        self.id = None
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.name}, {self.org_type})"
@@ -29,6 +47,13 @@ class Organism:
     def __eq__(self, other):
         return self.org_type == other.org_type and self.name == other.name
 
+    def __hash__(self):
+        return hash((self.org_type, self.name))
+
+    def __setstate__(self, state):
+        # Organisms pickled by earlier versions don't have an ID until they're added to a garden
+        super().__setstate__({"id": None, **state})
+
     @property
     def impact(self):
         return self._impact
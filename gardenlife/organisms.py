@@ -1,10 +1,13 @@
 """Contains classes to represent creatures and plants."""
 
-from organism import Organism
+from .organism import Organism
 
 
 class Creature(Organism):
     """Class to represent a creature."""
+
+    __slots__ = ("appeared",)
+
     def __init__(self, *args, appeared=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.appeared = appeared
@@ -15,6 +18,9 @@ class Creature(Organism):
 
 class Plant(Organism):
     """Class to represent a plant."""
+
+    __slots__ = ("edible", "planted")
+
     def __init__(self, *args, edible=False, planted=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.edible = edible
@@ -6,7 +6,8 @@ import traceback
 
 import PySimpleGUI as sg
 
-from constants import ICON, LOGO, VERSION_NUMBER
+from .constants import VERSION_NUMBER
+from . import images
 
 
 def fatal_error(error):
@@ -27,7 +28,7 @@ def about():
         f"    {VERSION_NUMBER}\n",
         "    A garden management application created by Jon Boland.\n",
         title="   About...",
-        image=LOGO,
+        image=images.logo(),
         keep_on_top=True,
     )
 
@@ -61,7 +62,7 @@ def remove_confirmation(name, element):
         f"This {element} will be permanently deleted.\n",
         "Click OK if you wish to proceed.\n",
         # Added because the global icon doesn't appear to be applied to this popup type
-        icon=ICON,
+        icon=images.icon(),
         title="Remove Confirmation",
         keep_on_top=True,
     )
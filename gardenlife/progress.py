@@ -0,0 +1,30 @@
+"""
+Progress functions for the gardenlife application.
+
+Evaluates the progress and next due date of every task in a garden.
+Each task caches its progress until the date it can next change, so only
+the tasks whose progress may have changed are calculated again.
+"""
+
+
+OUTSTANDING = {"Due", "Overdue", "Very overdue"}
+
+
+def garden_progress(tasks, current_date=None):
+    """
+    Return a dict of task names mapped to a tuple containing
+    each task's current progress and next due date in string format.
+    Only tasks without up to date cached progress are evaluated.
+    """
+    return {
+        task.name: (task.get_current_progress(current_date), task.get_next_due_date())
+        for task in tasks
+    }
+
+
+def outstanding_tasks(tasks, current_date=None):
+    """Return the number of tasks that are due, overdue, or very overdue."""
+    return sum(
+        progress in OUTSTANDING
+        for progress, _ in garden_progress(tasks, current_date).values()
+    )
@@ -0,0 +1,275 @@
+"""
+Contains a class to represent the scheduled dates of a task,
+and a function that shares schedules between tasks with the same parameters.
+"""
+
+from calendar import monthrange
+from datetime import datetime, time, timedelta, MAXYEAR
+from functools import lru_cache
+import bisect
+from math import gcd
+
+from dateutil.rrule import rrule, WEEKLY, MONTHLY, YEARLY
+
+from .constants import SCHEDULE_CACHE_SIZE
+
+
+DAYS_IN_400_YEARS = 146097
+
+
+def compile_schedule(dtstart, freq=MONTHLY, count=1, bymonth=None, interval=1, until=None):
+    """
+    Return a schedule with the supplied parameters.
+    Recently used schedules are shared rather than created again.
+    """
+    bymonth = tuple(sorted(set(bymonth))) if bymonth else None
+    return _shared_schedule(dtstart, freq, count, bymonth, interval, until)
+
+
+@lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def _shared_schedule(dtstart, freq, count, bymonth, interval, until):
+    return Schedule(dtstart, freq, count, bymonth, interval, until)
+
+
+class Schedule:
+    """
+    Class to represent the scheduled dates of a task.
+
+    Only the rrule parameters are stored. Dates are calculated when they are needed,
+    so the size of a schedule doesn't depend on how many dates it contains.
+    Schedules are immutable so they can be shared between tasks.
+
+    The dates can be limited by a count, an until date, or both. A schedule
+    with neither is open-ended and continues until the end of the year 9999.
+    """
+
+    __slots__ = ("dtstart", "freq", "count", "bymonth", "interval", "until", "_cycle", "_length")
+
+    def __init__(self, dtstart, freq=MONTHLY, count=1, bymonth=None, interval=1, until=None):
+        bymonth = tuple(sorted(set(bymonth))) if bymonth else None
+        values = (dtstart, freq, count, bymonth, interval, until, None, None)
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} objects are immutable")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}{self._params()}"
+
+    def __reduce__(self):
+        # Unpickled schedules are shared too. The month cycle and length are recalculated
+        return compile_schedule, self._params()
+
+    def __eq__(self, other):
+        if not isinstance(other, Schedule):
+            return NotImplemented
+        return self._params() == other._params()
+
+    def __hash__(self):
+        return hash(self._params())
+
+    def __len__(self):
+        if self._length is None:
+            object.__setattr__(self, "_length", self._calculate_length())
+        return self._length
+
+    def __bool__(self):
+        # Checking for a first date is quicker than calculating the length
+        if self._length is None and self._has_dates():
+            return self.until is None or self._nth(0) <= self.until
+        return len(self) > 0
+
+    def __iter__(self):
+        # A rule that never matches would otherwise be searched until the year 9999
+        return iter(self.rule()) if self else iter(())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._nth(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        # The first date is the one most often needed, so avoid calculating the length for it
+        if not (bool(self) if index == 0 else 0 <= index < len(self)):
+            raise IndexError("schedule index out of range")
+        return self._nth(index)
+
+    def __contains__(self, date):
+        position = self.bisect_left(date)
+        return position < len(self) and self[position] == date
+
+    def rule(self):
+        """Return the dateutil rrule that generates the scheduled dates."""
+        # dateutil deprecates combining count and until, but the length already applies both
+        return rrule(
+            dtstart=self.dtstart,
+            freq=self.freq,
+            count=self.count if self.until is None else len(self),
+            bymonth=self.bymonth,
+            interval=self.interval,
+        )
+
+    def _params(self):
+        return (self.dtstart, self.freq, self.count, self.bymonth, self.interval, self.until)
+
+    def bisect_left(self, date):
+        """Return the number of scheduled dates before date."""
+        if not self:
+            return 0
+        # Scheduled dates fall at midnight, so compare against the first midnight not before date
+        position = self._count_before(date.toordinal() + (date.time() != time.min))
+        return min(max(position, 0), len(self))
+
+    def bisect_right(self, date):
+        """Return the number of scheduled dates before or on date."""
+        if not self:
+            return 0
+        position = self._count_before(date.toordinal() + 1)
+        return min(max(position, 0), len(self))
+
+    def after(self, date, inc=False):
+        """Return the first scheduled date after date, or None if there isn't one."""
+        position = self.bisect_left(date) if inc else self.bisect_right(date)
+        return self[position] if position < len(self) else None
+
+    def between(self, after, before, inc=False):
+        """Return a list of the scheduled dates between after and before."""
+        if inc:
+            return self[self.bisect_left(after) : self.bisect_right(before)]
+        return self[self.bisect_right(after) : self.bisect_left(before)]
+
+    def _calculate_length(self):
+        if not self._has_dates():
+            return 0
+        # Count the dates up to the until date, or the last date there can be,
+        # as a count can run past the year 9999, where the rule stops
+        until = self.until or datetime.max
+        length = max(self._count_before(until.toordinal() + 1), 0)
+        return length if self.count is None else min(length, self.count)
+
+    def _count_before(self, limit):
+        # Count the dates before the limit ordinal, ignoring the count and until date
+        if self.freq in (MONTHLY, YEARLY):
+            return self._count_by_month(limit)
+        if self.bymonth:
+            return self._count_by_day_in_months(limit)
+        step = self.interval * (7 if self.freq == WEEKLY else 1)
+        return -(-(limit - self.dtstart.toordinal()) // step)
+
+    def _has_dates(self):
+        if self.count is not None and self.count < 1:
+            return False
+        if self.freq in (MONTHLY, YEARLY):
+            return bool(self._month_cycle()[1])
+        return True
+
+    def _nth(self, index):
+        # Return the date at a non-negative index without generating the earlier dates
+        if self.freq in (MONTHLY, YEARLY):
+            return self._nth_by_month(index)
+        if self.bymonth:
+            return self._nth_by_day_in_months(index)
+        step = self.interval * (7 if self.freq == WEEKLY else 1)
+        return self.dtstart + timedelta(days=index * step)
+
+    def _days_in_months(self):
+        # Walk year by year through the daily/weekly dates that fall in runs of chosen months.
+        # Yield the first day of each run and the first and last steps that fall within it
+        start = self.dtstart.toordinal()
+        step = self.interval * (7 if self.freq == WEEKLY else 1)
+        runs = _month_runs(self.bymonth)
+        for year in range(self.dtstart.year, MAXYEAR + 1):
+            for first_month, last_month in runs:
+                run_start = datetime(year, first_month, 1).toordinal()
+                run_end = datetime(year, last_month, monthrange(year, last_month)[1]).toordinal()
+                if run_end >= start:
+                    first_step = -(-(max(start, run_start) - start) // step)
+                    last_step = (run_end - start) // step
+                    yield run_start, first_step, last_step
+
+    def _nth_by_day_in_months(self, index):
+        step = self.interval * (7 if self.freq == WEEKLY else 1)
+        for _, first_step, last_step in self._days_in_months():
+            dates_in_run = max(last_step - first_step + 1, 0)
+            if index < dates_in_run:
+                return self.dtstart + timedelta(days=(first_step + index) * step)
+            index -= dates_in_run
+
+    def _count_by_day_in_months(self, limit):
+        # Count the dates before the limit ordinal one run of months at a time
+        step = self.interval * (7 if self.freq == WEEKLY else 1)
+        start = self.dtstart.toordinal()
+        # The calendar repeats every 400 years, so the dates do too once the step is back in phase
+        period = _lcm(step, DAYS_IN_400_YEARS)
+        cycles = max((limit - start - 1) // period, 0)
+        if cycles:
+            whole_period = self._count_by_day_in_months(start + period)
+            return cycles * whole_period + self._count_by_day_in_months(limit - cycles * period)
+        limit_step = (limit - 1 - start) // step
+        count = 0
+        for run_start, first_step, last_step in self._days_in_months():
+            if run_start >= limit:
+                return count
+            count += max(min(last_step, limit_step) - first_step + 1, 0)
+        return count
+
+    def _nth_by_month(self, index):
+        anchor, offsets, skipped, length = self._month_cycle()
+        cycles, position = divmod(index + skipped, len(offsets))
+        year, month = divmod(anchor + cycles * length + offsets[position], 12)
+        return datetime(year, month + 1, self.dtstart.day)
+
+    def _count_by_month(self, limit):
+        # Count the dates before the limit ordinal using whole cycles of the month pattern
+        anchor, offsets, skipped, length = self._month_cycle()
+        if limit <= 1:
+            return 0
+        # Use the last day before the limit, which exists even when the limit doesn't
+        last_date = datetime.fromordinal(limit - 1)
+        limit_month = last_date.year * 12 + last_date.month - 1
+        # The date in the last month is included if it falls on or before the last day
+        if self.dtstart.day <= last_date.day:
+            limit_month += 1
+        cycles, remainder = divmod(limit_month - anchor, length)
+        return cycles * len(offsets) + bisect.bisect_left(offsets, remainder) - skipped
+
+    def _month_cycle(self):
+        # Monthly and yearly dates fall on a repeating pattern of months.
+        # Return the anchor month, the month offsets in one cycle of the pattern,
+        # the number of offsets before the start date, and the cycle length
+        if self._cycle is None:
+            start = self.dtstart
+            yearly = self.freq == YEARLY
+            step = self.interval * (12 if yearly else 1)
+            months = self.bymonth or ((start.month,) if yearly else range(1, 13))
+            # The 29th of February only exists in leap years, which repeat every 400 years
+            length = _lcm(step, 4800 if start.day == 29 and 2 in months else 12)
+            anchor = start.year * 12 + (0 if yearly else start.month - 1)
+            offsets = []
+            for offset in range(length):
+                year, month = divmod(anchor + offset, 12)
+                if yearly and (year - start.year) % self.interval:
+                    continue
+                if not yearly and offset % self.interval:
+                    continue
+                if month + 1 in months and start.day <= monthrange(year, month + 1)[1]:
+                    offsets.append(offset)
+            # Yearly patterns are anchored on January, so skip months before the start date
+            skipped = sum(offset < start.month - 1 for offset in offsets) if yearly else 0
+            object.__setattr__(self, "_cycle", (anchor, offsets, skipped, length))
+        return self._cycle
+
+
+def _lcm(a, b):
+    return a * b // gcd(a, b)
+
+
+def _month_runs(months):
+    # Group months into runs of consecutive months, eg (3, 4, 5, 9) into [[3, 5], [9, 9]]
+    runs = []
+    for month in sorted(set(months)):
+        if runs and runs[-1][1] == month - 1:
+            runs[-1][1] = month
+        else:
+            runs.append([month, month])
+    return runs
@@ -0,0 +1,321 @@
+"""
+Contains a class to store each garden in its own shard file in a data directory,
+so saving only rewrites the gardens that have changed, and a damaged or very large
+garden doesn't affect the others.
+
+A shard holds a garden's details followed by its creatures, plants, and tasks,
+each encoded separately in the binary format from codec.py. Changes are encoded
+as they're recorded, so shards can be written by another thread. The manifest
+lists the gardens with their shard files and timestamps, so loading doesn't need
+to read every shard. Shards can also be read in parallel by a pool of processes.
+"""
+
+from datetime import datetime
+import json
+import os
+from struct import Struct
+import threading
+
+from .codec import decode_garden, decode_item, encode_garden, encode_item
+from .constants import MANIFEST_FILE, SHARD_DIRECTORY, SHARD_POOL_MINIMUM
+from .database import GardenTable
+from .gc_pause import paused_gc
+
+SHARD_MAGIC = b"GSHD"
+SHARD_VERSION = 1
+SHARD_HEADER = Struct("<4sH")
+UINT32 = Struct("<I")
+CATEGORIES = ("creatures", "plants", "tasks")
+
+
+class ShardStore:
+    """
+    Class to represent the data directory the gardens are stored in, one shard per garden.
+    Changes are recorded as they're made and the changed shards are written when saved.
+    """
+
+    def __init__(self, directory=SHARD_DIRECTORY):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, MANIFEST_FILE)
+        os.makedirs(directory, exist_ok=True)
+        self._manifest = self._read_manifest()
+        # Encoded details and items of the gardens that have been loaded or changed
+        self._shards = {}
+        self._dirty = set()
+        self._removed = set()
+        # The manifest and shards are changed under this lock, and a save copies
+        # the changed ones under it so it can write them while more changes are recorded
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+    def load(self):
+        """
+        Return a dict-like table of the gardens in the manifest.
+        Each garden's shard is read when the garden is first used.
+        """
+        timestamps = {
+            name: datetime.fromisoformat(entry["timestamp"])
+            for name, entry in self._manifest["gardens"].items()
+        }
+        return GardenTable(self, timestamps)
+
+    def load_garden(self, name):
+        """Return a garden from its shard, and attach the store to it."""
+        if name not in self._manifest["gardens"]:
+            raise KeyError(name)
+        with self._lock:
+            shard = self._shard(name)
+        garden = _decode_shard(shard)
+        self._attach(garden)
+        return garden
+
+    def load_all(self, processes=None):
+        """
+        Return a dict of every garden in the manifest, and attach the store to them.
+        The shards are read in parallel by a pool of processes if there are enough of them
+        and more than one processor.
+        """
+        paths = [self._path(name) for name in self._manifest["gardens"]]
+        processes = processes or os.cpu_count() or 1
+        if len(paths) < SHARD_POOL_MINIMUM or processes == 1:
+            loaded = map(_load_shard, paths)
+            gardens = {garden.name: garden for garden in loaded}
+        else:
+            # Imported here as it's slow to import and only needed for reports on every garden
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(processes) as executor:
+                gardens = {garden.name: garden for garden in executor.map(_load_shard, paths)}
+        for garden in gardens.values():
+            self._attach(garden)
+        return gardens
+
+    def import_gardens(self, gardens):
+        """Record every garden in the gardens dict and all their items, eg to import them."""
+        for garden in gardens.values():
+            garden.store = self
+            with self._lock:
+                self._manifest_entry(garden)
+                self._shards[garden.name] = {
+                    "details": encode_garden(garden),
+                    **{
+                        category: {
+                            name: encode_item(item)
+                            for name, item in getattr(garden, category).items()
+                        }
+                        for category in CATEGORIES
+                    },
+                }
+                self._dirty.add(garden.name)
+
+    def put_garden(self, garden):
+        """Record a created or updated garden and attach the store to it."""
+        garden.store = self
+        with self._lock:
+            self._put_details(garden)
+            self._dirty.add(garden.name)
+
+    def remove_garden(self, garden):
+        """Record a removed garden and detach the store from it."""
+        garden.store = None
+        with self._lock:
+            self._shards.pop(garden.name, None)
+            self._dirty.discard(garden.name)
+            if garden.name in self._manifest["gardens"]:
+                self._removed.add(self._manifest["gardens"].pop(garden.name)["file"])
+
+    def record(self, garden, operation, *args):
+        """
+        Record a change to a garden. The operation is the name of the Garden method
+        that made the change, and args are its arguments. Only the garden's timestamp
+        is updated with the change, as its details are recorded when it's put.
+        """
+        with self._lock:
+            if garden.name in self._manifest["gardens"]:
+                self._manifest_entry(garden)
+                shard = self._shard(garden.name)
+            else:
+                # A garden that was never put is recorded with the details it has now
+                shard = self._put_details(garden)
+            if operation == "add_item":
+                category, item = args
+                shard[category][item.name] = encode_item(item)
+            elif operation == "remove_item":
+                category, name = args
+                shard[category].pop(name, None)
+            elif operation == "rename_item":
+                category, name, new_name = args
+                shard[category].pop(name, None)
+                shard[category][new_name] = encode_item(getattr(garden, category)[new_name])
+            else:
+                # Progress changes replace the whole task
+                shard["tasks"][args[0]] = encode_item(garden.tasks[args[0]])
+            self._dirty.add(garden.name)
+
+    def save(self):
+        """
+        Write the shards of the changed gardens and the manifest, and return the size
+        in bytes of the shards written. Can be called from any thread.
+        If the save fails the changes are kept.
+        """
+        with self._save_lock:
+            with self._lock:
+                dirty, removed = self._dirty, self._removed
+                self._dirty, self._removed = set(), set()
+                # Copy the item dicts so changes can be recorded while the shards are written
+                changed = {
+                    self._manifest["gardens"][name]["file"]: {
+                        key: value.copy() if isinstance(value, dict) else value
+                        for key, value in self._shards[name].items()
+                    }
+                    for name in dirty
+                }
+                manifest = json.dumps(self._manifest)
+            try:
+                size = 0
+                for file, shard in changed.items():
+                    data = _encode_shard(shard)
+                    _write_file(os.path.join(self.directory, file), data)
+                    size += len(data)
+                if changed or removed:
+                    _write_file(self.manifest_path, manifest.encode())
+            except Exception:
+                # Keep the changes, so they're written by the next save
+                with self._lock:
+                    self._dirty |= dirty & set(self._manifest["gardens"])
+                    self._removed |= removed
+                raise
+            # Shards are only removed once the manifest no longer refers to them
+            for file in removed - set(changed):
+                try:
+                    os.remove(os.path.join(self.directory, file))
+                except FileNotFoundError:
+                    pass
+        return size
+
+    def discard(self):
+        """Forget the changes recorded since the store was last saved."""
+        with self._lock:
+            for name in self._dirty:
+                self._shards.pop(name, None)
+            self._dirty.clear()
+            self._removed.clear()
+            self._manifest = self._read_manifest()
+
+    def wait(self):
+        """Return immediately, as save writes the shards before it returns."""
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {"next": 1, "gardens": {}}
+
+    def _attach(self, garden):
+        # The manifest has the timestamp and next IDs as of the garden's latest change,
+        # which are newer than those in its details if it has changed since it was put
+        entry = self._manifest["gardens"][garden.name]
+        garden.timestamp = datetime.fromisoformat(entry["timestamp"])
+        garden.next_ids = entry.get("next_ids", garden.next_ids)
+        garden.store = self
+
+    def _put_details(self, garden):
+        # Add or update the garden's manifest entry and details, and return its shard
+        self._manifest_entry(garden)
+        if self._exists(garden.name):
+            shard = self._shard(garden.name)
+        else:
+            shard = self._shards[garden.name] = _empty_shard()
+        shard["details"] = encode_garden(garden)
+        return shard
+
+    def _manifest_entry(self, garden):
+        # Add or update the garden's entry, giving a new garden the next shard file
+        gardens = self._manifest["gardens"]
+        if garden.name not in gardens:
+            gardens[garden.name] = {"file": f"{self._manifest['next']}.garden"}
+            self._manifest["next"] += 1
+        gardens[garden.name]["timestamp"] = garden.timestamp.isoformat()
+        gardens[garden.name]["next_ids"] = garden.next_ids.copy()
+
+    def _path(self, name):
+        return os.path.join(self.directory, self._manifest["gardens"][name]["file"])
+
+    def _exists(self, name):
+        return name in self._shards or os.path.exists(self._path(name))
+
+    def _shard(self, name):
+        # Return the garden's encoded shard, reading it if it hasn't been read yet
+        if name not in self._shards:
+            with open(self._path(name), "rb") as file:
+                self._shards[name] = _parse_shard(file.read())
+        return self._shards[name]
+
+
+def _empty_shard():
+    return {"details": None, "creatures": {}, "plants": {}, "tasks": {}}
+
+
+def _load_shard(path):
+    # Return the garden in a shard file. Run in the pool's processes by load_all
+    with open(path, "rb") as file:
+        return _decode_shard(_parse_shard(file.read()))
+
+
+def _decode_shard(shard):
+    garden = decode_garden(shard["details"])
+    with paused_gc():
+        for category in CATEGORIES:
+            items = getattr(garden, category)
+            for name, data in shard[category].items():
+                items[name] = decode_item(data)
+    return garden
+
+
+def _encode_shard(shard):
+    # The details, then the number of items in each category followed by
+    # the name and encoded item of each one, all prefixed by their lengths
+    parts = [SHARD_HEADER.pack(SHARD_MAGIC, SHARD_VERSION)]
+    parts += [UINT32.pack(len(shard["details"])), shard["details"]]
+    for category in CATEGORIES:
+        items = shard[category]
+        parts.append(UINT32.pack(len(items)))
+        for name, data in items.items():
+            encoded_name = name.encode()
+            parts += [UINT32.pack(len(encoded_name)), encoded_name, UINT32.pack(len(data)), data]
+    return b"".join(parts)
+
+
+def _parse_shard(data):
+    # Return the encoded details and items in a shard file, without decoding them
+    magic, version = SHARD_HEADER.unpack_from(data)
+    if magic != SHARD_MAGIC or version != SHARD_VERSION:
+        raise ValueError(f"Not a version {SHARD_VERSION} garden shard")
+    offset = SHARD_HEADER.size
+
+    def read_bytes():
+        nonlocal offset
+        (length,) = UINT32.unpack_from(data, offset)
+        offset += UINT32.size + length
+        return data[offset - length : offset]
+
+    shard = {"details": read_bytes()}
+    for category in CATEGORIES:
+        (count,) = UINT32.unpack_from(data, offset)
+        offset += UINT32.size
+        items = shard[category] = {}
+        for _ in range(count):
+            name = read_bytes().decode()
+            items[name] = read_bytes()
+    return shard
+
+
+def _write_file(path, data):
+    # Write to a temporary file first so a failed write leaves the old file intact
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary_path, path)
@@ -0,0 +1,36 @@
+"""
+Contains a mixin for classes with __slots__, so they're pickled as they were
+before they had slots.
+"""
+
+from functools import lru_cache
+
+
+class Slotted:
+    """
+    Mixin for classes that declare __slots__ rather than having a __dict__.
+    Instances are pickled as a dict of the attributes that have been set, so attributes
+    pickled by earlier versions, which had a __dict__, are restored by setting them.
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self):
+        return {
+            name: getattr(self, name) for name in slot_names(type(self)) if hasattr(self, name)
+        }
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+@lru_cache(maxsize=None)
+def slot_names(cls):
+    """Return the names of the slots declared by a class and the classes it inherits from."""
+    return tuple(
+        name
+        for base in reversed(cls.__mro__)
+        for name in base.__dict__.get("__slots__", ())
+        if name != "__weakref__"
+    )
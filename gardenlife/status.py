@@ -1,34 +1,76 @@
+CURRENT = "Current"
+ARCHIVED = "Archived"
+STATUSES = (CURRENT, ARCHIVED)
+
+
 class Status:
     """
     Class to represent the status of an item. 
     Status can either be current or archived.
     Default status is current.
-    
+
+    Items store their status as one of the shared STATUSES strings in a _status slot,
+    and their status attribute returns a Status bound to the item when it's used.
     """
-    def __init__(self, status="Current"):
+
+    __slots__ = ("_item", "_status")
+
+    def __init__(self, status=CURRENT):
+        self._item = None
         self.status = status
 
+    @classmethod
+    def bound(cls, item):
+        """Return a status that reads and changes the status of an item."""
+        status = cls.__new__(cls)
+        status._item = item
+        return status
+
     @property
     def status(self):
-        return self._status
+        return (self if self._item is None else self._item)._status
 
     @status.setter
     def status(self, status):
-        if status not in ("Current", "Archived"):
+        if status not in STATUSES:
             raise ValueError(f"{status} is not a valid status")
-        self._status = status
+        # Stores the shared string, so every item with the same status refers to it
+        (self if self._item is None else self._item)._status = STATUSES[STATUSES.index(status)]
 
     def __repr__(self):
         return f"{self.__class__.__name__}('{self.status}')"
 
+    def __reduce__(self):
+        return self.__class__, (self.status,)
+
+    def __setstate__(self, state):
+        # Statuses pickled by earlier versions had a __dict__
+        self._item = None
+        self.status = state["_status"]
+
     def archive(self):
         """Set item status to archived."""
-        self.status = "Archived"
+        self.status = ARCHIVED
 
     def unarchive(self):
         """Set item status to current."""
-        self.status = "Current"
+        self.status = CURRENT
 
     def get(self):
         """Get the item's status."""
         return self.status
+
+
+class StatusAttribute:
+    """
+    Descriptor for the status of an item, which is stored in the item's _status slot.
+    Can be set to a status string or a Status, eg one pickled by an earlier version.
+    """
+
+    def __get__(self, item, owner=None):
+        if item is None:
+            return self
+        return Status.bound(item)
+
+    def __set__(self, item, status):
+        Status.bound(item).status = status.get() if isinstance(status, Status) else status
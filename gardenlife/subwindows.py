@@ -1,69 +1,46 @@
 """Subwindows for the gardenlife application."""
 
-import pickle
-import sys
-
 import PySimpleGUI as sg
 
-from constants import ACCENT_COLOR, CREATURE_HEADS, PLANT_HEADS, TASK_HEADS
-import summary_funcs
+from .constants import ACCENT_COLOR, CREATURE_HEADS, PLANT_HEADS, TASK_HEADS
+from . import progress
+from . import summaries
+from . import summary_funcs
 
 
-def unsaved_changes_window(window, gardens):
+def add_progress_window(window, garden, task, page=0):
     """
-    Display confirmation window when user attempts to close the application 
-    with unsaved changes. Options are save, don't save, and cancel.
+    Display window enabling user to add progress to the selected task.
+    The dates around today are shown first. Earlier and later dates are shown a page
+    at a time, and the pages with completed dates can be moved to directly.
     """
     window.Disable()
 
-    confirm_layout = [
-        [sg.Text("Would you like to save your changes?", pad=(0, 15))],
-        [
-            sg.Button("Save", size=(10, 1)),
-            sg.Button("Don't Save", size=(10, 1)),
-            sg.Button("Cancel", size=(10, 1)),
-        ],
-    ]
-
-    confirm_window = sg.Window(
-        "Confirm",
-        confirm_layout,
-        keep_on_top=True,
-        element_justification="center",
-    )
-
-    while True:
-        confirm_event, confirm_values = confirm_window.read()
-        # print(confirm_event, confirm_values)
-
-        if confirm_event == "Save":
-            with open("gardens.pickle", "wb") as file:
-                pickle.dump(gardens, file)
-            sys.exit()
-        if confirm_event == "Don't Save":
-            sys.exit()
-        if confirm_event in ("Cancel", sg.WIN_CLOSED):
-            confirm_window.close()
-            window.Enable()
-            break
-
-
-def add_progress_window(window, task):
-    """Display window enabling user to add progress to the selected task."""
-    window.Disable()
+    completed_pages = task.completed_pages()
+    # The page moved to by each button, or None if there isn't one to move to
+    pages = {
+        "Earlier Dates": page + 1 if task.get_all_progress(page + 1) else None,
+        "Later Dates": page - 1 if task.get_all_progress(page - 1) else None,
+        "Earlier Completed": min((p for p in completed_pages if p > page), default=None),
+        "Later Completed": max((p for p in completed_pages if p < page), default=None),
+    }
 
     progress_layout = [
         [
             sg.Column(
                 [
                     [sg.Checkbox(date, default=value, key=date)]
-                    for date, value in task.get_all_progress().items()
+                    for date, value in task.get_all_progress(page).items()
                 ],
                 size=(200, 200),
                 scrollable=True,
             ),
         ],
-        [sg.Button("Add")],
+        [
+            sg.Button("Add"),
+            sg.Button("Complete All Due"),
+        ],
+        [sg.Button(button, disabled=pages[button] is None) for button in pages],
     ]
 
     progress_window = sg.Window("Add Progress", progress_layout, keep_on_top=True)
@@ -73,7 +50,19 @@ def add_progress_window(window, task):
         # print(progress_event, progress_values)
 
         if progress_event == "Add":
-            task.update_completed_dates(progress_values)
+            garden.update_task_progress(task.name, progress_values)
+            progress_window.close()
+            window.Enable()
+            return True
+
+        if progress_event in pages:
+            # Keep any progress added to this page before moving to another one
+            garden.update_task_progress(task.name, progress_values)
+            progress_window.close()
+            return add_progress_window(window, garden, task, pages[progress_event]) or True
+
+        if progress_event == "Complete All Due":
+            garden.complete_task_until(task.name)
             progress_window.close()
             window.Enable()
             return True
@@ -92,7 +81,7 @@ def view_creatures_window(window, garden):
 
     creatures = [
         summary_funcs.creature_fields(creature)
-        for creature in summary_funcs.sorted_organisms(garden.creatures.values())
+        for creature in summaries.sorted_organisms(garden.creatures.values())
     ]
 
     creature_table = header_row + creatures
@@ -113,20 +102,17 @@ def view_creatures_window(window, garden):
             break
 
 
-def view_plants_window(window, garden, attr="name", title=""):
+def view_plants_window(window, garden, title="", **fields):
     """
     Display window containing summary of the plants in the currently selected garden.
-    The window can be filtered by an attribute such as whether the plant is edible.
+    The window can be filtered by indexed fields such as whether the plant is edible.
     """
     window.Disable()
 
     header_row = [[summary_funcs.summary_head_format(title) for title in PLANT_HEADS]]
 
-    plants = [
-        summary_funcs.plant_fields(plant)
-        for plant in summary_funcs.sorted_organisms(garden.plants.values())
-        if getattr(plant, attr)
-    ]
+    plants = garden.find_items("plants", **fields) if fields else garden.plants.values()
+    plants = [summary_funcs.plant_fields(plant) for plant in summaries.sorted_organisms(plants)]
 
     plant_table = header_row + plants
 
@@ -161,8 +147,11 @@ def view_tasks_window(window, garden):
 
     header_row = [name_head + other_head]
 
+    all_progress = progress.garden_progress(garden.tasks.values())
+
     tasks = [
-        summary_funcs.task_fields(task) for task in summary_funcs.sorted_tasks(garden.tasks.values())
+        summary_funcs.task_fields(task, all_progress[task.name])
+        for task in summaries.sorted_tasks(garden.tasks.values(), all_progress)
     ]
 
     task_table = header_row + tasks
@@ -0,0 +1,81 @@
+"""
+Summary functions for gardenlife that don't depend on the GUI.
+
+Return the values shown in the creature, plant, and task summaries,
+and sort the items in the order they're shown.
+"""
+
+from operator import attrgetter
+
+from . import progress
+
+
+def creature_values(creature):
+    """Return a tuple of the summary values for a creature."""
+    return (
+        creature.name,
+        creature.org_type,
+        creature.appeared,
+        creature.get_level("impact"),
+        creature.get_level("prevalence"),
+        creature.get_level("trend"),
+        creature.status.get(),
+    )
+
+
+def plant_values(plant):
+    """Return a tuple of the summary values for a plant."""
+    return (
+        plant.name,
+        plant.org_type,
+        plant.planted,
+        plant.get_level("impact"),
+        plant.get_level("prevalence"),
+        plant.get_level("trend"),
+        plant.status.get(),
+    )
+
+
+def task_values(task, task_progress=None):
+    """
+    Return a tuple of the summary values for a task.
+    Progress and next due date are calculated unless provided as a tuple.
+    """
+    if task_progress is None:
+        task_progress = (task.get_current_progress(), task.get_next_due_date())
+    return (
+        task.name,
+        *task_progress,
+        task.assignee,
+        task.length,
+        ", ".join(task.linked_creatures),
+        ", ".join(task.linked_plants),
+        task.status.get(),
+    )
+
+
+def sorted_organisms(organisms, sort_key="name"):
+    """Sort organism instances by archived status then by sort key."""
+    organisms = sorted(organisms, key=attrgetter(sort_key))
+    return sorted(organisms, key=lambda organism: str(organism.status), reverse=True)
+
+
+def sorted_tasks(tasks, all_progress=None, current_date=None):
+    """
+    Sort tasks instances by status, progress, due date, assignee, and name.
+    Progress is calculated for all the tasks at once, for current date or today, unless provided.
+    """
+    tasks = list(tasks)
+    if all_progress is None:
+        all_progress = progress.garden_progress(tasks, current_date)
+    tasks.sort(key=attrgetter("assignee", "name"))
+    tasks.sort(key=lambda task: all_progress[task.name][1])
+    tasks.sort(key=lambda task: _progress_order(all_progress[task.name][0]), reverse=True)
+    tasks.sort(key=lambda task: str(task.status), reverse=True)
+    return tasks
+
+
+def _progress_order(task_progress):
+    # Key for sorting tasks so those not yet due are placed before all others
+    # Note that the overall order is then reversed once this key has been applied to every task
+    return "A" if task_progress == "Not yet due" else task_progress
@@ -1,12 +1,36 @@
-from datetime import datetime
-from dateutil.rrule import rrule
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from heapq import merge
 
-from constants import FREQS
-from status import Status
+from .completed_dates import CompletedDates
+from .constants import FREQS, NO_END_DATE, PROGRESS_PAGE_SIZE
+from .dates import date_to_string, string_to_date, today
+from .schedule import compile_schedule
+from .slots import Slotted
+from .status import CURRENT, StatusAttribute
 
 
-class Task:
+class Task(Slotted):
     """Class to represent a garden task."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "schedule",
+        "description",
+        "assignee",
+        "length",
+        "completed_dates",
+        "linked_creatures",
+        "linked_plants",
+        "raw_schedule",
+        "_status",
+        "_progress_cache",
+        "_next_due_cache",
+    )
+
+    status = StatusAttribute()
+
     def __init__(
         self,
         name,
@@ -17,24 +41,67 @@ class Task:
         linked_plants=None,
     ):
         self.name = name
-        self.schedule = [self._set_date()]
+        self.schedule = compile_schedule(self._set_date())
         self.description = description
         self.assignee = assignee
         self.length = length
-        self.completed_dates = []
+        self.completed_dates = CompletedDates()
         self.linked_creatures = linked_creatures
         self.linked_plants = linked_plants
         self.raw_schedule = None
-        self.status = Status()
+        self.status = CURRENT
+        self._progress_cache = None
+        self._next_due_cache = None
+        # Given by the garden the task is added to
+        self.id = None
 
     def __repr__(self):
         return f"Task: {self.name}"
 
     def __eq__(self, other):
-        return repr(self) == other
+        # Tasks are equal if they have the same name, as the tasks in a garden are keyed by name
+        if not isinstance(other, Task):
+            return NotImplemented
+        return self.name == other.name
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __getstate__(self):
+        # Cached progress is recalculated when needed, so it isn't pickled
+        state = super().__getstate__()
+        state["_progress_cache"] = state["_next_due_cache"] = None
+        return state
 
-    def set_schedule(self, start_date, freq, count, bymonth, interval):
-        """Set task's scheduled dates using dateutils.rrule."""
+    def __setstate__(self, state):
+        # Tasks pickled by earlier versions don't have an ID until they're added to a garden
+        super().__setstate__({"id": None, **state})
+        self._progress_cache = self._next_due_cache = None
+        # Convert completed dates and schedules pickled as lists by earlier versions
+        if isinstance(self.completed_dates, list):
+            self.completed_dates = CompletedDates(self.completed_dates)
+        if isinstance(self.schedule, list):
+            first_date = self.schedule[0]
+            self.schedule = compile_schedule(first_date)
+            raw_schedule = self.raw_schedule
+            if raw_schedule:
+                # A blank start date meant the schedule started on the day it was set
+                self.set_schedule(
+                    start_date=raw_schedule["start date"] or date_to_string(first_date),
+                    freq=raw_schedule["freq"],
+                    count=raw_schedule["count"],
+                    bymonth=raw_schedule["bymonth"],
+                    interval=raw_schedule["interval"],
+                    until=raw_schedule.get("until", ""),
+                )
+                self.raw_schedule = raw_schedule
+
+    def set_schedule(self, start_date, freq, count, bymonth, interval, until=""):
+        """
+        Set task's schedule of dates based on dateutils.rrule.
+        Until can be the date of the last occurrence in string format, or NO_END_DATE
+        for an open-ended schedule. Count is then optional.
+        """
         # Stores the raw schedule values to repopulate UI fields
         self.raw_schedule = {
             "start date": start_date,
@@ -42,86 +109,154 @@ class Task:
             "count": count,
             "bymonth": bymonth,
             "interval": interval,
+            "until": until,
         }
         # Converts string to datetime object. Sets start date to today if not supplied
         start_date = self._set_date(start_date)
         # Sets the frequency to the required value or monthly if not supplied
         freq = FREQS.get(freq, FREQS["Monthly"])
-        count = int(count) if count else 1
+        # A schedule without a count or an until date has a single date
+        count = int(count) if count else (None if until else 1)
         bymonth = [int(month) for month in bymonth.split(" ")] if bymonth else None
         interval = int(interval) if interval else 1
-        # Creates the specified list of scheduled dates with dateutils.rrule
-        self.schedule = list(
-            rrule(
-                dtstart=start_date,
-                freq=freq,
-                count=count,
-                bymonth=bymonth,
-                interval=interval,
-            )
+        until = string_to_date(until) if until and until != NO_END_DATE else None
+        # Creates the schedule, which calculates the scheduled dates when they are needed
+        self.schedule = compile_schedule(
+            dtstart=start_date,
+            freq=freq,
+            count=count,
+            bymonth=bymonth,
+            interval=interval,
+            until=until,
         )
 
     def update_completed_dates(self, all_progress):
         """
         Take a dict containing all scheduled dates as keys in string format.
-        Add or removes dates from completed dates list based on their boolean values.
+        Add or removes dates from completed dates based on their boolean values.
         """
+        added, removed = [], []
         for date_string, boolean in all_progress.items():
-            date = self._string_to_date(date_string)
-            if boolean:
-                self._add_completed_date(date)
-            else:
-                self._remove_completed_date(date)
-        self.completed_dates.sort()
-
-    def _add_completed_date(self, date):
-        # Add date to completed date list if not already present
-        if date not in self.completed_dates:
-            self.completed_dates.append(date)
-
-    def _remove_completed_date(self, date):
-        # Remove date from completed dates list
-        try:
-            self.completed_dates.remove(date)
-        except ValueError:
-            pass
-
-    def get_all_progress(self):
+            (added if boolean else removed).append(string_to_date(date_string))
+        self.completed_dates.update(added, removed)
+
+    def complete_until(self, date=None):
+        """
+        Mark every scheduled date up to and including date as completed.
+        Date should be in string format. Today is used if no date is supplied.
         """
-        Return a dict containing all scheduled dates in string format with bool
+        date = self._set_date(date)
+        self.completed_dates.update(self.schedule[: self.schedule.bisect_right(date)])
+
+    def get_all_progress(self, page=0, current_date=None):
+        """
+        Return a dict containing scheduled dates in string format with bool
         indicating whether they are in the completed dates list.
         Any completed dates that are not in the current schedule are also included.
+        Dates are returned a page at a time. Page 0 contains the dates around
+        the current date, each positive page contains earlier dates,
+        and each negative page contains later dates.
         """
+        current_date = self._set_date(current_date)
+        first, last = self._page_bounds(page, self.schedule.bisect_left(current_date))
+        length = len(self.schedule)
+        # Pages beyond the first or last scheduled date are empty, as the pages
+        # at each end of the schedule include every completed date beyond it
+        if (page > 0 and last <= 0) or (page < 0 and first >= length):
+            return {}
+        first, last = max(first, 0), min(last, length)
+        start = bisect_left(self.completed_dates, self.schedule[first]) if first > 0 else 0
+        end = len(self.completed_dates)
+        if last < length:
+            end = bisect_left(self.completed_dates, self.schedule[last])
         return {
-            self._date_to_string(date): (date in self.completed_dates)
-            for date in sorted(self.schedule + self.completed_dates)
+            date_to_string(date): (date in self.completed_dates)
+            for date in merge(self.schedule[first:last], self.completed_dates[start:end])
         }
 
+    def completed_pages(self, current_date=None):
+        """
+        Return a sorted list of the pages of get_all_progress that contain completed dates,
+        so the dates around them can be shown without paging through every date between.
+        """
+        current_date = self._set_date(current_date)
+        centre = self.schedule.bisect_left(current_date)
+        pages = set()
+        for date in self.completed_dates:
+            # Each date is on the page of the last scheduled date on or before it
+            offset = max(self.schedule.bisect_right(date) - 1, 0) - centre
+            if offset < 0:
+                pages.add((-offset - 1) // PROGRESS_PAGE_SIZE)
+            else:
+                pages.add(-(offset // PROGRESS_PAGE_SIZE))
+        return sorted(pages)
+
     def get_current_progress(self, current_date=None):
-        """Return current task progress."""
+        """
+        Return current task progress.
+        The result is cached until the task changes or the date reaches its next transition.
+        """
         # Convert string to datetime object. Set current date to today if no date supplied
         current_date = self._set_date(current_date)
+        cache = self._progress_cache
+        if self._is_current(cache) and cache[3] <= current_date < cache[4]:
+            return cache[5]
+        progress = self._calculate_progress(current_date)
+        valid_until = self._next_transition(current_date)
+        self._progress_cache = self._cache_key() + (current_date, valid_until, progress)
+        return progress
+
+    def get_next_due_date(self):
+        """Return task's next due date in string format."""
+        if not self._is_current(self._next_due_cache):
+            self._next_due_cache = self._cache_key() + (self._calculate_next_due_date(),)
+        return self._next_due_cache[-1]
+
+    def clear_cached_progress(self):
+        """Forget the cached progress and next due date, so they're calculated again."""
+        self._progress_cache = self._next_due_cache = None
+
+    def _cache_key(self):
+        # The schedule and completed dates the cached values were calculated from
+        return (self.schedule, self.completed_dates, self.completed_dates.version)
+
+    def _is_current(self, cache):
+        # Check whether a cache was calculated from the current schedule and completed dates
+        return (
+            cache is not None
+            and cache[0] is self.schedule
+            and cache[1] is self.completed_dates
+            and cache[2] == self.completed_dates.version
+        )
+
+    def _next_transition(self, current_date):
+        # Progress can only change on a scheduled date or the day after one
+        upcoming = self.schedule.after(current_date, inc=True)
+        if upcoming is None:
+            return datetime.max
+        if upcoming == current_date:
+            return current_date + timedelta(days=1)
+        return upcoming
 
+    def _calculate_progress(self, current_date):
         if not self.completed_dates:
             if current_date < self.schedule[0]:
                 return "Not yet due"
             elif current_date == self.schedule[0]:
                 return "Due"
-            missed_dates_no_completed = sum(
-                date < current_date for date in self.schedule
-            )
+            missed_dates_no_completed = self.schedule.bisect_left(current_date)
             if missed_dates_no_completed == 1:
                 return "Overdue"
             # If number of missed dates isn't 1 it must be greater than 1
             return "Very overdue"
 
-        if current_date in self.schedule and current_date > self.completed_dates[-1]:
+        last_completed = self.completed_dates[-1]
+        if current_date > last_completed and current_date in self.schedule:
             return "Due"
         # Scheduled dates since task last completed, before or on the current date
-        missed_dates_with_completed = sum(
-            date > self.completed_dates[-1] and date < current_date
-            for date in self.schedule
-        )
+        missed_dates_with_completed = self.schedule.bisect_left(
+            current_date
+        ) - self.schedule.bisect_right(last_completed)
         if missed_dates_with_completed == 1:
             return "Overdue"
         elif missed_dates_with_completed > 1:
@@ -129,27 +264,26 @@ class Task:
         # If there aren't any missed dates the task is up to date
         return "Completed"
 
-    def get_next_due_date(self):
-        """Return task's next due date in string format."""
+    def _calculate_next_due_date(self):
         if not self.completed_dates:
-            return self._date_to_string(self.schedule[0])
-        elif self.schedule[-1] <= self.completed_dates[-1]:
+            return date_to_string(self.schedule[0])
+        next_due = self.schedule.after(self.completed_dates[-1])
+        if next_due is None:
             return "No further due dates"
-        next_due = min(
-            date for date in self.schedule if date > self.completed_dates[-1]
-        )
-        return self._date_to_string(next_due)
+        return date_to_string(next_due)
+
+    @staticmethod
+    def _page_bounds(page, centre):
+        # Return the positions in the schedule of the first date on a page, and the date after
+        # its last date. Page 0 spans a page either side of the current date's position
+        if page == 0:
+            return centre - PROGRESS_PAGE_SIZE, centre + PROGRESS_PAGE_SIZE
+        if page > 0:
+            return centre - (page + 1) * PROGRESS_PAGE_SIZE, centre - page * PROGRESS_PAGE_SIZE
+        return centre - page * PROGRESS_PAGE_SIZE, centre - (page - 1) * PROGRESS_PAGE_SIZE
 
     def _set_date(self, date=None):
         # Return datetime object from string or today if not date
         if date:
-            return self._string_to_date(date)
-        return datetime.today().replace(hour=0, minute=0, second=0, microsecond=0)
-
-    def _string_to_date(self, date_string):
-        # Convert a string into a datetime object
-        return datetime.strptime(date_string, "%d/%m/%Y")
-
-    def _date_to_string(self, date_object):
-        # Convert a datetime object into a string
-        return datetime.strftime(date_object, "%d/%m/%Y")
+            return string_to_date(date)
+        return today()
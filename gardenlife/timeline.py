@@ -0,0 +1,105 @@
+"""
+Contains a class to index the next due dates of tasks across all gardens,
+and functions to build the index and query it without the GUI.
+"""
+
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from heapq import merge
+
+from .dates import string_to_date, today
+
+
+class DueTimeline:
+    """
+    Class to represent a timeline of the next due dates of tasks in any number of gardens.
+
+    Entries are kept sorted by date, so the tasks due between two dates can be found
+    without evaluating every task's schedule. Gardens added to the timeline
+    keep it up to date as their tasks are added, removed, and progressed.
+    """
+
+    def __init__(self):
+        self._entries = []
+        self._due_dates = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add_garden(self, garden):
+        """Add all of a garden's tasks to the timeline and attach the timeline to the garden."""
+        garden.timeline = self
+        entries = []
+        for task in garden.tasks.values():
+            self.remove_task(garden.name, task.name)
+            ordinal = self._next_due_ordinal(task)
+            if ordinal is not None:
+                entries.append((ordinal, garden.name, task.name))
+                self._due_dates[(garden.name, task.name)] = ordinal
+        # Sorting the garden's entries once is faster than inserting them one at a time
+        self._entries = list(merge(self._entries, sorted(entries)))
+
+    def remove_garden(self, garden):
+        """Remove all of a garden's tasks from the timeline and detach the timeline from it."""
+        garden.timeline = None
+        for task_name in garden.tasks:
+            self.remove_task(garden.name, task_name)
+
+    def add_task(self, garden_name, task):
+        """
+        Add a task to the timeline or update its next due date if it's already present.
+        Archived tasks and tasks with no further due dates are left out.
+        """
+        self.remove_task(garden_name, task.name)
+        ordinal = self._next_due_ordinal(task)
+        if ordinal is not None:
+            insort(self._entries, (ordinal, garden_name, task.name))
+            self._due_dates[(garden_name, task.name)] = ordinal
+
+    def remove_task(self, garden_name, task_name):
+        """Remove a task from the timeline if it's present."""
+        ordinal = self._due_dates.pop((garden_name, task_name), None)
+        if ordinal is not None:
+            del self._entries[bisect_left(self._entries, (ordinal, garden_name, task_name))]
+
+    def _next_due_ordinal(self, task):
+        # Return the ordinal of the task's next due date if it should be in the timeline
+        next_due = task.get_next_due_date()
+        if task.status.get() == "Archived" or next_due == "No further due dates":
+            return None
+        return string_to_date(next_due).toordinal()
+
+    def due_between(self, start, end):
+        """
+        Return a list of (next due date, garden name, task name) tuples
+        for tasks with a next due date between start and end inclusive.
+        """
+        first = bisect_left(self._entries, (start.toordinal(),))
+        last = bisect_left(self._entries, (end.toordinal() + 1,))
+        return [
+            (datetime.fromordinal(ordinal), garden_name, task_name)
+            for ordinal, garden_name, task_name in self._entries[first:last]
+        ]
+
+
+def build_timeline(gardens):
+    """Return a timeline containing the tasks in every garden in the gardens dict."""
+    timeline = DueTimeline()
+    for garden in gardens.values():
+        timeline.add_garden(garden)
+    return timeline
+
+
+def due_tasks(gardens, days=7, current_date=None):
+    """
+    Return a list of (next due date, garden name, task name) tuples for tasks in
+    any garden that are overdue or due within the given number of days.
+    The timeline attached to the gardens is used, or built if there isn't one.
+    """
+    timeline = next(
+        (garden.timeline for garden in gardens.values() if garden.timeline is not None), None
+    )
+    if timeline is None:
+        timeline = build_timeline(gardens)
+    current_date = string_to_date(current_date) if current_date else today()
+    return timeline.due_between(datetime.min, current_date + timedelta(days=days))
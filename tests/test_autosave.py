@@ -0,0 +1,82 @@
+import logging
+import threading
+import time
+import pytest
+
+import context
+from gardenlife.autosave import Autosaver
+
+
+class FakeStore:
+    def __init__(self, fail=False):
+        self.saves = []
+        self.fail = fail
+        self.saved = threading.Event()
+
+    def save(self):
+        self.saves.append(threading.current_thread().name)
+        self.saved.set()
+        if self.fail:
+            raise OSError("Disk full")
+        return 10
+
+
+@pytest.fixture
+def logger():
+    return logging.getLogger("test_autosave")
+
+
+def test_burst_of_changes_saved_once(logger):
+    store = FakeStore()
+    autosaver = Autosaver(store, logger, delay=0.1)
+    for _ in range(5):
+        autosaver.changed()
+    assert store.saved.wait(2)
+    time.sleep(0.2)
+    autosaver.stop()
+    assert store.saves[0] == "autosave"
+    # The second save is the final one when stopping, which has nothing to write
+    assert len(store.saves) == 2
+
+
+def test_nothing_saved_before_delay(logger):
+    store = FakeStore()
+    autosaver = Autosaver(store, logger, delay=10)
+    autosaver.changed()
+    time.sleep(0.1)
+    assert store.saves == []
+    autosaver.stop()
+    assert store.saves == [threading.current_thread().name]
+
+
+def test_flush_saves_now(logger):
+    store = FakeStore()
+    autosaver = Autosaver(store, logger, delay=10)
+    autosaver.changed()
+    autosaver.flush()
+    assert store.saves == [threading.current_thread().name]
+    autosaver.stop()
+
+
+def test_save_logged(logger, caplog):
+    caplog.set_level(logging.INFO)
+    store = FakeStore()
+    autosaver = Autosaver(store, logger, delay=0)
+    autosaver.changed()
+    assert store.saved.wait(2)
+    autosaver.stop()
+    assert "Autosaved 10 bytes in" in caplog.text
+
+
+def test_failed_save_logged(logger, caplog):
+    store = FakeStore(fail=True)
+    autosaver = Autosaver(store, logger, delay=0)
+    autosaver.changed()
+    assert store.saved.wait(2)
+    autosaver.stop()
+    assert "Autosave failed" in caplog.text
+    assert "Disk full" in caplog.text
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,155 @@
+from datetime import datetime
+import pickle
+import pytest
+
+import context
+from gardenlife import codec
+from gardenlife.garden import Garden
+from gardenlife import organisms
+from gardenlife import task
+
+
+@pytest.fixture
+def gardens():
+    shade = Garden("Shade", "Hull", 1.5, "04/02/1987", ["Dave Davidson", "Sue Davidson"])
+    shade.timestamp = datetime(2021, 3, 4, 12, 30, 45, 123456)
+    badger = organisms.Creature(
+        "badger", org_type="mammal", notes="Digs holes.", appeared="03/07/2020", impact=5
+    )
+    badger.status.archive()
+    shade.add_item("creatures", badger)
+    shade.add_item("creatures", organisms.Creature("fox", org_type="mammal"))
+    shade.add_item(
+        "plants", organisms.Plant("leek", org_type="vegetable", edible=True, planted="1/5/2020")
+    )
+    cut_hedges = task.Task("cut hedges", assignee="Dave", length="2 hours")
+    cut_hedges.set_schedule(
+        start_date="01/05/2020", freq="Monthly", count="5", bymonth="5 10", interval=""
+    )
+    cut_hedges.linked_plants = ["leek"]
+    cut_hedges.update_completed_dates({"01/05/2020": True, "01/10/2020": True})
+    shade.add_item("tasks", cut_hedges)
+    weed = task.Task("weed")
+    weed.set_schedule("01/05/2020", "Weekly", "", "", "2", "Never")
+    shade.add_item("tasks", weed)
+    return {"Shade": shade, "Light": Garden("Light", "London", "0.2", "13/11/2017", [])}
+
+
+def check_same(loaded, gardens):
+    assert list(loaded) == list(gardens)
+    for name, garden in gardens.items():
+        loaded_garden = loaded[name]
+        for attribute in ("name", "location", "size", "since", "owners", "timestamp", "next_ids"):
+            assert getattr(loaded_garden, attribute) == getattr(garden, attribute)
+        for category in ("creatures", "plants", "tasks"):
+            items = getattr(garden, category)
+            loaded_items = getattr(loaded_garden, category)
+            assert list(loaded_items) == list(items)
+            for item_name, item in items.items():
+                check_same_item(loaded_items[item_name], item)
+
+
+def check_same_item(loaded, item):
+    assert type(loaded) is type(item)
+    assert loaded.__getstate__() == item.__getstate__()
+    assert loaded.status.get() == item.status.get()
+
+
+def test_round_trip(gardens):
+    check_same(codec.loads(codec.dumps(gardens)), gardens)
+
+
+def test_loaded_tasks_work(gardens):
+    loaded = codec.loads(codec.dumps(gardens))["Shade"].tasks
+    assert loaded["cut hedges"].get_next_due_date() == "01/05/2021"
+    assert loaded["cut hedges"].completed_dates == [datetime(2020, 5, 1), datetime(2020, 10, 1)]
+    assert loaded["weed"].schedule is gardens["Shade"].tasks["weed"].schedule
+
+
+def test_slider_levels(gardens):
+    ash = organisms.Plant("ash", org_type="tree", impact=4.0, prevalence=2.0, trend=3.0)
+    loaded = codec.decode_item(codec.encode_item(ash))
+    assert (loaded.impact, loaded.prevalence, loaded.trend) == (4, 2, 3)
+
+
+def test_strings_stored_once(gardens):
+    data = codec.dumps(gardens)
+    assert data.count(b"mammal") == 1
+    # Dates are stored as ordinals rather than strings
+    assert b"04/02/1987" not in data
+    # Pickles store each status as a string too, so they're smaller than they were
+    assert len(data) < len(pickle.dumps(gardens, pickle.HIGHEST_PROTOCOL)) * 0.55
+
+
+def test_values_keep_type():
+    light = Garden("Light", 1, 1.0, True, ["1", None])
+    loaded = codec.loads(codec.dumps({"Light": light}))["Light"]
+    assert [type(value) for value in (loaded.location, loaded.size, loaded.since)] == [
+        int,
+        float,
+        bool,
+    ]
+    assert loaded.owners == ["1", None]
+
+
+def test_pickle_migrated(gardens, tmp_path):
+    pickle_path = tmp_path / "gardens.pickle"
+    with open(pickle_path, "wb") as file:
+        pickle.dump(gardens, file)
+    check_same(codec.load(pickle_path), gardens)
+    codec.migrate_pickle(pickle_path, tmp_path / "gardens.dat")
+    with open(tmp_path / "gardens.dat", "rb") as file:
+        assert file.read(4) == codec.MAGIC
+    check_same(codec.load(tmp_path / "gardens.dat"), gardens)
+
+
+def test_pickle_without_package_read(gardens):
+    # Earlier versions imported the modules outside the package, eg as garden
+    data = pickle.dumps(gardens, 2).replace(b"cgardenlife.", b"c")
+    assert b"gardenlife." not in data
+    check_same(codec.loads(data), gardens)
+
+
+def test_version_1_read(gardens):
+    # Version 1 items didn't have IDs after their records
+    badger = gardens["Shade"].creatures["badger"]
+    data = codec.encode_item(badger)
+    version_1 = codec.ITEM_HEADER.pack(codec.ITEM_MAGIC, 1) + data[codec.ITEM_HEADER.size : -4]
+    loaded = codec.decode_item(version_1)
+    assert loaded.id is None
+    loaded.id = badger.id
+    check_same_item(loaded, badger)
+
+
+def test_version_2_read(gardens):
+    # Version 2 gardens didn't have the next IDs after their details
+    shade = gardens["Shade"]
+    assert shade.next_ids == {"creatures": 3, "plants": 2, "tasks": 3}
+    data = codec.encode_garden(shade)[codec.GARDEN_HEADER.size : -12]
+    version_2 = codec.GARDEN_HEADER.pack(codec.GARDEN_MAGIC, 2) + data
+    loaded = codec.decode_garden(version_2)
+    assert loaded.next_ids == {}
+    assert (loaded.name, loaded.owners) == (shade.name, shade.owners)
+
+
+def test_unsupported_version(gardens):
+    data = codec.HEADER.pack(codec.MAGIC, codec.FORMAT_VERSION + 1)
+    with pytest.raises(ValueError, match="not supported"):
+        codec.loads(data)
+
+
+def test_items(gardens):
+    for category in ("creatures", "plants", "tasks"):
+        for item in getattr(gardens["Shade"], category).values():
+            check_same_item(codec.decode_item(codec.encode_item(item)), item)
+            check_same_item(codec.decode_item(pickle.dumps(item)), item)
+
+
+def test_unsupported_value():
+    light = Garden("Light", {"London"}, 1, "13/11/2017", [])
+    with pytest.raises(TypeError):
+        codec.dumps({"Light": light})
+
+
+if __name__ == "__main__":
+    pytest.main()
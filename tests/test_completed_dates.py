@@ -0,0 +1,55 @@
+from datetime import datetime
+import pickle
+import pytest
+
+import context
+from gardenlife.completed_dates import CompletedDates
+
+
+@pytest.fixture
+def completed():
+    return CompletedDates([datetime(2020, 10, 1), datetime(2020, 5, 1)])
+
+
+def test_sorted(completed):
+    assert completed == [datetime(2020, 5, 1), datetime(2020, 10, 1)]
+
+
+def test_last(completed):
+    assert completed[-1] == datetime(2020, 10, 1)
+
+
+def test_contains(completed):
+    assert datetime(2020, 5, 1) in completed
+    assert datetime(2020, 6, 1) not in completed
+
+
+def test_add(completed):
+    completed.add(datetime(2020, 6, 1))
+    completed.add(datetime(2020, 6, 1))
+    assert completed == [datetime(2020, 5, 1), datetime(2020, 6, 1), datetime(2020, 10, 1)]
+
+
+def test_remove(completed):
+    completed.remove(datetime(2020, 5, 1))
+    completed.remove(datetime(2020, 6, 1))
+    assert completed == [datetime(2020, 10, 1)]
+
+
+def test_update(completed):
+    completed.update(
+        added=[datetime(2021, 5, 1), datetime(2020, 1, 1), datetime(2020, 5, 1)],
+        removed=[datetime(2020, 10, 1), datetime(2022, 1, 1)],
+    )
+    assert completed == [datetime(2020, 1, 1), datetime(2020, 5, 1), datetime(2021, 5, 1)]
+    assert datetime(2020, 10, 1) not in completed
+
+
+def test_pickle(completed):
+    unpickled = pickle.loads(pickle.dumps(completed))
+    assert unpickled == completed
+    assert datetime(2020, 5, 1) in unpickled
+
+
+if __name__ == "__main__":
+    pytest.main()
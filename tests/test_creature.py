@@ -1,7 +1,9 @@
+import pickle
 import pytest
 
 import context
-import organisms
+from gardenlife import organisms
+from gardenlife.status import Status
 
 
 @pytest.fixture
@@ -47,5 +49,44 @@ def test_unarchived(badger):
     assert badger.status.status == "Current"
 
 
+def test_no_instance_dict(badger):
+    with pytest.raises(AttributeError):
+        badger.colour = "black and white"
+
+
+def test_status_strings_shared(badger):
+    fox = organisms.Creature("fox", "mammal")
+    badger.status.archive()
+    fox.status.archive()
+    assert badger._status is fox._status
+
+
+def test_pickle_round_trip(badger):
+    badger.status.archive()
+    unpickled = pickle.loads(pickle.dumps(badger))
+    assert unpickled == badger
+    assert unpickled.__getstate__() == badger.__getstate__()
+
+
+class EarlierVersion:
+    # Pickles as an instance of the class with a __dict__, as earlier versions did
+    def __init__(self, cls, state):
+        self.cls = cls
+        self.state = state
+
+    def __reduce_ex__(self, protocol):
+        return object.__new__, (self.cls,), self.state
+
+
+def test_unpickle_earlier_version():
+    status = EarlierVersion(Status, {"_status": "Archived"})
+    state = {"name": "mole", "org_type": "mammal", "notes": None, "age": None}
+    state.update(_impact=2, _prevalence=3, _trend=4, status=status, appeared="01/01/2021")
+    mole = pickle.loads(pickle.dumps(EarlierVersion(organisms.Creature, state)))
+    assert mole.status.get() == "Archived"
+    assert mole.get_level("impact") == "Negative"
+    assert mole.appeared == "01/01/2021"
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,202 @@
+from datetime import datetime
+import pickle
+import pytest
+import sqlite3
+
+import context
+from gardenlife.codec import encode_item
+from gardenlife.database import Database, GardenTable, ItemTable
+from gardenlife.garden import Garden
+from gardenlife import organisms
+from gardenlife import task
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = Database(str(tmp_path / "gardens.db"))
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def shade(database):
+    shade = Garden("Shade", "Hull", 1, "04/02/1987", ["Dave Davidson"])
+    database.put_garden(shade)
+    shade.add_item("creatures", organisms.Creature("badger", org_type="mammal"))
+    shade.add_item("creatures", organisms.Creature("fox", org_type="mammal"))
+    shade.add_item("plants", organisms.Plant("leek", org_type="vegetable", edible=True))
+    cut_hedges = task.Task("cut hedges")
+    cut_hedges.set_schedule(
+        start_date="01/05/2020", freq="Monthly", count="5", bymonth="5 10", interval=""
+    )
+    shade.add_item("tasks", cut_hedges)
+    database.save()
+    return shade
+
+
+def reload(database):
+    return Database(database.path).load()
+
+
+def test_only_manifest_loaded(shade, database):
+    light = Garden("Light", "London", 0.2, "13/11/2017", ["Paul Daniels"])
+    database.put_garden(light)
+    database.save()
+    statements = []
+    loaded_database = Database(database.path)
+    loaded_database.connection.set_trace_callback(statements.append)
+    gardens = loaded_database.load()
+    assert isinstance(gardens, GardenTable)
+    assert sorted(gardens) == ["Light", "Shade"]
+    assert "Shade" in gardens
+    assert gardens._gardens == {}
+    assert gardens.latest().name == "Light"
+    assert list(gardens._gardens) == ["Light"]
+    assert sum("WHERE name" in statement for statement in statements) == 1
+
+
+def test_latest_garden_includes_changes(shade, database):
+    light = Garden("Light", "London", 0.2, "13/11/2017", ["Paul Daniels"])
+    database.put_garden(light)
+    database.save()
+    gardens = reload(database)
+    gardens["Shade"].add_item("creatures", organisms.Creature("mole", org_type="mammal"))
+    assert gardens.latest().name == "Shade"
+
+
+def test_garden_table_changes(shade, database):
+    gardens = reload(database)
+    light = Garden("Light", "London", 0.2, "13/11/2017", ["Paul Daniels"])
+    gardens["Light"] = light
+    assert gardens["Light"] is light
+    del gardens["Shade"]
+    assert list(gardens) == ["Light"]
+    with pytest.raises(KeyError):
+        gardens["Shade"]
+
+
+def test_items_loaded_when_used(shade, database):
+    loaded = reload(database)["Shade"]
+    assert isinstance(loaded.creatures, ItemTable)
+    assert len(loaded.creatures) == 2
+    assert loaded.creatures._items is None
+    assert sorted(loaded.creatures) == ["badger", "fox"]
+    assert loaded.creatures["badger"].org_type == "mammal"
+    assert loaded.tasks["cut hedges"].get_next_due_date() == "01/05/2020"
+
+
+def test_item_changes_saved(shade, database):
+    loaded_database = Database(database.path)
+    loaded = loaded_database.load()["Shade"]
+    loaded.remove_item("creatures", "badger")
+    loaded.add_item("creatures", organisms.Creature("mole", org_type="mammal"))
+    loaded.update_task_progress("cut hedges", {"01/05/2020": True})
+    loaded_database.save()
+    reloaded = reload(database)["Shade"]
+    assert sorted(reloaded.creatures) == ["fox", "mole"]
+    assert reloaded.tasks["cut hedges"].completed_dates == [datetime(2020, 5, 1)]
+
+
+def test_removed_organism_unlinked_saved(shade, database):
+    shade.add_item("tasks", task.Task("weed", linked_plants=["leek"]))
+    shade.remove_item("plants", "leek")
+    database.save()
+    assert reload(database)["Shade"].tasks["weed"].linked_plants == []
+
+
+def test_save_only_writes_changes(shade, database):
+    shade.add_item("creatures", organisms.Creature("mole", org_type="mammal"))
+    statements = []
+    database.connection.set_trace_callback(statements.append)
+    database.save()
+    assert sum("INSERT INTO items" in statement for statement in statements) == 1
+
+
+def test_save_returns_size(shade, database):
+    mole = organisms.Creature("mole", org_type="mammal")
+    shade.add_item("creatures", mole)
+    assert database.save() > len(encode_item(mole))
+    assert database.save() == 0
+
+
+def test_changes_recorded_during_save_kept(shade, database):
+    def record_change(statement):
+        if "INSERT INTO items" in statement and "mole" not in shade.creatures:
+            shade.add_item("creatures", organisms.Creature("mole", org_type="mammal"))
+
+    shade.add_item("creatures", organisms.Creature("vole", org_type="mammal"))
+    database.connection.set_trace_callback(record_change)
+    database.save()
+    database.connection.set_trace_callback(None)
+    assert sorted(reload(database)["Shade"].creatures) == ["badger", "fox", "vole"]
+    database.save()
+    assert sorted(reload(database)["Shade"].creatures) == ["badger", "fox", "mole", "vole"]
+
+
+def test_remove_garden(shade, database):
+    database.remove_garden(shade)
+    database.save()
+    assert reload(database) == {}
+    assert database.connection.execute("SELECT COUNT(*) FROM items").fetchone() == (0,)
+
+
+def test_database_without_next_ids_loaded(tmp_path):
+    # Databases created by earlier versions don't have the next_ids column
+    path = str(tmp_path / "gardens.db")
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE gardens (name TEXT PRIMARY KEY, location TEXT, size TEXT, since TEXT, "
+        "owners TEXT, timestamp TEXT)"
+    )
+    connection.execute(
+        "INSERT INTO gardens VALUES ('Shade', 'Hull', '1', '04/02/1987', '[]', ?)",
+        (datetime(2021, 3, 4).isoformat(),),
+    )
+    connection.commit()
+    connection.close()
+    database = Database(path)
+    assert database.load()["Shade"].next_ids == {}
+    database.close()
+
+
+def test_find_items(shade, database):
+    shade.creatures["fox"].status.archive()
+    shade.add_item("creatures", shade.creatures["fox"])
+    database.save()
+    found = database.find_items("creatures", org_type="mammal", status="Current")
+    assert found == [("Shade", organisms.Creature("badger", org_type="mammal"))]
+
+
+def test_tasks_due_before(shade, database):
+    assert database.tasks_due_before(datetime(2020, 5, 1)) == [
+        (datetime(2020, 5, 1), "Shade", "cut hedges")
+    ]
+    assert database.tasks_due_before(datetime(2020, 4, 30)) == []
+
+
+def test_indexes_used(database):
+    plan = database.connection.execute(
+        "EXPLAIN QUERY PLAN SELECT name FROM items WHERE next_due <= 0"
+    ).fetchall()
+    assert "items_next_due" in str(plan)
+
+
+def test_pickled_items_loaded(shade, database):
+    mole = organisms.Creature("mole", org_type="mammal")
+    with database.connection:
+        database.connection.execute(
+            "INSERT INTO items (garden, category, name, status, data) VALUES (?, ?, ?, ?, ?)",
+            ("Shade", "creatures", "mole", "Current", pickle.dumps(mole)),
+        )
+    assert reload(database)["Shade"].creatures["mole"] == mole
+
+
+def test_loaded_garden_pickled_with_items(shade, database):
+    loaded = reload(database)["Shade"]
+    unpickled = pickle.loads(pickle.dumps(loaded))
+    assert isinstance(unpickled.creatures, dict)
+    assert sorted(unpickled.creatures) == ["badger", "fox"]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,61 @@
+from datetime import datetime
+import pytest
+
+import context
+from gardenlife import dates
+
+
+@pytest.mark.parametrize(
+    "date_string, expected",
+    [
+        ("01/05/2020", datetime(2020, 5, 1)),
+        ("1/5/2020", datetime(2020, 5, 1)),
+        ("29/02/2020", datetime(2020, 2, 29)),
+        ("31/12/1999", datetime(1999, 12, 31)),
+    ],
+)
+def test_string_to_date(date_string, expected):
+    assert dates.string_to_date(date_string) == expected
+
+
+@pytest.mark.parametrize(
+    "date_string",
+    [
+        "",
+        "01/05",
+        "01/05/20",
+        "01/05/02020",
+        "01-05-2020",
+        "aa/05/2020",
+        "29/02/2021",
+        "32/01/2020",
+    ],
+)
+def test_string_to_date_invalid(date_string):
+    with pytest.raises(ValueError):
+        dates.string_to_date(date_string)
+
+
+def test_string_to_date_matches_strptime():
+    for day in range(1, 32):
+        for month in range(1, 13):
+            date_string = f"{day:02d}/{month}/2024"
+            try:
+                expected = datetime.strptime(date_string, "%d/%m/%Y")
+            except ValueError:
+                with pytest.raises(ValueError):
+                    dates.string_to_date(date_string)
+            else:
+                assert dates.string_to_date(date_string) == expected
+
+
+def test_date_to_string():
+    assert dates.date_to_string(datetime(2020, 5, 1)) == "01/05/2020"
+
+
+def test_today():
+    assert dates.today() == datetime.today().replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+if __name__ == "__main__":
+    pytest.main()
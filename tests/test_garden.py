@@ -1,9 +1,12 @@
+import pickle
 import pytest
+from types import SimpleNamespace
 
 import context
-import garden
-import organisms
-import task
+from gardenlife import garden
+from gardenlife import organisms
+from gardenlife import task
+from gardenlife import timeline
 
 
 @pytest.fixture
@@ -100,6 +103,74 @@ def test_add_item_task(shade):
     assert shade.tasks["cut hedges"] == cut_hedges
 
 
+def test_update_task_progress(shade):
+    cut_hedges = task.Task("cut hedges")
+    cut_hedges.set_schedule("01/05/2020", "Monthly", "2", "", "")
+    shade.add_item("tasks", cut_hedges)
+    shade.update_task_progress("cut hedges", {"01/05/2020": True})
+    assert cut_hedges.get_next_due_date() == "01/06/2020"
+
+
+def test_update_task_progress_valueerror(shade):
+    with pytest.raises(ValueError) as excinfo:
+        shade.update_task_progress("prune tree", {})
+    assert str(excinfo.value) == 'The task "prune tree" was not found in this garden.'
+
+
+def test_changes_passed_to_listeners(shade, badger):
+    changes = []
+    shade.listeners.append(lambda garden, *change: changes.append(change))
+    cut_hedges = task.Task("cut hedges", linked_creatures=["badger"])
+    cut_hedges.set_schedule("01/05/2020", "Monthly", "2", "", "")
+    shade.add_item("creatures", badger)
+    shade.add_item("tasks", cut_hedges)
+    shade.add_item("creatures", badger)
+    shade.update_task_progress("cut hedges", {"01/05/2020": True})
+    shade.remove_item("creatures", "badger")
+    assert changes == [
+        ("Added", "creatures", "badger"),
+        ("Added", "tasks", "cut hedges"),
+        ("Updated", "creatures", "badger"),
+        ("Progress changed", "tasks", "cut hedges"),
+        ("Removed", "creatures", "badger"),
+        # The removed creature is unlinked from the task
+        ("Updated", "tasks", "cut hedges"),
+    ]
+
+
+def test_rename_is_one_change(shade, badger):
+    records, changes = [], []
+    shade.store = SimpleNamespace(record=lambda garden, *record: records.append(record))
+    shade.listeners.append(lambda garden, *change: changes.append(change))
+    shade.add_item("creatures", badger)
+    shade.rename_item("creatures", "badger", "brock")
+    assert records[-1] == ("rename_item", "creatures", "badger", "brock")
+    assert len(records) == 2
+    assert changes[-1] == ("Updated", "creatures", "brock")
+    assert len(changes) == 2
+
+
+def test_dirty_sets(shade, badger):
+    shade.add_item("creatures", badger)
+    shade.add_item("plants", organisms.Plant("leek", "vegetable"))
+    assert shade.clean() == {"creatures": {"badger"}, "plants": {"leek"}, "tasks": set()}
+    shade.rename_item("creatures", "badger", "brock")
+    assert shade.dirty == {"creatures": {"badger", "brock"}, "plants": set(), "tasks": set()}
+
+
+def test_listeners_and_dirty_sets_not_pickled(shade, badger):
+    shade.listeners.append(print)
+    shade.add_item("creatures", badger)
+    unpickled = pickle.loads(pickle.dumps(shade))
+    assert unpickled.listeners == []
+    assert unpickled.dirty == {"creatures": set(), "plants": set(), "tasks": set()}
+
+
+def test_timeline_not_pickled(shade):
+    timeline.build_timeline({"Shade": shade})
+    assert pickle.loads(pickle.dumps(shade)).timeline is None
+
+
 def test_str_representation(shade):
     assert (
         str(shade)
@@ -1,5 +1,40 @@
+from pathlib import Path
+import subprocess
+import sys
+
 from gardenlife import __version__
 
 
 def test_version():
     assert __version__ == '0.1.0'
+
+
+def test_core_imported_when_used():
+    import gardenlife
+    from gardenlife.garden import Garden
+
+    assert gardenlife.Garden is Garden
+
+
+def test_modules_not_importable_outside_package():
+    # The package's modules would otherwise hide others with the same name, eg schedule
+    import gardenlife
+
+    assert str(Path(gardenlife.__file__).parent) not in sys.path
+
+
+def test_core_imported_without_gui():
+    # Run in a new interpreter, as the tests may already have imported these modules
+    code = (
+        "import sys, gardenlife\n"
+        "for name in gardenlife.CORE: getattr(gardenlife, name)\n"
+        "print(*[name for name in ('PySimpleGUI', 'tkinter', 'numpy') if name in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
@@ -0,0 +1,41 @@
+import gc
+import pytest
+
+import context
+from gardenlife.gc_pause import paused_gc
+
+
+@pytest.fixture
+def gc_enabled():
+    enabled = gc.isenabled()
+    gc.enable()
+    yield
+    if not enabled:
+        gc.disable()
+
+
+def test_paused_gc(gc_enabled):
+    with paused_gc():
+        assert not gc.isenabled()
+    assert gc.isenabled()
+
+
+def test_paused_gc_enabled_after_error(gc_enabled):
+    with pytest.raises(ValueError):
+        with paused_gc():
+            raise ValueError
+    assert gc.isenabled()
+
+
+def test_paused_gc_stays_disabled(gc_enabled):
+    gc.disable()
+    try:
+        with paused_gc():
+            pass
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,108 @@
+from itertools import islice
+import pytest
+
+from dateutil.rrule import rrulestr
+
+import context
+from gardenlife.garden import Garden
+from gardenlife.task import Task
+from gardenlife import ical
+
+
+SCHEDULES = [
+    ("01/05/2020", "Monthly", "5", "5 10", ""),
+    ("03/05/2020", "Daily", "200", "", "3"),
+    ("04/05/2020", "Weekly", "20", "6 7", "2"),
+    ("29/02/2020", "Yearly", "", "", "", "01/01/2040"),
+    ("30/01/2020", "Monthly", "4", "2 3", "", "01/01/2030"),
+    ("10/05/2020", "Weekly", "", "", "", "Never"),
+]
+
+
+@pytest.fixture
+def gardens():
+    shade = Garden("Shade", "Hull", 1, "04/02/1987", ["Dave Davidson"])
+    for number, schedule in enumerate(SCHEDULES):
+        task = Task(f"task {number}", description="Water, then feed;\nrepeat")
+        task.set_schedule(*schedule)
+        shade.add_item("tasks", task)
+    return {"Shade": shade}
+
+
+def events(lines):
+    # Unfold the lines and group them into a dict of properties for each event
+    unfolded = []
+    for line in lines:
+        if line.startswith(" "):
+            unfolded[-1] += line[1:]
+        else:
+            unfolded.append(line)
+    event = None
+    for line in unfolded:
+        if line == "BEGIN:VEVENT":
+            event = {}
+        elif line == "END:VEVENT":
+            yield event
+        elif event is not None:
+            name, value = line.split(":", 1)
+            event[name] = value
+
+
+def test_rrule_matches_schedule(gardens):
+    tasks = list(gardens["Shade"].tasks.values())
+    for task, event in zip(tasks, events(ical.calendar_lines(gardens))):
+        rule = f"DTSTART;VALUE=DATE:{event['DTSTART;VALUE=DATE']}"
+        if "RRULE" in event:
+            rule += f"\nRRULE:{event['RRULE']}"
+        assert list(islice(rrulestr(rule), 300)) == task.schedule[:300]
+
+
+def test_event_properties(gardens):
+    event = next(events(ical.calendar_lines(gardens)))
+    assert event["SUMMARY"] == "task 0"
+    assert event["LOCATION"] == "Shade"
+    assert event["DESCRIPTION"] == "Water\\, then feed\\;\\nrepeat"
+    assert event["RRULE"] == "FREQ=MONTHLY;COUNT=5;BYMONTH=5,10"
+
+
+def test_count_and_until_not_combined(gardens):
+    rules = [event["RRULE"] for event in events(ical.calendar_lines(gardens))]
+    assert rules[3] == "FREQ=YEARLY;UNTIL=20400101"
+    assert rules[4] == "FREQ=MONTHLY;COUNT=4;BYMONTH=2,3"
+    assert rules[5] == "FREQ=WEEKLY"
+
+
+def test_single_date_has_no_rrule(gardens):
+    task = Task("prune tree")
+    task.set_schedule("01/11/2020", "Yearly", "", "", "")
+    gardens["Shade"].add_item("tasks", task)
+    event = list(events(ical.calendar_lines(gardens)))[-1]
+    assert event["DTSTART;VALUE=DATE"] == "20201101"
+    assert "RRULE" not in event
+
+
+def test_archived_tasks_left_out(gardens):
+    gardens["Shade"].tasks["task 0"].status.archive()
+    summaries = [event["SUMMARY"] for event in events(ical.calendar_lines(gardens))]
+    assert "task 0" not in summaries
+    assert len(summaries) == len(SCHEDULES) - 1
+
+
+def test_long_lines_folded(gardens):
+    gardens["Shade"].tasks["task 0"].description = "ü" * 100
+    lines = list(ical.calendar_lines(gardens))
+    assert all(len(line.encode("utf-8")) <= ical.LINE_LENGTH for line in lines)
+    assert next(events(lines))["DESCRIPTION"] == "ü" * 100
+
+
+def test_export_calendar(gardens, tmp_path):
+    path = tmp_path / "gardens.ics"
+    ical.export_calendar(gardens, path)
+    content = path.read_bytes()
+    assert content.startswith(b"BEGIN:VCALENDAR\r\n")
+    assert content.endswith(b"END:VCALENDAR\r\n")
+    assert content.count(b"BEGIN:VEVENT\r\n") == len(SCHEDULES)
+
+
+if __name__ == "__main__":
+    pytest.main()
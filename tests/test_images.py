@@ -0,0 +1,20 @@
+import pytest
+
+import context
+from gardenlife import images
+
+
+def test_icon_is_base64_png():
+    assert images.icon().startswith(b"iVBORw0KGgo")
+
+
+def test_logo_is_base64_png():
+    assert images.logo().startswith(b"iVBORw0KGgo")
+
+
+def test_images_are_read_once():
+    assert images.icon() is images.icon()
+
+
+if __name__ == "__main__":
+    pytest.main()
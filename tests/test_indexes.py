@@ -0,0 +1,210 @@
+import pickle
+import pytest
+
+import context
+from gardenlife.garden import Garden
+from gardenlife.indexes import GardenIndex
+from gardenlife.organisms import Creature, Plant
+from gardenlife.task import Task
+
+
+@pytest.fixture
+def shade():
+    garden = Garden("Shade", "Hull", 1, "04/02/1987", ["Dave Davidson"])
+    garden.add_item("creatures", Creature("badger", "mammal"))
+    garden.add_item("creatures", Creature("fox", "mammal"))
+    garden.add_item("creatures", Creature("ant", "insect"))
+    garden.add_item("plants", Plant("leek", "vegetable", edible=True))
+    garden.add_item("plants", Plant("ash", "tree"))
+    garden.add_item("tasks", Task("weed", assignee="Bob", linked_plants=["leek"]))
+    garden.add_item(
+        "tasks",
+        Task("prune", assignee="Jill", linked_creatures=["badger"], linked_plants=["ash", "leek"]),
+    )
+    return garden
+
+
+def names(items):
+    return sorted(item.name for item in items)
+
+
+def test_find_items(shade):
+    assert names(shade.find_items("creatures", org_type="mammal")) == ["badger", "fox"]
+    assert names(shade.find_items("plants", edible=True)) == ["leek"]
+    assert names(shade.find_items("tasks", assignee="Jill")) == ["prune"]
+
+
+def test_find_items_several_fields(shade):
+    assert names(shade.find_items("plants", org_type="tree", edible=True)) == []
+    assert names(shade.find_items("plants", org_type="tree", edible=False)) == ["ash"]
+
+
+def test_find_items_no_fields(shade):
+    assert names(shade.find_items("creatures")) == ["ant", "badger", "fox"]
+
+
+def test_field_values(shade):
+    assert shade.field_values("creatures", "org_type") == {"mammal", "insect"}
+
+
+def test_add_item_updates_index(shade):
+    shade.field_values("creatures", "org_type")
+    shade.add_item("creatures", Creature("frog", "amphibian"))
+    assert shade.field_values("creatures", "org_type") == {"mammal", "insect", "amphibian"}
+
+
+def test_replaced_item_updates_index(shade):
+    shade.field_values("creatures", "org_type")
+    archived = Creature("fox", "mammal")
+    archived.status.archive()
+    shade.add_item("creatures", archived)
+    assert names(shade.find_items("creatures", status="Archived")) == ["fox"]
+    assert names(shade.find_items("creatures", status="Current")) == ["ant", "badger"]
+
+
+def test_remove_item_updates_index(shade):
+    shade.field_values("creatures", "org_type")
+    shade.remove_item("creatures", "ant")
+    assert shade.field_values("creatures", "org_type") == {"mammal"}
+
+
+def test_categories_indexed_when_first_used(shade):
+    shade.find_items("creatures")
+    assert "creatures" not in shade._index
+    shade.find_items("plants", edible=True)
+    assert "plants" in shade._index
+    assert "creatures" not in shade._index
+
+
+def test_field_not_indexed(shade):
+    with pytest.raises(ValueError) as excinfo:
+        shade.find_items("creatures", notes="")
+    assert str(excinfo.value) == "notes is not an indexed field of creatures"
+
+
+def test_items_given_ids(shade):
+    ids = [shade.item_id("creatures", name) for name in ("badger", "fox", "ant")]
+    assert ids == [1, 2, 3]
+    assert shade.item_by_id("creatures", 2).name == "fox"
+    assert shade.item_id("plants", "leek") == 1
+
+
+def test_edited_item_keeps_id(shade):
+    fox_id = shade.item_id("creatures", "fox")
+    shade.add_item("creatures", Creature("fox", "canine"))
+    assert shade.item_id("creatures", "fox") == fox_id
+    assert shade.item_by_id("creatures", fox_id).org_type == "canine"
+
+
+def test_renamed_item_keeps_id(shade):
+    fox_id = shade.item_id("creatures", "fox")
+    shade.rename_item("creatures", "fox", "red fox")
+    assert shade.item_id("creatures", "red fox") == fox_id
+    assert shade.item_by_id("creatures", fox_id).name == "red fox"
+
+
+def test_removed_item_id_not_given_again(shade):
+    ant_id = shade.item_id("creatures", "ant")
+    shade.remove_item("creatures", "ant")
+    shade.add_item("creatures", Creature("frog", "amphibian"))
+    assert shade.item_id("creatures", "frog") != ant_id
+    with pytest.raises(ValueError) as excinfo:
+        shade.item_by_id("creatures", ant_id)
+    assert str(excinfo.value) == f"The creature with ID {ant_id} was not found in this garden."
+
+
+def test_item_from_another_garden_given_unused_id(shade):
+    light = Garden("Light", "London", 1, "13/11/2017", [])
+    light.add_item("creatures", Creature("frog", "amphibian"))
+    frog = light.creatures["frog"]
+    shade.add_item("creatures", frog)
+    assert frog.id == 4
+    assert shade.item_by_id("creatures", 1).name == "badger"
+
+
+def test_items_without_ids_given_ids(shade):
+    # Items saved by earlier versions don't have IDs
+    unpickled = pickle.loads(pickle.dumps(shade))
+    unpickled.next_ids = {}
+    for creature in unpickled.creatures.values():
+        creature.id = None
+    ids = {unpickled.item_id("creatures", name) for name in unpickled.creatures}
+    assert ids == {1, 2, 3}
+
+
+def test_index_not_pickled(shade):
+    shade.field_values("creatures", "org_type")
+    unpickled = pickle.loads(pickle.dumps(shade))
+    assert unpickled._index is None
+    assert names(unpickled.find_items("creatures", org_type="insect")) == ["ant"]
+
+
+def test_remove_item_not_indexed():
+    index = GardenIndex()
+    index.remove_item("creatures", "badger")
+    assert "creatures" not in index
+
+
+# Links
+
+
+def test_linked_tasks(shade):
+    assert names(shade.linked_tasks("plants", "leek")) == ["prune", "weed"]
+    assert names(shade.linked_tasks("creatures", "badger")) == ["prune"]
+    assert shade.linked_tasks("creatures", "fox") == []
+
+
+def test_linked_tasks_not_organisms(shade):
+    with pytest.raises(ValueError) as excinfo:
+        shade.linked_tasks("tasks", "weed")
+    assert str(excinfo.value) == "tasks can't be linked to tasks"
+
+
+def test_added_task_updates_links(shade):
+    shade.linked_tasks("plants", "leek")
+    shade.add_item("tasks", Task("weed", linked_plants=["ash"]))
+    assert names(shade.linked_tasks("plants", "leek")) == ["prune"]
+    assert names(shade.linked_tasks("plants", "ash")) == ["prune", "weed"]
+
+
+def test_removed_task_updates_links(shade):
+    shade.linked_tasks("plants", "leek")
+    shade.remove_item("tasks", "prune")
+    assert names(shade.linked_tasks("plants", "leek")) == ["weed"]
+    assert shade.linked_tasks("creatures", "badger") == []
+
+
+def test_removed_organism_unlinked(shade):
+    shade.remove_item("plants", "leek")
+    assert shade.tasks["weed"].linked_plants == []
+    assert shade.tasks["prune"].linked_plants == ["ash"]
+    assert shade.linked_tasks("plants", "leek") == []
+
+
+def test_renamed_organism_relinked(shade):
+    shade.rename_item("plants", "leek", "onion")
+    assert "onion" in shade.plants and "leek" not in shade.plants
+    assert shade.plants["onion"].name == "onion"
+    assert shade.tasks["prune"].linked_plants == ["ash", "onion"]
+    assert names(shade.linked_tasks("plants", "onion")) == ["prune", "weed"]
+    assert names(shade.find_items("plants", edible=True)) == ["onion"]
+
+
+def test_renamed_task_keeps_links(shade):
+    shade.rename_item("tasks", "weed", "hoe")
+    assert names(shade.linked_tasks("plants", "leek")) == ["hoe", "prune"]
+
+
+def test_rename_to_existing_name(shade):
+    with pytest.raises(ValueError) as excinfo:
+        shade.rename_item("plants", "leek", "ash")
+    assert str(excinfo.value) == 'The plant "ash" already exists in this garden.'
+
+
+def test_broken_links(shade):
+    shade.tasks["weed"].linked_creatures = ["mole"]
+    assert shade.broken_links() == [("weed", "creatures", "mole")]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,166 @@
+from datetime import datetime
+import os
+import pickle
+import pytest
+
+import context
+from gardenlife.garden import Garden
+from gardenlife.journal import Journal
+from gardenlife import organisms
+from gardenlife import task
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return Journal(
+        snapshot_path=str(tmp_path / "gardens.pickle"),
+        journal_path=str(tmp_path / "gardens.journal"),
+    )
+
+
+@pytest.fixture
+def gardens(journal):
+    gardens = journal.load()
+    shade = Garden("Shade", "Hull", 1, "04/02/1987", ["Dave Davidson"])
+    gardens["Shade"] = shade
+    journal.put_garden(shade)
+    return gardens
+
+
+@pytest.fixture
+def badger():
+    return organisms.Creature("badger", org_type="mammal", appeared="03/07/2020")
+
+
+@pytest.fixture
+def cut_hedges():
+    cut_hedges = task.Task("cut hedges")
+    cut_hedges.set_schedule(
+        start_date="01/05/2020", freq="Monthly", count="5", bymonth="5 10", interval=""
+    )
+    return cut_hedges
+
+
+def reload(journal):
+    reloaded = Journal(journal.snapshot_path, journal.journal_path)
+    gardens = reloaded.load()
+    reloaded.wait()
+    return gardens
+
+
+def test_changes_replayed(journal, gardens, badger, cut_hedges):
+    shade = gardens["Shade"]
+    shade.add_item("creatures", badger)
+    shade.add_item("tasks", cut_hedges)
+    shade.update_task_progress("cut hedges", {"01/05/2020": True, "01/10/2020": True})
+    shade.update_task_progress("cut hedges", {"01/10/2020": False})
+    journal.save()
+    loaded = reload(journal)["Shade"]
+    assert loaded.owners == ["Dave Davidson"]
+    assert list(loaded.creatures) == ["badger"]
+    assert loaded.tasks["cut hedges"].completed_dates == [datetime(2020, 5, 1)]
+    assert loaded.timestamp == shade.timestamp
+
+
+def test_complete_task_until_replayed_with_date(journal, gardens, cut_hedges):
+    gardens["Shade"].add_item("tasks", cut_hedges)
+    gardens["Shade"].complete_task_until("cut hedges")
+    journal.save()
+    loaded = reload(journal)["Shade"]
+    assert loaded.tasks["cut hedges"].completed_dates == list(cut_hedges.schedule)
+
+
+def test_removals_replayed(journal, gardens, badger):
+    gardens["Shade"].add_item("creatures", badger)
+    gardens["Shade"].remove_item("creatures", "badger")
+    light = Garden("Light", "London", 0.2, "13/11/2017", ["Paul Daniels"])
+    journal.put_garden(light)
+    journal.remove_garden(light)
+    journal.save()
+    loaded = reload(journal)
+    assert list(loaded) == ["Shade"]
+    assert loaded["Shade"].creatures == {}
+
+
+def test_renames_replayed(journal, gardens, badger, cut_hedges):
+    cut_hedges.linked_creatures = ["badger"]
+    gardens["Shade"].add_item("creatures", badger)
+    gardens["Shade"].add_item("tasks", cut_hedges)
+    gardens["Shade"].rename_item("creatures", "badger", "brock")
+    journal.save()
+    loaded = reload(journal)["Shade"]
+    assert list(loaded.creatures) == ["brock"]
+    assert loaded.tasks["cut hedges"].linked_creatures == ["brock"]
+
+
+def test_save_appends_only_changes(journal, gardens, badger):
+    journal.save()
+    size = os.path.getsize(journal.journal_path)
+    gardens["Shade"].add_item("creatures", badger)
+    appended = journal.save()
+    record = pickle.dumps(
+        ("add_item", "Shade", gardens["Shade"].timestamp, "creatures", badger),
+        pickle.HIGHEST_PROTOCOL,
+    )
+    assert appended == len(record)
+    assert os.path.getsize(journal.journal_path) == size + len(record)
+
+
+def test_partly_written_record_dropped(journal, gardens, badger):
+    journal.save()
+    size = os.path.getsize(journal.journal_path)
+    with open(journal.journal_path, "ab") as file:
+        file.write(pickle.dumps(("add_item", "Shade"))[:-3])
+    assert list(reload(journal)) == ["Shade"]
+    assert os.path.getsize(journal.journal_path) == size
+
+
+def test_legacy_snapshot_loaded(journal):
+    shade = Garden("Shade", "Hull", 1, "04/02/1987", ["Dave Davidson"])
+    with open(journal.snapshot_path, "wb") as file:
+        pickle.dump({"Shade": shade}, file)
+    assert list(journal.load()) == ["Shade"]
+
+
+def test_compaction(journal, gardens, badger, cut_hedges):
+    journal.compact_size = 0
+    gardens["Shade"].add_item("creatures", badger)
+    journal.save()
+    journal.wait()
+    gardens["Shade"].add_item("tasks", cut_hedges)
+    journal.save()
+    journal.wait()
+    assert not os.path.exists(journal.sealed_path)
+    assert not os.path.exists(journal.journal_path)
+    with open(journal.snapshot_path, "rb") as file:
+        snapshot = pickle.load(file)
+    assert list(snapshot["Shade"].creatures) == ["badger"]
+    assert list(snapshot["Shade"].tasks) == ["cut hedges"]
+
+
+def test_interrupted_compaction_replayed(journal, gardens, badger, cut_hedges):
+    shade = gardens["Shade"]
+    shade.add_item("creatures", badger)
+    shade.add_item("tasks", cut_hedges)
+    shade.update_task_progress("cut hedges", {"01/05/2020": True})
+    shade.remove_item("tasks", "cut hedges")
+    shade.add_item("tasks", cut_hedges)
+    journal.save()
+    with open(journal.journal_path, "rb") as file:
+        records = file.read()
+    journal.compact()
+    journal.wait()
+    # Leave the sealed journal behind as if the application exited before removing it
+    with open(journal.sealed_path, "wb") as file:
+        file.write(records)
+    loaded = reload(journal)["Shade"]
+    assert list(loaded.creatures) == ["badger"]
+    assert loaded.tasks["cut hedges"].completed_dates == [datetime(2020, 5, 1)]
+
+
+def test_journal_not_pickled_with_garden(gardens):
+    assert pickle.loads(pickle.dumps(gardens["Shade"])).store is None
+
+
+if __name__ == "__main__":
+    pytest.main()
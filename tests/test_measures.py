@@ -0,0 +1,88 @@
+import pytest
+
+import context
+from gardenlife.garden import Garden
+from gardenlife import measures
+from gardenlife.organisms import Creature, Plant
+
+
+@pytest.fixture
+def shade():
+    garden = Garden("Shade", "Hull", 1, "04/02/1987", ["Dave Davidson"])
+    garden.add_item("creatures", Creature("badger", "mammal", impact=2, trend=1))
+    garden.add_item("creatures", Creature("fox", "mammal", impact=5, trend=4))
+    garden.add_item("creatures", Creature("ant", "insect", impact=3, trend=2))
+    mole = Creature("mole", "mammal", impact=1, trend=1)
+    mole.status.archive()
+    garden.add_item("creatures", mole)
+    return garden
+
+
+@pytest.fixture(params=["numpy", "python"])
+def numpy_or_python(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(measures, "numpy", lambda: None)
+
+
+@pytest.mark.usefixtures("numpy_or_python")
+def test_mean_by_type(shade):
+    assert shade.measures("creatures").mean_by_type("impact") == {"mammal": 3.5, "insect": 3}
+
+
+@pytest.mark.usefixtures("numpy_or_python")
+def test_mean_by_type_including_archived(shade):
+    means = shade.measures("creatures").mean_by_type("impact", include_archived=True)
+    assert means == {"mammal": 8 / 3, "insect": 3}
+
+
+@pytest.mark.usefixtures("numpy_or_python")
+def test_counts_by_level(shade):
+    counts = shade.measures("creatures").counts_by_level("trend")
+    assert counts == {1: 1, 2: 1, 3: 0, 4: 1, 5: 0}
+
+
+@pytest.mark.usefixtures("numpy_or_python")
+def test_declining_share(shade):
+    assert shade.measures("creatures").declining_share() == 2 / 3
+    assert measures.MeasureColumns().declining_share() == 0
+
+
+def test_columns_follow_changes(shade):
+    columns = shade.measures("creatures")
+    shade.remove_item("creatures", "badger")
+    shade.add_item("creatures", Creature("fox", "canine", impact=4))
+    shade.add_item("creatures", Creature("frog", "amphibian", impact=2))
+    assert sorted(columns.names) == ["ant", "fox", "frog", "mole"]
+    assert columns.mean_by_type("impact") == {"canine": 4, "insect": 3, "amphibian": 2}
+
+
+def test_remove_last_row():
+    columns = measures.MeasureColumns([Creature("ant", "insect"), Creature("bee", "insect")])
+    columns.remove("bee")
+    columns.remove("bee")
+    assert columns.names == ["ant"]
+    assert len(columns.columns["impact"]) == 1
+
+
+def test_slider_levels():
+    columns = measures.MeasureColumns([Plant("ash", "tree", impact=4.0)])
+    assert columns.mean_by_type("impact") == {"tree": 4}
+
+
+def test_tasks_have_no_measures(shade):
+    with pytest.raises(ValueError) as excinfo:
+        shade.measures("tasks")
+    assert str(excinfo.value) == "tasks don't have measures"
+
+
+def test_combine(shade):
+    light = Garden("Light", "London", 0.2, "13/11/2017", ["Paul Daniels"])
+    light.add_item("creatures", Creature("fox", "mammal", impact=1))
+    combined = measures.combine({"Shade": shade, "Light": light}, "creatures")
+    assert len(combined) == 5
+    assert ("Light", "fox") in combined.names
+    assert combined.mean_by_type("impact") == {"mammal": 8 / 3, "insect": 3}
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -1,7 +1,7 @@
 import pytest
 
 import context
-import organisms
+from gardenlife import organisms
 
 
 @pytest.fixture
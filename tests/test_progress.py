@@ -0,0 +1,96 @@
+import pytest
+
+import context
+from gardenlife import progress
+from gardenlife.task import Task
+
+
+@pytest.fixture
+def tasks():
+    cut_hedges = Task("cut hedges")
+    cut_hedges.set_schedule(
+        start_date="01/05/2020", freq="Monthly", count="5", bymonth="5 10", interval=""
+    )
+    water_veg = Task("water veg")
+    water_veg.set_schedule(
+        start_date="03/05/2020", freq="Daily", count="200", bymonth="", interval="3"
+    )
+    water_veg.update_completed_dates({"06/05/2020": True, "15/05/2020": True})
+    mow_lawn = Task("mow lawn")
+    mow_lawn.set_schedule(
+        start_date="04/05/2020", freq="Weekly", count="20", bymonth="6 7", interval=""
+    )
+    mow_lawn.update_completed_dates({"05/06/2020": True})
+    prune_tree = Task("prune tree")
+    prune_tree.set_schedule(
+        start_date="01/11/2020", freq="Yearly", count="2", bymonth="", interval=""
+    )
+    prune_tree.update_completed_dates({"01/11/2020": True, "01/11/2021": True})
+    return [cut_hedges, water_veg, mow_lawn, prune_tree]
+
+
+@pytest.mark.parametrize(
+    "current_date, expected",
+    [
+        (
+            "15/06/2020",
+            {
+                "cut hedges": ("Overdue", "01/05/2020"),
+                "water veg": ("Very overdue", "18/05/2020"),
+                "mow lawn": ("Due", "08/06/2020"),
+                "prune tree": ("Completed", "No further due dates"),
+            },
+        ),
+        (
+            "02/10/2020",
+            {
+                "cut hedges": ("Very overdue", "01/05/2020"),
+                "water veg": ("Very overdue", "18/05/2020"),
+                "mow lawn": ("Very overdue", "08/06/2020"),
+                "prune tree": ("Completed", "No further due dates"),
+            },
+        ),
+    ],
+)
+def test_garden_progress(tasks, current_date, expected):
+    assert progress.garden_progress(tasks, current_date) == expected
+
+
+def test_garden_progress_cached_between_days(tasks):
+    # Progress cached on one day is recalculated once it may have changed
+    progress.garden_progress(tasks, "15/06/2020")
+    all_progress = progress.garden_progress(tasks, "01/10/2020")
+    assert all_progress["cut hedges"] == ("Overdue", "01/05/2020")
+    assert all_progress["mow lawn"] == ("Very overdue", "08/06/2020")
+    all_progress = progress.garden_progress(tasks, "02/10/2020")
+    assert all_progress["cut hedges"] == ("Very overdue", "01/05/2020")
+
+
+def test_garden_progress_today(tasks):
+    all_progress = progress.garden_progress(tasks)
+    assert all_progress["prune tree"] == ("Completed", "No further due dates")
+
+
+def test_garden_progress_only_evaluates_stale_tasks(tasks, monkeypatch):
+    progress.garden_progress(tasks, "01/10/2020")
+    evaluated = []
+    calculate = Task._calculate_progress
+    monkeypatch.setattr(
+        Task,
+        "_calculate_progress",
+        lambda task, date: evaluated.append(task.name) or calculate(task, date),
+    )
+    progress.garden_progress(tasks, "02/10/2020")
+    assert evaluated == ["cut hedges"]
+
+
+def test_garden_progress_no_tasks():
+    assert progress.garden_progress([]) == {}
+
+
+def test_outstanding_tasks(tasks):
+    assert progress.outstanding_tasks(tasks, "01/10/2020") == 3
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,186 @@
+from datetime import datetime, timedelta
+import bisect
+import pickle
+import pytest
+
+from dateutil.rrule import rrule, DAILY, WEEKLY, MONTHLY, YEARLY
+
+import context
+from gardenlife.schedule import Schedule, compile_schedule
+
+
+RULES = [
+    (datetime(2020, 5, 1), DAILY, 40, None, 3),
+    (datetime(2020, 5, 1), DAILY, 100, (2, 6), 1),
+    (datetime(2020, 5, 1), WEEKLY, 30, None, 2),
+    (datetime(2020, 5, 1), WEEKLY, 30, (6, 7, 12), 3),
+    (datetime(2020, 5, 1), MONTHLY, 20, (5, 10), 1),
+    (datetime(2020, 1, 31), MONTHLY, 20, None, 1),
+    (datetime(2020, 3, 30), MONTHLY, 15, (2, 3, 4), 2),
+    (datetime(2020, 2, 29), MONTHLY, 10, (2,), 1),
+    (datetime(2020, 5, 1), YEARLY, 10, (3, 5, 10), 2),
+    (datetime(2020, 2, 29), YEARLY, 4, None, 1),
+]
+
+
+@pytest.fixture
+def cut_hedges():
+    return Schedule(datetime(2020, 5, 1), MONTHLY, 5, (5, 10), 1)
+
+
+@pytest.mark.parametrize("params", RULES)
+def test_matches_rrule(params):
+    dtstart, freq, count, bymonth, interval = params
+    expected = list(rrule(freq, dtstart=dtstart, count=count, bymonth=bymonth, interval=interval))
+    schedule = Schedule(dtstart, freq, count, bymonth, interval)
+    assert len(schedule) == len(expected)
+    assert [schedule[i] for i in range(len(schedule))] == expected
+    assert list(schedule) == expected
+
+
+@pytest.mark.parametrize("params", RULES)
+def test_bisect_matches_rrule(params):
+    dtstart, freq, count, bymonth, interval = params
+    expected = list(rrule(freq, dtstart=dtstart, count=count, bymonth=bymonth, interval=interval))
+    schedule = Schedule(dtstart, freq, count, bymonth, interval)
+    for date in rrule(DAILY, dtstart=datetime(2020, 1, 1), until=expected[-1] + timedelta(days=3)):
+        assert schedule.bisect_left(date) == bisect.bisect_left(expected, date)
+        assert schedule.bisect_right(date) == bisect.bisect_right(expected, date)
+
+
+@pytest.mark.parametrize("params", RULES)
+@pytest.mark.parametrize("limit_count", [False, True])
+def test_until_matches_rrule(params, limit_count):
+    dtstart, freq, count, bymonth, interval = params
+    until = datetime(2023, 3, 1)
+    count = count if limit_count else None
+    expected = list(rrule(freq, dtstart=dtstart, until=until, bymonth=bymonth, interval=interval))
+    expected = expected[:count]
+    schedule = Schedule(dtstart, freq, count, bymonth, interval, until)
+    assert list(schedule) == expected
+    assert schedule[:] == expected
+    for date in rrule(DAILY, dtstart=datetime(2020, 1, 1), until=datetime(2023, 4, 1)):
+        assert schedule.bisect_left(date) == bisect.bisect_left(expected, date)
+        assert schedule.bisect_right(date) == bisect.bisect_right(expected, date)
+
+
+@pytest.mark.parametrize("params", RULES)
+def test_open_ended_ends_in_last_year(params):
+    dtstart, freq, _, bymonth, interval = params
+    schedule = Schedule(dtstart, freq, None, bymonth, interval)
+    assert schedule[-1].year >= 9990
+    assert schedule.bisect_right(schedule[-1]) == len(schedule)
+    assert schedule.after(schedule[-1]) is None
+    # The last dates continue the same pattern until the end of the year 9999
+    tail = rrule(freq, dtstart=schedule[-2], bymonth=bymonth, interval=interval)
+    assert list(tail) == schedule[-2:]
+
+
+@pytest.mark.parametrize("freq, bymonth, interval", [(DAILY, (2, 6), 3), (WEEKLY, (6, 7, 12), 2)])
+def test_until_over_400_year_cycles(freq, bymonth, interval):
+    dtstart, until = datetime(2020, 5, 1), datetime(2900, 3, 1)
+    schedule = Schedule(dtstart, freq, None, bymonth, interval, until)
+    expected = rrule(freq, dtstart=dtstart, until=until, bymonth=bymonth, interval=interval)
+    assert len(schedule) == expected.count()
+
+
+@pytest.mark.parametrize(
+    "dtstart, freq, count, bymonth",
+    [
+        (datetime(2020, 5, 1), YEARLY, 9000, None),
+        (datetime(2020, 5, 1), MONTHLY, 100_000, (5, 10)),
+        (datetime(9990, 5, 1), WEEKLY, 1000, None),
+        (datetime(9999, 12, 1), DAILY, 100, (12,)),
+    ],
+)
+def test_count_past_last_year_matches_rrule(dtstart, freq, count, bymonth):
+    expected = list(rrule(freq, dtstart=dtstart, count=count, bymonth=bymonth))
+    schedule = Schedule(dtstart, freq, count, bymonth)
+    assert len(expected) < count
+    assert len(schedule) == len(expected)
+    assert schedule[-1] == expected[-1]
+    assert list(schedule) == expected
+
+
+def test_open_ended_daily():
+    schedule = Schedule(datetime(2020, 5, 1), DAILY, None)
+    assert len(schedule) == datetime.max.toordinal() - datetime(2020, 5, 1).toordinal() + 1
+    assert schedule.bisect_left(datetime(2020, 5, 11)) == 10
+
+
+def test_until_before_start():
+    schedule = Schedule(datetime(2020, 5, 1), MONTHLY, None, None, 1, datetime(2020, 4, 1))
+    assert not schedule
+    assert list(schedule) == []
+
+
+def test_negative_index(cut_hedges):
+    assert cut_hedges[-1] == datetime(2022, 5, 1)
+
+
+def test_index_out_of_range(cut_hedges):
+    with pytest.raises(IndexError):
+        cut_hedges[5]
+
+
+def test_slice(cut_hedges):
+    assert cut_hedges[1:3] == [datetime(2020, 10, 1), datetime(2021, 5, 1)]
+
+
+def test_no_dates():
+    schedule = Schedule(datetime(2020, 1, 30), MONTHLY, 3, (2,), 1)
+    assert not schedule
+    assert len(schedule) == 0
+    assert list(schedule) == []
+
+
+def test_contains(cut_hedges):
+    assert datetime(2021, 5, 1) in cut_hedges
+    assert datetime(2021, 6, 1) not in cut_hedges
+
+
+def test_after(cut_hedges):
+    assert cut_hedges.after(datetime(2020, 10, 1)) == datetime(2021, 5, 1)
+    assert cut_hedges.after(datetime(2020, 10, 1), inc=True) == datetime(2020, 10, 1)
+    assert cut_hedges.after(datetime(2022, 5, 1)) is None
+
+
+def test_between(cut_hedges):
+    assert cut_hedges.between(datetime(2020, 5, 1), datetime(2021, 10, 1)) == [
+        datetime(2020, 10, 1),
+        datetime(2021, 5, 1),
+    ]
+
+
+def test_between_inclusive(cut_hedges):
+    assert cut_hedges.between(datetime(2020, 5, 1), datetime(2020, 10, 1), inc=True) == [
+        datetime(2020, 5, 1),
+        datetime(2020, 10, 1),
+    ]
+
+
+def test_pickle_size_independent_of_count():
+    short = Schedule(datetime(2020, 5, 1), DAILY, 10)
+    long = Schedule(datetime(2020, 5, 1), DAILY, 100000)
+    assert len(pickle.dumps(long)) - len(pickle.dumps(short)) < 8
+
+
+def test_compile_schedule_shared():
+    schedule = compile_schedule(datetime(2020, 5, 1), MONTHLY, 5, [10, 5], 1)
+    assert compile_schedule(datetime(2020, 5, 1), MONTHLY, 5, (5, 10), 1) is schedule
+    assert compile_schedule(datetime(2020, 5, 1), MONTHLY, 6, (5, 10), 1) is not schedule
+
+
+def test_unpickled_schedule_shared(cut_hedges):
+    first, second = pickle.loads(pickle.dumps([cut_hedges, Schedule(*cut_hedges._params())]))
+    assert first is second
+    assert first == cut_hedges
+
+
+def test_immutable(cut_hedges):
+    with pytest.raises(AttributeError):
+        cut_hedges.count = 10
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,135 @@
+from datetime import datetime
+import json
+import os
+import pytest
+
+import context
+from gardenlife.garden import Garden
+from gardenlife import organisms
+from gardenlife.shards import ShardStore
+from gardenlife import task
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ShardStore(str(tmp_path / "gardens"))
+
+
+@pytest.fixture
+def shade(store):
+    shade = Garden("Shade", "Hull", 1, "04/02/1987", ["Dave Davidson"])
+    store.put_garden(shade)
+    shade.add_item("creatures", organisms.Creature("badger", org_type="mammal"))
+    shade.add_item("plants", organisms.Plant("leek", org_type="vegetable", edible=True))
+    cut_hedges = task.Task("cut hedges")
+    cut_hedges.set_schedule(
+        start_date="01/05/2020", freq="Monthly", count="5", bymonth="5 10", interval=""
+    )
+    shade.add_item("tasks", cut_hedges)
+    store.save()
+    return shade
+
+
+@pytest.fixture
+def light(store):
+    light = Garden("Light", "London", 0.2, "13/11/2017", ["Paul Daniels"])
+    store.put_garden(light)
+    light.add_item("plants", organisms.Plant("ash", org_type="tree"))
+    store.save()
+    return light
+
+
+def reload(store):
+    return ShardStore(store.directory).load()
+
+
+def shard_files(store):
+    return sorted(file for file in os.listdir(store.directory) if file.endswith(".garden"))
+
+
+def test_garden_saved_in_own_shard(shade, light, store):
+    assert shard_files(store) == ["1.garden", "2.garden"]
+    loaded = reload(store)
+    assert sorted(loaded) == ["Light", "Shade"]
+    assert loaded["Shade"].owners == ["Dave Davidson"]
+    assert loaded["Shade"].timestamp == shade.timestamp
+    assert list(loaded["Shade"].creatures) == ["badger"]
+    assert loaded["Shade"].tasks["cut hedges"].get_next_due_date() == "01/05/2020"
+    assert loaded.latest().name == "Light"
+
+
+def test_only_changed_shards_written(shade, light, store):
+    modified = os.path.getmtime(os.path.join(store.directory, "2.garden"))
+    os.utime(os.path.join(store.directory, "2.garden"), (0, 0))
+    shade.add_item("creatures", organisms.Creature("fox", org_type="mammal"))
+    store.save()
+    assert os.path.getmtime(os.path.join(store.directory, "2.garden")) == 0
+    assert os.path.getmtime(os.path.join(store.directory, "1.garden")) >= modified
+    assert sorted(reload(store)["Shade"].creatures) == ["badger", "fox"]
+
+
+def test_item_changes_saved(shade, store):
+    loaded_store = ShardStore(store.directory)
+    loaded = loaded_store.load()["Shade"]
+    loaded.remove_item("creatures", "badger")
+    loaded.update_task_progress("cut hedges", {"01/05/2020": True})
+    loaded_store.save()
+    reloaded = reload(store)["Shade"]
+    assert reloaded.creatures == {}
+    assert reloaded.tasks["cut hedges"].completed_dates == [datetime(2020, 5, 1)]
+
+
+def test_damaged_shard_only_affects_its_garden(shade, light, store):
+    with open(os.path.join(store.directory, "1.garden"), "wb") as file:
+        file.write(b"damaged")
+    loaded = reload(store)
+    assert list(loaded["Light"].plants) == ["ash"]
+    with pytest.raises(Exception):
+        loaded["Shade"]
+
+
+def test_remove_garden(shade, light, store):
+    store.remove_garden(shade)
+    store.save()
+    assert shard_files(store) == ["2.garden"]
+    assert list(reload(store)) == ["Light"]
+
+
+def test_change_to_garden_not_put_recorded(store):
+    light = Garden("Light", "London", 0.2, "13/11/2017", ["Paul Daniels"])
+    light.store = store
+    light.add_item("plants", organisms.Plant("ash", org_type="tree"))
+    store.save()
+    reloaded = reload(store)["Light"]
+    assert reloaded.location == "London"
+    assert list(reloaded.plants) == ["ash"]
+
+
+def test_manifest(shade, store):
+    with open(store.manifest_path) as file:
+        manifest = json.load(file)
+    assert manifest["gardens"] == {
+        "Shade": {
+            "file": "1.garden",
+            "timestamp": shade.timestamp.isoformat(),
+            "next_ids": {"creatures": 2, "plants": 2, "tasks": 2},
+        }
+    }
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_load_all(store, processes, monkeypatch):
+    monkeypatch.setattr("gardenlife.shards.SHARD_POOL_MINIMUM", 2)
+    for number in range(3):
+        garden = Garden(f"Garden {number}", "Hull", 1, "04/02/1987", ["Dave Davidson"])
+        store.put_garden(garden)
+        garden.add_item("creatures", organisms.Creature(f"Creature {number}", org_type="bird"))
+    store.save()
+    gardens = ShardStore(store.directory).load_all(processes)
+    assert sorted(gardens) == ["Garden 0", "Garden 1", "Garden 2"]
+    assert list(gardens["Garden 2"].creatures) == ["Creature 2"]
+    assert gardens["Garden 2"].store is not None
+
+
+if __name__ == "__main__":
+    pytest.main()
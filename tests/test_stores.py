@@ -0,0 +1,136 @@
+import os
+import pytest
+
+import context
+from gardenlife.database import Database
+from gardenlife.garden import Garden
+from gardenlife.journal import Journal
+from gardenlife import organisms
+from gardenlife.shards import ShardStore
+from gardenlife import task
+
+# Functions to open each kind of store in a directory
+STORES = {
+    "database": lambda directory: Database(os.path.join(directory, "gardens.db")),
+    "journal": lambda directory: Journal(
+        snapshot_path=os.path.join(directory, "gardens.pickle"),
+        journal_path=os.path.join(directory, "gardens.journal"),
+    ),
+    "shards": lambda directory: ShardStore(os.path.join(directory, "gardens")),
+}
+
+
+@pytest.fixture(params=sorted(STORES))
+def open_store(request, tmp_path):
+    opened = []
+
+    def open_store():
+        store = STORES[request.param](str(tmp_path))
+        opened.append(store)
+        return store
+
+    yield open_store
+    for store in opened:
+        if isinstance(store, Database):
+            store.close()
+
+
+@pytest.fixture
+def store(open_store):
+    return open_store()
+
+
+@pytest.fixture
+def shade(store):
+    shade = Garden("Shade", "Hull", 1, "04/02/1987", ["Dave Davidson"])
+    store.put_garden(shade)
+    shade.add_item("creatures", organisms.Creature("badger", org_type="mammal"))
+    shade.add_item("plants", organisms.Plant("leek", org_type="vegetable", edible=True))
+    cut_hedges = task.Task("cut hedges")
+    cut_hedges.set_schedule(
+        start_date="01/05/2020", freq="Monthly", count="5", bymonth="5 10", interval=""
+    )
+    shade.add_item("tasks", cut_hedges)
+    store.save()
+    return shade
+
+
+def reload(open_store):
+    store = open_store()
+    gardens = store.load()
+    store.wait()
+    return gardens
+
+
+def test_load_nothing_saved(store):
+    assert store.load() == {}
+
+
+def test_garden_saved(shade, open_store):
+    loaded = reload(open_store)["Shade"]
+    assert (loaded.location, loaded.since) == ("Hull", "04/02/1987")
+    assert loaded.owners == ["Dave Davidson"]
+    assert loaded.timestamp == shade.timestamp
+    assert list(loaded.creatures) == ["badger"]
+    assert loaded.tasks["cut hedges"].get_next_due_date() == "01/05/2020"
+
+
+def test_updated_garden_keeps_items(shade, open_store):
+    store = open_store()
+    loaded = store.load()["Shade"]
+    updated = Garden("Shade", "Leeds", 2, "04/02/1987", ["Dave Davidson"])
+    updated.creatures = loaded.creatures
+    store.put_garden(updated)
+    store.save()
+    reloaded = reload(open_store)["Shade"]
+    assert reloaded.location == "Leeds"
+    assert list(reloaded.creatures) == ["badger"]
+
+
+def test_item_added_after_update_keeps_details(shade, store, open_store):
+    # The window's selected garden can be the one from before the update
+    updated = Garden("Shade", "Leeds", 2, "04/02/1987", ["Dave Davidson"])
+    updated.creatures = shade.creatures
+    store.put_garden(updated)
+    shade.add_item("creatures", organisms.Creature("fox", org_type="mammal"))
+    store.save()
+    reloaded = reload(open_store)["Shade"]
+    assert reloaded.location == "Leeds"
+    assert reloaded.timestamp == shade.timestamp
+    assert sorted(reloaded.creatures) == ["badger", "fox"]
+
+
+def test_renamed_item_saved(shade, store, open_store):
+    shade.rename_item("creatures", "badger", "brock")
+    store.save()
+    reloaded = reload(open_store)["Shade"]
+    assert list(reloaded.creatures) == ["brock"]
+    assert reloaded.creatures["brock"].id == shade.creatures["brock"].id
+
+
+def test_removed_item_id_not_given_after_reload(shade, store, open_store):
+    badger_id = shade.item_id("creatures", "badger")
+    shade.remove_item("creatures", "badger")
+    store.save()
+    reloaded = reload(open_store)["Shade"]
+    reloaded.add_item("creatures", organisms.Creature("fox", org_type="mammal"))
+    assert reloaded.item_id("creatures", "fox") > badger_id
+
+
+def test_unsaved_changes_discarded(shade, store, open_store):
+    shade.remove_item("creatures", "badger")
+    store.discard()
+    store.save()
+    assert list(reload(open_store)["Shade"].creatures) == ["badger"]
+
+
+def test_import_gardens(store, open_store):
+    light = Garden("Light", "London", 0.2, "13/11/2017", ["Paul Daniels"])
+    light.add_item("plants", organisms.Plant("ash", org_type="tree"))
+    store.import_gardens({"Light": light})
+    store.save()
+    assert list(reload(open_store)["Light"].plants) == ["ash"]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,69 @@
+import pytest
+
+import context
+from gardenlife import organisms
+from gardenlife import summaries
+from gardenlife.task import Task
+
+
+@pytest.fixture
+def tasks():
+    cut_hedges = Task("cut hedges", assignee="Dave", linked_creatures=[], linked_plants=["ash"])
+    cut_hedges.set_schedule(
+        start_date="01/05/2020", freq="Monthly", count="5", bymonth="5 10", interval=""
+    )
+    prune_tree = Task("prune tree", assignee="Sue", linked_creatures=[], linked_plants=[])
+    prune_tree.set_schedule(
+        start_date="01/11/2020", freq="Yearly", count="2", bymonth="", interval=""
+    )
+    prune_tree.update_completed_dates({"01/11/2020": True, "01/11/2021": True})
+    water_veg = Task("water veg", assignee="Dave", linked_creatures=[], linked_plants=[])
+    water_veg.set_schedule("01/01/2100", "Daily", "", "", "")
+    return [prune_tree, water_veg, cut_hedges]
+
+
+def test_creature_values():
+    badger = organisms.Creature("badger", org_type="mammal", appeared="03/07/2020", impact=1)
+    assert summaries.creature_values(badger) == (
+        "badger",
+        "mammal",
+        "03/07/2020",
+        "Very Negative",
+        "Medium",
+        "Stable",
+        "Current",
+    )
+
+
+def test_task_values(tasks):
+    assert summaries.task_values(tasks[2], ("Very overdue", "01/05/2020")) == (
+        "cut hedges",
+        "Very overdue",
+        "01/05/2020",
+        "Dave",
+        None,
+        "",
+        "ash",
+        "Current",
+    )
+
+
+def test_sorted_tasks(tasks):
+    tasks[0].status.archive()
+    assert [task.name for task in summaries.sorted_tasks(tasks)] == [
+        "cut hedges",
+        "water veg",
+        "prune tree",
+    ]
+
+
+def test_sorted_organisms():
+    badger = organisms.Creature("badger", org_type="mammal")
+    ant = organisms.Creature("ant", org_type="insect")
+    ant.status.archive()
+    fox = organisms.Creature("fox", org_type="mammal")
+    assert summaries.sorted_organisms([fox, ant, badger]) == [badger, fox, ant]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -1,9 +1,12 @@
 from datetime import datetime
+import pickle
 import pytest
 import time
 
 import context
-from task import Task
+from gardenlife.completed_dates import CompletedDates
+from gardenlife.schedule import Schedule
+from gardenlife.task import Task
 
 
 @pytest.fixture
@@ -64,6 +67,17 @@ def test_equality_comparison_true(cut_hedges, cut_hedges_too):
     assert (cut_hedges == cut_hedges_too) == True
 
 
+def test_equality_comparison_string(cut_hedges):
+    assert cut_hedges != "Task: cut hedges"
+    assert cut_hedges != "cut hedges"
+
+
+def test_hash_equal_tasks(cut_hedges, cut_hedges_too):
+    assert cut_hedges == cut_hedges_too
+    assert hash(cut_hedges) == hash(cut_hedges_too)
+    assert len({cut_hedges, cut_hedges_too}) == 1
+
+
 # Set schedule
 
 
@@ -76,7 +90,7 @@ def test_set_schedule_with_start_date(prune_tree):
     prune_tree.set_schedule(
         start_date="01/10/2020", freq="monthly", count="4", bymonth="", interval=""
     )
-    assert prune_tree.schedule == [
+    assert list(prune_tree.schedule) == [
         datetime(2020, 10, 1, 0, 0),
         datetime(2020, 11, 1, 0, 0),
         datetime(2020, 12, 1, 0, 0),
@@ -84,6 +98,51 @@ def test_set_schedule_with_start_date(prune_tree):
     ]
 
 
+def test_set_schedule_shared(cut_hedges):
+    task = Task("trim hedges")
+    task.set_schedule(
+        freq="monthly", start_date="01/05/2020", count="5", bymonth="10 5", interval=1
+    )
+    assert task.schedule is cut_hedges.schedule
+
+
+def test_set_schedule_with_until_date(prune_tree):
+    prune_tree.set_schedule(
+        start_date="01/10/2020", freq="monthly", count="", bymonth="", interval="2",
+        until="01/04/2021",
+    )
+    assert list(prune_tree.schedule) == [
+        datetime(2020, 10, 1, 0, 0),
+        datetime(2020, 12, 1, 0, 0),
+        datetime(2021, 2, 1, 0, 0),
+        datetime(2021, 4, 1, 0, 0),
+    ]
+
+
+def test_set_schedule_with_count_and_until_date(prune_tree):
+    prune_tree.set_schedule(
+        start_date="01/10/2020", freq="monthly", count="2", bymonth="", interval="",
+        until="01/04/2021",
+    )
+    assert list(prune_tree.schedule) == [datetime(2020, 10, 1, 0, 0), datetime(2020, 11, 1, 0, 0)]
+
+
+def test_set_schedule_open_ended(prune_tree):
+    prune_tree.set_schedule(
+        start_date="01/10/2020", freq="Daily", count="", bymonth="", interval="",
+        until="Never",
+    )
+    assert prune_tree.schedule[-1] == datetime(9999, 12, 31, 0, 0)
+    assert len(pickle.dumps(prune_tree)) < 1000
+
+
+def test_set_schedule_pickled_as_list(cut_hedges):
+    cut_hedges.schedule = list(cut_hedges.schedule)
+    unpickled = pickle.loads(pickle.dumps(cut_hedges))
+    assert isinstance(unpickled.schedule, Schedule)
+    assert list(unpickled.schedule) == list(cut_hedges.schedule)
+
+
 # Add completed dates
 
 
@@ -176,6 +235,22 @@ def test_remove_two_completed_dates(cut_hedges):
     assert cut_hedges.completed_dates == [datetime(2020, 5, 1, 0, 0)]
 
 
+def test_complete_until(cut_hedges):
+    cut_hedges.complete_until("01/06/2021")
+    assert cut_hedges.completed_dates == [
+        datetime(2020, 5, 1, 0, 0),
+        datetime(2020, 10, 1, 0, 0),
+        datetime(2021, 5, 1, 0, 0),
+    ]
+
+
+def test_completed_dates_pickled_as_list(cut_hedges):
+    cut_hedges.completed_dates = [datetime(2020, 5, 1, 0, 0)]
+    unpickled = pickle.loads(pickle.dumps(cut_hedges))
+    assert isinstance(unpickled.completed_dates, CompletedDates)
+    assert datetime(2020, 5, 1, 0, 0) in unpickled.completed_dates
+
+
 # Get all progress
 
 
@@ -201,6 +276,65 @@ def test_get_all_progress_with_completed_dates(cut_hedges):
     }
 
 
+def test_get_all_progress_open_ended_pages(prune_tree):
+    prune_tree.set_schedule(
+        start_date="01/01/2020", freq="Daily", count="", bymonth="", interval="",
+        until="Never",
+    )
+    prune_tree.update_completed_dates({"31/12/2019": True, "01/01/2020": True, "01/06/2020": True})
+    first_page = prune_tree.get_all_progress(current_date="01/06/2020")
+    assert len(first_page) == 100
+    assert list(first_page)[0] == "12/04/2020"
+    assert list(first_page)[-1] == "20/07/2020"
+    assert first_page["01/06/2020"] is True
+    history = {}
+    for page in range(1, 10):
+        history.update(prune_tree.get_all_progress(page, current_date="01/06/2020"))
+    assert len(history) == 103
+    assert history["31/12/2019"] is True
+    assert history["01/01/2020"] is True
+    assert not history.keys() & first_page.keys()
+
+
+def test_get_all_progress_page_past_history(cut_hedges):
+    assert cut_hedges.get_all_progress(1) == {}
+
+
+def test_get_all_progress_later_pages(prune_tree):
+    prune_tree.set_schedule(
+        start_date="01/01/2020", freq="Daily", count="250", bymonth="", interval=""
+    )
+    prune_tree.update_completed_dates({"01/06/2020": True, "15/08/2020": True, "01/01/2021": True})
+    first_page = prune_tree.get_all_progress(current_date="01/06/2020")
+    assert list(first_page)[-1] == "20/07/2020"
+    assert "15/08/2020" not in first_page
+    later_page = prune_tree.get_all_progress(-1, current_date="01/06/2020")
+    assert len(later_page) == 49
+    assert list(later_page)[0] == "21/07/2020"
+    assert later_page["15/08/2020"] is True
+    assert later_page["01/01/2021"] is True
+    assert prune_tree.get_all_progress(-2, current_date="01/06/2020") == {}
+
+
+def test_get_all_progress_page_past_schedule(cut_hedges):
+    assert cut_hedges.get_all_progress(-1) == {}
+
+
+def test_completed_pages(prune_tree):
+    prune_tree.set_schedule(
+        start_date="01/01/2020", freq="Daily", count="", bymonth="", interval="",
+        until="Never",
+    )
+    prune_tree.update_completed_dates({"31/12/2019": True, "01/06/2020": True, "01/06/2021": True})
+    assert prune_tree.completed_pages(current_date="01/06/2020") == [-7, 0, 3]
+    assert prune_tree.get_all_progress(-7, current_date="01/06/2020")["01/06/2021"] is True
+    assert prune_tree.get_all_progress(3, current_date="01/06/2020")["31/12/2019"] is True
+
+
+def test_completed_pages_no_completed_dates(cut_hedges):
+    assert cut_hedges.completed_pages() == []
+
+
 # Get current progress
 
 
@@ -252,6 +386,41 @@ def test_current_progress_with_completed_dates_no_missed_dates(cut_hedges):
     assert current_progress == "Completed"
 
 
+def calculations(monkeypatch):
+    # Return a list that the date of each progress calculation is appended to
+    calculated = []
+    calculate = Task._calculate_progress
+    monkeypatch.setattr(
+        Task,
+        "_calculate_progress",
+        lambda task, date: calculated.append(date) or calculate(task, date),
+    )
+    return calculated
+
+
+def test_current_progress_cached(cut_hedges, monkeypatch):
+    calculated = calculations(monkeypatch)
+    assert cut_hedges.get_current_progress(current_date="01/06/2020") == "Overdue"
+    assert cut_hedges.get_current_progress(current_date="30/09/2020") == "Overdue"
+    assert calculated == [datetime(2020, 6, 1)]
+    cut_hedges.get_current_progress(current_date="01/10/2020")
+    assert calculated == [datetime(2020, 6, 1), datetime(2020, 10, 1)]
+
+
+def test_clear_cached_progress(cut_hedges, monkeypatch):
+    calculated = calculations(monkeypatch)
+    cut_hedges.get_current_progress(current_date="01/06/2020")
+    cut_hedges.clear_cached_progress()
+    cut_hedges.get_current_progress(current_date="01/06/2020")
+    assert len(calculated) == 2
+
+
+def test_current_progress_cache_updated_with_completed_dates(cut_hedges):
+    assert cut_hedges.get_current_progress(current_date="01/06/2020") == "Overdue"
+    cut_hedges.update_completed_dates({"01/05/2020": True})
+    assert cut_hedges.get_current_progress(current_date="01/06/2020") == "Completed"
+
+
 # Get next date date
 
 
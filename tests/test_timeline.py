@@ -0,0 +1,88 @@
+from datetime import datetime
+import pytest
+
+import context
+from gardenlife.garden import Garden
+from gardenlife.task import Task
+from gardenlife import timeline
+
+
+def make_task(name, start_date, count="3"):
+    task = Task(name)
+    task.set_schedule(start_date=start_date, freq="Weekly", count=count, bymonth="", interval="")
+    return task
+
+
+@pytest.fixture
+def gardens():
+    shade = Garden("Shade", "Hull", 1, "04/02/1987", ["Dave Davidson"])
+    light = Garden("Light", "London", 0.2, "13/11/2017", ["Paul Daniels"])
+    shade.add_item("tasks", make_task("cut hedges", "01/05/2020"))
+    shade.add_item("tasks", make_task("water veg", "10/05/2020"))
+    light.add_item("tasks", make_task("mow lawn", "05/05/2020"))
+    return {"Shade": shade, "Light": light}
+
+
+@pytest.fixture
+def due_timeline(gardens):
+    return timeline.build_timeline(gardens)
+
+
+def test_build_timeline(gardens, due_timeline):
+    assert len(due_timeline) == 3
+    assert gardens["Shade"].timeline is due_timeline
+
+
+def test_due_between(due_timeline):
+    assert due_timeline.due_between(datetime(2020, 5, 1), datetime(2020, 5, 9)) == [
+        (datetime(2020, 5, 1), "Shade", "cut hedges"),
+        (datetime(2020, 5, 5), "Light", "mow lawn"),
+    ]
+
+
+def test_add_item_updates_timeline(gardens, due_timeline):
+    gardens["Light"].add_item("tasks", make_task("mow lawn", "02/05/2020"))
+    assert due_timeline.due_between(datetime(2020, 5, 2), datetime(2020, 5, 5)) == [
+        (datetime(2020, 5, 2), "Light", "mow lawn"),
+    ]
+
+
+def test_remove_item_updates_timeline(gardens, due_timeline):
+    gardens["Shade"].remove_item("tasks", "cut hedges")
+    assert len(due_timeline) == 2
+
+
+def test_progress_updates_timeline(gardens, due_timeline):
+    gardens["Shade"].update_task_progress("cut hedges", {"01/05/2020": True})
+    assert (datetime(2020, 5, 8), "Shade", "cut hedges") in due_timeline.due_between(
+        datetime(2020, 5, 8), datetime(2020, 5, 8)
+    )
+
+
+def test_completed_task_removed_from_timeline(gardens, due_timeline):
+    gardens["Light"].complete_task_until("mow lawn", "31/12/2020")
+    assert len(due_timeline) == 2
+
+
+def test_archived_task_not_in_timeline(gardens, due_timeline):
+    task = make_task("prune tree", "01/05/2020")
+    task.status.archive()
+    gardens["Light"].add_item("tasks", task)
+    assert len(due_timeline) == 3
+
+
+def test_remove_garden(gardens, due_timeline):
+    due_timeline.remove_garden(gardens["Shade"])
+    assert len(due_timeline) == 1
+    assert gardens["Shade"].timeline is None
+
+
+def test_due_tasks(gardens):
+    assert timeline.due_tasks(gardens, days=3, current_date="04/05/2020") == [
+        (datetime(2020, 5, 1), "Shade", "cut hedges"),
+        (datetime(2020, 5, 5), "Light", "mow lawn"),
+    ]
+
+
+if __name__ == "__main__":
+    pytest.main()